@@ -0,0 +1,334 @@
+"""
+Incremental Analysis Pipeline for Real Estate Valuation and Negotiation Strategist
+
+This module models single-property analysis as a dependency graph of stages
+(geocoding, property data, market, valuation, investment, renovation, CMA and
+financing). Every stage result is cached under a key derived from the content
+hashes of its inputs, so re-running an analysis only recomputes the stages
+whose inputs changed. Small projection stages select the fields each
+expensive stage actually reads; when a change (such as a new listing price)
+leaves a projection's output unchanged, everything downstream of it comes from
+the cache.
+"""
+
+import os
+import copy
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from batch_checkpoint import json_default
+from financing_grid import build_financing_grid
+from property_analysis import PropertyAnalyzer
+from seeding import analysis_rng, resolve_data_version
+
+# Stage cache settings (should be stored in environment variables)
+STAGE_CACHE_TTL = int(os.getenv("STAGE_CACHE_TTL", "3600"))  # Bounds staleness of provider data
+STAGE_CACHE_MAX_ENTRIES = int(os.getenv("STAGE_CACHE_MAX_ENTRIES", "10000"))
+
+# Fields read by the stages downstream of each projection
+VALUATION_BASIS_FIELDS = ('address', 'estimated_value', 'square_feet')
+INVESTMENT_BASIS_FIELDS = ('annual_tax_amount', 'property_type')
+RENOVATION_BASIS_FIELDS = ('address', 'square_feet', 'year_built', 'property_type')
+CMA_BASIS_FIELDS = ('address', 'bedrooms', 'bathrooms', 'square_feet', 'year_built', 'coordinates')
+INVESTMENT_MARKET_FIELDS = {
+    'market_metrics': ('price_growth_rate',),
+    'supply_demand': ('market_type',),
+    'neighborhood': ('rental_demand',)
+}
+
+
+def _hash_default(value: Any) -> Any:
+    """Makes values the json module cannot serialize hashable by content"""
+    try:
+        return json_default(value)
+    except TypeError:
+        return repr(value)
+
+
+def content_hash(value: Any) -> str:
+    """
+    Computes a stable content hash of a JSON-like value
+
+    Args:
+        value: Value to hash (dict key order does not matter)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=_hash_default)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _select(data: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """Returns the given fields of a dict (missing fields are left out)"""
+    return {field: data[field] for field in fields if field in data}
+
+
+class Stage(NamedTuple):
+    """One node of the analysis graph"""
+    name: str
+    inputs: Tuple[str, ...]  # Upstream stages or pipeline inputs, passed positionally
+    run: Callable[..., Any]
+
+
+class StageCache:
+    """
+    In-memory cache of stage results keyed by stage input hashes
+
+    Each entry holds the stage output and its content hash, so a cache hit
+    also tells downstream stages whether their inputs changed.
+    """
+
+    def __init__(self, ttl: int = None, max_entries: int = None):
+        """
+        Initialize the StageCache
+
+        Args:
+            ttl: Seconds to keep a stage result before recomputing it
+            max_entries: Maximum number of results kept (least recently used
+                results are evicted first)
+        """
+        self.ttl = STAGE_CACHE_TTL if ttl is None else ttl
+        self.max_entries = STAGE_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: str) -> Optional[Tuple[Any, str]]:
+        """
+        Looks up a stage result
+
+        Args:
+            key: Stage key
+
+        Returns:
+            Tuple of (output, output hash), or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, output, digest = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return output, digest
+
+    def set(self, key: str, output: Any, digest: str) -> None:
+        """
+        Stores a stage result
+
+        Args:
+            key: Stage key
+            output: Stage output
+            digest: Content hash of the output
+        """
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, output, digest)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every cached stage result"""
+        with self._lock:
+            self._entries.clear()
+
+
+class AnalysisGraph:
+    """
+    Single-property analysis as an incrementally re-evaluated stage graph
+
+    Usage:
+        graph = AnalysisGraph()
+        result = graph.run('123 Main St, Springfield, IL 62701')
+        # Only the valuation aggregation and its cheap dependents rerun
+        result = graph.run('123 Main St, Springfield, IL 62701', overrides={'listing_price': 310000})
+    """
+
+    def __init__(self, analyzer: PropertyAnalyzer = None, cache: StageCache = None):
+        """
+        Initialize the AnalysisGraph
+
+        Args:
+            analyzer: Property analyzer whose stages the graph runs
+            cache: Stage result cache (defaults to a new in-memory cache)
+        """
+        self.analyzer = analyzer or PropertyAnalyzer()
+        self.cache = StageCache() if cache is None else cache
+        self.stages = OrderedDict((stage.name, stage) for stage in self._build_stages())
+
+    def run(self,
+            address: str,
+            overrides: Dict[str, Any] = None,
+            financing: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Analyzes a property, recomputing only stages whose inputs changed
+
+        Args:
+            address: The property address
+            overrides: Property fields supplied by the user (e.g. listing_price,
+                bedrooms); None values are ignored
+            financing: Financing grid axes and overrides (down_payment_percents,
+                interest_rates, loan_terms, points, monthly_rent); None skips
+                the financing grid
+
+        Returns:
+            Dict containing property, market and valuation data, the financing
+            grid and which stages were recomputed or taken from the cache
+        """
+        inputs = {
+            'address': address,
+            'overrides': {field: value for field, value in (overrides or {}).items() if value is not None},
+            'financing': financing
+        }
+        outputs = {name: (value, content_hash(value)) for name, value in inputs.items()}
+        report = {'recomputed': [], 'cached': []}
+
+        try:
+            for name in self.stages:
+                self._evaluate(name, outputs, report)
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'stages': report
+            }
+
+        # Cached outputs are shared; hand out independent copies
+        def output(name: str) -> Any:
+            return copy.deepcopy(outputs[name][0])
+
+        return {
+            'success': True,
+            'property': output('property'),
+            'market': output('market'),
+            'valuation': {
+                'valuation': output('enhanced_valuation'),
+                'investment_metrics': output('investment'),
+                'renovation_analysis': output('renovation'),
+                'cma_results': output('cma')
+            },
+            'financing_grid': output('financing_grid'),
+            'stages': report
+        }
+
+    def _evaluate(self, name: str, outputs: Dict[str, Tuple[Any, str]], report: Dict[str, List[str]]) -> None:
+        """
+        Evaluates one stage, from the cache when its inputs are unchanged
+
+        Args:
+            name: Stage name (its inputs must already be in outputs)
+            outputs: Stage and pipeline input outputs with their hashes
+            report: Recomputed and cached stage names, updated in place
+        """
+        stage = self.stages[name]
+        key = content_hash([
+            stage.name,
+            resolve_data_version(self.analyzer.data_version),
+            [outputs[upstream][1] for upstream in stage.inputs]
+        ])
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            outputs[name] = cached
+            report['cached'].append(name)
+            return
+
+        output = stage.run(*(outputs[upstream][0] for upstream in stage.inputs))
+        digest = content_hash(output)
+        self.cache.set(key, output, digest)
+        outputs[name] = (output, digest)
+        report['recomputed'].append(name)
+
+    def _build_stages(self) -> List[Stage]:
+        """Defines the analysis stages in dependency order"""
+        analyzer = self.analyzer
+        retriever = analyzer.data_retriever
+
+        def location(address: str) -> Dict[str, Any]:
+            address = analyzer.prepare_address(address)
+            location_data = analyzer.address_processor.geocode_address(address)
+            if not location_data.get('success', False):
+                raise ValueError(f"Failed to geocode address: {location_data.get('error', 'Unknown error')}")
+            return {'address': address, 'location_data': location_data}
+
+        def provider_property(location: Dict[str, Any]) -> Dict[str, Any]:
+            result = retriever.get_property_data(location['address'], location['location_data'])
+            if not result.get('success', False):
+                raise ValueError(f"Failed to retrieve property data: {result.get('error', 'Unknown error')}")
+            return result['data']
+
+        def provider_valuations(basis: Dict[str, Any]) -> Dict[str, Any]:
+            primary, secondary = retriever._get_provider_valuations(basis.get('address', ''), basis)
+            return {'primary_valuation': primary, 'secondary_valuation': secondary}
+
+        def valuation_data(valuations: Dict[str, Any], property_data: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                **valuations,
+                'aggregated_valuation': retriever._aggregate_valuations(
+                    valuations['primary_valuation'],
+                    valuations['secondary_valuation'],
+                    property_data
+                )
+            }
+
+        def financing_grid(value: Dict[str, Any],
+                           basis: Dict[str, Any],
+                           market: Dict[str, Any],
+                           financing: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if financing is None:
+                return None
+            axes = _select(financing, ('down_payment_percents', 'interest_rates', 'loan_terms', 'points'))
+            grid = build_financing_grid(
+                property_value=financing.get('purchase_price') or value.get('final_value', 0),
+                property_type=basis.get('property_type', 'Single Family'),
+                market_type=market.get('supply_demand', {}).get('market_type', 'balanced'),
+                annual_tax_amount=basis.get('annual_tax_amount'),
+                monthly_rent=financing.get('monthly_rent'),
+                **axes
+            )
+            return grid.to_dict(include_schedules=bool(financing.get('include_schedules', False)))
+
+        def project(fields: Iterable[str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+            return lambda data: _select(data, fields)
+
+        def project_market(market: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                section: _select(market.get(section, {}), fields)
+                for section, fields in INVESTMENT_MARKET_FIELDS.items()
+            }
+
+        return [
+            Stage('location', ('address',), location),
+            Stage('provider_property', ('location',), provider_property),
+            Stage('property', ('provider_property', 'overrides'), lambda data, overrides: {**data, **overrides}),
+            Stage('market', ('location',), lambda location: analyzer._analyze_market(location['location_data'], {})),
+            Stage('valuation_basis', ('property',), project(VALUATION_BASIS_FIELDS)),
+            Stage('provider_valuations', ('valuation_basis',), provider_valuations),
+            Stage('valuation_data', ('provider_valuations', 'property'), valuation_data),
+            Stage('enhanced_valuation', ('valuation_data', 'property', 'market'),
+                  analyzer._enhance_valuation_with_market_context),
+            Stage('value', ('enhanced_valuation',), project(('final_value',))),
+            Stage('investment_basis', ('property',), project(INVESTMENT_BASIS_FIELDS)),
+            Stage('investment_market', ('market',), project_market),
+            Stage('investment', ('value', 'investment_basis', 'investment_market'),
+                  analyzer._generate_investment_analysis),
+            Stage('renovation_basis', ('property',), project(RENOVATION_BASIS_FIELDS)),
+            Stage('renovation', ('value', 'renovation_basis'),
+                  lambda value, basis: analyzer._generate_renovation_analysis(
+                      value, basis, analysis_rng(basis.get('address', ''), 'renovation', analyzer.data_version))),
+            Stage('cma_basis', ('property',), project(CMA_BASIS_FIELDS)),
+            Stage('cma', ('value', 'cma_basis', 'market'),
+                  lambda value, basis, market: analyzer._generate_cma(
+                      value, basis, market, analysis_rng(basis.get('address', ''), 'cma', analyzer.data_version))),
+            Stage('financing_grid', ('value', 'investment_basis', 'investment_market', 'financing'), financing_grid)
+        ]
@@ -0,0 +1,316 @@
+"""
+Checkpointed Batch Output for Real Estate Valuation and Negotiation Strategist
+
+This module writes batch results as JSON Lines and periodically records a
+durable checkpoint (rows completed, results succeeded, byte offset of the
+output and a digest of the input rows). An interrupted batch can be resumed:
+finished rows are skipped, so providers are not queried for them again, and
+new results are appended to the existing output.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, Any, Iterable, Iterator, IO, Optional, Union
+
+import numpy as np
+
+# Checkpoint settings (should be stored in environment variables)
+BATCH_CHECKPOINT_INTERVAL = int(os.getenv("BATCH_CHECKPOINT_INTERVAL", "100"))  # Rows between checkpoints
+
+
+def json_default(value: Any) -> Any:
+    """
+    Converts NumPy values in analysis results to JSON-serializable types
+
+    Args:
+        value: Value the json module cannot serialize
+
+    Returns:
+        Equivalent built-in Python value
+
+    Raises:
+        TypeError: If the value is not a NumPy scalar or array
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class BatchCheckpoint:
+    """
+    Durable checkpoint file for one batch output
+
+    The checkpoint is replaced atomically, so a crash while saving leaves the
+    previous checkpoint intact.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        Initialize the BatchCheckpoint
+
+        Args:
+            path: Checkpoint file path
+        """
+        self.path = os.fspath(path)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Reads the checkpoint
+
+        Returns:
+            Checkpoint state, or None if there is no readable checkpoint
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, state: Dict[str, Any]) -> None:
+        """
+        Writes the checkpoint durably
+
+        Args:
+            state: Checkpoint state
+        """
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def clear(self) -> None:
+        """Removes the checkpoint"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class JsonlResultWriter:
+    """
+    Writes batch results as JSON Lines, with optional checkpoints and resume
+
+    Each record is written as one line and flushed immediately. When the
+    output is a path, a checkpoint is saved every ``checkpoint_interval`` rows
+    (after syncing the output), and ``open(..., resume=True)`` continues an
+    interrupted batch. Complete lines written after the last checkpoint are
+    recovered too; a partially written last line is discarded.
+
+    Usage:
+        with JsonlResultWriter('results.jsonl', 'results.jsonl.checkpoint') as writer:
+            for address in writer.open(addresses, resume=True):
+                writer.write(analyze(address))
+            writer.finish()
+    """
+
+    def __init__(self,
+                 sink: Union[str, os.PathLike, IO[str]],
+                 checkpoint_path: Union[str, os.PathLike, None] = None,
+                 checkpoint_interval: int = None):
+        """
+        Initialize the JsonlResultWriter
+
+        Args:
+            sink: Output file path or text file-like object
+            checkpoint_path: Checkpoint file path (requires an output path;
+                None disables checkpoints)
+            checkpoint_interval: Rows between checkpoints
+        """
+        self.path = os.fspath(sink) if isinstance(sink, (str, os.PathLike)) else None
+        if checkpoint_path is not None and self.path is None:
+            raise ValueError("Checkpoints require an output path")
+
+        self.checkpoint = BatchCheckpoint(checkpoint_path) if checkpoint_path is not None else None
+        self.checkpoint_interval = max(1, checkpoint_interval or BATCH_CHECKPOINT_INTERVAL)
+        self.rows = 0
+        self.succeeded = 0
+        self.resumed_rows = 0
+        self.summary: Optional[Dict[str, Any]] = None
+        self._sink = sink if self.path is None else None
+        self._digest = hashlib.sha256()
+        self._checkpoint_rows = 0
+
+    def __enter__(self) -> 'JsonlResultWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def open(self, addresses: Iterable[Any], resume: bool = False) -> Iterator[Any]:
+        """
+        Opens the output and returns the input rows still to be processed
+
+        Args:
+            addresses: Every input row of the batch, in order
+            resume: Continue from the existing output and checkpoint instead of
+                starting over
+
+        Returns:
+            Iterator over the rows that have no result yet (empty if the batch
+            already finished; see ``summary``)
+
+        Raises:
+            ValueError: If resuming with an output path is not possible, or if
+                the input does not match the rows already processed
+        """
+        addresses = iter(addresses)
+        if self.path is None:
+            if resume:
+                raise ValueError("Resuming requires an output path")
+            return addresses
+
+        offset = 0
+        tail = []
+        if resume and os.path.exists(self.path):
+            state = self.checkpoint.load() if self.checkpoint is not None else None
+            if state is not None and state.get('completed'):
+                self.summary = state['summary']
+                return iter(())
+            if state is not None:
+                offset = state['output_offset']
+                self.rows = state['rows_completed']
+                self.succeeded = state['succeeded']
+                self._skip(addresses, self.rows, state['input_digest'])
+            offset, tail = self._recover_tail(offset)
+            for record in tail:
+                expected = next(addresses, None)
+                if expected is None or str(expected) != str(record.get('address')):
+                    raise ValueError(f"Batch input does not match existing output at row {self.rows}")
+                self._count(record)
+            self.resumed_rows = self.rows
+
+        self._sink = open(self.path, 'r+b' if offset else 'wb')
+        self._sink.seek(offset)
+        self._sink.truncate()
+        self._checkpoint_rows = self.rows
+        return iter(()) if self.summary is not None else addresses
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Writes one result record
+
+        Args:
+            record: Result for the next input row (its 'address' and 'success'
+                fields are used for resume checks and counts)
+        """
+        self._write_line(json.dumps(record, default=json_default))
+        self._count(record)
+        if self.checkpoint is not None and self.rows - self._checkpoint_rows >= self.checkpoint_interval:
+            self.save_checkpoint()
+
+    def finish(self, **fields: Any) -> Dict[str, Any]:
+        """
+        Writes the trailing summary record
+
+        Args:
+            **fields: Additional summary fields
+
+        Returns:
+            Dict containing the summary record
+        """
+        if self.summary is not None:
+            return self.summary
+
+        self.summary = {
+            'record_type': 'summary',
+            'rows': self.rows,
+            'succeeded': self.succeeded,
+            'failed': self.rows - self.succeeded,
+            'resumed_rows': self.resumed_rows,
+            **fields,
+            'completed_at': datetime.now().isoformat()
+        }
+        self._write_line(json.dumps(self.summary, default=json_default))
+        if self.checkpoint is not None:
+            self.save_checkpoint(completed=True)
+        return self.summary
+
+    def save_checkpoint(self, completed: bool = False) -> None:
+        """
+        Syncs the output and records the rows completed so far
+
+        Args:
+            completed: Whether the summary record has been written
+        """
+        self._sink.flush()
+        os.fsync(self._sink.fileno())
+        self.checkpoint.save({
+            'output_path': self.path,
+            'output_offset': self._sink.tell(),
+            'rows_completed': self.rows,
+            'succeeded': self.succeeded,
+            'input_digest': self._digest.hexdigest(),
+            'completed': completed,
+            'summary': self.summary if completed else None,
+            'updated_at': datetime.now().isoformat()
+        })
+        self._checkpoint_rows = self.rows
+
+    def close(self) -> None:
+        """Saves a final checkpoint and closes the output if this writer opened it"""
+        if self.path is None or self._sink is None:
+            return
+        try:
+            if self.checkpoint is not None and self.summary is None:
+                self.save_checkpoint()
+        finally:
+            self._sink.close()
+            self._sink = None
+
+    def _write_line(self, line: str) -> None:
+        """Writes and flushes one line"""
+        if self.path is None:
+            self._sink.write(line + '\n')
+        else:
+            self._sink.write(line.encode('utf-8') + b'\n')
+        self._sink.flush()
+
+    def _count(self, record: Dict[str, Any]) -> None:
+        """Updates the row counts and input digest for a written record"""
+        self.rows += 1
+        self.succeeded += bool(record.get('success'))
+        self._digest.update(f"{record.get('address')}\n".encode('utf-8'))
+
+    def _skip(self, addresses: Iterator[Any], count: int, expected_digest: str) -> None:
+        """Consumes the checkpointed input rows and verifies their digest"""
+        for _ in range(count):
+            address = next(addresses, None)
+            if address is None:
+                break
+            self._digest.update(f"{address}\n".encode('utf-8'))
+        if self._digest.hexdigest() != expected_digest:
+            raise ValueError("Batch input does not match the checkpoint")
+
+    def _recover_tail(self, offset: int) -> tuple:
+        """
+        Reads complete result lines written after the checkpoint
+
+        Args:
+            offset: Byte offset of the checkpoint
+
+        Returns:
+            Tuple of the byte offset after the last complete line and the
+            result records found (a summary record sets ``summary`` instead)
+        """
+        records = []
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                offset += len(line)
+                if record.get('record_type') == 'summary':
+                    self.summary = record
+                    break
+                records.append(record)
+        return offset, records
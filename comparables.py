@@ -0,0 +1,360 @@
+"""
+Comparable Sales Index for Real Estate Valuation and Negotiation Strategist
+
+This module stores recorded property sales in a KD-tree and answers
+k-nearest-comparable queries for a CMA. Coordinates are projected onto the
+unit sphere (3-D Earth-centred coordinates), where straight-line distance
+orders points exactly like great-circle distance, so the index has no map
+projection distortion anywhere in the country. Attribute bands (bedrooms,
+bathrooms, square footage, year built) and the sale recency window are
+applied inside the tree search, so the k results are the nearest sales that
+pass every filter.
+"""
+
+import os
+import math
+import heapq
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Comparables settings (should be stored in environment variables)
+COMPARABLES_PATH = os.getenv("COMPARABLES_PATH", os.path.join("data", "comparable_sales.csv"))
+COMPARABLES_LEAF_SIZE = int(os.getenv("COMPARABLES_LEAF_SIZE", "32"))
+
+EARTH_RADIUS_MILES = 3958.8
+
+# Attribute columns used by the filters, in index order
+_ATTRIBUTES = ('bedrooms', 'bathrooms', 'square_feet', 'year_built', 'sale_day')
+_EPOCH = date(1970, 1, 1)
+
+
+@dataclass(frozen=True)
+class ComparableCriteria:
+    """Attribute bands and search limits for comparable sales"""
+    bedroom_band: Optional[int] = 1  # +/- bedrooms
+    bathroom_band: Optional[float] = 1.0  # +/- bathrooms
+    square_feet_band: Optional[float] = 0.2  # +/- fraction of the subject's square footage
+    year_built_band: Optional[int] = 15  # +/- years
+    recency_days: Optional[int] = 180  # Sales within this many days before the as-of date
+    max_distance_miles: Optional[float] = 2.0
+
+
+def project(latitudes: Union[float, Sequence[float]], longitudes: Union[float, Sequence[float]]) -> np.ndarray:
+    """
+    Projects latitude/longitude onto Earth-centred 3-D coordinates in miles
+
+    Args:
+        latitudes: Latitudes in degrees
+        longitudes: Longitudes in degrees
+
+    Returns:
+        Array of shape (..., 3)
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=float))
+    lon = np.radians(np.asarray(longitudes, dtype=float))
+    cos_lat = np.cos(lat)
+    return EARTH_RADIUS_MILES * np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def _chord_to_miles(chord: np.ndarray) -> np.ndarray:
+    """Converts straight-line (chord) distances to great-circle miles"""
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.minimum(chord / (2 * EARTH_RADIUS_MILES), 1.0))
+
+
+def _miles_to_chord(miles: float) -> float:
+    """Converts a great-circle distance to a straight-line (chord) distance"""
+    return 2 * EARTH_RADIUS_MILES * math.sin(min(miles / (2 * EARTH_RADIUS_MILES), math.pi / 2))
+
+
+def _to_day(value: Any) -> float:
+    """Converts a date, datetime or ISO date string to days since 1970-01-01"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return math.nan
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        value = value.date()
+    return float((value - _EPOCH).days)
+
+
+class ComparablesStore:
+    """
+    KD-tree index of recorded property sales
+
+    Sales are given as a DataFrame (or records) with latitude, longitude,
+    sale_price and sale_date columns, plus optional address, bedrooms,
+    bathrooms, square_feet and year_built. A sale missing an attribute never
+    passes a filter on that attribute.
+    """
+
+    def __init__(self, sales: Union['pd.DataFrame', Iterable[Dict[str, Any]]], leaf_size: int = None):
+        """
+        Initialize the ComparablesStore
+
+        Args:
+            sales: Recorded sales
+            leaf_size: Maximum number of sales per KD-tree leaf
+
+        Raises:
+            ValueError: If a required column is missing
+        """
+        import pandas as pd
+        sales = sales if isinstance(sales, pd.DataFrame) else pd.DataFrame(list(sales))
+        missing = {'latitude', 'longitude', 'sale_price', 'sale_date'} - set(sales.columns)
+        if missing:
+            raise ValueError(f"Comparable sales are missing columns: {', '.join(sorted(missing))}")
+
+        sales = sales.dropna(subset=['latitude', 'longitude']).reset_index(drop=True)
+        self.leaf_size = max(1, leaf_size or COMPARABLES_LEAF_SIZE)
+
+        attributes = np.column_stack([
+            pd.to_numeric(sales[name], errors='coerce').to_numpy(dtype=float) if name in sales
+            else np.full(len(sales), np.nan)
+            for name in _ATTRIBUTES[:-1]
+        ] + [np.array([_to_day(value) for value in sales['sale_date']], dtype=float)]) if len(sales) else np.empty((0, 5))
+        # Missing attributes compare below every band, so they fail active filters only
+        attributes[np.isnan(attributes)] = -np.inf
+
+        points = project(sales['latitude'].to_numpy(dtype=float), sales['longitude'].to_numpy(dtype=float))
+        self._order = np.arange(len(sales))
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._lo: List[tuple] = []
+        self._hi: List[tuple] = []
+        self._children: List[tuple] = []
+        if len(sales):
+            self._build(points, 0, len(sales))
+
+        # Store sales in tree order so every leaf is a contiguous slice
+        self._points = np.ascontiguousarray(points[self._order])
+        self._attributes = np.ascontiguousarray(attributes[self._order])
+        self._records = sales.iloc[self._order].to_dict('records')
+
+    @classmethod
+    def from_csv(cls, path: str, leaf_size: int = None) -> 'ComparablesStore':
+        """
+        Loads recorded sales from a CSV file
+
+        Args:
+            path: CSV path
+            leaf_size: Maximum number of sales per KD-tree leaf
+
+        Returns:
+            ComparablesStore
+        """
+        import pandas as pd
+        return cls(pd.read_csv(path), leaf_size=leaf_size)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def query(self,
+              subject: Dict[str, Any],
+              k: int = 5,
+              criteria: ComparableCriteria = None,
+              as_of: Union[date, datetime, str, None] = None) -> List[Dict[str, Any]]:
+        """
+        Finds the nearest comparable sales for a property
+
+        Args:
+            subject: Property details with 'coordinates' (or 'latitude' and
+                'longitude') and optionally bedrooms, bathrooms, square_feet
+                and year_built; missing attributes are not filtered on
+            k: Number of comparables
+            criteria: Attribute bands and search limits
+            as_of: Date the recency window ends (defaults to today)
+
+        Returns:
+            Up to k comparable sales, nearest first, each with its
+            distance_miles
+        """
+        criteria = criteria or ComparableCriteria()
+        coordinates = subject.get('coordinates') or subject
+        latitude, longitude = coordinates.get('latitude'), coordinates.get('longitude')
+        if latitude is None or longitude is None or not len(self) or k <= 0:
+            return []
+
+        point = project(latitude, longitude)
+        low, high = self._bands(subject, criteria, as_of)
+        bound = math.inf if criteria.max_distance_miles is None else _miles_to_chord(criteria.max_distance_miles)
+        indices, chords = self._nearest(point, k, low, high, bound * bound)
+        return self._results(indices, chords)
+
+    def query_many(self,
+                   subjects: Sequence[Dict[str, Any]],
+                   k: int = 5,
+                   criteria: ComparableCriteria = None,
+                   as_of: Union[date, datetime, str, None] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Finds comparable sales for every property of a batch
+
+        Args:
+            subjects: Property details, as for query
+            k: Number of comparables per property
+            criteria: Attribute bands and search limits
+            as_of: Date the recency window ends (defaults to today)
+
+        Returns:
+            List with the comparables of each property, in input order
+        """
+        criteria = criteria or ComparableCriteria()
+        as_of = date.today() if as_of is None else as_of
+        return [self.query(subject, k=k, criteria=criteria, as_of=as_of) for subject in subjects]
+
+    def _bands(self,
+               subject: Dict[str, Any],
+               criteria: ComparableCriteria,
+               as_of: Union[date, datetime, str, None]) -> tuple:
+        """
+        Builds the attribute bands for a query
+
+        Returns:
+            Tuple of (low, high) arrays with one bound per attribute column
+        """
+        low = np.full(len(_ATTRIBUTES), -np.inf)
+        high = np.full(len(_ATTRIBUTES), np.inf)
+
+        def band(column: int, value: Any, width: Optional[float]) -> None:
+            if value is None or width is None:
+                return
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return
+            low[column], high[column] = value - width, value + width
+
+        band(0, subject.get('bedrooms'), criteria.bedroom_band)
+        band(1, subject.get('bathrooms'), criteria.bathroom_band)
+        square_feet = subject.get('square_feet')
+        if square_feet and criteria.square_feet_band is not None:
+            band(2, square_feet, float(square_feet) * criteria.square_feet_band)
+        band(3, subject.get('year_built'), criteria.year_built_band)
+
+        today = _to_day(date.today() if as_of is None else as_of)
+        high[4] = today
+        if criteria.recency_days is not None:
+            low[4] = today - criteria.recency_days
+        return low, high
+
+    def _build(self, points: np.ndarray, start: int, end: int) -> int:
+        """
+        Builds the KD-tree node for sales ``_order[start:end]``
+
+        Returns:
+            Node index
+        """
+        indices = self._order[start:end]
+        node_points = points[indices]
+        lo, hi = node_points.min(axis=0), node_points.max(axis=0)
+
+        node = len(self._starts)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._lo.append(tuple(lo.tolist()))
+        self._hi.append(tuple(hi.tolist()))
+        self._children.append(None)
+
+        if end - start > self.leaf_size:
+            # Split at the median of the widest dimension
+            dim = int(np.argmax(hi - lo))
+            mid = (end - start) // 2
+            partition = np.argpartition(node_points[:, dim], mid)
+            self._order[start:end] = indices[partition]
+            left = self._build(points, start, start + mid)
+            right = self._build(points, start + mid, end)
+            self._children[node] = (left, right)
+        return node
+
+    def _box_distance2(self, node: int, point: tuple) -> float:
+        """Squared distance from a point to a node's bounding box"""
+        total = 0.0
+        for p, lo, hi in zip(point, self._lo[node], self._hi[node]):
+            if p < lo:
+                total += (lo - p) ** 2
+            elif p > hi:
+                total += (p - hi) ** 2
+        return total
+
+    def _nearest(self, point: np.ndarray, k: int, low: np.ndarray, high: np.ndarray, bound2: float) -> tuple:
+        """
+        Best-first KD-tree search for the k nearest sales passing the bands
+
+        Args:
+            point: Projected query point
+            k: Number of neighbours
+            low: Lower attribute bounds
+            high: Upper attribute bounds
+            bound2: Squared maximum chord distance
+
+        Returns:
+            Tuple of (tree-order indices, chord distances), nearest first
+        """
+        point_tuple = tuple(point.tolist())
+        best_d2 = np.empty(0)
+        best_index = np.empty(0, dtype=np.int64)
+        worst = bound2
+        heap = [(self._box_distance2(0, point_tuple), 0)]
+
+        while heap:
+            distance2, node = heapq.heappop(heap)
+            if distance2 > worst:
+                break
+
+            children = self._children[node]
+            if children is not None:
+                for child in children:
+                    child_distance2 = self._box_distance2(child, point_tuple)
+                    if child_distance2 <= worst:
+                        heapq.heappush(heap, (child_distance2, child))
+                continue
+
+            start, end = self._starts[node], self._ends[node]
+            diff = self._points[start:end] - point
+            d2 = np.einsum('ij,ij->i', diff, diff)
+            attributes = self._attributes[start:end]
+            passing = (d2 <= worst) & ((attributes >= low) & (attributes <= high)).all(axis=1)
+            if not passing.any():
+                continue
+
+            best_d2 = np.concatenate([best_d2, d2[passing]])
+            best_index = np.concatenate([best_index, np.flatnonzero(passing) + start])
+            if len(best_d2) > k:
+                keep = np.argpartition(best_d2, k - 1)[:k]
+                best_d2, best_index = best_d2[keep], best_index[keep]
+            if len(best_d2) == k:
+                worst = min(worst, float(best_d2.max()))
+
+        order = np.argsort(best_d2, kind='stable')
+        return best_index[order], np.sqrt(best_d2[order])
+
+    def _results(self, indices: np.ndarray, chords: np.ndarray) -> List[Dict[str, Any]]:
+        """Builds the result dicts for matched sales"""
+        results = []
+        for index, miles in zip(indices.tolist(), _chord_to_miles(chords).tolist()):
+            sale = dict(self._records[index])
+            sale['sale_date'] = str(sale['sale_date'])[:10]
+            sale['distance_miles'] = round(miles, 2)
+            results.append(sale)
+        return results
+
+
+_default_store = None
+_default_store_loaded = False
+_default_lock = threading.Lock()
+
+
+def get_default_comparables_store() -> Optional[ComparablesStore]:
+    """Returns the process-wide comparables store, or None if COMPARABLES_PATH does not exist"""
+    global _default_store, _default_store_loaded
+    with _default_lock:
+        if not _default_store_loaded:
+            _default_store = ComparablesStore.from_csv(COMPARABLES_PATH) if os.path.exists(COMPARABLES_PATH) else None
+            _default_store_loaded = True
+        return _default_store
@@ -9,13 +9,6 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-print("\nLoading environment variables in FreeSourcesConfig:")
-print(f"CENSUS_API_KEY: {os.getenv('CENSUS_API_KEY')}")
-print(f"WALK_SCORE_API_KEY: {os.getenv('WALK_SCORE_API_KEY')}")
-print(f"HUD_API_KEY: {os.getenv('HUD_API_KEY')}")
-print(f"DATA_GOV_API_KEY: {os.getenv('DATA_GOV_API_KEY')}")
-print(f"BLS_API_KEY: {os.getenv('BLS_API_KEY')}")
-
 class FreeSourcesConfig:
     """Configuration class for free data sources."""
     
@@ -29,15 +22,6 @@ class FreeSourcesConfig:
     BLS_API_KEY = os.getenv('BLS_API_KEY', '')
     PROPERTY_API_KEY = os.getenv('PROPERTY_API_KEY', 'demo_key')  # Add property API key with demo_key as default
     
-    print("\nInitializing FreeSourcesConfig class variables:")
-    print(f"CENSUS_API_KEY: {CENSUS_API_KEY}")
-    print(f"WALK_SCORE_API_KEY: {WALK_SCORE_API_KEY}")
-    print(f"HUD_API_KEY: {HUD_API_KEY}")
-    print(f"EPA_API_KEY: {EPA_API_KEY}")
-    print(f"NOAA_API_KEY: {NOAA_API_KEY}")
-    print(f"DATA_GOV_API_KEY: {DATA_GOV_API_KEY}")
-    print(f"BLS_API_KEY: {BLS_API_KEY}")
-    
     # Census Bureau API
     CENSUS_API = {
         'base_url': 'https://api.census.gov/data/2020/dec/pl',
@@ -300,14 +284,6 @@ class FreeSourcesConfig:
             'irs_apis': cls.IRS_APIS,
             'usps_apis': cls.USPS_APIS
         }
-        print("\nReturning configuration from get_config():")
-        print(f"census_api_key: {config['census_api_key']}")
-        print(f"walk_score_api_key: {config['walk_score_api_key']}")
-        print(f"hud_api_key: {config['hud_api_key']}")
-        print(f"epa_api_key: {config['epa_api_key']}")
-        print(f"noaa_api_key: {config['noaa_api_key']}")
-        print(f"data_gov_api_key: {config['data_gov_api_key']}")
-        print(f"bls_api_key: {config['bls_api_key']}")
         return config
     
     @classmethod
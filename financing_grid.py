@@ -0,0 +1,36 @@
+"""
+Financing Scenario Grid for Real Estate Valuation and Negotiation Strategist
+
+This module evaluates every combination of down payment, interest rate, loan
+term and discount points for a property in one NumPy broadcast. Month-by-month
+amortization schedules are available for the whole grid as a 3-D array, and are
+only computed when first requested.
+
+The engine lives in the backend package, whose image is built from the backend
+directory alone; this module re-exports it for the Flask app and the analysis
+graph.
+"""
+
+from real_estate_analysis.backend.app.services.financing_grid import (
+    DEFAULT_DOWN_PAYMENT_PERCENTS,
+    DEFAULT_INTEREST_RATES,
+    DEFAULT_LOAN_TERMS,
+    DEFAULT_POINTS,
+    SCHEDULE_FIELDS,
+    MAX_GRID_SCENARIOS,
+    MAX_SCHEDULE_SCENARIOS,
+    FinancingGrid,
+    build_financing_grid
+)
+
+__all__ = [
+    'DEFAULT_DOWN_PAYMENT_PERCENTS',
+    'DEFAULT_INTEREST_RATES',
+    'DEFAULT_LOAN_TERMS',
+    'DEFAULT_POINTS',
+    'SCHEDULE_FIELDS',
+    'MAX_GRID_SCENARIOS',
+    'MAX_SCHEDULE_SCENARIOS',
+    'FinancingGrid',
+    'build_financing_grid'
+]
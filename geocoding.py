@@ -0,0 +1,388 @@
+"""
+Geocoding Support for Real Estate Valuation and Negotiation Strategist
+
+This module provides address canonicalization, a persistent geocode cache and an
+offline ZIP/ZCTA-centroid table used when the online geocoder is unavailable.
+"""
+
+import os
+import re
+import csv
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+# Cache settings (should be stored in environment variables)
+GEOCODE_CACHE_PATH = os.getenv("GEOCODE_CACHE_PATH", os.path.join("data", "geocode_cache.sqlite3"))
+GEOCODE_CACHE_TTL = int(os.getenv("GEOCODE_CACHE_TTL", str(365 * 86400)))  # Addresses rarely move
+GEOCODE_NEGATIVE_TTL = int(os.getenv("GEOCODE_NEGATIVE_TTL", "86400"))  # Retry unknown addresses daily
+ZIP_CENTROIDS_PATH = os.getenv("ZIP_CENTROIDS_PATH", os.path.join("data", "zcta_centroids.txt"))
+
+# Common street suffix and directional abbreviations (USPS Publication 28)
+STREET_ABBREVIATIONS = {
+    'STREET': 'ST', 'AVENUE': 'AVE', 'BOULEVARD': 'BLVD', 'DRIVE': 'DR', 'LANE': 'LN',
+    'ROAD': 'RD', 'COURT': 'CT', 'PLACE': 'PL', 'TERRACE': 'TER', 'CIRCLE': 'CIR',
+    'PARKWAY': 'PKWY', 'HIGHWAY': 'HWY', 'SQUARE': 'SQ', 'TRAIL': 'TRL', 'WAY': 'WAY',
+    'NORTH': 'N', 'SOUTH': 'S', 'EAST': 'E', 'WEST': 'W',
+    'NORTHEAST': 'NE', 'NORTHWEST': 'NW', 'SOUTHEAST': 'SE', 'SOUTHWEST': 'SW',
+    'APARTMENT': 'APT', 'SUITE': 'STE', 'UNIT': 'UNIT', '#': 'UNIT'
+}
+
+ZIP_PATTERN = re.compile(r'\b(\d{5})(?:-\d{4})?\s*$')
+# A unit designator followed by a unit identifier (one with a digit, or a single letter)
+_UNIT = r'(?:#|\b(?:APT|APARTMENT|UNIT|SUITE|STE)\b\.?)\s*(?:(?=[\w-]*\d)[\w-]+|[A-Z])'
+# Unit at the end of the street line ("20 Oak Ave Apt 1"); the street needs a
+# number and a name before it, so "5 Unit Rd" is a street, not a unit
+STREET_UNIT_PATTERN = re.compile(r'^(?P<street>\s*\S+\s+\S.*?)\s*' + _UNIT + r'\s*$', re.IGNORECASE)
+# Unit as its own part right after the street line ("20 Oak Ave, Suite 200, ...")
+UNIT_PART_PATTERN = re.compile(r'^\s*' + _UNIT + r'\s*$', re.IGNORECASE)
+
+
+def canonical_address(address: str) -> str:
+    """
+    Builds the canonical form of an address used as a cache key
+
+    Case, punctuation, whitespace, ZIP+4 extensions and common street suffix
+    spellings are normalized, so "123 Main Street, Springfield, IL 62701-1234"
+    and "123 main st,  springfield, il 62701" share a key.
+
+    Args:
+        address: The address string to canonicalize
+
+    Returns:
+        str: Canonical address
+    """
+    address = address.upper().replace('#', ' # ')
+    address = re.sub(r'(\d{5})-\d{4}\b', r'\1', address)
+
+    parts = []
+    for part in address.split(','):
+        words = re.sub(r'[^\w\s#]', ' ', part).split()
+        words = [STREET_ABBREVIATIONS.get(word, word) for word in words]
+        if words:
+            parts.append(' '.join(words))
+
+    return ', '.join(parts)
+
+
+def strip_unit(address: str) -> str:
+    """
+    Removes the unit designator (apartment, suite, unit or "#") from an address
+
+    Only a designator followed by a unit identifier is removed, and only at
+    the end of the street line or as the part right after it, so street and
+    city names such as "Unit Rd" or "Ste. Genevieve" are left alone.
+
+    Args:
+        address: The address string
+
+    Returns:
+        str: Address of the building the unit belongs to
+    """
+    parts = address.split(',')
+    match = STREET_UNIT_PATTERN.match(parts[0])
+    if match:
+        parts[0] = match.group('street')
+    if len(parts) > 2 and UNIT_PART_PATTERN.match(parts[1]):
+        del parts[1]
+    return ','.join(parts)
+
+
+def building_key(address: str) -> str:
+    """
+    Builds the canonical address of the building, ignoring any unit
+
+    Different units of the same building share a building key, and therefore
+    share coordinates.
+
+    Args:
+        address: The address string
+
+    Returns:
+        str: Canonical building address
+    """
+    return canonical_address(strip_unit(address))
+
+
+def extract_zip_code(address: str) -> Optional[str]:
+    """
+    Extracts the 5-digit ZIP code from the end of an address
+
+    Args:
+        address: The address string
+
+    Returns:
+        ZIP code, or None if the address does not end with one
+    """
+    match = ZIP_PATTERN.search(address.strip())
+    return match.group(1) if match else None
+
+
+def parse_address_components(address: str) -> Dict[str, str]:
+    """
+    Extracts city, state and ZIP components from a "street, city, ST 12345" address
+
+    Args:
+        address: The address string
+
+    Returns:
+        Dict containing whichever of city, state_code and zip_code could be parsed
+    """
+    components = {}
+    parts = [part.strip() for part in address.split(',')]
+
+    zip_code = extract_zip_code(address)
+    if zip_code:
+        components['zip_code'] = zip_code
+
+    if len(parts) >= 3:
+        components['city'] = parts[-2]
+        state_match = re.match(r'^([A-Za-z]{2})\b', parts[-1])
+        if state_match:
+            components['state_code'] = state_match.group(1).upper()
+
+    return components
+
+
+class GeocodeCache:
+    """
+    Persistent geocode cache keyed by canonical address
+
+    Results are stored in SQLite so they survive restarts and can be shared by
+    every worker on the host. Successful lookups use a long TTL; addresses the
+    geocoder could not resolve are cached for a shorter period.
+    """
+
+    def __init__(self,
+                 path: str = None,
+                 ttl: int = None,
+                 negative_ttl: int = None):
+        """
+        Initialize the GeocodeCache
+
+        Args:
+            path: SQLite database path (":memory:" for a process-local cache)
+            ttl: Seconds to keep successful geocoding results
+            negative_ttl: Seconds to keep "address not found" results
+        """
+        self.path = path or GEOCODE_CACHE_PATH
+        self.ttl = GEOCODE_CACHE_TTL if ttl is None else ttl
+        self.negative_ttl = GEOCODE_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        self._lock = threading.Lock()
+
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            if self.path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS geocodes (
+                    address_key TEXT PRIMARY KEY,
+                    zip_code TEXT,
+                    latitude REAL,
+                    longitude REAL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_geocodes_zip ON geocodes (zip_code)')
+
+    def get(self, address_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a cached geocoding result
+
+        Args:
+            address_key: Canonical address
+
+        Returns:
+            Cached geocoding result, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT result FROM geocodes WHERE address_key = ? AND expires_at > ?',
+                (address_key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, address_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Looks up many cached geocoding results at once
+
+        Args:
+            address_keys: Canonical addresses
+
+        Returns:
+            Dict mapping each cached, unexpired key to its geocoding result
+        """
+        address_keys = list(dict.fromkeys(address_keys))
+        now = time.time()
+        found = {}
+
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(address_keys), 500):
+                batch = address_keys[start:start + 500]
+                placeholders = ', '.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f'SELECT address_key, result FROM geocodes '
+                    f'WHERE address_key IN ({placeholders}) AND expires_at > ?',
+                    (*batch, now)
+                ).fetchall()
+                found.update((key, json.loads(result)) for key, result in rows)
+
+        return found
+
+    def set(self, address_key: str, result: Dict[str, Any]) -> None:
+        """
+        Stores a geocoding result
+
+        Args:
+            address_key: Canonical address
+            result: Geocoding result as returned by AddressProcessor.geocode_address
+        """
+        now = time.time()
+        ttl = self.ttl if result.get('success', False) else self.negative_ttl
+        coordinates = result.get('coordinates', {})
+        zip_code = result.get('components', {}).get('zip_code') or extract_zip_code(address_key)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO geocodes VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (
+                    address_key,
+                    zip_code,
+                    coordinates.get('latitude'),
+                    coordinates.get('longitude'),
+                    json.dumps(result),
+                    now,
+                    now + ttl
+                )
+            )
+
+    def zip_centroid(self, zip_code: str) -> Optional[Tuple[float, float]]:
+        """
+        Computes the centroid of cached, successfully geocoded addresses in a ZIP code
+
+        Args:
+            zip_code: 5-digit ZIP code
+
+        Returns:
+            (latitude, longitude) tuple, or None if no address in the ZIP is cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT AVG(latitude), AVG(longitude) FROM geocodes '
+                'WHERE zip_code = ? AND latitude IS NOT NULL',
+                (zip_code,)
+            ).fetchone()
+        return (row[0], row[1]) if row and row[0] is not None else None
+
+    def purge_expired(self) -> int:
+        """
+        Deletes expired entries
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute('DELETE FROM geocodes WHERE expires_at <= ?', (time.time(),))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Closes the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class ZipCentroidTable:
+    """
+    Offline ZIP/ZCTA centroid lookup
+
+    Reads either the Census Gazetteer ZCTA file (tab-separated with GEOID,
+    INTPTLAT and INTPTLONG columns) or a simple CSV with zip_code, latitude and
+    longitude columns. The file is loaded lazily on first lookup; a missing file
+    simply yields no centroids.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Initialize the ZipCentroidTable
+
+        Args:
+            path: Path to the centroid file
+        """
+        self.path = path or ZIP_CENTROIDS_PATH
+        self._centroids: Optional[Dict[str, Tuple[float, float]]] = None
+        self._lock = threading.Lock()
+
+    def lookup(self, zip_code: str) -> Optional[Tuple[float, float]]:
+        """
+        Looks up the centroid of a ZIP code
+
+        Args:
+            zip_code: 5-digit ZIP code
+
+        Returns:
+            (latitude, longitude) tuple, or None if the ZIP code is unknown
+        """
+        if self._centroids is None:
+            with self._lock:
+                if self._centroids is None:
+                    self._centroids = self._load()
+        return self._centroids.get(zip_code)
+
+    def _load(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Loads the centroid file
+
+        Returns:
+            Dict mapping ZIP code to (latitude, longitude)
+        """
+        if not os.path.exists(self.path):
+            return {}
+
+        with open(self.path, newline='', encoding='utf-8') as f:
+            sample = f.readline()
+            f.seek(0)
+            reader = csv.DictReader(f, delimiter='\t' if '\t' in sample else ',')
+
+            centroids = {}
+            for row in reader:
+                row = {key.strip().lower(): value.strip() for key, value in row.items() if key}
+                zip_code = row.get('geoid') or row.get('zcta') or row.get('zip_code') or row.get('zip')
+                latitude = row.get('intptlat') or row.get('latitude') or row.get('lat')
+                longitude = row.get('intptlong') or row.get('longitude') or row.get('lon') or row.get('lng')
+                try:
+                    centroids[zip_code.zfill(5)] = (float(latitude), float(longitude))
+                except (AttributeError, TypeError, ValueError):
+                    continue
+
+        return centroids
+
+
+_default_cache = None
+_default_centroid_table = None
+_defaults_lock = threading.Lock()
+
+
+def get_default_cache() -> GeocodeCache:
+    """Returns the process-wide geocode cache"""
+    global _default_cache
+    with _defaults_lock:
+        if _default_cache is None:
+            _default_cache = GeocodeCache()
+        return _default_cache
+
+
+def get_default_centroid_table() -> ZipCentroidTable:
+    """Returns the process-wide ZIP centroid table"""
+    global _default_centroid_table
+    with _defaults_lock:
+        if _default_centroid_table is None:
+            _default_centroid_table = ZipCentroidTable()
+        return _default_centroid_table
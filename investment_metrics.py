@@ -0,0 +1,652 @@
+"""
+Investment Metrics Engine for Real Estate Valuation and Negotiation Strategist
+
+This module computes rental income, operating expenses, financing scenarios and
+investment rules for many properties at once using NumPy broadcasting. Results
+are columnar: every metric is an array with one entry per property (and one
+column per financing scenario where applicable). It also provides vectorized
+IRR/NPV solvers and returns by hold period.
+"""
+
+from typing import TYPE_CHECKING, Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Rent and operating expense assumptions are shared with the backend's financing grid
+from real_estate_analysis.backend.app.services.investment_assumptions import (
+    BASE_RENT_RATIO,
+    PROPERTY_TYPE_RENT_FACTORS,
+    MARKET_TYPE_RENT_FACTORS,
+    DEFAULT_TAX_RATE,
+    INSURANCE_RATE,
+    MAINTENANCE_RATE,
+    MANAGEMENT_FEE_RATE,
+    VACANCY_RATE
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Financing scenarios: (name, down payment fraction, loan fraction, interest rate %, term in years).
+# Higher down payments get slightly better rates.
+FINANCING_SCENARIOS: Tuple[Tuple[str, float, float, float, int], ...] = (
+    ('twenty_percent_down', 0.2, 0.8, 6.25, 30),
+    ('twenty_five_percent_down', 0.25, 0.75, 6.15, 30),
+    ('thirty_percent_down', 0.3, 0.7, 6.0, 30),
+    ('all_cash', 1.0, 0.0, 0, 0)
+)
+# Scenario used for the break-even ratio
+REFERENCE_SCENARIO = 'twenty_percent_down'
+
+# Appreciation projections: (name, annual rate, horizons in years)
+APPRECIATION_SCENARIOS = (
+    ('conservative_2%', 1.02),
+    ('moderate_3%', 1.03),
+    ('optimistic_4%', 1.04)
+)
+APPRECIATION_HORIZONS = (5, 10)
+
+
+def _lookup_factors(values: Optional[Sequence[str]], factors: Dict[str, float], size: int) -> np.ndarray:
+    """
+    Maps category labels to numeric factors (1.0 for unknown labels)
+
+    Args:
+        values: Category label per property, or None
+        factors: Factor for each known label
+        size: Number of properties
+
+    Returns:
+        Array of factors
+    """
+    if values is None:
+        return np.ones(size)
+    labels, inverse = np.unique(np.asarray(values, dtype=object).astype(str), return_inverse=True)
+    return np.array([factors.get(label, 1.0) for label in labels])[inverse]
+
+
+def safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divides element-wise, returning 0 where the denominator is not positive"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator > 0, numerator / denominator, 0.0)
+
+
+def irr(cash_flows: np.ndarray, max_iterations: int = 50, tolerance: float = 1e-9) -> np.ndarray:
+    """
+    Computes the internal rate of return of many cash flow series at once
+
+    The NPV is a polynomial in the discount factor v = 1 / (1 + r), so it and
+    its derivative are evaluated with Horner's rule instead of a power per cash
+    flow. Newton's method runs on every series together; series where it fails
+    to converge (or leaves the valid range) are solved by bisection instead.
+
+    Args:
+        cash_flows: Array of shape (..., periods); period 0 is the initial
+            investment (negative)
+        max_iterations: Newton iterations before falling back to bisection
+        tolerance: Convergence tolerance on the discount factor
+
+    Returns:
+        Array of shape (...) with the periodic IRR (NaN where no IRR exists)
+    """
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    flows = _period_major(cash_flows)
+
+    factor = _initial_discount_factor(flows)
+    converged = np.zeros(flows.shape[1], dtype=bool)
+
+    # Newton iterations; once most series have converged the rest are
+    # compacted so later iterations only touch unconverged series
+    active = np.arange(flows.shape[1])
+    active_flows, active_factor = flows, factor.copy()
+    done = np.zeros(flows.shape[1], dtype=bool)
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        for _ in range(max_iterations):
+            present_value, derivative = _npv_polynomial(active_flows, active_factor)
+            step = present_value / derivative
+            active_factor = np.where(done, active_factor, active_factor - step)
+            done |= (np.abs(step) < tolerance) | ~np.isfinite(active_factor)
+            if done.all() or done.mean() > 0.5:
+                factor[active[done]] = active_factor[done]
+                converged[active[done]] = np.isfinite(active_factor[done])
+                if done.all():
+                    break
+                active, active_flows, active_factor = active[~done], active_flows[:, ~done], active_factor[~done]
+                done = done[~done]
+        else:
+            factor[active] = active_factor
+            converged[active[done]] = np.isfinite(active_factor[done])
+
+        rate = 1 / factor - 1
+
+    # Bisection for series Newton could not solve
+    unresolved = ~(converged & np.isfinite(rate) & (factor > 0))
+    if unresolved.any():
+        rate[unresolved] = _irr_bisection(flows[:, unresolved])
+
+    return rate.reshape(cash_flows.shape[:-1])
+
+
+def _period_major(cash_flows: np.ndarray) -> np.ndarray:
+    """
+    Lays cash flows out as (periods, series) so each Horner step reads a contiguous row
+
+    No copy is made when ``cash_flows`` is already a period-major array viewed
+    with the period axis moved last.
+
+    Args:
+        cash_flows: Array of shape (..., periods)
+
+    Returns:
+        Array of shape (periods, series)
+    """
+    return np.ascontiguousarray(np.moveaxis(cash_flows, -1, 0).reshape(cash_flows.shape[-1], -1))
+
+
+def _initial_discount_factor(flows: np.ndarray) -> np.ndarray:
+    """
+    Estimates a starting discount factor for Newton's method
+
+    The multiple of money returned, spread evenly over the life of the cash
+    flows, gives a rate close to the IRR for typical investment profiles; this
+    avoids the slow convergence of a fixed starting point on long series.
+
+    Args:
+        flows: Cash flows of shape (periods, series)
+
+    Returns:
+        Discount factor per series
+    """
+    periods = flows.shape[0]
+    last_period = periods - 1 - np.argmax(flows[::-1] != 0, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        multiple = flows[1:].sum(axis=0) / -flows[0]
+        rate = multiple ** (1 / np.maximum(last_period, 1)) - 1
+    rate = np.where(np.isfinite(rate) & (multiple > 0), np.clip(rate, -0.9, 1.0), 0.1)
+    return 1 / (1 + rate)
+
+
+def _npv_polynomial(flows: np.ndarray, factor: np.ndarray) -> tuple:
+    """
+    Evaluates NPV and its derivative with respect to the discount factor
+
+    Args:
+        flows: Cash flows of shape (periods, series)
+        factor: Discount factor per series
+
+    Returns:
+        Tuple of (npv, derivative) arrays
+    """
+    present_value = flows[-1].copy()
+    derivative = np.zeros_like(present_value)
+    for period in range(flows.shape[0] - 2, -1, -1):
+        derivative *= factor
+        derivative += present_value
+        present_value *= factor
+        present_value += flows[period]
+    return present_value, derivative
+
+
+def _irr_bisection(flows: np.ndarray, iterations: int = 100) -> np.ndarray:
+    """
+    Solves IRR by bisection for rates in (-0.99, 10)
+
+    Args:
+        flows: Cash flows of shape (periods, series)
+        iterations: Bisection steps
+
+    Returns:
+        IRR per series (NaN where the NPV has no root in the bracket)
+    """
+    # Bracket on the discount factor: r = 10 -> 1/11, r = -0.99 -> 100
+    low = np.full(flows.shape[1], 1 / 11)
+    high = np.full(flows.shape[1], 100.0)
+
+    npv_low = _npv_polynomial(flows, low)[0]
+    bracketed = np.sign(npv_low) != np.sign(_npv_polynomial(flows, high)[0])
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        npv_mid = _npv_polynomial(flows, mid)[0]
+        same_side = np.sign(npv_mid) == np.sign(npv_low)
+        low = np.where(same_side, mid, low)
+        npv_low = np.where(same_side, npv_mid, npv_low)
+        high = np.where(same_side, high, mid)
+
+    return np.where(bracketed, 1 / ((low + high) / 2) - 1, np.nan)
+
+
+def npv(rate: float, cash_flows: np.ndarray) -> np.ndarray:
+    """
+    Computes the net present value of many cash flow series at once
+
+    Args:
+        rate: Periodic discount rate
+        cash_flows: Array of shape (..., periods); period 0 is undiscounted
+
+    Returns:
+        Array of shape (...) with the NPV of each series
+    """
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    flows = _period_major(cash_flows)
+    factor = np.full(flows.shape[1], 1 / (1 + rate))
+    return _npv_polynomial(flows, factor)[0].reshape(cash_flows.shape[:-1])
+
+
+class InvestmentMetrics:
+    """
+    Columnar investment metrics for a batch of properties
+
+    Per-property metrics are 1-D arrays of length N. Financing metrics are
+    N x S arrays, with one column per entry in ``scenario_names``.
+    """
+
+    def __init__(self,
+                 columns: Dict[str, np.ndarray],
+                 scenario_names: Tuple[str, ...],
+                 rental_demands: np.ndarray,
+                 price_growth_rates: np.ndarray):
+        """
+        Initialize the InvestmentMetrics
+
+        Args:
+            columns: Metric name to array
+            scenario_names: Financing scenario name for each scenario column
+            rental_demands: Rental demand label per property
+            price_growth_rates: Annual price growth rate per property
+        """
+        self.columns = columns
+        self.scenario_names = scenario_names
+        self.rental_demands = rental_demands
+        self.price_growth_rates = price_growth_rates
+
+    def __len__(self) -> int:
+        return len(self.columns['property_value'])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def scenario(self, name: str, metric: str) -> np.ndarray:
+        """
+        Returns one financing metric for one scenario
+
+        Args:
+            name: Financing scenario name (e.g. 'twenty_percent_down')
+            metric: Financing metric (e.g. 'cash_on_cash_return')
+
+        Returns:
+            Array with one value per property
+        """
+        return self.columns[metric][:, self.scenario_names.index(name)]
+
+    def to_frame(self) -> 'pd.DataFrame':
+        """
+        Flattens the metrics into a DataFrame with one row per property
+
+        Financing metrics become ``<scenario>.<metric>`` columns.
+
+        Returns:
+            DataFrame of investment metrics
+        """
+        data = {}
+        for name, values in self.columns.items():
+            if values.ndim == 1:
+                data[name] = values
+            else:
+                for column, scenario_name in enumerate(self.scenario_names):
+                    data[f'{scenario_name}.{name}'] = values[:, column]
+        import pandas as pd
+        return pd.DataFrame(data)
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        """
+        Builds the investment analysis for one property
+
+        Args:
+            index: Position of the property in the batch
+
+        Returns:
+            Dict in the format returned by PropertyAnalyzer._generate_investment_analysis
+        """
+        c = {name: values[index] for name, values in self.columns.items()}
+        property_value = float(c['property_value'])
+        monthly_rent = float(c['monthly_rent'])
+        annual_rent = float(c['annual_rent'])
+        total_expenses = float(c['total_expenses'])
+        price_growth_rate = float(self.price_growth_rates[index])
+
+        financing_scenarios = {}
+        for column, (name, _, _, interest_rate, term) in enumerate(FINANCING_SCENARIOS):
+            financing_scenarios[name] = {
+                'down_payment': int(c['down_payment'][column]),
+                'loan_amount': int(c['loan_amount'][column]),
+                'interest_rate': interest_rate,
+                'loan_term_years': term,
+                'monthly_mortgage': int(c['monthly_mortgage'][column]),
+                'monthly_cash_flow': int(c['monthly_cash_flow'][column]),
+                'annual_cash_flow': int(c['annual_cash_flow'][column]),
+                'cash_on_cash_return': round(float(c['cash_on_cash_return'][column]), 2)
+            }
+
+        rent_percentage = round(float(c['rent_to_value_percentage']), 2)
+        investment_rules = {
+            'one_percent_rule': {
+                'target': int(c['one_percent_target']),
+                'actual': int(monthly_rent),
+                'actual_percentage': rent_percentage,
+                'compliant': bool(c['one_percent_compliant'])
+            },
+            'two_percent_rule': {
+                'target': int(c['two_percent_target']),
+                'actual': int(monthly_rent),
+                'actual_percentage': rent_percentage,
+                'compliant': bool(c['two_percent_compliant'])
+            },
+            'fifty_percent_rule': {
+                'estimated_operating_expenses': int(annual_rent * 0.5),
+                'actual_operating_expenses': int(total_expenses),
+                'compliant': bool(c['fifty_percent_compliant'])
+            }
+        }
+
+        appreciation_projections = {
+            name: {
+                f'{years}_year': int(c[f'appreciation_{name}_{years}'])
+                for years in APPRECIATION_HORIZONS
+            }
+            for name, _ in APPRECIATION_SCENARIOS
+        }
+
+        return {
+            'financing_scenarios': financing_scenarios,
+            'investment_rules': investment_rules,
+            'break_even_ratio': round(float(c['break_even_ratio']), 2),
+            'appreciation_projections': appreciation_projections,
+            'rental_analysis': {
+                'monthly_rent': int(monthly_rent),
+                'rent_range': {
+                    'low': int(monthly_rent * 0.9),
+                    'high': int(monthly_rent * 1.1)
+                },
+                'annual_rent': int(annual_rent),
+                'gross_rent_multiplier': round(float(c['gross_rent_multiplier']), 1),
+                'rent_to_value_ratio': round(float(c['rent_to_value_ratio']), 1),
+                'operating_expenses': {
+                    'property_tax': int(c['property_tax']),
+                    'insurance': int(c['insurance']),
+                    'maintenance': int(c['maintenance']),
+                    'property_management': int(c['property_management']),
+                    'vacancy_allowance': int(c['vacancy_allowance']),
+                    'total_expenses': int(total_expenses)
+                },
+                'net_operating_income': int(c['net_operating_income']),
+                'cap_rate': round(float(c['cap_rate']), 2),
+                'rental_demand': str(self.rental_demands[index]).lower(),
+                'rental_growth_potential': 'high' if price_growth_rate > 0.05 else 'moderate' if price_growth_rate > 0.02 else 'low'
+            }
+        }
+
+
+def compute_investment_metrics(property_values: Sequence[float],
+                               annual_taxes: Optional[Sequence[float]] = None,
+                               property_types: Optional[Sequence[str]] = None,
+                               market_types: Optional[Sequence[str]] = None,
+                               price_growth_rates: Optional[Sequence[float]] = None,
+                               rental_demands: Optional[Sequence[str]] = None) -> InvestmentMetrics:
+    """
+    Computes investment metrics for a batch of properties
+
+    Args:
+        property_values: Property value per property
+        annual_taxes: Annual property tax per property (NaN or None falls back
+            to 1% of value)
+        property_types: Property type per property (e.g. 'Condo')
+        market_types: Market type per property ('seller', 'buyer' or 'balanced')
+        price_growth_rates: Annual price growth rate per property (default 3%)
+        rental_demands: Rental demand label per property (default 'moderate')
+
+    Returns:
+        InvestmentMetrics with one entry per property
+    """
+    value = np.asarray(property_values, dtype=float)
+    size = len(value)
+
+    # Estimate monthly rent and adjust for property type and market
+    monthly_rent = value * BASE_RENT_RATIO
+    monthly_rent = monthly_rent * _lookup_factors(property_types, PROPERTY_TYPE_RENT_FACTORS, size)
+    monthly_rent = monthly_rent * _lookup_factors(market_types, MARKET_TYPE_RENT_FACTORS, size)
+    annual_rent = monthly_rent * 12
+
+    # Operating expenses
+    if annual_taxes is None:
+        property_tax = value * DEFAULT_TAX_RATE
+    else:
+        taxes = np.asarray(annual_taxes, dtype=float)
+        property_tax = np.where(np.isnan(taxes), value * DEFAULT_TAX_RATE, taxes)
+    insurance = value * INSURANCE_RATE
+    maintenance = value * MAINTENANCE_RATE
+    property_management = annual_rent * MANAGEMENT_FEE_RATE
+    vacancy_allowance = annual_rent * VACANCY_RATE
+    total_expenses = property_tax + insurance + maintenance + property_management + vacancy_allowance
+
+    net_operating_income = annual_rent - total_expenses
+    cap_rate = safe_divide(net_operating_income, value) * 100
+
+    # Financing scenarios, broadcast as N x S
+    names = tuple(scenario[0] for scenario in FINANCING_SCENARIOS)
+    down_fraction = np.array([scenario[1] for scenario in FINANCING_SCENARIOS])
+    loan_fraction = np.array([scenario[2] for scenario in FINANCING_SCENARIOS])
+    monthly_rate = np.array([scenario[3] for scenario in FINANCING_SCENARIOS]) / 1200
+    payments = np.array([scenario[4] for scenario in FINANCING_SCENARIOS]) * 12
+    growth = (1 + monthly_rate) ** payments
+    # Unfinanced scenarios have no payment; avoid 0/0
+    annuity_denominator = np.where(monthly_rate > 0, growth - 1, 1.0)
+
+    down_payment = value[:, None] * down_fraction
+    loan_amount = value[:, None] * loan_fraction
+    monthly_mortgage = loan_amount * monthly_rate * growth / annuity_denominator
+    monthly_cash_flow = monthly_rent[:, None] - (total_expenses / 12)[:, None] - monthly_mortgage
+    annual_cash_flow = monthly_cash_flow * 12
+    cash_on_cash_return = safe_divide(annual_cash_flow, down_payment) * 100
+
+    # Investment rules
+    one_percent_target = value * 0.01
+    two_percent_target = value * 0.02
+    reference_mortgage = monthly_mortgage[:, names.index(REFERENCE_SCENARIO)]
+    break_even_ratio = safe_divide((total_expenses / 12) + reference_mortgage, monthly_rent) * 100
+
+    columns = {
+        'property_value': value,
+        'monthly_rent': monthly_rent,
+        'annual_rent': annual_rent,
+        'property_tax': property_tax,
+        'insurance': insurance,
+        'maintenance': maintenance,
+        'property_management': property_management,
+        'vacancy_allowance': vacancy_allowance,
+        'total_expenses': total_expenses,
+        'net_operating_income': net_operating_income,
+        'cap_rate': cap_rate,
+        'gross_rent_multiplier': safe_divide(value, annual_rent),
+        'rent_to_value_ratio': safe_divide(annual_rent, value) * 100,
+        'rent_to_value_percentage': safe_divide(monthly_rent, value) * 100,
+        'one_percent_target': one_percent_target,
+        'two_percent_target': two_percent_target,
+        'one_percent_compliant': monthly_rent >= one_percent_target,
+        'two_percent_compliant': monthly_rent >= two_percent_target,
+        'fifty_percent_compliant': total_expenses <= annual_rent * 0.5,
+        'break_even_ratio': break_even_ratio,
+        'down_payment': down_payment,
+        'loan_amount': loan_amount,
+        'monthly_mortgage': monthly_mortgage,
+        'monthly_cash_flow': monthly_cash_flow,
+        'annual_cash_flow': annual_cash_flow,
+        'cash_on_cash_return': cash_on_cash_return
+    }
+
+    for name, rate in APPRECIATION_SCENARIOS:
+        for years in APPRECIATION_HORIZONS:
+            columns[f'appreciation_{name}_{years}'] = value * (rate ** years)
+
+    return InvestmentMetrics(
+        columns=columns,
+        scenario_names=names,
+        rental_demands=np.full(size, 'moderate', dtype=object) if rental_demands is None else np.asarray(rental_demands, dtype=object),
+        price_growth_rates=np.full(size, 0.03) if price_growth_rates is None else np.asarray(price_growth_rates, dtype=float)
+    )
+
+
+class HoldPeriodReturns:
+    """
+    Returns by hold period for a batch of properties
+
+    Arrays have shape (N, H), one column per entry in ``hold_years``.
+    """
+
+    def __init__(self,
+                 hold_years: np.ndarray,
+                 cash_flows: np.ndarray,
+                 irr: np.ndarray,
+                 npv: np.ndarray,
+                 equity_multiple: np.ndarray,
+                 discount_rate: float):
+        """
+        Initialize the HoldPeriodReturns
+
+        Args:
+            hold_years: Hold periods evaluated
+            cash_flows: Cash flow matrices of shape (N, H, max hold + 1)
+            irr: Annual IRR per property and hold period
+            npv: NPV at ``discount_rate`` per property and hold period
+            equity_multiple: Total distributions divided by equity invested
+            discount_rate: Discount rate used for the NPV
+        """
+        self.hold_years = hold_years
+        self.cash_flows = cash_flows
+        self.irr = irr
+        self.npv = npv
+        self.equity_multiple = equity_multiple
+        self.discount_rate = discount_rate
+
+    def __len__(self) -> int:
+        return self.irr.shape[0]
+
+    @property
+    def best_hold_years(self) -> np.ndarray:
+        """Hold period with the highest IRR, per property (0 if no IRR exists)"""
+        irr = np.where(np.isnan(self.irr), -np.inf, self.irr)
+        best = self.hold_years[np.argmax(irr, axis=1)]
+        return np.where(np.isnan(self.irr).all(axis=1), 0, best)
+
+    def curve(self, index: int) -> Dict[str, Any]:
+        """
+        Builds the IRR-by-hold-period curve for one property
+
+        Args:
+            index: Position of the property in the batch
+
+        Returns:
+            Dict containing one point per hold period and the best hold period
+        """
+        points = []
+        for column, years in enumerate(self.hold_years):
+            rate = float(self.irr[index, column])
+            points.append({
+                'hold_years': int(years),
+                'irr': round(rate * 100, 2) if np.isfinite(rate) else None,
+                'npv': int(self.npv[index, column]),
+                'equity_multiple': round(float(self.equity_multiple[index, column]), 2)
+            })
+        return {
+            'discount_rate': self.discount_rate,
+            'best_hold_years': int(self.best_hold_years[index]),
+            'curve': points
+        }
+
+
+def compute_hold_period_returns(metrics: InvestmentMetrics,
+                                scenario: str = REFERENCE_SCENARIO,
+                                hold_years: Sequence[int] = range(1, 31),
+                                appreciation_rates: Optional[Sequence[float]] = None,
+                                rent_growth: float = 0.03,
+                                expense_growth: float = 0.025,
+                                selling_cost_rate: float = 0.06,
+                                discount_rate: float = 0.08) -> HoldPeriodReturns:
+    """
+    Computes IRR, NPV and equity multiple for every property and hold period
+
+    Annual cash flows start from the rent, expense and financing figures in
+    ``metrics``: rent-based expenses (management and vacancy) grow with rent,
+    fixed expenses grow with ``expense_growth``, debt service is level, and the
+    property is sold at the end of each hold period. The cash-flow matrices for
+    all properties and hold periods are solved for IRR in one vectorized pass.
+
+    Args:
+        metrics: Investment metrics for the batch
+        scenario: Financing scenario name (see FINANCING_SCENARIOS)
+        hold_years: Hold periods to evaluate, in years
+        appreciation_rates: Annual appreciation per property (defaults to each
+            property's price growth rate)
+        rent_growth: Annual rent growth
+        expense_growth: Annual growth of taxes, insurance and maintenance
+        selling_cost_rate: Selling costs as a fraction of the sale price
+        discount_rate: Annual discount rate for the NPV
+
+    Returns:
+        HoldPeriodReturns with one row per property
+    """
+    hold = np.asarray(list(hold_years), dtype=int)
+    if hold.size == 0 or np.any(hold < 1):
+        raise ValueError("hold_years must contain positive hold periods")
+    column = metrics.scenario_names.index(scenario)
+    _, _, _, interest_rate, term = FINANCING_SCENARIOS[column]
+
+    value = metrics['property_value']
+    appreciation = metrics.price_growth_rates if appreciation_rates is None else np.asarray(appreciation_rates, dtype=float)
+    years = np.arange(1, hold.max() + 1)
+
+    # Annual operating cash flow for every year up to the longest hold, (N, Y)
+    rent_factor = (1 + rent_growth) ** (years - 1)
+    expense_factor = (1 + expense_growth) ** (years - 1)
+    variable_expenses = metrics['property_management'] + metrics['vacancy_allowance']
+    fixed_expenses = metrics['property_tax'] + metrics['insurance'] + metrics['maintenance']
+    operating_income = (
+        (metrics['annual_rent'] - variable_expenses)[:, None] * rent_factor
+        - fixed_expenses[:, None] * expense_factor
+    )
+    debt_service = metrics['monthly_mortgage'][:, column] * 12
+    annual_cash_flow = operating_income - debt_service[:, None]
+
+    # Sale proceeds at the end of each hold period, (N, H)
+    loan = metrics['loan_amount'][:, column]
+    monthly_rate = interest_rate / 1200
+    months_paid = np.minimum(hold * 12, term * 12)
+    if monthly_rate > 0:
+        growth_n = (1 + monthly_rate) ** (term * 12)
+        growth_k = (1 + monthly_rate) ** months_paid
+        balance = loan[:, None] * (growth_n - growth_k) / (growth_n - 1)
+    elif term > 0:
+        balance = loan[:, None] * (1 - months_paid / (term * 12))
+    else:
+        balance = np.zeros((len(value), len(hold)))
+    sale_value = value[:, None] * (1 + appreciation[:, None]) ** hold
+    sale_proceeds = sale_value * (1 - selling_cost_rate) - balance
+
+    # Cash-flow matrices, built period-major (Y + 1, N, H) for the solvers and
+    # exposed as (N, H, Y + 1); years after the sale are zero
+    equity = metrics['down_payment'][:, column]
+    in_hold = years[:, None] <= hold[None, :]
+    period_major = np.zeros((len(years) + 1, len(value), len(hold)))
+    period_major[0] = -equity[:, None]
+    period_major[1:] = np.where(in_hold[:, None, :], annual_cash_flow.T[:, :, None], 0.0)
+    period_major[hold[None, :], np.arange(len(value))[:, None], np.arange(len(hold))[None, :]] += sale_proceeds
+    flows = np.moveaxis(period_major, 0, -1)
+
+    equity_multiple = safe_divide(period_major[1:].sum(axis=0), equity[:, None])
+    return HoldPeriodReturns(
+        hold_years=hold,
+        cash_flows=flows,
+        irr=irr(flows),
+        npv=npv(discount_rate, flows),
+        equity_multiple=equity_multiple,
+        discount_rate=discount_rate
+    )
@@ -0,0 +1,289 @@
+"""
+Monte Carlo Investment Simulation for Real Estate Valuation and Negotiation Strategist
+
+This module simulates thousands of holding-period paths per property, with
+random appreciation, rent growth, vacancy and interest rate changes, and
+reports the resulting IRR, cash-on-cash and probability-of-loss distributions.
+Every property and path is simulated together as NumPy arrays; randomness comes
+from a single seeded ``numpy.random.Generator`` so results are reproducible.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+from investment_metrics import (
+    BASE_RENT_RATIO,
+    DEFAULT_TAX_RATE,
+    INSURANCE_RATE,
+    MAINTENANCE_RATE,
+    MANAGEMENT_FEE_RATE,
+    irr
+)
+
+# Percentiles reported for each distribution
+SUMMARY_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Properties simulated together; small chunks keep the per-year arrays cache-friendly
+SIMULATION_CHUNK_SIZE = 4
+
+
+@dataclass(frozen=True)
+class SimulationAssumptions:
+    """Distribution and financing assumptions for the Monte Carlo simulation"""
+    n_paths: int = 10000
+    hold_years: int = 10
+    appreciation_volatility: float = 0.05
+    rent_growth_mean: float = 0.03
+    rent_growth_volatility: float = 0.03
+    appreciation_rent_correlation: float = 0.5
+    vacancy_mean: float = 0.05
+    vacancy_concentration: float = 40.0  # Beta distribution a + b; higher is less dispersed
+    down_payment_fraction: float = 0.2
+    interest_rate: float = 6.25  # Initial annual rate in percent
+    rate_volatility: float = 0.5  # Annual rate change standard deviation in percentage points
+    adjustable_rate: bool = True  # Payments reset yearly to the simulated rate
+    loan_term_years: int = 30
+    expense_growth: float = 0.025
+    selling_cost_rate: float = 0.06
+
+
+def _summarize(values: np.ndarray, scale: float = 1.0, digits: int = 2) -> Dict[str, Any]:
+    """
+    Summarizes a distribution with its mean, spread and percentiles
+
+    Args:
+        values: Samples (NaN samples are ignored)
+        scale: Multiplier applied before rounding (e.g. 100 for percentages)
+        digits: Decimal places
+
+    Returns:
+        Dict containing mean, std and pNN percentiles
+    """
+    values = values[np.isfinite(values)] * scale
+    if values.size == 0:
+        return {'mean': None, 'std': None, **{f'p{p}': None for p in SUMMARY_PERCENTILES}}
+    percentiles = np.percentile(values, SUMMARY_PERCENTILES)
+    return {
+        'mean': round(float(values.mean()), digits),
+        'std': round(float(values.std()), digits),
+        **{f'p{p}': round(float(v), digits) for p, v in zip(SUMMARY_PERCENTILES, percentiles)}
+    }
+
+
+class SimulationResult:
+    """
+    Simulated outcomes for a batch of properties
+
+    Every array has shape (properties, paths).
+    """
+
+    def __init__(self,
+                 irr: np.ndarray,
+                 cash_on_cash: np.ndarray,
+                 total_profit: np.ndarray,
+                 ending_value: np.ndarray,
+                 equity_invested: np.ndarray,
+                 assumptions: SimulationAssumptions):
+        """
+        Initialize the SimulationResult
+
+        Args:
+            irr: Annual IRR per path
+            cash_on_cash: Average annual cash-on-cash return per path, in percent
+            total_profit: Cash flows plus sale proceeds less equity invested
+            ending_value: Property value at the end of the hold
+            equity_invested: Initial equity per property
+            assumptions: Simulation assumptions used
+        """
+        self.irr = irr
+        self.cash_on_cash = cash_on_cash
+        self.total_profit = total_profit
+        self.ending_value = ending_value
+        self.equity_invested = equity_invested
+        self.assumptions = assumptions
+
+    def __len__(self) -> int:
+        return self.irr.shape[0]
+
+    @property
+    def probability_of_loss(self) -> np.ndarray:
+        """Share of paths that lose money over the hold, per property"""
+        return (self.total_profit < 0).mean(axis=1)
+
+    def summary(self, index: int) -> Dict[str, Any]:
+        """
+        Summarizes the simulated distributions for one property
+
+        Args:
+            index: Position of the property in the batch
+
+        Returns:
+            Dict containing IRR, cash-on-cash, profit and ending value
+            distributions plus the probability of loss
+        """
+        return {
+            'paths': self.assumptions.n_paths,
+            'hold_years': self.assumptions.hold_years,
+            'equity_invested': int(self.equity_invested[index]),
+            'irr': _summarize(self.irr[index], scale=100),
+            'cash_on_cash_return': _summarize(self.cash_on_cash[index]),
+            'total_profit': _summarize(self.total_profit[index], digits=0),
+            'ending_value': _summarize(self.ending_value[index], digits=0),
+            'probability_of_loss': round(float(self.probability_of_loss[index]), 4)
+        }
+
+    def summaries(self) -> List[Dict[str, Any]]:
+        """Summarizes every property in the batch"""
+        return [self.summary(index) for index in range(len(self))]
+
+
+def simulate_investments(property_values: Sequence[float],
+                         monthly_rents: Optional[Sequence[float]] = None,
+                         annual_fixed_expenses: Optional[Sequence[float]] = None,
+                         appreciation_means: Union[float, Sequence[float]] = 0.03,
+                         assumptions: SimulationAssumptions = None,
+                         seed: Union[int, np.random.Generator, None] = None) -> SimulationResult:
+    """
+    Simulates holding-period outcomes for a batch of properties
+
+    Each year of each path draws property appreciation and rent growth
+    (correlated normals), a vacancy rate (beta) and an interest rate change
+    (normal random walk). Adjustable-rate loans re-amortize the remaining
+    balance at the new rate each year. The property is sold at the end of the
+    hold.
+
+    Args:
+        property_values: Purchase price per property
+        monthly_rents: Initial monthly rent per property (defaults to the
+            investment analysis rent estimate)
+        annual_fixed_expenses: Annual taxes, insurance and maintenance per
+            property (defaults to the investment analysis rates); these grow
+            with ``expense_growth``
+        appreciation_means: Expected annual appreciation, per property or shared
+        assumptions: Distribution and financing assumptions
+        seed: Seed or Generator for reproducible results (draws are taken in
+            batch order, so the same seed and batch give the same result)
+
+    Returns:
+        SimulationResult with one row per property
+    """
+    assumptions = assumptions or SimulationAssumptions()
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+    values = np.asarray(property_values, dtype=float)
+    rents = values * BASE_RENT_RATIO if monthly_rents is None else np.asarray(monthly_rents, dtype=float)
+    if annual_fixed_expenses is None:
+        fixed_expenses = values * (DEFAULT_TAX_RATE + INSURANCE_RATE + MAINTENANCE_RATE)
+    else:
+        fixed_expenses = np.asarray(annual_fixed_expenses, dtype=float)
+    appreciation = np.broadcast_to(np.asarray(appreciation_means, dtype=float), values.shape)
+
+    chunks = []
+    for start in range(0, len(values), SIMULATION_CHUNK_SIZE):
+        stop = start + SIMULATION_CHUNK_SIZE
+        chunks.append(_simulate_chunk(
+            values[start:stop], rents[start:stop], fixed_expenses[start:stop],
+            appreciation[start:stop], assumptions, rng
+        ))
+
+    if not chunks:
+        empty = np.empty((0, assumptions.n_paths))
+        return SimulationResult(empty, empty, empty, empty, np.empty(0), assumptions)
+
+    return SimulationResult(
+        *(np.concatenate(arrays) for arrays in zip(*chunks)),
+        assumptions=assumptions
+    )
+
+
+def _simulate_chunk(values: np.ndarray,
+                    rents: np.ndarray,
+                    fixed_expenses: np.ndarray,
+                    appreciation: np.ndarray,
+                    a: SimulationAssumptions,
+                    rng: np.random.Generator) -> tuple:
+    """
+    Simulates one chunk of properties
+
+    Args:
+        values: Purchase prices, shape (N,)
+        rents: Initial monthly rents, shape (N,)
+        fixed_expenses: Initial annual fixed expenses, shape (N,)
+        appreciation: Expected annual appreciation, shape (N,)
+        a: Simulation assumptions
+        rng: Random generator
+
+    Returns:
+        Tuple of (irr, cash_on_cash, total_profit, ending_value, equity) arrays
+    """
+    n, paths, years = len(values), a.n_paths, a.hold_years
+    shape = (years, n, paths)
+
+    # All randomness for the chunk is drawn up front
+    z_value = rng.standard_normal(shape)
+    z_rent = (a.appreciation_rent_correlation * z_value
+              + np.sqrt(1 - a.appreciation_rent_correlation ** 2) * rng.standard_normal(shape))
+    value_growth = 1 + appreciation[None, :, None] + a.appreciation_volatility * z_value
+    rent_growth = 1 + a.rent_growth_mean + a.rent_growth_volatility * z_rent
+    alpha = a.vacancy_mean * a.vacancy_concentration
+    vacancy = rng.beta(alpha, a.vacancy_concentration - alpha, shape)
+    if a.adjustable_rate:
+        rate_changes = rng.normal(0.0, a.rate_volatility, shape)
+        rates = np.maximum(a.interest_rate + np.cumsum(rate_changes, axis=0), 0.0)
+    else:
+        rates = np.full(shape, a.interest_rate)
+
+    # Rent and expense levels for year t are the year-start levels grown t-1 times
+    rent_levels = rents[None, :, None] * 12 * np.cumprod(
+        np.concatenate([np.ones((1, n, paths)), rent_growth[:-1]]), axis=0
+    )
+    expense_growth = (1 + a.expense_growth) ** np.arange(years)
+    fixed = fixed_expenses[None, :, None] * expense_growth[:, None, None]
+    collected = rent_levels * (1 - vacancy)
+    net_operating_income = collected * (1 - MANAGEMENT_FEE_RATE) - fixed
+
+    # Debt service, re-amortizing each year at that year's rate
+    equity = values * a.down_payment_fraction
+    balance = np.broadcast_to(values - equity, (n,))[:, None] * np.ones((1, paths))
+    debt_service = np.empty(shape)
+    for year in range(years):
+        monthly_rate = rates[year] / 1200
+        remaining = (a.loan_term_years - year) * 12
+        if remaining <= 0:
+            debt_service[year] = 0.0
+            balance = np.zeros_like(balance)
+            continue
+        growth = (1 + monthly_rate) ** remaining
+        with np.errstate(divide='ignore', invalid='ignore'):
+            payment = np.where(
+                monthly_rate > 0,
+                balance * monthly_rate * growth / (growth - 1),
+                balance / remaining
+            )
+            growth_12 = (1 + monthly_rate) ** min(12, remaining)
+            balance = np.where(
+                monthly_rate > 0,
+                balance * growth_12 - payment * (growth_12 - 1) / monthly_rate,
+                balance - payment * min(12, remaining)
+            )
+        balance = np.maximum(balance, 0.0)
+        debt_service[year] = payment * 12
+
+    cash_flow = net_operating_income - debt_service
+    ending_value = values[:, None] * np.prod(value_growth, axis=0)
+    sale_proceeds = ending_value * (1 - a.selling_cost_rate) - balance
+
+    flows = np.empty((n, paths, years + 1))
+    flows[..., 0] = -equity[:, None]
+    flows[..., 1:] = np.moveaxis(cash_flow, 0, -1)
+    flows[..., -1] += sale_proceeds
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cash_on_cash = np.where(
+            equity[:, None] > 0, cash_flow.mean(axis=0) / equity[:, None] * 100, 0.0
+        )
+    total_profit = flows.sum(axis=-1)
+
+    return irr(flows), cash_on_cash, total_profit, ending_value, equity
@@ -0,0 +1,345 @@
+"""
+Listing Event Store for Real Estate Valuation and Negotiation Strategist
+
+This module keeps an append-only history of listing events (listed, price
+change, pending, withdrawn, sold) in SQLite, indexed by canonical address and
+ZIP code. Histories are summarized into the signals seller motivation scoring
+uses: cumulative days on market, price cuts, total price reduction and relists
+during the current marketing run. Summaries for a whole batch of addresses are
+read with a single query.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Union
+
+from geocoding import canonical_address, extract_zip_code
+
+# Store location (should be stored in environment variables)
+LISTING_EVENTS_PATH = os.getenv("LISTING_EVENTS_PATH", os.path.join("data", "listing_events.sqlite3"))
+
+EVENT_TYPES = ('list', 'price_change', 'pending', 'withdrawn', 'sold')
+
+# Events that set the asking price
+PRICED_EVENT_TYPES = ('list', 'price_change')
+
+# Events after which the property is on the market (others take it off)
+ACTIVE_EVENT_TYPES = PRICED_EVENT_TYPES
+
+
+def _event_date(value: Union[str, date, datetime]) -> str:
+    """Normalizes an event date to YYYY-MM-DD"""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return date.fromisoformat(str(value)[:10]).isoformat()
+
+
+class ListingHistory(NamedTuple):
+    """
+    Summary of one address's current marketing run
+
+    A run starts with the first 'list' event after the previous sale, so
+    withdrawing and relisting a property continues the same run.
+    """
+    address_key: str
+    status: str  # Type of the latest event
+    listed_date: Optional[str]  # First 'list' event of the run
+    original_list_price: Optional[float]  # Asking price at listed_date
+    current_price: Optional[float]  # Latest asking (or sold) price
+    price_cuts: int  # Times the asking price went down
+    reduction_pct: float  # Reduction from original_list_price to current_price, in percent
+    relist_count: int  # 'list' events after the first
+    event_count: int
+    active_days: int = 0  # Days on market in the run's closed active periods
+    active_since: Optional[str] = None  # Start of the open active period, if still on the market
+
+    def days_on_market(self, as_of: Union[str, date, None] = None) -> Optional[int]:
+        """
+        Cumulative days on market of the run
+
+        Only time while listed counts: the clock stops at a pending,
+        withdrawn or sold event and restarts when the property is relisted.
+
+        Args:
+            as_of: Date to count to (defaults to today)
+
+        Returns:
+            Days on market, or None if the run has no 'list' event
+        """
+        if self.listed_date is None:
+            return None
+        days = self.active_days
+        if self.active_since is not None:
+            end = date.today() if as_of is None else date.fromisoformat(_event_date(as_of))
+            days += max(0, (end - date.fromisoformat(self.active_since)).days)
+        return days
+
+
+def summarize_events(address_key: str, events: List[Dict[str, Any]]) -> ListingHistory:
+    """
+    Summarizes the current marketing run of one address
+
+    Args:
+        address_key: Canonical address
+        events: The address's events in date order, each with event_type,
+            event_date and price
+
+    Returns:
+        ListingHistory of the latest run
+    """
+    # Find where the current run starts: the first listing after the last sale
+    start = 0
+    for i, event in enumerate(events):
+        if event['event_type'] == 'list' and i > 0 and events[i - 1]['event_type'] == 'sold':
+            start = i
+    run = events[start:]
+
+    listed_date = None
+    original_list_price = None
+    current_price = None
+    asking_price = None
+    price_cuts = 0
+    listings = 0
+    active_days = 0
+    active_since = None
+    for event in run:
+        price = event['price']
+        if event['event_type'] in ACTIVE_EVENT_TYPES:
+            if active_since is None:
+                active_since = event['event_date']
+        elif active_since is not None:
+            active_days += max(0, (date.fromisoformat(event['event_date']) - date.fromisoformat(active_since)).days)
+            active_since = None
+        if event['event_type'] == 'list':
+            listings += 1
+            if listed_date is None:
+                listed_date = event['event_date']
+                original_list_price = price
+        if event['event_type'] in PRICED_EVENT_TYPES and price is not None:
+            if asking_price is not None and price < asking_price:
+                price_cuts += 1
+            asking_price = price
+            current_price = price
+        elif event['event_type'] == 'sold' and price is not None:
+            current_price = price
+
+    reduction_pct = 0.0
+    if original_list_price and current_price is not None and current_price < original_list_price:
+        reduction_pct = (original_list_price - current_price) / original_list_price * 100
+
+    return ListingHistory(
+        address_key=address_key,
+        status=run[-1]['event_type'] if run else '',
+        listed_date=listed_date,
+        original_list_price=original_list_price,
+        current_price=current_price,
+        price_cuts=price_cuts,
+        reduction_pct=reduction_pct,
+        relist_count=max(0, listings - 1),
+        event_count=len(run),
+        active_days=active_days,
+        active_since=active_since
+    )
+
+
+class ListingEventStore:
+    """
+    Append-only store of listing events keyed by canonical address
+
+    Events are never updated or deleted (the database rejects both), so the
+    store is a faithful record of what was observed and when.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Initialize the ListingEventStore
+
+        Args:
+            path: SQLite database path (":memory:" for a process-local store)
+        """
+        self.path = path or LISTING_EVENTS_PATH
+        self._lock = threading.Lock()
+
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            if self.path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS listing_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    address_key TEXT NOT NULL,
+                    zip_code TEXT,
+                    event_type TEXT NOT NULL,
+                    event_date TEXT NOT NULL,
+                    price REAL,
+                    recorded_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_listing_events_address ON listing_events (address_key, event_date, id)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_listing_events_zip ON listing_events (zip_code)')
+            for operation in ('UPDATE', 'DELETE'):
+                self._conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS listing_events_no_{operation.lower()}
+                    BEFORE {operation} ON listing_events
+                    BEGIN SELECT RAISE(ABORT, 'listing events are append-only'); END
+                """)
+
+    def append(self,
+               address: str,
+               event_type: str,
+               event_date: Union[str, date, datetime],
+               price: Optional[float] = None) -> None:
+        """
+        Records one listing event
+
+        Args:
+            address: Property address (canonicalized before storing)
+            event_type: One of EVENT_TYPES
+            event_date: Date of the event
+            price: Asking price for 'list' and 'price_change' events, sale
+                price for 'sold' events
+
+        Raises:
+            ValueError: If the event type or date is invalid
+        """
+        self.append_many([{'address': address, 'event_type': event_type, 'event_date': event_date, 'price': price}])
+
+    def append_many(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Records many listing events in one transaction
+
+        Args:
+            events: Dicts with address, event_type, event_date and optional price
+
+        Returns:
+            Number of events recorded
+
+        Raises:
+            ValueError: If an event type or date is invalid (nothing is recorded)
+        """
+        now = time.time()
+        rows = []
+        for event in events:
+            if event['event_type'] not in EVENT_TYPES:
+                raise ValueError(f"Unknown listing event type: {event['event_type']}")
+            price = event.get('price')
+            rows.append((
+                canonical_address(event['address']),
+                extract_zip_code(event['address']),
+                event['event_type'],
+                _event_date(event['event_date']),
+                None if price is None else float(price),
+                now
+            ))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT INTO listing_events (address_key, zip_code, event_type, event_date, price, recorded_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+        return len(rows)
+
+    def events(self, address: str) -> List[Dict[str, Any]]:
+        """
+        Lists the events of one address
+
+        Args:
+            address: Property address
+
+        Returns:
+            List of event dicts (event_type, event_date, price), oldest first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT event_type, event_date, price FROM listing_events '
+                'WHERE address_key = ? ORDER BY event_date, id',
+                (canonical_address(address),)
+            ).fetchall()
+        return [{'event_type': row[0], 'event_date': row[1], 'price': row[2]} for row in rows]
+
+    def histories(self, addresses: Iterable[str]) -> Dict[str, ListingHistory]:
+        """
+        Summarizes the listing histories of many addresses with a single query
+
+        Args:
+            addresses: Property addresses
+
+        Returns:
+            Dict mapping the canonical address of each address with recorded
+            events to its ListingHistory
+        """
+        address_keys = list(dict.fromkeys(canonical_address(address) for address in addresses if address))
+        if not address_keys:
+            return {}
+
+        with self._lock:
+            # The keys travel as one JSON parameter, so any number fits in one query
+            rows = self._conn.execute(
+                'SELECT address_key, event_type, event_date, price FROM listing_events '
+                'WHERE address_key IN (SELECT value FROM json_each(?)) '
+                'ORDER BY address_key, event_date, id',
+                (json.dumps(address_keys),)
+            ).fetchall()
+        return self._summarize_rows(rows)
+
+    def histories_in_zip(self, zip_code: str) -> Dict[str, ListingHistory]:
+        """
+        Summarizes the listing histories of every address in a ZIP code
+
+        Args:
+            zip_code: 5-digit ZIP code
+
+        Returns:
+            Dict mapping canonical address to ListingHistory
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT address_key, event_type, event_date, price FROM listing_events '
+                'WHERE zip_code = ? ORDER BY address_key, event_date, id',
+                (zip_code,)
+            ).fetchall()
+        return self._summarize_rows(rows)
+
+    @staticmethod
+    def _summarize_rows(rows: List[tuple]) -> Dict[str, ListingHistory]:
+        """Groups (address_key, event_type, event_date, price) rows sorted by address and summarizes each"""
+        histories = {}
+        events: List[Dict[str, Any]] = []
+        for i, (address_key, event_type, event_date, price) in enumerate(rows):
+            events.append({'event_type': event_type, 'event_date': event_date, 'price': price})
+            if i + 1 == len(rows) or rows[i + 1][0] != address_key:
+                histories[address_key] = summarize_events(address_key, events)
+                events = []
+        return histories
+
+    def close(self) -> None:
+        """Closes the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+_default_store = None
+_default_store_loaded = False
+_default_lock = threading.Lock()
+
+
+def get_default_listing_event_store() -> Optional[ListingEventStore]:
+    """Returns the process-wide listing event store, or None if LISTING_EVENTS_PATH does not exist"""
+    global _default_store, _default_store_loaded
+    with _default_lock:
+        if not _default_store_loaded:
+            _default_store = ListingEventStore(LISTING_EVENTS_PATH) if os.path.exists(LISTING_EVENTS_PATH) else None
+            _default_store_loaded = True
+        return _default_store
@@ -0,0 +1,177 @@
+"""
+Market Context Cache for Real Estate Valuation and Negotiation Strategist
+
+Market conditions (metrics, cycle, supply/demand, neighborhood and economic
+indicators) depend on the ZIP code, not on the individual property. This module
+caches the ZIP-level market context in memory, keyed by ZIP code and data
+version, so every property in a batch and every later request in the process
+reuses it until its TTL expires.
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+
+# Cache settings (should be stored in environment variables)
+MARKET_CACHE_TTL = int(os.getenv("MARKET_CACHE_TTL", "86400"))  # Market data refreshes daily
+MARKET_CACHE_MAX_ENTRIES = int(os.getenv("MARKET_CACHE_MAX_ENTRIES", "10000"))
+
+
+def copy_market_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copies a market context so callers cannot modify the cached one
+
+    Market contexts are two levels deep (section -> field), with lists as the
+    only mutable values, so this is much cheaper than copy.deepcopy.
+
+    Args:
+        context: Market context to copy
+
+    Returns:
+        Dict containing an independent copy of the context
+    """
+    return {
+        section: {
+            field: list(value) if isinstance(value, list) else value
+            for field, value in fields.items()
+        } if isinstance(fields, dict) else fields
+        for section, fields in context.items()
+    }
+
+
+class MarketContextCache:
+    """
+    In-memory cache of ZIP-level market contexts
+
+    Entries are keyed by (ZIP code, data version) and expire after the TTL.
+    Concurrent requests for the same missing key build the context once; the
+    other threads wait for that result instead of building their own.
+    """
+
+    def __init__(self, ttl: int = None, max_entries: int = None):
+        """
+        Initialize the MarketContextCache
+
+        Args:
+            ttl: Seconds to keep a market context before rebuilding it
+            max_entries: Maximum number of contexts kept (least recently used
+                contexts are evicted first)
+        """
+        self.ttl = MARKET_CACHE_TTL if ttl is None else ttl
+        self.max_entries = MARKET_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._building = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, zip_code: str, data_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a cached market context
+
+        Args:
+            zip_code: ZIP code
+            data_version: Data version the context was built for
+
+        Returns:
+            Cached market context, or None if missing or expired
+        """
+        key = (zip_code, data_version)
+        with self._lock:
+            return self._lookup(key, time.time())
+
+    def set(self, zip_code: str, data_version: str, context: Dict[str, Any]) -> None:
+        """
+        Stores a market context
+
+        Args:
+            zip_code: ZIP code
+            data_version: Data version the context was built for
+            context: Market context
+        """
+        with self._lock:
+            self._store((zip_code, data_version), context, time.time())
+
+    def get_or_build(self,
+                     zip_code: str,
+                     data_version: str,
+                     build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Returns the cached market context, building it on a miss
+
+        Args:
+            zip_code: ZIP code
+            data_version: Data version the context is built for
+            build: Function that builds the market context
+
+        Returns:
+            Dict containing the shared market context (callers must not modify
+            it; see copy_market_context)
+        """
+        key = (zip_code, data_version)
+        while True:
+            with self._lock:
+                context = self._lookup(key, time.time())
+                if context is not None:
+                    self.hits += 1
+                    return context
+                pending = self._building.get(key)
+                if pending is None:
+                    pending = self._building[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # Another thread is building this context; wait, then look again
+            pending.wait()
+
+        try:
+            context = build()
+            with self._lock:
+                self._store(key, context, time.time())
+            return context
+        finally:
+            with self._lock:
+                del self._building[key]
+            pending.set()
+
+    def clear(self) -> None:
+        """Removes every cached market context"""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key: Tuple[str, str], now: float) -> Optional[Dict[str, Any]]:
+        """Returns an unexpired entry and marks it recently used (lock held)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, context = entry
+        if expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return context
+
+    def _store(self, key: Tuple[str, str], context: Dict[str, Any], now: float) -> None:
+        """Stores an entry, evicting the least recently used ones (lock held)"""
+        self._entries[key] = (now + self.ttl, context)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_default_market_cache() -> MarketContextCache:
+    """Returns the process-wide market context cache"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = MarketContextCache()
+        return _default_cache
@@ -0,0 +1,336 @@
+"""
+Negotiation Script Templates for Real Estate Valuation and Negotiation Strategist
+
+This module turns a negotiation strategy into a script (opening statement, key
+points and closing statement). Script text lives in ``string.Template``
+templates compiled once at import; each strategy variant has a function that
+extracts the few values its script needs, and rendered scripts are memoized
+on the variant and those values, so properties with the same parameters share
+one rendering.
+"""
+
+import os
+from functools import lru_cache
+from string import Template
+from typing import Dict, Any, Callable, NamedTuple, Optional, Tuple
+
+# Rendered scripts kept in memory (should be stored in environment variables)
+SCRIPT_CACHE_SIZE = int(os.getenv("NEGOTIATION_SCRIPT_CACHE_SIZE", "4096"))
+
+
+class KeyPoint(NamedTuple):
+    """A key point template and the parameters that control it"""
+    template: Template
+    each: Optional[str] = None  # Parameter holding items; one point per item
+    when: Optional[str] = None  # Parameter that must be truthy for the point to appear
+
+
+class ScriptTemplate(NamedTuple):
+    """Compiled templates for one strategy variant"""
+    opening: Template
+    key_points: Tuple[KeyPoint, ...]
+    closing: Template
+
+
+def _point(text: str, each: str = None, when: str = None) -> KeyPoint:
+    return KeyPoint(Template(text), each, when)
+
+
+def _script(opening: str, key_points: Tuple, closing: str) -> ScriptTemplate:
+    return ScriptTemplate(
+        Template(opening),
+        tuple(point if isinstance(point, KeyPoint) else _point(point) for point in key_points),
+        Template(closing)
+    )
+
+
+# Dollar amounts are pre-formatted with thousands separators; ``$$`` is a literal $
+SCRIPT_TEMPLATES: Dict[Tuple[str, str], ScriptTemplate] = {
+    ('default', 'generic'): _script(
+        "I'm interested in this property and would like to discuss making an offer.",
+        ("Discuss property features", "Ask about seller's timeline", "Mention financing pre-approval"),
+        "I'll prepare a formal offer based on our discussion."
+    ),
+    ('price', 'below_market'): _script(
+        "After carefully analyzing the property and current market conditions, I'd like to make an offer of $$${offer_price}.",
+        (
+            "I've done extensive research on comparable properties in the area",
+            "My offer reflects ${reflects}",
+            _point("This price point works with my investment criteria and budget constraints", when='has_roi_impact')
+        ),
+        "I'm prepared to move forward quickly with this offer and can provide proof of funds or pre-approval."
+    ),
+    ('price', 'incremental'): _script(
+        "I'd like to start the conversation with an offer of $$${offer_price}, though I understand we may need to discuss the price further.",
+        (
+            "I'm flexible and open to finding a price that works for both of us",
+            "I value clear communication throughout the negotiation process",
+            "My initial offer is based on my analysis of the property and market"
+        ),
+        "While $$${offer_price} is my starting point, I'm willing to work with you to find a mutually acceptable price. My absolute maximum budget for this property would be around $$${max_price}."
+    ),
+    ('price', 'price_tiers'): _script(
+        "I'd like to propose a flexible pricing structure based on different terms that might be valuable to you.",
+        (_point("Option ${number}: ${condition} - $$${price}", each='tiers'),),
+        "These options give you flexibility to choose what works best for your situation. I'm happy to discuss any of these approaches in more detail."
+    ),
+    ('price', 'generic'): _script(
+        "I'd like to make an offer of $$${offer_price} for the property.",
+        (
+            "This offer is based on my careful analysis of the property and market",
+            "I'm pre-approved for financing and ready to move forward",
+            "I can be flexible on closing timeline to accommodate your needs"
+        ),
+        "I look forward to your response and am open to discussing the details further."
+    ),
+    ('terms', 'closing_timeline'): _script(
+        "I understand that timing can be as important as price in real estate transactions. I'd like to discuss how we can structure the closing timeline to best meet your needs.",
+        (
+            _point("Option: ${name} - ${description}", each='options'),
+            _point("I'm offering this flexibility because ${justification}", when='has_justification')
+        ),
+        "By accommodating your preferred timeline, we can create a smoother transaction process for both of us. What timeline would work best for you?"
+    ),
+    ('terms', 'contingency'): _script(
+        "To strengthen my offer, I'm willing to adjust the standard contingencies to reduce uncertainty for you as the seller.",
+        (
+            _point("I can ${description}", each='options'),
+            _point("These adjustments benefit you because ${justification}", when='has_justification')
+        ),
+        "These modifications to standard contingencies demonstrate my serious interest in the property and confidence in completing the purchase."
+    ),
+    ('terms', 'earnest_money'): _script(
+        "To demonstrate my serious interest and financial capability, I'm prepared to offer an increased earnest money deposit of $$${increased} instead of the standard $$${standard}.",
+        (
+            "This larger deposit shows my commitment to completing the purchase",
+            "It provides you with greater security in accepting my offer",
+            "I'm confident in my financing and ability to close"
+        ),
+        "The increased earnest money deposit demonstrates that I'm a serious buyer with the financial means to complete this transaction smoothly."
+    ),
+    ('terms', 'generic'): _script(
+        "I'd like to discuss some flexible terms that might make my offer more attractive to you beyond just the price.",
+        (
+            "I can be flexible on closing timeline to accommodate your needs",
+            "I'm willing to work with you on contingencies to reduce uncertainty",
+            "My goal is to create a smooth transaction process for both of us"
+        ),
+        "By focusing on these terms, we can create a win-win agreement that addresses both our needs."
+    ),
+    ('creative', 'repair_credits'): _script(
+        "Rather than requesting a price reduction, I'd like to propose $$${credit_amount} in repair credits to address some issues with the property.",
+        (
+            "This approach maintains your asking price for appraisal and neighborhood comp purposes",
+            "It allows me to address the property issues directly after closing",
+            "This can be a tax advantage for both of us compared to a price reduction"
+        ),
+        "This structure gives you the sale price you want while acknowledging the property's condition and necessary improvements."
+    ),
+    ('creative', 'as_is'): _script(
+        "I'm prepared to purchase the property as-is, without requesting any repairs, but would need to account for the condition in my offer price.",
+        (
+            "I'll conduct an inspection for information only, not for negotiation",
+            "This eliminates the risk of repair negotiations or surprises later",
+            "My offer would need to be adjusted by approximately $$${discount} to account for the needed repairs",
+            "This creates a clean, simple transaction with no contingencies for property condition"
+        ),
+        "This approach gives you certainty that the deal won't fall through due to property condition issues, while allowing me to address the needed repairs after closing."
+    ),
+    ('creative', 'pain_points'): _script(
+        "I'd like to understand if there are any specific challenges or concerns you have about selling this property, beyond just the price.",
+        (_point("If ${pain_point} is a concern, I could ${solution}", each='solutions'),),
+        "By addressing these specific concerns, we can create a transaction that truly works for your situation, not just a standard deal focused only on price."
+    ),
+    ('creative', 'seller_financing'): _script(
+        "I'd like to propose a creative financing structure that might benefit both of us, involving some seller financing.",
+        (
+            "I would make a $$${down_payment} down payment (20%)",
+            "Get bank financing for $$${bank_financing} (60%)",
+            "And ask you to carry a note for $$${seller_financing} (20%)",
+            "The seller note would be at ${seller_note_terms}",
+            "This would provide you with monthly income of approximately $$${monthly_payment_to_seller}"
+        ),
+        "This structure provides you with some immediate cash at closing, plus an ongoing income stream at an interest rate higher than most savings accounts or CDs."
+    ),
+    ('creative', 'generic'): _script(
+        "I'd like to propose a creative approach to this transaction that might address both our needs better than a standard offer.",
+        (
+            "I've thought about ways to structure this deal that go beyond just the price",
+            "My goal is to find a win-win solution that addresses your specific needs",
+            "This approach could provide benefits that a traditional transaction might not"
+        ),
+        "I'm open to discussing this creative approach further and adapting it based on your feedback and specific situation."
+    )
+}
+
+
+def _money(amount: Any) -> str:
+    """Formats a dollar amount with thousands separators"""
+    return format(amount, ',')
+
+
+def _justification_params(strategy: Dict[str, Any]) -> Dict[str, Any]:
+    justifications = strategy.get('justification', [])
+    return {
+        'has_justification': bool(justifications),
+        'justification': justifications[0].lower() if justifications else ''
+    }
+
+
+def _below_market_params(strategy: Dict[str, Any]) -> Dict[str, Any]:
+    justifications = strategy.get('justification', [])
+    return {
+        'offer_price': _money(strategy.get('offer_price', 0)),
+        'reflects': ', '.join(justifications) if justifications else 'current market conditions',
+        'has_roi_impact': 'roi_impact' in strategy
+    }
+
+
+def _incremental_params(strategy: Dict[str, Any]) -> Dict[str, Any]:
+    offer_price = strategy.get('offer_price', 0)
+    return {
+        'offer_price': _money(offer_price),
+        'max_price': _money(strategy.get('max_price', offer_price * 1.05))
+    }
+
+
+def _price_tiers_params(strategy: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'tiers': tuple(
+            {'number': i + 1, 'condition': tier['condition'], 'price': _money(tier['price'])}
+            for i, tier in enumerate(strategy.get('condition_tiers', []))
+        )
+    }
+
+
+def _closing_timeline_params(strategy: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'options': tuple(
+            {'name': option['name'], 'description': option['description']}
+            for option in strategy.get('options', [])
+        ),
+        **_justification_params(strategy)
+    }
+
+
+def _contingency_params(strategy: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'options': tuple({'description': option['description'].lower()} for option in strategy.get('options', [])),
+        **_justification_params(strategy)
+    }
+
+
+def _seller_financing_params(strategy: Dict[str, Any]) -> Dict[str, Any]:
+    structure = strategy.get('structure', {})
+    return {
+        'down_payment': _money(structure.get('down_payment', 0)),
+        'bank_financing': _money(structure.get('bank_financing', 0)),
+        'seller_financing': _money(structure.get('seller_financing', 0)),
+        'seller_note_terms': structure.get('seller_note_terms', '6% interest'),
+        'monthly_payment_to_seller': _money(structure.get('monthly_payment_to_seller', 0))
+    }
+
+
+# Strategy variants per strategy type, matched on the strategy name in order
+# (strategies matching none use the type's 'generic' variant), with the
+# function extracting each variant's template parameters
+SCRIPT_VARIANTS: Dict[str, Tuple[Tuple[str, str, Callable[[Dict[str, Any]], Dict[str, Any]]], ...]] = {
+    'price': (
+        ('Below-Market Offer', 'below_market', _below_market_params),
+        ('Incremental Negotiation', 'incremental', _incremental_params),
+        ('Conditional Price Tiers', 'price_tiers', _price_tiers_params),
+    ),
+    'terms': (
+        ('Closing Timeline', 'closing_timeline', _closing_timeline_params),
+        ('Contingency', 'contingency', _contingency_params),
+        ('Earnest Money', 'earnest_money', lambda strategy: {
+            'standard': _money(strategy.get('standard_amount', 0)),
+            'increased': _money(strategy.get('increased_amount', 0))
+        }),
+    ),
+    'creative': (
+        ('Repair Credits', 'repair_credits', lambda strategy: {'credit_amount': _money(strategy.get('credit_amount', 0))}),
+        ('As-Is Purchase', 'as_is', lambda strategy: {'discount': _money(strategy.get('discount_needed', 0))}),
+        ('Seller Pain Point', 'pain_points', lambda strategy: {
+            'solutions': tuple(
+                {'pain_point': solution['pain_point'].lower(), 'solution': solution['solution'].lower()}
+                for solution in strategy.get('potential_solutions', [])
+            )
+        }),
+        ('Seller Financing', 'seller_financing', _seller_financing_params),
+    )
+}
+
+_GENERIC_PARAMS = {
+    'price': lambda strategy: {'offer_price': _money(strategy.get('offer_price', 0))}
+}
+
+
+def _freeze(params: Dict[str, Any]) -> Tuple:
+    """Converts template parameters (including item dicts) into a hashable key"""
+    return tuple(
+        (name, tuple(tuple(item.items()) for item in value) if type(value) is tuple else value)
+        for name, value in params.items()
+    )
+
+
+def script_key(strategy: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], Tuple]:
+    """
+    Resolves a strategy to its script template and parameters
+
+    Args:
+        strategy: Negotiation strategy (None for no strategy)
+
+    Returns:
+        Tuple of the SCRIPT_TEMPLATES key and the frozen template parameters
+    """
+    if not strategy or strategy['type'] not in SCRIPT_VARIANTS:
+        return ('default', 'generic'), ()
+
+    strategy_type = strategy['type']
+    strategy_name = strategy.get('name', '')
+    for fragment, variant, params in SCRIPT_VARIANTS[strategy_type]:
+        if fragment in strategy_name:
+            return (strategy_type, variant), _freeze(params(strategy))
+    generic_params = _GENERIC_PARAMS.get(strategy_type)
+    return (strategy_type, 'generic'), _freeze(generic_params(strategy)) if generic_params else ()
+
+
+@lru_cache(maxsize=SCRIPT_CACHE_SIZE)
+def _render(key: Tuple[str, str], params: Tuple) -> Tuple[str, Tuple[str, ...], str]:
+    """Renders one script; results are memoized on the template key and parameters"""
+    template = SCRIPT_TEMPLATES[key]
+    values = {name: value for name, value in params}
+
+    key_points = []
+    for point in template.key_points:
+        if point.each is not None:
+            key_points.extend(point.template.substitute(values, **dict(item)) for item in values[point.each])
+        elif point.when is None or values[point.when]:
+            key_points.append(point.template.substitute(values))
+
+    return template.opening.substitute(values), tuple(key_points), template.closing.substitute(values)
+
+
+def render_script(strategy: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Renders the negotiation script for a strategy
+
+    Args:
+        strategy: Negotiation strategy (None renders the default script)
+
+    Returns:
+        Dict containing opening_statement, key_points and closing_statement
+    """
+    opening, key_points, closing = _render(*script_key(strategy))
+    # Fresh list per call so callers cannot alter the memoized rendering
+    return {
+        'opening_statement': opening,
+        'key_points': list(key_points),
+        'closing_statement': closing
+    }
+
+
+def clear_script_cache():
+    """Drops all memoized script renderings"""
+    _render.cache_clear()
@@ -7,33 +7,358 @@ market conditions, and seller motivation factors.
 
 import os
 import json
-import random
-from typing import Dict, Any, List, Tuple, Optional
+import heapq
+from typing import Dict, Any, List, NamedTuple, Sequence, Tuple, Optional
 import numpy as np
-import pandas as pd
 from datetime import datetime
 
+from seeding import analysis_rng
+from geocoding import canonical_address
+from listing_events import ListingEventStore, ListingHistory, get_default_listing_event_store
+from offer_optimization import OfferCurves, compute_offer_curves, success_probability
+from negotiation_scripts import render_script
+
+# Generic motivations suggested when a seller shows few concrete signs
+POSSIBLE_MOTIVATION_FACTORS = [
+    "Possible life change (job relocation, divorce, etc.)",
+    "May have already purchased another home",
+    "Potential financial pressure",
+    "Property may have been inherited",
+    "Possible investment property liquidation"
+]
+
+
+class MarketFactors(NamedTuple):
+    """Market conditions read by the motivation, leverage and ranking steps"""
+    market_type: str
+    market_cycle: str
+    avg_dom: Any
+    contraction: bool
+
+
+class _MarketFactorCache:
+    """Reads each distinct market dict of a batch once"""
+    
+    def __init__(self):
+        self._factors: Dict[int, Tuple[Dict[str, Any], MarketFactors]] = {}
+    
+    def get(self, market_data: Dict[str, Any]) -> MarketFactors:
+        """
+        Returns the market factors of a market dict
+        
+        Args:
+            market_data: Market analysis data
+            
+        Returns:
+            MarketFactors
+        """
+        entry = self._factors.get(id(market_data))
+        if entry is None:
+            market_cycle = market_data.get('market_cycle', {}).get('cycle_position', 'Expansion')
+            factors = MarketFactors(
+                market_type=market_data.get('supply_demand', {}).get('market_type', 'balanced'),
+                market_cycle=market_cycle,
+                avg_dom=market_data.get('market_metrics', {}).get('days_on_market', 30),
+                contraction=market_cycle in ['Early Contraction', 'Contraction']
+            )
+            # Keep the dict alive so its id is not reused within the batch
+            entry = self._factors[id(market_data)] = (market_data, factors)
+        return entry[1]
+
+
+class RankedStrategies(list):
+    """
+    A property's top-ranked strategies, best first
+    
+    The list holds the top k strategies (all of them if k is None); the
+    remaining strategies are only sorted if all() is called. Ties keep the
+    order the strategies were generated in.
+    """
+    
+    def __init__(self, strategies: List[Dict[str, Any]], scores: List[float], k: Optional[int] = None):
+        """
+        Initialize the RankedStrategies
+        
+        Args:
+            strategies: Scored strategies, in generated order
+            scores: Score per strategy
+            k: Number of top strategies to rank (at least 1; None ranks all)
+        """
+        self.candidates = strategies
+        self.scores = scores
+        if k is None or k >= len(strategies):
+            self._top = sorted(range(len(strategies)), key=self._key)
+        else:
+            self._top = heapq.nsmallest(max(1, k), range(len(strategies)), key=self._key)
+        self._rest = None
+        super().__init__(self._ranked(self._top, start=1))
+    
+    def _key(self, index: int) -> float:
+        """Sort key of a strategy (higher scores first)"""
+        return -self.scores[index]
+    
+    def _ranked(self, indices: List[int], start: int) -> List[Dict[str, Any]]:
+        strategies = [self.candidates[i] for i in indices]
+        for rank, strategy in enumerate(strategies, start=start):
+            strategy['rank'] = rank
+        return strategies
+    
+    def all(self) -> List[Dict[str, Any]]:
+        """
+        Returns every strategy in rank order, sorting the ones beyond the top k
+        
+        Returns:
+            List of all strategies, best first
+        """
+        if self._rest is None:
+            top = set(self._top)
+            rest = sorted((i for i in range(len(self.candidates)) if i not in top), key=self._key)
+            self._rest = self._ranked(rest, start=len(self._top) + 1)
+        return list(self) + self._rest
+    
+    def best(self, types: Sequence[str], exclude_top: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Finds the highest ranked strategy of the given types without ordering the rest
+        
+        Args:
+            types: Strategy types to consider
+            exclude_top: Whether to skip the top-ranked strategy
+            
+        Returns:
+            Highest ranked matching strategy, or None
+        """
+        skip = self._top[0] if exclude_top and self._top else None
+        matches = [
+            i for i, strategy in enumerate(self.candidates)
+            if i != skip and strategy['type'] in types
+        ]
+        if not matches:
+            return None
+        best = min(matches, key=self._key)
+        strategy = self.candidates[best]
+        if self._rest is None and best not in self._top:
+            # Rank it by counting the strategies ahead of it
+            position = (self._key(best), best)
+            strategy['rank'] = 1 + sum(1 for i in range(len(self.candidates)) if (self._key(i), i) < position)
+        return strategy
+
+
+def _select(conditions: List[np.ndarray], choices: List[Any], default: Any) -> np.ndarray:
+    """
+    Picks, element-wise, the choice of the first true condition (like np.select)
+    
+    Nested np.where calls are much cheaper than np.select for the small
+    batches of single-property analyses.
+    
+    Args:
+        conditions: Boolean arrays, in priority order
+        choices: Value for each condition
+        default: Value where no condition holds
+        
+    Returns:
+        Array of chosen values
+    """
+    result = np.full(np.shape(conditions[0]), default)
+    for condition, choice in zip(reversed(conditions), reversed(choices)):
+        result = np.where(condition, choice, result)
+    return result
+
+
 class SellerMotivationAnalyzer:
     """
     Analyzes seller motivation based on property and market data
     """
     
-    def __init__(self):
-        """Initialize the SellerMotivationAnalyzer"""
-        pass
+    def __init__(self, data_version: str = None, listing_events: ListingEventStore = None):
+        """
+        Initialize the SellerMotivationAnalyzer
         
-    def analyze_motivation(self, property_data: Dict[str, Any], market_data: Dict[str, Any]) -> Dict[str, Any]:
+        Args:
+            data_version: Data version used to seed estimates (defaults to
+                ANALYSIS_DATA_VERSION)
+            listing_events: Recorded listing events used for price history
+                (defaults to the store at LISTING_EVENTS_PATH, if that file
+                exists); properties without events fall back to estimates
+        """
+        self.data_version = data_version
+        self.listing_events = get_default_listing_event_store() if listing_events is None else listing_events
+        
+    def analyze_motivation(self, 
+                           property_data: Dict[str, Any], 
+                           market_data: Dict[str, Any],
+                           rng: np.random.Generator = None) -> Dict[str, Any]:
         """
         Analyzes seller motivation based on property and market data
         
+        This is a single-property view of analyze_motivation_batch.
+        
         Args:
             property_data: Property details and characteristics
             market_data: Market analysis and conditions
+            rng: Random generator for estimated price history and factors
+                (defaults to one seeded from the property address)
             
         Returns:
             Dict containing seller motivation assessment
         """
-        # Extract relevant data
+        return self.analyze_motivation_batch([property_data], [market_data], None if rng is None else [rng])[0]
+    
+    def analyze_motivation_batch(self,
+                                 properties: Sequence[Dict[str, Any]],
+                                 markets: Sequence[Dict[str, Any]],
+                                 rngs: Sequence[np.random.Generator] = None) -> List[Dict[str, Any]]:
+        """
+        Analyzes seller motivation for many properties at once
+        
+        Price histories of the whole batch are read from the listing event
+        store in one query; properties without recorded events get estimates
+        drawn from their own seeded generator. The motivation scores are then
+        computed as arrays.
+        
+        Args:
+            properties: Property details per property
+            markets: Market analysis per property (properties in the same
+                market may share one dict; its factors are read once)
+            rngs: Random generator per property (defaults to ones seeded from
+                each property address)
+            
+        Returns:
+            List of seller motivation assessments, in input order
+        """
+        if rngs is None:
+            rngs = [analysis_rng(data.get('address', ''), 'motivation', self.data_version) for data in properties]
+        market_factors = _MarketFactorCache()
+        addresses = [data.get('address', '') for data in properties]
+        histories = self.listing_events.histories(addresses) if self.listing_events is not None else {}
+        property_histories = [
+            histories.get(canonical_address(address)) if histories and address else None for address in addresses
+        ]
+        # Only histories with a listing price replace the estimates
+        recorded = [history is not None and bool(history.original_list_price) for history in property_histories]
+        
+        days_on_market_values, price_cuts_values, price_reduction_values = [], [], []
+        for property_data, market_data, rng, history, is_recorded in zip(
+                properties, markets, rngs, property_histories, recorded):
+            if is_recorded:
+                days_on_market, price_cuts, price_reduction_pct = self._recorded_price_history(property_data, history)
+            else:
+                days_on_market, price_cuts, price_reduction_pct = self._estimate_price_history(property_data, market_data, rng)
+            days_on_market_values.append(days_on_market)
+            price_cuts_values.append(price_cuts)
+            price_reduction_values.append(price_reduction_pct)
+        relist_counts = [history.relist_count if history is not None else 0 for history in property_histories]
+        factors = [market_factors.get(market_data) for market_data in markets]
+        
+        days_on_market = np.array(days_on_market_values, dtype=float)
+        avg_dom = np.array([factor.avg_dom for factor in factors], dtype=float)
+        price_cuts = np.array(price_cuts_values, dtype=int)
+        price_reduction = np.array(price_reduction_values, dtype=float)
+        market_type = np.array([factor.market_type for factor in factors], dtype=object)
+        contraction = np.array([factor.contraction for factor in factors], dtype=bool)
+        expansion = np.array([factor.market_cycle == 'Expansion' for factor in factors], dtype=bool)
+        
+        # Start with neutral motivation (0-100) and adjust for days on market,
+        # price cuts, price reduction and market conditions
+        motivation_score = np.full(len(properties), 50)
+        motivation_score += _select(
+            [days_on_market > avg_dom * 2, days_on_market > avg_dom * 1.5,
+             days_on_market > avg_dom, days_on_market < avg_dom * 0.5],
+            [25, 15, 5, -15], 0
+        )
+        motivation_score += _select([price_cuts >= 2, price_cuts == 1], [20, 10], 0)
+        motivation_score += _select([price_reduction > 10, price_reduction > 5], [20, 10], 0)
+        motivation_score += _select([market_type == 'buyer', market_type == 'seller'], [15, -15], 0)
+        motivation_score += _select([contraction, expansion], [10, -10], 0)
+        # Relisting (e.g. to reset days on market) is a sign of a seller struggling to sell
+        motivation_score += np.where(np.array(relist_counts) > 0, 10, 0)
+        motivation_score = np.clip(motivation_score, 0, 100)
+        motivation_levels = _select([motivation_score >= 75, motivation_score >= 40], ['high', 'moderate'], 'low')
+        
+        # Seasonal factors apply to every property
+        winter = datetime.now().month in [11, 12, 1, 2]
+        
+        results = []
+        for i, (property_data, rng, factor) in enumerate(zip(properties, rngs, factors)):
+            motivation_level = str(motivation_levels[i])
+            
+            # Identify potential motivation factors
+            motivation_factors = []
+            
+            if days_on_market[i] > avg_dom[i]:
+                motivation_factors.append(f"Property has been on market for {days_on_market_values[i]} days (market average: {factor.avg_dom})")
+            
+            if price_cuts_values[i] > 0:
+                motivation_factors.append(f"{price_cuts_values[i]} price reduction(s) totaling {price_reduction_values[i]:.1f}% of original list price")
+            
+            if relist_counts[i] > 0:
+                motivation_factors.append(f"Property has been relisted {relist_counts[i]} time(s)")
+            
+            if factor.market_type == 'buyer':
+                motivation_factors.append("Current buyer's market conditions")
+            
+            if factor.contraction:
+                motivation_factors.append(f"Declining market in {factor.market_cycle} phase")
+            
+            if winter:
+                motivation_factors.append("Winter season typically has fewer buyers")
+            
+            # If we don't have enough factors, add some generic possibilities
+            if len(motivation_factors) < 2:
+                # Add some random factors based on motivation level
+                if motivation_level == 'high':
+                    picks = rng.choice(len(POSSIBLE_MOTIVATION_FACTORS), size=min(2, len(POSSIBLE_MOTIVATION_FACTORS)), replace=False)
+                    motivation_factors.extend(POSSIBLE_MOTIVATION_FACTORS[pick] for pick in picks)
+                elif motivation_level == 'moderate' and len(motivation_factors) < 2:
+                    motivation_factors.append(POSSIBLE_MOTIVATION_FACTORS[rng.integers(len(POSSIBLE_MOTIVATION_FACTORS))])
+            
+            results.append({
+                'score': int(motivation_score[i]),
+                'level': motivation_level,
+                'factors': motivation_factors,
+                'days_on_market': days_on_market_values[i],
+                'price_cuts': price_cuts_values[i],
+                'price_reduction_pct': round(price_reduction_values[i], 1),
+                'relist_count': relist_counts[i],
+                'price_history_source': 'listing_events' if recorded[i] else 'estimated',
+                'carrying_costs': self._estimate_carrying_costs(property_data)
+            })
+        
+        return results
+    
+    def _recorded_price_history(self,
+                                property_data: Dict[str, Any],
+                                history: ListingHistory) -> Tuple[Any, int, float]:
+        """
+        Reads days on market and price cuts from a recorded listing history
+        
+        Args:
+            property_data: Property details (its days_on_market is only used
+                when the history has no 'list' event)
+            history: Listing history of the property
+            
+        Returns:
+            Tuple of (days on market, number of price cuts, price reduction %)
+        """
+        days_on_market = history.days_on_market()
+        if days_on_market is None:
+            days_on_market = property_data.get('days_on_market')
+        return days_on_market, history.price_cuts, history.reduction_pct
+    
+    def _estimate_price_history(self,
+                                property_data: Dict[str, Any],
+                                market_data: Dict[str, Any],
+                                rng: np.random.Generator) -> Tuple[Any, int, float]:
+        """
+        Estimates days on market and price cuts for one property
+        
+        Args:
+            property_data: Property details
+            market_data: Market analysis data
+            rng: Random generator for estimated price history
+            
+        Returns:
+            Tuple of (days on market, number of price cuts, price reduction %)
+        """
         days_on_market = property_data.get('days_on_market', 
                                           market_data.get('market_metrics', {}).get('days_on_market', 30))
         
@@ -49,11 +374,11 @@ class SellerMotivationAnalyzer:
         # If original list price is not available, estimate it
         if original_list_price is None:
             # Randomly determine if there were price cuts
-            has_price_cuts = random.random() < 0.3  # 30% chance of price cuts
+            has_price_cuts = rng.random() < 0.3  # 30% chance of price cuts
             
             if has_price_cuts:
                 # Estimate original price 5-15% higher than current
-                original_list_price = current_price * (1 + random.uniform(0.05, 0.15))
+                original_list_price = current_price * (1 + rng.uniform(0.05, 0.15))
             else:
                 original_list_price = current_price
         
@@ -65,112 +390,13 @@ class SellerMotivationAnalyzer:
             
             # Estimate number of price cuts based on reduction percentage
             if price_reduction_pct > 10:
-                price_cuts = random.choice([2, 3])
+                price_cuts = int(rng.choice([2, 3]))
             elif price_reduction_pct > 5:
-                price_cuts = random.choice([1, 2])
+                price_cuts = int(rng.choice([1, 2]))
             elif price_reduction_pct > 0:
                 price_cuts = 1
         
-        # Extract market data
-        market_type = market_data.get('supply_demand', {}).get('market_type', 'balanced')
-        market_cycle = market_data.get('market_cycle', {}).get('cycle_position', 'Expansion')
-        avg_dom = market_data.get('market_metrics', {}).get('days_on_market', 30)
-        
-        # Determine base motivation score (0-100)
-        motivation_score = 50  # Start with neutral motivation
-        
-        # Adjust based on days on market
-        if days_on_market > avg_dom * 2:
-            motivation_score += 25  # Significantly above average DOM
-        elif days_on_market > avg_dom * 1.5:
-            motivation_score += 15  # Above average DOM
-        elif days_on_market > avg_dom:
-            motivation_score += 5   # Slightly above average DOM
-        elif days_on_market < avg_dom * 0.5:
-            motivation_score -= 15  # Significantly below average DOM
-        
-        # Adjust based on price cuts
-        if price_cuts >= 2:
-            motivation_score += 20  # Multiple price cuts
-        elif price_cuts == 1:
-            motivation_score += 10  # One price cut
-        
-        # Adjust based on price reduction percentage
-        if price_reduction_pct > 10:
-            motivation_score += 20  # Significant price reduction
-        elif price_reduction_pct > 5:
-            motivation_score += 10  # Moderate price reduction
-        
-        # Adjust based on market conditions
-        if market_type == 'buyer':
-            motivation_score += 15  # Buyer's market increases motivation
-        elif market_type == 'seller':
-            motivation_score -= 15  # Seller's market decreases motivation
-            
-        if market_cycle in ['Early Contraction', 'Contraction']:
-            motivation_score += 10  # Declining market increases motivation
-        elif market_cycle == 'Expansion':
-            motivation_score -= 10  # Rising market decreases motivation
-        
-        # Cap the score between 0 and 100
-        motivation_score = max(0, min(100, motivation_score))
-        
-        # Determine motivation level
-        if motivation_score >= 75:
-            motivation_level = 'high'
-        elif motivation_score >= 40:
-            motivation_level = 'moderate'
-        else:
-            motivation_level = 'low'
-        
-        # Identify potential motivation factors
-        motivation_factors = []
-        
-        if days_on_market > avg_dom:
-            motivation_factors.append(f"Property has been on market for {days_on_market} days (market average: {avg_dom})")
-        
-        if price_cuts > 0:
-            motivation_factors.append(f"{price_cuts} price reduction(s) totaling {price_reduction_pct:.1f}% of original list price")
-        
-        if market_type == 'buyer':
-            motivation_factors.append("Current buyer's market conditions")
-        
-        if market_cycle in ['Early Contraction', 'Contraction']:
-            motivation_factors.append(f"Declining market in {market_cycle} phase")
-        
-        # Add seasonal factors if relevant
-        current_month = datetime.now().month
-        if current_month in [11, 12, 1, 2]:  # Winter months
-            motivation_factors.append("Winter season typically has fewer buyers")
-        
-        # If we don't have enough factors, add some generic possibilities
-        if len(motivation_factors) < 2:
-            possible_factors = [
-                "Possible life change (job relocation, divorce, etc.)",
-                "May have already purchased another home",
-                "Potential financial pressure",
-                "Property may have been inherited",
-                "Possible investment property liquidation"
-            ]
-            
-            # Add some random factors based on motivation level
-            if motivation_level == 'high':
-                motivation_factors.extend(random.sample(possible_factors, min(2, len(possible_factors))))
-            elif motivation_level == 'moderate' and len(motivation_factors) < 2:
-                motivation_factors.append(random.choice(possible_factors))
-        
-        # Calculate carrying costs
-        carrying_costs = self._estimate_carrying_costs(property_data)
-        
-        return {
-            'score': motivation_score,
-            'level': motivation_level,
-            'factors': motivation_factors,
-            'days_on_market': days_on_market,
-            'price_cuts': price_cuts,
-            'price_reduction_pct': round(price_reduction_pct, 1),
-            'carrying_costs': carrying_costs
-        }
+        return days_on_market, price_cuts, price_reduction_pct
     
     def _estimate_carrying_costs(self, property_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -239,6 +465,8 @@ class BuyerLeverageAnalyzer:
         """
         Identifies leverage points for the buyer in negotiations
         
+        This is a single-property view of identify_leverage_batch.
+        
         Args:
             property_data: Property details and characteristics
             valuation_data: Property valuation and investment analysis
@@ -247,141 +475,173 @@ class BuyerLeverageAnalyzer:
         Returns:
             Dict containing buyer leverage points
         """
-        leverage_points = []
-        leverage_score = 50  # Start with neutral leverage
-        
-        # Extract key data
-        listing_price = property_data.get('listing_price', property_data.get('estimated_value', 0))
-        estimated_value = valuation_data.get('valuation', {}).get('final_value', 0)
-        days_on_market = property_data.get('days_on_market', 0)
-        avg_dom = market_data.get('market_metrics', {}).get('days_on_market', 30)
-        market_type = market_data.get('supply_demand', {}).get('market_type', 'balanced')
-        property_condition = valuation_data.get('renovation_analysis', {}).get('property_condition', 'Good')
+        return self.identify_leverage_batch([property_data], [valuation_data], [market_data])[0]
+    
+    def identify_leverage_batch(self,
+                                properties: Sequence[Dict[str, Any]],
+                                valuations: Sequence[Dict[str, Any]],
+                                markets: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Identifies buyer leverage points for many properties at once
         
-        # Check for price leverage
-        if listing_price > estimated_value * 1.05:
-            leverage_points.append({
-                'type': 'price',
-                'description': 'Property is overpriced compared to estimated value',
-                'strength': 'high',
-                'negotiation_impact': f"Potential {round((listing_price - estimated_value) / listing_price * 100, 1)}% price reduction opportunity"
-            })
-            leverage_score += 15
-        elif listing_price > estimated_value * 1.02:
-            leverage_points.append({
-                'type': 'price',
-                'description': 'Property is slightly overpriced compared to estimated value',
-                'strength': 'moderate',
-                'negotiation_impact': f"Potential {round((listing_price - estimated_value) / listing_price * 100, 1)}% price reduction opportunity"
-            })
-            leverage_score += 5
+        Each leverage check is evaluated as a boolean array over the batch and
+        the leverage scores are their weighted sum.
         
-        # Check for time on market leverage
-        if days_on_market > avg_dom * 2:
-            leverage_points.append({
-                'type': 'time',
-                'description': f'Property has been on the market for {days_on_market} days (more than double the average)',
-                'strength': 'high',
-                'negotiation_impact': 'Seller likely experiencing market fatigue and carrying costs'
-            })
-            leverage_score += 15
-        elif days_on_market > avg_dom:
-            leverage_points.append({
-                'type': 'time',
-                'description': f'Property has been on the market for {days_on_market} days (above average)',
-                'strength': 'moderate',
-                'negotiation_impact': 'Seller may be becoming concerned about selling timeline'
-            })
-            leverage_score += 10
-        
-        # Check for market condition leverage
-        if market_type == 'buyer':
-            leverage_points.append({
-                'type': 'market',
-                'description': 'Current market favors buyers',
-                'strength': 'high',
-                'negotiation_impact': 'Reduced competition and more negotiating power'
-            })
-            leverage_score += 15
-        elif market_type == 'balanced':
-            leverage_points.append({
-                'type': 'market',
-                'description': 'Market is balanced between buyers and sellers',
-                'strength': 'moderate',
-                'negotiation_impact': 'Fair negotiation environment with reasonable flexibility'
-            })
-            leverage_score += 5
+        Args:
+            properties: Property details per property
+            valuations: Valuation and investment analysis per property
+            markets: Market analysis per property (properties in the same
+                market may share one dict; its factors are read once)
+            
+        Returns:
+            List of buyer leverage assessments, in input order
+        """
+        market_factors = _MarketFactorCache()
+        factors = [market_factors.get(market_data) for market_data in markets]
         
-        # Check for property condition leverage
-        if property_condition in ['Poor', 'Fair']:
-            leverage_points.append({
-                'type': 'condition',
-                'description': f'Property is in {property_condition} condition',
-                'strength': 'high',
-                'negotiation_impact': 'Repairs and renovations needed, justifying lower offer'
-            })
-            leverage_score += 15
-        elif property_condition == 'Good':
-            leverage_points.append({
-                'type': 'condition',
-                'description': 'Property is in good condition but may need some updates',
-                'strength': 'low',
-                'negotiation_impact': 'Minor improvements needed, potential for small concessions'
-            })
-            leverage_score += 5
-        
-        # Check for investment metrics leverage
-        investment_metrics = valuation_data.get('investment_metrics', {})
-        cash_flow = investment_metrics.get('financing_scenarios', {}).get('twenty_percent_down', {}).get('monthly_cash_flow', 0)
-        
-        if cash_flow < 0:
-            leverage_points.append({
-                'type': 'investment',
-                'description': 'Property has negative cash flow at current price',
-                'strength': 'high',
-                'negotiation_impact': 'Price reduction needed to achieve positive cash flow'
-            })
-            leverage_score += 10
-        
-        # Check for renovation leverage
-        renovation_analysis = valuation_data.get('renovation_analysis', {})
-        renovation_cost = renovation_analysis.get('estimated_renovation_cost', 0)
-        
-        if renovation_cost > property_value * 0.1:
-            leverage_points.append({
-                'type': 'renovation',
-                'description': f'Property needs significant renovations (estimated ${renovation_cost:,})',
-                'strength': 'high',
-                'negotiation_impact': 'Renovation costs justify lower purchase price or seller credits'
-            })
-            leverage_score += 10
-        elif renovation_cost > property_value * 0.05:
-            leverage_points.append({
-                'type': 'renovation',
-                'description': f'Property needs moderate renovations (estimated ${renovation_cost:,})',
-                'strength': 'moderate',
-                'negotiation_impact': 'Renovation costs justify modest price reduction or seller credits'
+        # Extract key data
+        listing_prices = [data.get('listing_price', data.get('estimated_value', 0)) for data in properties]
+        estimated_values = [data.get('valuation', {}).get('final_value', 0) for data in valuations]
+        days_on_market_values = [data.get('days_on_market', 0) for data in properties]
+        property_conditions = np.array(
+            [data.get('renovation_analysis', {}).get('property_condition', 'Good') for data in valuations], dtype=object
+        )
+        renovation_costs = [data.get('renovation_analysis', {}).get('estimated_renovation_cost', 0) for data in valuations]
+        cash_flows = np.array([
+            data.get('investment_metrics', {}).get('financing_scenarios', {}).get('twenty_percent_down', {}).get('monthly_cash_flow', 0)
+            for data in valuations
+        ], dtype=float)
+        
+        listing_price = np.array(listing_prices, dtype=float)
+        estimated_value = np.array(estimated_values, dtype=float)
+        days_on_market = np.array(days_on_market_values, dtype=float)
+        avg_dom = np.array([factor.avg_dom for factor in factors], dtype=float)
+        market_type = np.array([factor.market_type for factor in factors], dtype=object)
+        renovation_cost = np.array(renovation_costs, dtype=float)
+        
+        # Leverage checks; each pair is mutually exclusive
+        overpriced = listing_price > estimated_value * 1.05
+        slightly_overpriced = ~overpriced & (listing_price > estimated_value * 1.02)
+        stale_listing = days_on_market > avg_dom * 2
+        aging_listing = ~stale_listing & (days_on_market > avg_dom)
+        buyer_market = market_type == 'buyer'
+        balanced_market = market_type == 'balanced'
+        poor_condition = np.isin(property_conditions, ['Poor', 'Fair'])
+        good_condition = property_conditions == 'Good'
+        negative_cash_flow = cash_flows < 0
+        major_renovation = renovation_cost > estimated_value * 0.1
+        moderate_renovation = ~major_renovation & (renovation_cost > estimated_value * 0.05)
+        
+        # Start with neutral leverage and cap the score between 0 and 100
+        leverage_score = (
+            50
+            + 15 * overpriced + 5 * slightly_overpriced
+            + 15 * stale_listing + 10 * aging_listing
+            + 15 * buyer_market + 5 * balanced_market
+            + 15 * poor_condition + 5 * good_condition
+            + 10 * negative_cash_flow
+            + 10 * major_renovation + 5 * moderate_renovation
+        )
+        leverage_score = np.clip(leverage_score, 0, 100)
+        leverage_levels = _select([leverage_score >= 75, leverage_score >= 40], ['high', 'moderate'], 'low')
+        
+        results = []
+        for i in range(len(properties)):
+            leverage_points = []
+            listing_price_i, estimated_value_i = listing_prices[i], estimated_values[i]
+            
+            # Check for price leverage
+            if overpriced[i] or slightly_overpriced[i]:
+                leverage_points.append({
+                    'type': 'price',
+                    'description': 'Property is overpriced compared to estimated value' if overpriced[i]
+                                   else 'Property is slightly overpriced compared to estimated value',
+                    'strength': 'high' if overpriced[i] else 'moderate',
+                    'negotiation_impact': f"Potential {round((listing_price_i - estimated_value_i) / listing_price_i * 100, 1)}% price reduction opportunity"
+                })
+            
+            # Check for time on market leverage
+            if stale_listing[i]:
+                leverage_points.append({
+                    'type': 'time',
+                    'description': f'Property has been on the market for {days_on_market_values[i]} days (more than double the average)',
+                    'strength': 'high',
+                    'negotiation_impact': 'Seller likely experiencing market fatigue and carrying costs'
+                })
+            elif aging_listing[i]:
+                leverage_points.append({
+                    'type': 'time',
+                    'description': f'Property has been on the market for {days_on_market_values[i]} days (above average)',
+                    'strength': 'moderate',
+                    'negotiation_impact': 'Seller may be becoming concerned about selling timeline'
+                })
+            
+            # Check for market condition leverage
+            if buyer_market[i]:
+                leverage_points.append({
+                    'type': 'market',
+                    'description': 'Current market favors buyers',
+                    'strength': 'high',
+                    'negotiation_impact': 'Reduced competition and more negotiating power'
+                })
+            elif balanced_market[i]:
+                leverage_points.append({
+                    'type': 'market',
+                    'description': 'Market is balanced between buyers and sellers',
+                    'strength': 'moderate',
+                    'negotiation_impact': 'Fair negotiation environment with reasonable flexibility'
+                })
+            
+            # Check for property condition leverage
+            if poor_condition[i]:
+                leverage_points.append({
+                    'type': 'condition',
+                    'description': f'Property is in {property_conditions[i]} condition',
+                    'strength': 'high',
+                    'negotiation_impact': 'Repairs and renovations needed, justifying lower offer'
+                })
+            elif good_condition[i]:
+                leverage_points.append({
+                    'type': 'condition',
+                    'description': 'Property is in good condition but may need some updates',
+                    'strength': 'low',
+                    'negotiation_impact': 'Minor improvements needed, potential for small concessions'
+                })
+            
+            # Check for investment metrics leverage
+            if negative_cash_flow[i]:
+                leverage_points.append({
+                    'type': 'investment',
+                    'description': 'Property has negative cash flow at current price',
+                    'strength': 'high',
+                    'negotiation_impact': 'Price reduction needed to achieve positive cash flow'
+                })
+            
+            # Check for renovation leverage
+            if major_renovation[i]:
+                leverage_points.append({
+                    'type': 'renovation',
+                    'description': f'Property needs significant renovations (estimated ${renovation_costs[i]:,})',
+                    'strength': 'high',
+                    'negotiation_impact': 'Renovation costs justify lower purchase price or seller credits'
+                })
+            elif moderate_renovation[i]:
+                leverage_points.append({
+                    'type': 'renovation',
+                    'description': f'Property needs moderate renovations (estimated ${renovation_costs[i]:,})',
+                    'strength': 'moderate',
+                    'negotiation_impact': 'Renovation costs justify modest price reduction or seller credits'
+                })
+            
+            results.append({
+                'score': int(leverage_score[i]),
+                'level': str(leverage_levels[i]),
+                'points': leverage_points,
+                'primary_leverage': leverage_points[0] if leverage_points else None,
+                'secondary_leverage': leverage_points[1] if len(leverage_points) > 1 else None
             })
-            leverage_score += 5
-        
-        # Cap the score between 0 and 100
-        leverage_score = max(0, min(100, leverage_score))
         
-        # Determine overall leverage level
-        if leverage_score >= 75:
-            leverage_level = 'high'
-        elif leverage_score >= 40:
-            leverage_level = 'moderate'
-        else:
-            leverage_level = 'low'
-        
-        return {
-            'score': leverage_score,
-            'level': leverage_level,
-            'points': leverage_points,
-            'primary_leverage': leverage_points[0] if leverage_points else None,
-            'secondary_leverage': leverage_points[1] if len(leverage_points) > 1 else None
-        }
+        return results
 
 
 class StrategyGenerator:
@@ -389,15 +649,35 @@ class StrategyGenerator:
     Generates negotiation strategies based on property analysis and market conditions
     """
     
-    def __init__(self):
-        """Initialize the StrategyGenerator"""
-        self.seller_motivation_analyzer = SellerMotivationAnalyzer()
+    def __init__(self,
+                 data_version: str = None,
+                 render_scripts: bool = True,
+                 top_k: Optional[int] = None,
+                 listing_events: ListingEventStore = None):
+        """
+        Initialize the StrategyGenerator
+        
+        Args:
+            data_version: Data version used to seed estimates (defaults to
+                ANALYSIS_DATA_VERSION)
+            render_scripts: Whether results include the negotiation script
+                (if False, 'negotiation_script' is None and scripts are
+                rendered on request with render_script)
+            top_k: Default number of strategies ranked and returned per
+                property (None returns all of them)
+            listing_events: Recorded listing events for seller motivation
+                (defaults to the store at LISTING_EVENTS_PATH, if that file exists)
+        """
+        self.seller_motivation_analyzer = SellerMotivationAnalyzer(data_version=data_version, listing_events=listing_events)
         self.buyer_leverage_analyzer = BuyerLeverageAnalyzer()
+        self.render_scripts = render_scripts
+        self.top_k = top_k
         
     def generate_strategies(self, 
                            property_data: Dict[str, Any], 
                            market_data: Dict[str, Any], 
-                           valuation_data: Dict[str, Any]) -> Dict[str, Any]:
+                           valuation_data: Dict[str, Any],
+                           top_k: Optional[int] = None) -> Dict[str, Any]:
         """
         Generates tailored negotiation strategies based on property, valuation, and market data
         
@@ -405,57 +685,160 @@ class StrategyGenerator:
             property_data: Property details and characteristics
             market_data: Market analysis and conditions
             valuation_data: Property valuation and investment analysis
+            top_k: Number of strategies to rank and return (defaults to the
+                generator's top_k)
             
         Returns:
             Dict containing recommended negotiation strategies and their projected impacts
         """
         try:
-            # Analyze seller motivation
-            seller_motivation = self.seller_motivation_analyzer.analyze_motivation(property_data, market_data)
-            
-            # Identify buyer leverage points
-            buyer_leverage = self.buyer_leverage_analyzer.identify_leverage(property_data, valuation_data, market_data)
-            
-            # Generate price negotiation strategies
-            price_strategies = self._generate_price_strategies(property_data, valuation_data, market_data, seller_motivation)
-            
-            # Generate terms negotiation strategies
-            terms_strategies = self._generate_terms_strategies(property_data, valuation_data, market_data, seller_motivation)
-            
-            # Generate creative negotiation strategies
-            creative_strategies = self._generate_creative_strategies(property_data, valuation_data, market_data, seller_motivation)
+            return self._generate_recommendations([property_data], [market_data], [valuation_data], top_k)[0]
+        except Exception as e:
+            return self._error_result(e)
+    
+    @staticmethod
+    def _error_result(error: Exception) -> Dict[str, Any]:
+        """Builds the result for a property whose strategies could not be generated"""
+        return {
+            'success': False,
+            'error': 'Failed to generate negotiation strategies',
+            'error_message': str(error)
+        }
+    
+    def generate_strategies_batch(self,
+                                  analyses: Sequence[Dict[str, Any]],
+                                  top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Generates negotiation strategies for a portfolio of properties
+        
+        Market factors are read once per distinct market, seller motivation,
+        buyer leverage, strategy ranking and offer curves are scored as
+        arrays across the portfolio, and a negotiation script is rendered only
+        for each property's top strategy. Each result equals what
+        generate_strategies returns for that property.
+        
+        Args:
+            analyses: Property analyses, each with 'property', 'market' and
+                'valuation' entries (as returned by the batch analyzer)
+            top_k: Number of strategies to rank and return per property
+                (defaults to the generator's top_k)
             
-            # Calculate ROI impact for each strategy
-            strategies_with_roi = self._calculate_roi_impact(
-                price_strategies + terms_strategies + creative_strategies,
-                valuation_data
-            )
+        Returns:
+            List of negotiation strategy dicts, in input order
+        """
+        properties = [analysis.get('property', {}) for analysis in analyses]
+        markets = [analysis.get('market', {}) for analysis in analyses]
+        valuations = [analysis.get('valuation', {}) for analysis in analyses]
+        return self._generate_recommendations_isolated(properties, markets, valuations, top_k)
+    
+    def _generate_recommendations_isolated(self,
+                                           properties: Sequence[Dict[str, Any]],
+                                           markets: Sequence[Dict[str, Any]],
+                                           valuations: Sequence[Dict[str, Any]],
+                                           top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Generates recommendations, isolating properties whose analysis fails
+        
+        Per-property steps already fail per property. If a batch-wide step
+        fails, the batch is split in half and each half retried, so a bad row
+        only costs a few extra small batches; a failing single property gets
+        the error result generate_strategies would return.
+        
+        Args:
+            properties: Property details per property
+            markets: Market analysis per property
+            valuations: Valuation and investment analysis per property
+            top_k: Number of strategies to rank and return per property
             
-            # Rank strategies by effectiveness and acceptability
-            ranked_strategies = self._rank_strategies(
-                strategies_with_roi,
-                seller_motivation,
-                market_data
+        Returns:
+            List of recommendation or error dicts, in input order
+        """
+        if len(properties) <= 1:
+            return [
+                self.generate_strategies(property_data, market_data, valuation_data, top_k)
+                for property_data, market_data, valuation_data in zip(properties, markets, valuations)
+            ]
+        try:
+            return self._generate_recommendations(properties, markets, valuations, top_k)
+        except Exception:
+            middle = len(properties) // 2
+            return (
+                self._generate_recommendations_isolated(properties[:middle], markets[:middle], valuations[:middle], top_k)
+                + self._generate_recommendations_isolated(properties[middle:], markets[middle:], valuations[middle:], top_k)
             )
+    
+    def _generate_recommendations(self,
+                                  properties: Sequence[Dict[str, Any]],
+                                  markets: Sequence[Dict[str, Any]],
+                                  valuations: Sequence[Dict[str, Any]],
+                                  top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Generates the recommendation package for a batch of properties
+        
+        Args:
+            properties: Property details per property
+            markets: Market analysis per property
+            valuations: Valuation and investment analysis per property
+            top_k: Number of strategies to rank and return per property
+                (defaults to the generator's top_k)
             
-            # Create final recommendation package
-            recommendation = {
-                'success': True,
-                'seller_motivation': seller_motivation,
-                'buyer_leverage': buyer_leverage,
-                'recommended_strategies': ranked_strategies,
-                'negotiation_script': self._generate_negotiation_script(ranked_strategies[0] if ranked_strategies else None),
-                'fallback_options': self._identify_fallback_options(ranked_strategies)
-            }
-            
-            return recommendation
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'error': 'Failed to generate negotiation strategies',
-                'error_message': str(e)
-            }
+        Returns:
+            List of recommendation dicts, in input order
+        """
+        if top_k is None:
+            top_k = self.top_k
+        
+        # Analyze seller motivation
+        seller_motivations = self.seller_motivation_analyzer.analyze_motivation_batch(properties, markets)
+        
+        # Identify buyer leverage points
+        buyer_leverages = self.buyer_leverage_analyzer.identify_leverage_batch(properties, valuations, markets)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(properties)
+        strategy_lists = []
+        for i, (property_data, market_data, valuation_data, seller_motivation) in enumerate(
+                zip(properties, markets, valuations, seller_motivations)):
+            try:
+                # Generate price, terms and creative negotiation strategies
+                price_strategies = self._generate_price_strategies(property_data, valuation_data, market_data, seller_motivation)
+                terms_strategies = self._generate_terms_strategies(property_data, valuation_data, market_data, seller_motivation)
+                creative_strategies = self._generate_creative_strategies(property_data, valuation_data, market_data, seller_motivation)
+                
+                # Calculate ROI impact for each strategy
+                strategy_lists.append(self._calculate_roi_impact(
+                    price_strategies + terms_strategies + creative_strategies,
+                    valuation_data
+                ))
+            except Exception as e:
+                results[i] = self._error_result(e)
+                strategy_lists.append([])
+        
+        # Rank strategies by effectiveness and acceptability
+        ranked_lists = self._rank_strategies_batch(strategy_lists, seller_motivations, markets, top_k)
+        offer_curves = self._compute_offer_curves(properties, markets, seller_motivations)
+        
+        # Create final recommendation packages
+        for i, (seller_motivation, buyer_leverage, ranked_strategies) in enumerate(
+                zip(seller_motivations, buyer_leverages, ranked_lists)):
+            if results[i] is not None:
+                continue
+            try:
+                results[i] = {
+                    'success': True,
+                    'seller_motivation': seller_motivation,
+                    'buyer_leverage': buyer_leverage,
+                    'recommended_strategies': ranked_strategies,
+                    'negotiation_script': (
+                        self._generate_negotiation_script(ranked_strategies[0] if ranked_strategies else None)
+                        if self.render_scripts else None
+                    ),
+                    'fallback_options': self._identify_fallback_options(ranked_strategies),
+                    'offer_curve': offer_curves.to_dict(i)
+                }
+            except Exception as e:
+                results[i] = self._error_result(e)
+        
+        return results
     
     def _generate_price_strategies(self, 
                                   property_data: Dict[str, Any], 
@@ -905,7 +1288,8 @@ class StrategyGenerator:
     def _rank_strategies(self, 
                         strategies: List[Dict[str, Any]], 
                         seller_motivation: Dict[str, Any], 
-                        market_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+                        market_data: Dict[str, Any],
+                        top_k: Optional[int] = None) -> RankedStrategies:
         """
         Ranks strategies by effectiveness and acceptability
         
@@ -913,334 +1297,104 @@ class StrategyGenerator:
             strategies: List of negotiation strategies with ROI impact
             seller_motivation: Seller motivation assessment
             market_data: Market analysis data
+            top_k: Number of top strategies to rank (None ranks all)
             
         Returns:
-            List of ranked strategies
+            Ranked strategies
         """
-        # Extract key data
-        motivation_level = seller_motivation.get('level', 'moderate')
-        market_type = market_data.get('supply_demand', {}).get('market_type', 'balanced')
-        
-        # Calculate strategy scores
-        for strategy in strategies:
-            # Base score starts at 50
-            score = 50
-            
-            # Add points for ROI impact
-            roi_impact = strategy.get('roi_impact', {})
-            total_savings = roi_impact.get('total_savings', 0)
-            cash_on_cash_impact = roi_impact.get('cash_on_cash_impact', 0)
-            
-            # More savings = higher score
-            if total_savings > 10000:
-                score += 20
-            elif total_savings > 5000:
-                score += 10
-            elif total_savings > 1000:
-                score += 5
-            
-            # Better cash-on-cash return = higher score
-            if cash_on_cash_impact > 2:
-                score += 15
-            elif cash_on_cash_impact > 1:
-                score += 10
-            elif cash_on_cash_impact > 0.5:
-                score += 5
-            
-            # Add points for success probability
-            success_probability = strategy.get('expected_success_probability', 0.5)
-            score += success_probability * 30  # Up to 30 points for high probability
-            
-            # Adjust based on market conditions and seller motivation
-            if market_type == 'buyer':
-                # In buyer's market, price strategies get bonus
-                if strategy['type'] == 'price':
-                    score += 10
-            elif market_type == 'seller':
-                # In seller's market, terms and creative strategies get bonus
-                if strategy['type'] in ['terms', 'creative']:
-                    score += 10
-            
-            if motivation_level == 'high':
-                # With highly motivated seller, price strategies get bonus
-                if strategy['type'] == 'price':
-                    score += 15
-            elif motivation_level == 'low':
-                # With low motivation seller, terms and creative strategies get bonus
-                if strategy['type'] in ['terms', 'creative']:
-                    score += 15
-            
-            # Add score to strategy
-            strategy['score'] = score
-        
-        # Rank strategies by score
-        ranked_strategies = sorted(strategies, key=lambda x: x.get('score', 0), reverse=True)
-        
-        # Add rank to each strategy
-        for i, strategy in enumerate(ranked_strategies):
-            strategy['rank'] = i + 1
-        
-        return ranked_strategies
+        return self._rank_strategies_batch([strategies], [seller_motivation], [market_data], top_k)[0]
     
-    def _generate_negotiation_script(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
+    def _rank_strategies_batch(self,
+                               strategy_lists: Sequence[List[Dict[str, Any]]],
+                               seller_motivations: Sequence[Dict[str, Any]],
+                               markets: Sequence[Dict[str, Any]],
+                               top_k: Optional[int] = None) -> List[RankedStrategies]:
         """
-        Generates a negotiation script based on the top strategy
+        Ranks the strategies of many properties, scoring them as one array
         
-        Args:
-            strategy: Top-ranked negotiation strategy
-            
-        Returns:
-            Dict containing negotiation script
-        """
-        if not strategy:
-            return {
-                'opening_statement': "I'm interested in this property and would like to discuss making an offer.",
-                'key_points': ["Discuss property features", "Ask about seller's timeline", "Mention financing pre-approval"],
-                'closing_statement': "I'll prepare a formal offer based on our discussion."
-            }
-        
-        # Generate script based on strategy type
-        if strategy['type'] == 'price':
-            return self._generate_price_strategy_script(strategy)
-        elif strategy['type'] == 'terms':
-            return self._generate_terms_strategy_script(strategy)
-        elif strategy['type'] == 'creative':
-            return self._generate_creative_strategy_script(strategy)
-        else:
-            return {
-                'opening_statement': "I'm interested in this property and would like to discuss making an offer.",
-                'key_points': ["Discuss property features", "Ask about seller's timeline", "Mention financing pre-approval"],
-                'closing_statement': "I'll prepare a formal offer based on our discussion."
-            }
-    
-    def _generate_price_strategy_script(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Generates a negotiation script for a price-based strategy
-        
-        Args:
-            strategy: Price-based negotiation strategy
-            
-        Returns:
-            Dict containing negotiation script
-        """
-        # Extract key data
-        strategy_name = strategy.get('name', '')
-        offer_price = strategy.get('offer_price', 0)
-        justifications = strategy.get('justification', [])
-        
-        # Generate script based on strategy name
-        if 'Below-Market Offer' in strategy_name:
-            opening = f"After carefully analyzing the property and current market conditions, I'd like to make an offer of ${offer_price:,}."
-            
-            key_points = [
-                "I've done extensive research on comparable properties in the area",
-                f"My offer reflects {', '.join(justifications)}" if justifications else "My offer reflects current market conditions"
-            ]
-            
-            if 'roi_impact' in strategy:
-                savings = strategy['roi_impact'].get('total_savings', 0)
-                key_points.append(f"This price point works with my investment criteria and budget constraints")
-            
-            closing = "I'm prepared to move forward quickly with this offer and can provide proof of funds or pre-approval."
-            
-        elif 'Incremental Negotiation' in strategy_name:
-            opening = f"I'd like to start the conversation with an offer of ${offer_price:,}, though I understand we may need to discuss the price further."
-            
-            key_points = [
-                "I'm flexible and open to finding a price that works for both of us",
-                "I value clear communication throughout the negotiation process",
-                "My initial offer is based on my analysis of the property and market"
-            ]
-            
-            max_price = strategy.get('max_price', offer_price * 1.05)
-            closing = f"While ${offer_price:,} is my starting point, I'm willing to work with you to find a mutually acceptable price. My absolute maximum budget for this property would be around ${max_price:,}."
-            
-        elif 'Conditional Price Tiers' in strategy_name:
-            opening = "I'd like to propose a flexible pricing structure based on different terms that might be valuable to you."
-            
-            tiers = strategy.get('condition_tiers', [])
-            key_points = [f"Option {i+1}: {tier['condition']} - ${tier['price']:,}" for i, tier in enumerate(tiers)]
-            
-            closing = "These options give you flexibility to choose what works best for your situation. I'm happy to discuss any of these approaches in more detail."
-            
-        else:
-            # Generic price strategy script
-            opening = f"I'd like to make an offer of ${offer_price:,} for the property."
-            
-            key_points = [
-                "This offer is based on my careful analysis of the property and market",
-                "I'm pre-approved for financing and ready to move forward",
-                "I can be flexible on closing timeline to accommodate your needs"
-            ]
-            
-            closing = "I look forward to your response and am open to discussing the details further."
-        
-        return {
-            'opening_statement': opening,
-            'key_points': key_points,
-            'closing_statement': closing
-        }
-    
-    def _generate_terms_strategy_script(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Generates a negotiation script for a terms-based strategy
+        Every strategy is scored, but only each property's top k are ordered;
+        the rest are sorted if RankedStrategies.all() is called.
         
         Args:
-            strategy: Terms-based negotiation strategy
+            strategy_lists: Negotiation strategies with ROI impact per property
+            seller_motivations: Seller motivation assessment per property
+            markets: Market analysis per property
+            top_k: Number of top strategies to rank per property (None ranks all)
             
         Returns:
-            Dict containing negotiation script
+            Ranked strategies per property
         """
-        # Extract key data
-        strategy_name = strategy.get('name', '')
-        description = strategy.get('description', '')
-        justifications = strategy.get('justification', [])
-        
-        # Generate script based on strategy name
-        if 'Closing Timeline' in strategy_name:
-            opening = "I understand that timing can be as important as price in real estate transactions. I'd like to discuss how we can structure the closing timeline to best meet your needs."
-            
-            options = strategy.get('options', [])
-            key_points = [f"Option: {option['name']} - {option['description']}" for option in options]
-            
-            if justifications:
-                key_points.append(f"I'm offering this flexibility because {justifications[0].lower()}")
-            
-            closing = "By accommodating your preferred timeline, we can create a smoother transaction process for both of us. What timeline would work best for you?"
-            
-        elif 'Contingency' in strategy_name:
-            opening = "To strengthen my offer, I'm willing to adjust the standard contingencies to reduce uncertainty for you as the seller."
-            
-            options = strategy.get('options', [])
-            key_points = [f"I can {option['description'].lower()}" for option in options]
-            
-            if justifications:
-                key_points.append(f"These adjustments benefit you because {justifications[0].lower()}")
-            
-            closing = "These modifications to standard contingencies demonstrate my serious interest in the property and confidence in completing the purchase."
-            
-        elif 'Earnest Money' in strategy_name:
-            standard = strategy.get('standard_amount', 0)
-            increased = strategy.get('increased_amount', 0)
-            
-            opening = f"To demonstrate my serious interest and financial capability, I'm prepared to offer an increased earnest money deposit of ${increased:,} instead of the standard ${standard:,}."
-            
-            key_points = [
-                "This larger deposit shows my commitment to completing the purchase",
-                "It provides you with greater security in accepting my offer",
-                "I'm confident in my financing and ability to close"
-            ]
-            
-            closing = "The increased earnest money deposit demonstrates that I'm a serious buyer with the financial means to complete this transaction smoothly."
-            
-        else:
-            # Generic terms strategy script
-            opening = "I'd like to discuss some flexible terms that might make my offer more attractive to you beyond just the price."
-            
-            key_points = [
-                "I can be flexible on closing timeline to accommodate your needs",
-                "I'm willing to work with you on contingencies to reduce uncertainty",
-                "My goal is to create a smooth transaction process for both of us"
-            ]
-            
-            closing = "By focusing on these terms, we can create a win-win agreement that addresses both our needs."
-        
-        return {
-            'opening_statement': opening,
-            'key_points': key_points,
-            'closing_statement': closing
-        }
+        market_factors = _MarketFactorCache()
+        owners = np.repeat(np.arange(len(strategy_lists)), [len(strategies) for strategies in strategy_lists])
+        strategies = [strategy for strategy_list in strategy_lists for strategy in strategy_list]
+        
+        # Extract key data, per property and per strategy
+        motivation_level = np.array(
+            [motivation.get('level', 'moderate') for motivation in seller_motivations], dtype=object
+        )[owners]
+        market_type = np.array(
+            [market_factors.get(market_data).market_type for market_data in markets], dtype=object
+        )[owners]
+        total_savings = np.array([strategy.get('roi_impact', {}).get('total_savings', 0) for strategy in strategies], dtype=float)
+        cash_on_cash_impact = np.array(
+            [strategy.get('roi_impact', {}).get('cash_on_cash_impact', 0) for strategy in strategies], dtype=float
+        )
+        success_probabilities = np.array(
+            [strategy.get('expected_success_probability', 0.5) for strategy in strategies], dtype=float
+        )
+        strategy_type = np.array([strategy['type'] for strategy in strategies], dtype=object)
+        is_price = strategy_type == 'price'
+        is_terms_or_creative = (strategy_type == 'terms') | (strategy_type == 'creative')
+        
+        # Base score starts at 50
+        score = np.full(len(strategies), 50.0)
+        # More savings and better cash-on-cash return = higher score
+        score += _select([total_savings > 10000, total_savings > 5000, total_savings > 1000], [20, 10, 5], 0)
+        score += _select([cash_on_cash_impact > 2, cash_on_cash_impact > 1, cash_on_cash_impact > 0.5], [15, 10, 5], 0)
+        # Up to 30 points for high probability
+        score += success_probabilities * 30
+        # In a buyer's market price strategies get a bonus, in a seller's
+        # market terms and creative strategies do
+        score += _select([(market_type == 'buyer') & is_price,
+                            (market_type == 'seller') & is_terms_or_creative], [10, 10], 0)
+        # With a highly motivated seller price strategies get a bonus, with a
+        # low motivation seller terms and creative strategies do
+        score += _select([(motivation_level == 'high') & is_price,
+                            (motivation_level == 'low') & is_terms_or_creative], [15, 15], 0)
+        
+        scores = score.tolist()
+        for strategy, strategy_score in zip(strategies, scores):
+            strategy['score'] = strategy_score
+        
+        # Rank each property's top strategies by score
+        ranked_lists = []
+        start = 0
+        for strategy_list in strategy_lists:
+            stop = start + len(strategy_list)
+            ranked_lists.append(RankedStrategies(strategy_list, scores[start:stop], top_k))
+            start = stop
+        
+        return ranked_lists
     
-    def _generate_creative_strategy_script(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_negotiation_script(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Generates a negotiation script for a creative strategy
+        Generates a negotiation script based on the top strategy
         
         Args:
-            strategy: Creative negotiation strategy
+            strategy: Top-ranked negotiation strategy
             
         Returns:
             Dict containing negotiation script
         """
-        # Extract key data
-        strategy_name = strategy.get('name', '')
-        description = strategy.get('description', '')
-        justifications = strategy.get('justification', [])
-        
-        # Generate script based on strategy name
-        if 'Repair Credits' in strategy_name:
-            credit_amount = strategy.get('credit_amount', 0)
-            
-            opening = f"Rather than requesting a price reduction, I'd like to propose ${credit_amount:,} in repair credits to address some issues with the property."
-            
-            key_points = [
-                "This approach maintains your asking price for appraisal and neighborhood comp purposes",
-                "It allows me to address the property issues directly after closing",
-                "This can be a tax advantage for both of us compared to a price reduction"
-            ]
-            
-            closing = "This structure gives you the sale price you want while acknowledging the property's condition and necessary improvements."
-            
-        elif 'As-Is Purchase' in strategy_name:
-            discount = strategy.get('discount_needed', 0)
-            
-            opening = "I'm prepared to purchase the property as-is, without requesting any repairs, but would need to account for the condition in my offer price."
-            
-            key_points = [
-                "I'll conduct an inspection for information only, not for negotiation",
-                "This eliminates the risk of repair negotiations or surprises later",
-                f"My offer would need to be adjusted by approximately ${discount:,} to account for the needed repairs",
-                "This creates a clean, simple transaction with no contingencies for property condition"
-            ]
-            
-            closing = "This approach gives you certainty that the deal won't fall through due to property condition issues, while allowing me to address the needed repairs after closing."
-            
-        elif 'Seller Pain Point' in strategy_name:
-            opening = "I'd like to understand if there are any specific challenges or concerns you have about selling this property, beyond just the price."
-            
-            solutions = strategy.get('potential_solutions', [])
-            key_points = [f"If {solution['pain_point'].lower()} is a concern, I could {solution['solution'].lower()}" for solution in solutions]
-            
-            closing = "By addressing these specific concerns, we can create a transaction that truly works for your situation, not just a standard deal focused only on price."
-            
-        elif 'Seller Financing' in strategy_name:
-            structure = strategy.get('structure', {})
-            
-            opening = "I'd like to propose a creative financing structure that might benefit both of us, involving some seller financing."
-            
-            key_points = [
-                f"I would make a ${structure.get('down_payment', 0):,} down payment (20%)",
-                f"Get bank financing for ${structure.get('bank_financing', 0):,} (60%)",
-                f"And ask you to carry a note for ${structure.get('seller_financing', 0):,} (20%)",
-                f"The seller note would be at {structure.get('seller_note_terms', '6% interest')}",
-                f"This would provide you with monthly income of approximately ${structure.get('monthly_payment_to_seller', 0):,}"
-            ]
-            
-            closing = "This structure provides you with some immediate cash at closing, plus an ongoing income stream at an interest rate higher than most savings accounts or CDs."
-            
-        else:
-            # Generic creative strategy script
-            opening = "I'd like to propose a creative approach to this transaction that might address both our needs better than a standard offer."
-            
-            key_points = [
-                "I've thought about ways to structure this deal that go beyond just the price",
-                "My goal is to find a win-win solution that addresses your specific needs",
-                "This approach could provide benefits that a traditional transaction might not"
-            ]
-            
-            closing = "I'm open to discussing this creative approach further and adapting it based on your feedback and specific situation."
-        
-        return {
-            'opening_statement': opening,
-            'key_points': key_points,
-            'closing_statement': closing
-        }
+        return render_script(strategy)
     
-    def _identify_fallback_options(self, ranked_strategies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _identify_fallback_options(self, ranked_strategies: RankedStrategies) -> List[Dict[str, Any]]:
         """
         Identifies fallback options if the top strategy is rejected
         
         Args:
-            ranked_strategies: List of ranked negotiation strategies
+            ranked_strategies: Ranked negotiation strategies (fallbacks may
+                come from beyond the top k)
             
         Returns:
             List of fallback options
@@ -1248,7 +1402,7 @@ class StrategyGenerator:
         fallback_options = []
         
         # Need at least 2 strategies to create fallbacks
-        if len(ranked_strategies) < 2:
+        if len(ranked_strategies.candidates) < 2:
             return fallback_options
         
         # Get top strategy
@@ -1257,14 +1411,13 @@ class StrategyGenerator:
         # If top strategy is price-based, first fallback should be terms or creative
         if top_strategy['type'] == 'price':
             # Find highest ranked non-price strategy
-            for strategy in ranked_strategies[1:]:
-                if strategy['type'] != 'price':
-                    fallback_options.append({
-                        'name': f"Switch to {strategy['name']}",
-                        'description': f"If price negotiation fails, pivot to {strategy['description']}",
-                        'original_strategy': strategy
-                    })
-                    break
+            strategy = ranked_strategies.best(('terms', 'creative'))
+            if strategy is not None:
+                fallback_options.append({
+                    'name': f"Switch to {strategy['name']}",
+                    'description': f"If price negotiation fails, pivot to {strategy['description']}",
+                    'original_strategy': strategy
+                })
             
             # Add a price compromise fallback
             if 'offer_price' in top_strategy:
@@ -1281,14 +1434,13 @@ class StrategyGenerator:
         # If top strategy is terms-based, fallback to price or different terms
         elif top_strategy['type'] == 'terms':
             # Find highest ranked price strategy
-            for strategy in ranked_strategies[1:]:
-                if strategy['type'] == 'price':
-                    fallback_options.append({
-                        'name': f"Switch to {strategy['name']}",
-                        'description': f"If terms negotiation fails, pivot to {strategy['description']}",
-                        'original_strategy': strategy
-                    })
-                    break
+            strategy = ranked_strategies.best(('price',))
+            if strategy is not None:
+                fallback_options.append({
+                    'name': f"Switch to {strategy['name']}",
+                    'description': f"If terms negotiation fails, pivot to {strategy['description']}",
+                    'original_strategy': strategy
+                })
             
             # Add a terms compromise fallback
             fallback_options.append({
@@ -1299,25 +1451,15 @@ class StrategyGenerator:
         
         # If top strategy is creative, fallback to price or terms
         elif top_strategy['type'] == 'creative':
-            # Find highest ranked price strategy
-            for strategy in ranked_strategies[1:]:
-                if strategy['type'] == 'price':
-                    fallback_options.append({
-                        'name': f"Switch to {strategy['name']}",
-                        'description': f"If creative approach fails, pivot to {strategy['description']}",
-                        'original_strategy': strategy
-                    })
-                    break
-            
-            # Find highest ranked terms strategy
-            for strategy in ranked_strategies[1:]:
-                if strategy['type'] == 'terms':
+            # Find highest ranked price and terms strategies
+            for strategy_type in ('price', 'terms'):
+                strategy = ranked_strategies.best((strategy_type,))
+                if strategy is not None:
                     fallback_options.append({
                         'name': f"Switch to {strategy['name']}",
                         'description': f"If creative approach fails, pivot to {strategy['description']}",
                         'original_strategy': strategy
                     })
-                    break
         
         # Add a general compromise fallback if we don't have enough options
         if len(fallback_options) < 2:
@@ -1329,6 +1471,27 @@ class StrategyGenerator:
         
         return fallback_options
     
+    def _compute_offer_curves(self,
+                              properties: Sequence[Dict[str, Any]],
+                              markets: Sequence[Dict[str, Any]],
+                              seller_motivations: Sequence[Dict[str, Any]]) -> OfferCurves:
+        """
+        Computes success probability and expected savings curves over offer prices
+        
+        Args:
+            properties: Property details per property
+            markets: Market analysis per property
+            seller_motivations: Seller motivation assessment per property
+            
+        Returns:
+            OfferCurves with one row per property
+        """
+        return compute_offer_curves(
+            listing_prices=[data.get('listing_price', data.get('estimated_value', 0)) for data in properties],
+            motivation_levels=[motivation.get('level', 'moderate') for motivation in seller_motivations],
+            market_types=[market_data.get('supply_demand', {}).get('market_type', 'balanced') for market_data in markets]
+        )
+    
     def _calculate_success_probability(self, 
                                       discount_pct: float, 
                                       motivation_level: str, 
@@ -1344,43 +1507,7 @@ class StrategyGenerator:
         Returns:
             Float representing probability of success (0-1)
         """
-        # Base probability based on discount percentage
-        if discount_pct <= 0.03:
-            base_probability = 0.9
-        elif discount_pct <= 0.05:
-            base_probability = 0.8
-        elif discount_pct <= 0.08:
-            base_probability = 0.7
-        elif discount_pct <= 0.1:
-            base_probability = 0.6
-        elif discount_pct <= 0.15:
-            base_probability = 0.4
-        else:
-            base_probability = 0.3
-        
-        # Adjust based on seller motivation
-        motivation_factor = 1.0
-        if motivation_level == 'high':
-            motivation_factor = 1.3
-        elif motivation_level == 'moderate':
-            motivation_factor = 1.0
-        else:  # low
-            motivation_factor = 0.7
-        
-        # Adjust based on market type
-        market_factor = 1.0
-        if market_type == 'buyer':
-            market_factor = 1.2
-        elif market_type == 'balanced':
-            market_factor = 1.0
-        else:  # seller
-            market_factor = 0.8
-        
-        # Calculate final probability
-        probability = base_probability * motivation_factor * market_factor
-        
-        # Cap between 0.1 and 0.95
-        return max(0.1, min(0.95, probability))
+        return float(success_probability(discount_pct, motivation_level, market_type))
 
 
 class NegotiationStrategist:
@@ -1388,14 +1515,36 @@ class NegotiationStrategist:
     Main class for generating negotiation strategies and scripts
     """
     
-    def __init__(self):
-        """Initialize the NegotiationStrategist"""
-        self.strategy_generator = StrategyGenerator()
+    def __init__(self,
+                 data_version: str = None,
+                 render_scripts: bool = True,
+                 top_k: Optional[int] = None,
+                 listing_events: ListingEventStore = None):
+        """
+        Initialize the NegotiationStrategist
+        
+        Args:
+            data_version: Data version used to seed estimates (defaults to
+                ANALYSIS_DATA_VERSION)
+            render_scripts: Whether strategies include the negotiation script
+                (if False, render it on request with negotiation_script)
+            top_k: Default number of strategies ranked and returned per
+                property (None returns all of them)
+            listing_events: Recorded listing events for seller motivation
+                (defaults to the store at LISTING_EVENTS_PATH, if that file exists)
+        """
+        self.strategy_generator = StrategyGenerator(
+            data_version=data_version,
+            render_scripts=render_scripts,
+            top_k=top_k,
+            listing_events=listing_events
+        )
         
     def generate_strategies(self, 
                            property_data: Dict[str, Any], 
                            market_data: Dict[str, Any], 
-                           valuation_data: Dict[str, Any]) -> Dict[str, Any]:
+                           valuation_data: Dict[str, Any],
+                           top_k: Optional[int] = None) -> Dict[str, Any]:
         """
         Generates negotiation strategies based on property, market, and valuation data
         
@@ -1403,11 +1552,47 @@ class NegotiationStrategist:
             property_data: Property details and characteristics
             market_data: Market analysis and conditions
             valuation_data: Property valuation and investment analysis
+            top_k: Number of strategies to rank and return (defaults to the
+                strategist's top_k)
             
         Returns:
             Dict containing negotiation strategies and recommendations
         """
-        return self.strategy_generator.generate_strategies(property_data, market_data, valuation_data)
+        return self.strategy_generator.generate_strategies(property_data, market_data, valuation_data, top_k)
+    
+    def generate_strategies_batch(self,
+                                  analyses: Sequence[Dict[str, Any]],
+                                  top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Generates negotiation strategies for a portfolio of properties
+        
+        Args:
+            analyses: Property analyses, each with 'property', 'market' and
+                'valuation' entries
+            top_k: Number of strategies to rank and return per property
+                (defaults to the strategist's top_k)
+            
+        Returns:
+            List of negotiation strategy dicts, in input order (each equal to
+            generate_strategies for that property)
+        """
+        return self.strategy_generator.generate_strategies_batch(analyses, top_k)
+    
+    def negotiation_script(self, negotiation_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the negotiation script for generated strategies, rendering it
+        from the top-ranked strategy if it was not included
+        
+        Args:
+            negotiation_data: Result of generate_strategies
+            
+        Returns:
+            Dict containing opening_statement, key_points and closing_statement
+        """
+        if negotiation_data.get('negotiation_script'):
+            return negotiation_data['negotiation_script']
+        strategies = negotiation_data.get('recommended_strategies') or [None]
+        return render_script(strategies[0])
 
 
 # Example usage
@@ -0,0 +1,201 @@
+"""
+Offer Price Optimization for Real Estate Valuation and Negotiation Strategist
+
+This module scores offer prices for many properties at once. The success
+probability of an offer depends on its discount from the listing price, the
+seller's motivation level and the market type; it is tabulated for every
+motivation x market combination over a dense grid of discounts, then
+multiplied by the savings at each discount to find the offer that maximizes
+the expected savings. Results keep the full curve so it can be plotted.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Any, Optional, Sequence, Union
+
+import numpy as np
+
+# Success probability by discount from listing price: discounts up to each
+# edge (inclusive) get the matching probability, larger discounts the last one
+DISCOUNT_BIN_EDGES = np.array([0.03, 0.05, 0.08, 0.1, 0.15])
+DISCOUNT_BIN_PROBABILITIES = np.array([0.9, 0.8, 0.7, 0.6, 0.4, 0.3])
+
+# Probability multipliers; unknown labels get the last (least favourable) factor
+MOTIVATION_LEVELS = ('high', 'moderate', 'low')
+MOTIVATION_FACTORS = np.array([1.3, 1.0, 0.7])
+MARKET_TYPES = ('buyer', 'balanced', 'seller')
+MARKET_FACTORS = np.array([1.2, 1.0, 0.8])
+
+MIN_SUCCESS_PROBABILITY = 0.1
+MAX_SUCCESS_PROBABILITY = 0.95
+
+# Offer discounts evaluated: 0-25% below listing price in 0.1% steps
+OFFER_DISCOUNT_GRID = np.round(np.arange(251) * 0.001, 3)
+
+
+def _label_codes(labels: Union[str, Sequence[str]], names: Sequence[str]) -> np.ndarray:
+    """
+    Maps labels to their position in names (unknown labels map to the last name)
+
+    Args:
+        labels: One label or a sequence of labels
+        names: Known labels
+
+    Returns:
+        Integer array with the shape of labels
+    """
+    lookup = {name: code for code, name in enumerate(names)}
+    if isinstance(labels, str):
+        return np.array(lookup.get(labels, len(names) - 1))
+    return np.array([lookup.get(label, len(names) - 1) for label in labels], dtype=int)
+
+
+# Plain-Python copies of the tables for scoring one offer at a time
+_BIN_EDGES = DISCOUNT_BIN_EDGES.tolist()
+_BIN_PROBABILITIES = DISCOUNT_BIN_PROBABILITIES.tolist()
+_MOTIVATION_FACTORS = dict(zip(MOTIVATION_LEVELS, MOTIVATION_FACTORS.tolist()))
+_MARKET_FACTORS = dict(zip(MARKET_TYPES, MARKET_FACTORS.tolist()))
+
+
+def _scalar_success_probability(discount: float, motivation_level: str, market_type: str) -> float:
+    """Scores one offer without array overhead (same rules as success_probability)"""
+    probability = (_BIN_PROBABILITIES[bisect_left(_BIN_EDGES, discount)]
+                   * _MOTIVATION_FACTORS.get(motivation_level, _MOTIVATION_FACTORS[MOTIVATION_LEVELS[-1]])
+                   * _MARKET_FACTORS.get(market_type, _MARKET_FACTORS[MARKET_TYPES[-1]]))
+    return max(MIN_SUCCESS_PROBABILITY, min(MAX_SUCCESS_PROBABILITY, probability))
+
+
+def success_probability_table(discounts: Sequence[float] = None) -> np.ndarray:
+    """
+    Tabulates offer success probabilities for every motivation and market
+
+    Args:
+        discounts: Discounts from listing price as fractions (defaults to
+            OFFER_DISCOUNT_GRID)
+
+    Returns:
+        Array of shape (motivation levels, market types, discounts), indexed
+        in MOTIVATION_LEVELS and MARKET_TYPES order
+    """
+    discounts = OFFER_DISCOUNT_GRID if discounts is None else np.asarray(discounts, dtype=float)
+    base = DISCOUNT_BIN_PROBABILITIES[np.searchsorted(DISCOUNT_BIN_EDGES, discounts, side='left')]
+    probability = base * MOTIVATION_FACTORS[:, None, None] * MARKET_FACTORS[None, :, None]
+    return np.clip(probability, MIN_SUCCESS_PROBABILITY, MAX_SUCCESS_PROBABILITY)
+
+
+def success_probability(discounts: Union[float, Sequence[float]],
+                        motivation_levels: Union[str, Sequence[str]],
+                        market_types: Union[str, Sequence[str]]) -> np.ndarray:
+    """
+    Computes offer success probabilities, broadcasting the arguments together
+
+    Args:
+        discounts: Discount from listing price as a fraction
+        motivation_levels: Seller motivation level (high, moderate, low)
+        market_types: Market type (buyer, balanced, seller)
+
+    Returns:
+        Array of probabilities between MIN_SUCCESS_PROBABILITY and
+        MAX_SUCCESS_PROBABILITY
+    """
+    if isinstance(motivation_levels, str) and isinstance(market_types, str) and np.ndim(discounts) == 0:
+        return np.float64(_scalar_success_probability(float(discounts), motivation_levels, market_types))
+    discounts = np.asarray(discounts, dtype=float)
+    base = DISCOUNT_BIN_PROBABILITIES[np.searchsorted(DISCOUNT_BIN_EDGES, discounts, side='left')]
+    probability = (base
+                   * MOTIVATION_FACTORS[_label_codes(motivation_levels, MOTIVATION_LEVELS)]
+                   * MARKET_FACTORS[_label_codes(market_types, MARKET_TYPES)])
+    return np.clip(probability, MIN_SUCCESS_PROBABILITY, MAX_SUCCESS_PROBABILITY)
+
+
+class OfferCurves:
+    """
+    Success probability and expected savings curves for a batch of properties
+
+    Curves are N x G arrays, with one column per entry in ``discounts``.
+    """
+
+    def __init__(self,
+                 discounts: np.ndarray,
+                 listing_prices: np.ndarray,
+                 probabilities: np.ndarray):
+        """
+        Initialize the OfferCurves
+
+        Args:
+            discounts: Discount grid as fractions of listing price
+            listing_prices: Listing price per property
+            probabilities: Success probability per property and discount
+        """
+        self.discounts = discounts
+        self.listing_prices = listing_prices
+        self.probabilities = probabilities
+        self.savings = listing_prices[:, None] * discounts
+        self.offer_prices = listing_prices[:, None] - self.savings
+        self.expected_savings = probabilities * self.savings
+        # First maximum, so ties go to the smaller discount
+        self.optimal_index = np.argmax(self.expected_savings, axis=1)
+
+    def __len__(self) -> int:
+        return len(self.listing_prices)
+
+    def optimal(self, name: str) -> np.ndarray:
+        """
+        Returns one curve's value at each property's optimal offer
+
+        Args:
+            name: Curve attribute (e.g. 'offer_prices', 'expected_savings')
+
+        Returns:
+            Array with one value per property
+        """
+        return getattr(self, name)[np.arange(len(self)), self.optimal_index]
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        """
+        Builds the offer curve for one property
+
+        Args:
+            index: Position of the property in the batch
+
+        Returns:
+            Dict containing the curve (one entry per discount) and the offer
+            that maximizes the expected savings
+        """
+        best = self.optimal_index[index]
+        return {
+            'discount_percentages': np.round(self.discounts * 100, 1).tolist(),
+            'offer_prices': self.offer_prices[index].astype(int).tolist(),
+            'success_probabilities': np.round(self.probabilities[index], 3).tolist(),
+            'expected_savings': self.expected_savings[index].astype(int).tolist(),
+            'optimal_offer': {
+                'offer_price': int(self.offer_prices[index, best]),
+                'discount_percentage': round(float(self.discounts[best]) * 100, 1),
+                'success_probability': round(float(self.probabilities[index, best]), 3),
+                'savings': int(self.savings[index, best]),
+                'expected_savings': int(self.expected_savings[index, best])
+            }
+        }
+
+
+def compute_offer_curves(listing_prices: Sequence[float],
+                         motivation_levels: Sequence[str],
+                         market_types: Sequence[str],
+                         discounts: Optional[Sequence[float]] = None) -> OfferCurves:
+    """
+    Computes offer curves and expected-value-optimal offers for a batch of properties
+
+    Args:
+        listing_prices: Listing price per property
+        motivation_levels: Seller motivation level per property
+        market_types: Market type per property
+        discounts: Discounts from listing price as fractions (defaults to
+            OFFER_DISCOUNT_GRID)
+
+    Returns:
+        OfferCurves with one row per property
+    """
+    discounts = OFFER_DISCOUNT_GRID if discounts is None else np.asarray(discounts, dtype=float)
+    table = success_probability_table(discounts)
+    probabilities = table[_label_codes(motivation_levels, MOTIVATION_LEVELS),
+                          _label_codes(market_types, MARKET_TYPES)]
+    return OfferCurves(discounts, np.asarray(listing_prices, dtype=float), probabilities)
@@ -8,13 +8,37 @@ and valuation analysis.
 import os
 import re
 import json
-import requests
-from typing import Dict, Any, Tuple, List, Optional
+import math
+import time
+import multiprocessing
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from typing import Dict, Any, Tuple, List, Optional, Iterable, Iterator, NamedTuple, IO, Union
 from dotenv import load_dotenv
-import pandas as pd
 import numpy as np
-from geopy.geocoders import GoogleV3
-from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+
+from geocoding import (
+    GeocodeCache,
+    ZipCentroidTable,
+    canonical_address,
+    building_key,
+    strip_unit,
+    extract_zip_code,
+    parse_address_components,
+    get_default_cache,
+    get_default_centroid_table
+)
+from investment_metrics import InvestmentMetrics, compute_investment_metrics, compute_hold_period_returns
+from investment_simulation import SimulationAssumptions, simulate_investments
+from renovation_analysis import compute_renovation_analysis
+from seeding import analysis_rng, resolve_data_version
+from market_context import MarketContextCache, copy_market_context, get_default_market_cache
+from batch_checkpoint import JsonlResultWriter
+from property_records import PropertyRecord
+from comparables import ComparablesStore, get_default_comparables_store
+from stage_timing import create_stage_timer
 
 # Load environment variables
 load_dotenv()
@@ -26,20 +50,61 @@ ATTOM_API_KEY = os.getenv("ATTOM_API_KEY", "demo_key")
 ZILLOW_API_KEY = os.getenv("ZILLOW_API_KEY", "demo_key")
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY", "demo_key")
 
+# Batch processing settings
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "8"))
+BATCH_ADDRESS_TIMEOUT = float(os.getenv("BATCH_ADDRESS_TIMEOUT", "30"))
+BATCH_CHUNK_SIZE = int(os.getenv("BATCH_CHUNK_SIZE", "16"))
+BATCH_GEOCODE_BLOCK_SIZE = int(os.getenv("BATCH_GEOCODE_BLOCK_SIZE", "500"))
+
+def _random_list_choice(rng: np.random.Generator, options: List[List[str]]) -> List[str]:
+    """
+    Picks one of several feature lists at random
+    
+    Generator.choice only accepts 1-D choices, so lists of lists are chosen by index.
+    
+    Args:
+        rng: Random generator
+        options: Candidate feature lists
+        
+    Returns:
+        A copy of the chosen list
+    """
+    return list(options[rng.integers(len(options))])
+
+
 class AddressProcessor:
     """
     Handles address validation, standardization, and geocoding
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, 
+                 api_key: str = None,
+                 cache: GeocodeCache = None,
+                 centroid_table: ZipCentroidTable = None):
         """
         Initialize the AddressProcessor
         
         Args:
             api_key: Google Maps API key for geocoding
+            cache: Persistent geocode cache (defaults to the shared cache)
+            centroid_table: Offline ZIP centroid table used when the geocoder is unavailable
         """
         self.api_key = api_key or GOOGLE_MAPS_API_KEY
-        self.geocoder = GoogleV3(api_key=self.api_key)
+        self._geocoder = None
+        self.cache = cache or get_default_cache()
+        self.centroid_table = centroid_table or get_default_centroid_table()
+    
+    @property
+    def geocoder(self):
+        """Google geocoder client, created on first use so geopy is only imported when needed"""
+        if self._geocoder is None:
+            from geopy.geocoders import GoogleV3
+            self._geocoder = GoogleV3(api_key=self.api_key)
+        return self._geocoder
+    
+    @geocoder.setter
+    def geocoder(self, geocoder) -> None:
+        self._geocoder = geocoder
         
     def validate_address(self, address: str) -> bool:
         """
@@ -76,51 +141,100 @@ class AddressProcessor:
         """
         Converts address to geographic coordinates and extracts location components
         
+        Results are served from the persistent cache when possible. If the
+        geocoder times out, is over quota or is otherwise unavailable, the
+        address is placed at its ZIP code centroid instead.
+        
         Args:
             address: The address to geocode
             
         Returns:
             Dict containing geocoding results including coordinates and address components
         """
+        address_key = canonical_address(address)
+        cached = self.cache.get(address_key)
+        if cached is not None:
+            return cached
+        
+        from geopy.exc import GeocoderTimedOut, GeocoderServiceError
         try:
             location = self.geocoder.geocode(address, exactly_one=True)
-            if not location:
-                return {
-                    'success': False,
-                    'error': 'Address could not be geocoded'
-                }
-            
-            # Extract address components from raw data
-            address_components = {}
-            raw = location.raw.get('address_components', [])
-            
-            for component in raw:
-                types = component.get('types', [])
-                if 'postal_code' in types:
-                    address_components['zip_code'] = component.get('long_name')
-                elif 'locality' in types:
-                    address_components['city'] = component.get('long_name')
-                elif 'administrative_area_level_1' in types:
-                    address_components['state'] = component.get('long_name')
-                    address_components['state_code'] = component.get('short_name')
-                elif 'administrative_area_level_2' in types:
-                    address_components['county'] = component.get('long_name')
-                
-            return {
-                'success': True,
-                'coordinates': {
-                    'latitude': location.latitude,
-                    'longitude': location.longitude
-                },
-                'formatted_address': location.address,
-                'components': address_components
+        except (GeocoderTimedOut, GeocoderServiceError) as e:
+            return self._geocode_from_zip_centroid(address, f'Geocoding error: {str(e)}')
+        
+        if not location:
+            result = {
+                'success': False,
+                'error': 'Address could not be geocoded'
             }
+            self.cache.set(address_key, result)
+            return result
+        
+        # Extract address components from raw data
+        address_components = {}
+        raw = location.raw.get('address_components', [])
+        
+        for component in raw:
+            types = component.get('types', [])
+            if 'postal_code' in types:
+                address_components['zip_code'] = component.get('long_name')
+            elif 'locality' in types:
+                address_components['city'] = component.get('long_name')
+            elif 'administrative_area_level_1' in types:
+                address_components['state'] = component.get('long_name')
+                address_components['state_code'] = component.get('short_name')
+            elif 'administrative_area_level_2' in types:
+                address_components['county'] = component.get('long_name')
             
-        except (GeocoderTimedOut, GeocoderServiceError) as e:
+        result = {
+            'success': True,
+            'coordinates': {
+                'latitude': location.latitude,
+                'longitude': location.longitude
+            },
+            'formatted_address': location.address,
+            'components': address_components
+        }
+        self.cache.set(address_key, result)
+        return result
+    
+    def _geocode_from_zip_centroid(self, address: str, error: str) -> Dict[str, Any]:
+        """
+        Approximates an address's location by its ZIP code centroid
+        
+        The offline centroid table is tried first, then the centroid of cached
+        addresses in the same ZIP. Approximate results are never cached, so the
+        address is geocoded properly once the geocoder is back.
+        
+        Args:
+            address: The address to locate
+            error: Error from the online geocoder, returned if no centroid is known
+            
+        Returns:
+            Dict containing approximate geocoding results, or the geocoder error
+        """
+        zip_code = extract_zip_code(address)
+        centroid = None
+        if zip_code:
+            centroid = self.centroid_table.lookup(zip_code) or self.cache.zip_centroid(zip_code)
+        
+        if centroid is None:
             return {
                 'success': False,
-                'error': f'Geocoding error: {str(e)}'
+                'error': error
             }
+        
+        return {
+            'success': True,
+            'coordinates': {
+                'latitude': centroid[0],
+                'longitude': centroid[1]
+            },
+            'formatted_address': address,
+            'components': parse_address_components(address),
+            'approximate': True,
+            'location_source': 'zip_centroid'
+        }
 
 
 class PropertyDataRetriever:
@@ -132,7 +246,8 @@ class PropertyDataRetriever:
                  housecanary_key: str = None, 
                  housecanary_secret: str = None,
                  attom_key: str = None,
-                 zillow_key: str = None):
+                 zillow_key: str = None,
+                 data_version: str = None):
         """
         Initialize the PropertyDataRetriever
         
@@ -141,11 +256,14 @@ class PropertyDataRetriever:
             housecanary_secret: HouseCanary API secret
             attom_key: ATTOM API key
             zillow_key: Zillow API key
+            data_version: Data version used to seed simulated responses
+                (defaults to ANALYSIS_DATA_VERSION)
         """
         self.housecanary_key = housecanary_key or HOUSECANARY_API_KEY
         self.housecanary_secret = housecanary_secret or HOUSECANARY_API_SECRET
         self.attom_key = attom_key or ATTOM_API_KEY
         self.zillow_key = zillow_key or ZILLOW_API_KEY
+        self.data_version = data_version
         
     def get_property_data(self, address: str, location_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -172,7 +290,9 @@ class PropertyDataRetriever:
             # property_data = response.json()
             
             # For demonstration, generate mock data
-            property_data = self._generate_mock_property_data(address, location_data)
+            property_data = self._generate_mock_property_data(
+                address, location_data, analysis_rng(address, 'property', self.data_version)
+            )
             return {
                 'success': True,
                 'data': property_data
@@ -181,7 +301,9 @@ class PropertyDataRetriever:
         except Exception as e:
             # If primary API fails, try fallback
             try:
-                fallback_data = self._get_fallback_property_data(address, location_data)
+                fallback_data = self._get_fallback_property_data(
+                    address, location_data, analysis_rng(address, 'property', self.data_version)
+                )
                 return {
                     'success': True,
                     'data': fallback_data,
@@ -209,11 +331,7 @@ class PropertyDataRetriever:
         # For demonstration, we'll simulate the API responses
         
         try:
-            # Primary valuation (HouseCanary)
-            primary_valuation = self._get_primary_valuation(address, property_data)
-            
-            # Secondary valuation (Zillow)
-            secondary_valuation = self._get_secondary_valuation(address, property_data)
+            primary_valuation, secondary_valuation = self._get_provider_valuations(address, property_data)
             
             # Aggregate and analyze valuations
             aggregated_valuation = self._aggregate_valuations(
@@ -237,13 +355,38 @@ class PropertyDataRetriever:
                 'error': f'Failed to retrieve valuation data: {str(e)}'
             }
     
-    def _generate_mock_property_data(self, address: str, location_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_provider_valuations(self, address: str, property_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Retrieves the raw valuations from the primary and secondary sources
+        
+        Args:
+            address: The property address
+            property_data: Property details data
+            
+        Returns:
+            Tuple containing the primary and secondary valuations
+        """
+        rng = analysis_rng(address, 'valuation', self.data_version)
+        
+        # Primary valuation (HouseCanary)
+        primary_valuation = self._get_primary_valuation(address, property_data, rng)
+        
+        # Secondary valuation (Zillow)
+        secondary_valuation = self._get_secondary_valuation(address, property_data, rng)
+        
+        return primary_valuation, secondary_valuation
+    
+    def _generate_mock_property_data(self, 
+                                     address: str, 
+                                     location_data: Dict[str, Any],
+                                     rng: np.random.Generator) -> Dict[str, Any]:
         """
         Generates mock property data for demonstration purposes
         
         Args:
             address: The property address
             location_data: Geocoded location data
+            rng: Random generator for the property stage
             
         Returns:
             Dict containing mock property details
@@ -259,19 +402,19 @@ class PropertyDataRetriever:
         base_value = 200000 + (zip_num * 1000)
         
         # Generate random property details
-        bedrooms = np.random.choice([2, 3, 4, 5], p=[0.2, 0.4, 0.3, 0.1])
-        bathrooms = np.random.choice([1, 1.5, 2, 2.5, 3, 3.5, 4], 
+        bedrooms = rng.choice([2, 3, 4, 5], p=[0.2, 0.4, 0.3, 0.1])
+        bathrooms = rng.choice([1, 1.5, 2, 2.5, 3, 3.5, 4], 
                                      p=[0.1, 0.15, 0.3, 0.2, 0.15, 0.05, 0.05])
         
         # Square footage based on bedrooms and bathrooms
         base_sqft = 750 + (bedrooms * 300) + (int(bathrooms) * 150)
-        square_feet = base_sqft + np.random.randint(-200, 200)
+        square_feet = base_sqft + int(rng.integers(-200, 200))
         
         # Lot size typically larger than house
-        lot_size = square_feet * np.random.uniform(1.5, 5)
+        lot_size = square_feet * rng.uniform(1.5, 5)
         
         # Year built - older in higher ZIP codes (just for variation)
-        year_built = 2023 - (zip_num % 100) - np.random.randint(0, 30)
+        year_built = 2023 - (zip_num % 100) - int(rng.integers(0, 30))
         
         # Property value based on features
         value_adjustment = (
@@ -283,80 +426,84 @@ class PropertyDataRetriever:
         estimated_value = base_value + value_adjustment
         
         # Days on market - random but weighted toward recent listings
-        days_on_market = int(np.random.exponential(30)) + 1
+        days_on_market = int(rng.exponential(30)) + 1
         
         # Last sold date - random but weighted toward recent sales
-        years_since_sale = int(np.random.exponential(5)) + 1
-        last_sold_date = f"{2023 - years_since_sale}-{np.random.randint(1, 13):02d}-{np.random.randint(1, 29):02d}"
+        years_since_sale = int(rng.exponential(5)) + 1
+        last_sold_date = f"{2023 - years_since_sale}-{int(rng.integers(1, 13)):02d}-{int(rng.integers(1, 29)):02d}"
         
         # Last sold price - typically less than current value
-        last_sold_price = estimated_value * np.random.uniform(0.7, 0.95)
+        last_sold_price = estimated_value * rng.uniform(0.7, 0.95)
         
         # Create property data structure
         return {
-            'property_id': f"{zip_code}{np.random.randint(1000, 9999)}",
+            'property_id': f"{zip_code}{int(rng.integers(1000, 9999))}",
             'address': address,
             'bedrooms': bedrooms,
             'bathrooms': bathrooms,
             'square_feet': int(square_feet),
             'lot_size': int(lot_size),
             'year_built': year_built,
-            'property_type': np.random.choice(['Single Family', 'Condo', 'Townhouse'], p=[0.7, 0.2, 0.1]),
+            'property_type': rng.choice(['Single Family', 'Condo', 'Townhouse'], p=[0.7, 0.2, 0.1]),
             'estimated_value': int(estimated_value),
             'last_sold_price': int(last_sold_price),
             'last_sold_date': last_sold_date,
             'days_on_market': days_on_market,
-            'listing_status': np.random.choice(['For Sale', 'Pending', 'Off Market'], p=[0.6, 0.1, 0.3]),
-            'listing_price': int(estimated_value * np.random.uniform(0.95, 1.1)),
+            'listing_status': rng.choice(['For Sale', 'Pending', 'Off Market'], p=[0.6, 0.1, 0.3]),
+            'listing_price': int(estimated_value * rng.uniform(0.95, 1.1)),
             'price_per_sqft': int(estimated_value / square_feet),
             'zoning': 'Residential',
-            'parking': np.random.choice(['Garage - 1 car', 'Garage - 2 car', 'Carport', 'Street']),
-            'heating': np.random.choice(['Central', 'Forced Air', 'Heat Pump', 'None']),
-            'cooling': np.random.choice(['Central', 'Window Units', 'None']),
-            'appliances': np.random.choice([
+            'parking': rng.choice(['Garage - 1 car', 'Garage - 2 car', 'Carport', 'Street']),
+            'heating': rng.choice(['Central', 'Forced Air', 'Heat Pump', 'None']),
+            'cooling': rng.choice(['Central', 'Window Units', 'None']),
+            'appliances': _random_list_choice(rng, [
                 ['Refrigerator', 'Dishwasher', 'Range/Oven'],
                 ['Refrigerator', 'Dishwasher', 'Range/Oven', 'Microwave'],
                 ['Refrigerator', 'Dishwasher', 'Range/Oven', 'Microwave', 'Washer', 'Dryer']
             ]),
-            'exterior_features': np.random.choice([
+            'exterior_features': _random_list_choice(rng, [
                 ['Deck'],
                 ['Patio'],
                 ['Deck', 'Patio'],
                 ['Deck', 'Pool'],
                 ['Patio', 'Porch']
             ]),
-            'interior_features': np.random.choice([
+            'interior_features': _random_list_choice(rng, [
                 ['Hardwood Floors'],
                 ['Carpet'],
                 ['Hardwood Floors', 'Fireplace'],
                 ['Tile Floors', 'Vaulted Ceilings']
             ]),
-            'roof_type': np.random.choice(['Composition Shingle', 'Tile', 'Metal']),
-            'foundation_type': np.random.choice(['Concrete Perimeter', 'Slab', 'Crawl Space']),
-            'construction_materials': np.random.choice([
+            'roof_type': rng.choice(['Composition Shingle', 'Tile', 'Metal']),
+            'foundation_type': rng.choice(['Concrete Perimeter', 'Slab', 'Crawl Space']),
+            'construction_materials': _random_list_choice(rng, [
                 ['Wood Frame', 'Stucco'],
                 ['Wood Frame', 'Vinyl Siding'],
                 ['Brick', 'Wood Frame']
             ]),
             'school_district': f"{location_data.get('components', {}).get('city', 'Local')} Unified",
-            'elementary_school': f"{np.random.choice(['Lincoln', 'Washington', 'Jefferson', 'Roosevelt'])} Elementary",
-            'middle_school': f"{np.random.choice(['Madison', 'Franklin', 'Kennedy'])} Middle School",
-            'high_school': f"{np.random.choice(['Central', 'Northern', 'Western', 'Eastern'])} High School",
+            'elementary_school': f"{rng.choice(['Lincoln', 'Washington', 'Jefferson', 'Roosevelt'])} Elementary",
+            'middle_school': f"{rng.choice(['Madison', 'Franklin', 'Kennedy'])} Middle School",
+            'high_school': f"{rng.choice(['Central', 'Northern', 'Western', 'Eastern'])} High School",
             'tax_assessment': int(estimated_value * 0.9),
             'annual_tax_amount': int(estimated_value * 0.01),
-            'hoa_fee': np.random.choice([0, 150, 250, 350, 450], p=[0.6, 0.1, 0.1, 0.1, 0.1]),
-            'flood_zone': np.random.choice(['X', 'A', 'AE'], p=[0.8, 0.1, 0.1]),
-            'earthquake_zone': np.random.choice(['Low Risk', 'Moderate Risk', 'High Risk']),
+            'hoa_fee': rng.choice([0, 150, 250, 350, 450], p=[0.6, 0.1, 0.1, 0.1, 0.1]),
+            'flood_zone': rng.choice(['X', 'A', 'AE'], p=[0.8, 0.1, 0.1]),
+            'earthquake_zone': rng.choice(['Low Risk', 'Moderate Risk', 'High Risk']),
             'coordinates': location_data.get('coordinates', {})
         }
     
-    def _get_fallback_property_data(self, address: str, location_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_fallback_property_data(self, 
+                                    address: str, 
+                                    location_data: Dict[str, Any],
+                                    rng: np.random.Generator) -> Dict[str, Any]:
         """
         Retrieves property data from fallback API (ATTOM)
         
         Args:
             address: The property address
             location_data: Geocoded location data
+            rng: Random generator for the property stage
             
         Returns:
             Dict containing property details from fallback source
@@ -365,22 +512,26 @@ class PropertyDataRetriever:
         # For demonstration, we'll simulate the API response
         
         # Simulate fallback data with slight variations from primary
-        primary_data = self._generate_mock_property_data(address, location_data)
+        primary_data = self._generate_mock_property_data(address, location_data, rng)
         
         # Adjust some values to simulate different data source
-        primary_data['estimated_value'] = int(primary_data['estimated_value'] * np.random.uniform(0.9, 1.1))
+        primary_data['estimated_value'] = int(primary_data['estimated_value'] * rng.uniform(0.9, 1.1))
         primary_data['price_per_sqft'] = int(primary_data['estimated_value'] / primary_data['square_feet'])
         primary_data['data_source'] = 'ATTOM (fallback)'
         
         return primary_data
     
-    def _get_primary_valuation(self, address: str, property_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_primary_valuation(self, 
+                               address: str, 
+                               property_data: Dict[str, Any],
+                               rng: np.random.Generator) -> Dict[str, Any]:
         """
         Retrieves valuation data from primary source (HouseCanary)
         
         Args:
             address: The property address
             property_data: Property details
+            rng: Random generator for the valuation stage
             
         Returns:
             Dict containing valuation data
@@ -407,17 +558,21 @@ class PropertyDataRetriever:
                 '5_year': int(estimated_value * 1.15)
             },
             'valuation_method': 'HouseCanary AVM',
-            'confidence_score': np.random.randint(75, 96),
+            'confidence_score': int(rng.integers(75, 96)),
             'data_source': 'HouseCanary'
         }
     
-    def _get_secondary_valuation(self, address: str, property_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_secondary_valuation(self, 
+                                 address: str, 
+                                 property_data: Dict[str, Any],
+                                 rng: np.random.Generator) -> Dict[str, Any]:
         """
         Retrieves valuation data from secondary source (Zillow)
         
         Args:
             address: The property address
             property_data: Property details
+            rng: Random generator for the valuation stage
             
         Returns:
             Dict containing valuation data
@@ -429,7 +584,7 @@ class PropertyDataRetriever:
         square_feet = property_data.get('square_feet', 1000)
         
         # Add some variation to the valuation
-        zillow_value = int(estimated_value * np.random.uniform(0.92, 1.08))
+        zillow_value = int(estimated_value * rng.uniform(0.92, 1.08))
         confidence_margin = zillow_value * 0.07
         
         return {
@@ -445,7 +600,7 @@ class PropertyDataRetriever:
                 '5_year': int(zillow_value * 1.12)
             },
             'valuation_method': 'Zillow Zestimate',
-            'confidence_score': np.random.randint(70, 91),
+            'confidence_score': int(rng.integers(70, 91)),
             'data_source': 'Zillow'
         }
     
@@ -620,57 +775,110 @@ class PropertyAnalyzer:
                  housecanary_key: str = None,
                  housecanary_secret: str = None,
                  attom_key: str = None,
-                 zillow_key: str = None):
+                 zillow_key: str = None,
+                 geocode_cache: GeocodeCache = None,
+                 data_version: str = None,
+                 market_cache: MarketContextCache = None,
+                 comparables_store: ComparablesStore = None,
+                 stage_timing: bool = None):
         """
         Initialize the PropertyAnalyzer
         
+        Analysis results are a pure function of the address, its geocoding
+        result and the data version: every stage draws from a generator seeded
+        from those, never from the global random state.
+        
         Args:
             google_api_key: Google Maps API key
             housecanary_key: HouseCanary API key
             housecanary_secret: HouseCanary API secret
             attom_key: ATTOM API key
             zillow_key: Zillow API key
+            geocode_cache: Geocode cache (defaults to the shared persistent cache)
+            data_version: Data version used to seed analyses (defaults to
+                ANALYSIS_DATA_VERSION)
+            market_cache: ZIP-level market context cache (defaults to the
+                shared in-process cache)
+            comparables_store: Recorded sales used for the CMA (defaults to
+                the sales at COMPARABLES_PATH, if that file exists)
+            stage_timing: Whether to time each analysis step and attach the
+                timings as 'stage_timings' (defaults to STAGE_TIMING_ENABLED)
         """
-        self.address_processor = AddressProcessor(api_key=google_api_key)
+        self.data_version = data_version
+        self.stage_timing = stage_timing
+        self.market_cache = get_default_market_cache() if market_cache is None else market_cache
+        self.comparables_store = get_default_comparables_store() if comparables_store is None else comparables_store
+        self.address_processor = AddressProcessor(api_key=google_api_key, cache=geocode_cache)
         self.data_retriever = PropertyDataRetriever(
             housecanary_key=housecanary_key,
             housecanary_secret=housecanary_secret,
             attom_key=attom_key,
-            zillow_key=zillow_key
+            zillow_key=zillow_key,
+            data_version=data_version
         )
         
-    def analyze_property(self, address: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def prepare_address(self, address: str) -> str:
         """
-        Analyzes a property based on its address
+        Validates an address, standardizing it if needed
         
         Args:
             address: The property address
             
         Returns:
-            Tuple containing property data and market data
+            str: The address to geocode and analyze
+            
+        Raises:
+            ValueError: If the address cannot be brought into a valid format
         """
-        # Step 1: Process and validate address
         if not self.address_processor.validate_address(address):
             standardized_address = self.address_processor.standardize_address(address)
             if not self.address_processor.validate_address(standardized_address):
                 raise ValueError(f"Invalid address format: {address}")
             address = standardized_address
+        return address
+    
+    def analyze_property(self, 
+                         address: str, 
+                         location_data: Dict[str, Any] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Analyzes a property based on its address
+        
+        Args:
+            address: The property address
+            location_data: Geocoding result for the address, if already known
+                (e.g. from a batch geocoding stage)
+            
+        Returns:
+            Tuple containing property data and market data (with stage timing
+            enabled, property data includes the step timings as 'stage_timings')
+        """
+        timer = create_stage_timer(self.stage_timing)
+        
+        # Step 1: Process and validate address
+        with timer.stage('address'):
+            address = self.prepare_address(address)
         
         # Step 2: Geocode address
-        location_data = self.address_processor.geocode_address(address)
+        if location_data is None:
+            with timer.stage('geocode'):
+                location_data = self.address_processor.geocode_address(address)
         if not location_data.get('success', False):
             raise ValueError(f"Failed to geocode address: {location_data.get('error', 'Unknown error')}")
         
         # Step 3: Retrieve property data
-        property_result = self.data_retriever.get_property_data(address, location_data)
+        with timer.stage('property_data'):
+            property_result = self.data_retriever.get_property_data(address, location_data)
         if not property_result.get('success', False):
             raise ValueError(f"Failed to retrieve property data: {property_result.get('error', 'Unknown error')}")
         
         property_data = property_result['data']
         
         # Step 4: Generate market analysis
-        market_data = self._analyze_market(location_data, property_data)
+        with timer.stage('market'):
+            market_data = self._analyze_market(location_data, property_data)
         
+        if timer.timings is not None:
+            property_data['stage_timings'] = timer.timings
         return property_data, market_data
     
     def generate_valuation(self, property_data: Dict[str, Any], market_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -682,9 +890,31 @@ class PropertyAnalyzer:
             market_data: Market analysis data
             
         Returns:
-            Dict containing valuation analysis
+            Dict containing valuation analysis (with stage timing enabled, also
+            the timings of every step so far as 'stage_timings')
         """
+        timer = create_stage_timer(self.stage_timing)
+        
         # Step 1: Retrieve valuation data
+        with timer.stage('valuation_data'):
+            valuation_data = self._fetch_valuation_data(property_data)
+        
+        # Steps 2-5: Market context, investment, renovation and CMA analysis
+        valuation = self._run_valuation_stages(valuation_data, property_data, market_data, timer)
+        if timer.timings is not None:
+            valuation['stage_timings'] = {**property_data.get('stage_timings', {}), **timer.timings}
+        return valuation
+    
+    def _fetch_valuation_data(self, property_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Retrieves raw valuation data from the valuation providers (I/O-bound)
+        
+        Args:
+            property_data: Property details
+            
+        Returns:
+            Dict containing primary, secondary and aggregated valuations
+        """
         valuation_result = self.data_retriever.get_valuation_data(
             property_data.get('address', ''), 
             property_data
@@ -693,47 +923,83 @@ class PropertyAnalyzer:
         if not valuation_result.get('success', False):
             raise ValueError(f"Failed to retrieve valuation data: {valuation_result.get('error', 'Unknown error')}")
         
-        valuation_data = valuation_result['data']
+        return valuation_result['data']
+    
+    def _run_valuation_stages(self, 
+                              valuation_data: Dict[str, Any], 
+                              property_data: Dict[str, Any], 
+                              market_data: Dict[str, Any],
+                              timer=None) -> Dict[str, Any]:
+        """
+        Runs the CPU-bound valuation stages on already retrieved data
+        
+        Args:
+            valuation_data: Raw valuation data from the providers
+            property_data: Property details
+            market_data: Market analysis data
+            timer: Stage timer of the calling analysis (a new one is created,
+                and its timings attached, if None)
+            
+        Returns:
+            Dict containing valuation analysis
+        """
+        address = property_data.get('address', '')
+        owns_timer = timer is None
+        if owns_timer:
+            timer = create_stage_timer(self.stage_timing)
         
         # Step 2: Enhance valuation with market context
-        enhanced_valuation = self._enhance_valuation_with_market_context(
-            valuation_data, 
-            property_data,
-            market_data
-        )
+        with timer.stage('market_context'):
+            enhanced_valuation = self._enhance_valuation_with_market_context(
+                valuation_data, 
+                property_data,
+                market_data
+            )
         
         # Step 3: Generate investment analysis
-        investment_analysis = self._generate_investment_analysis(
-            enhanced_valuation,
-            property_data,
-            market_data
-        )
+        with timer.stage('investment'):
+            investment_analysis = self._generate_investment_analysis(
+                enhanced_valuation,
+                property_data,
+                market_data
+            )
         
         # Step 4: Generate renovation analysis
-        renovation_analysis = self._generate_renovation_analysis(
-            enhanced_valuation,
-            property_data
-        )
+        with timer.stage('renovation'):
+            renovation_analysis = self._generate_renovation_analysis(
+                enhanced_valuation,
+                property_data,
+                analysis_rng(address, 'renovation', self.data_version)
+            )
         
         # Step 5: Generate comparable properties analysis
-        cma_results = self._generate_cma(
-            enhanced_valuation,
-            property_data,
-            market_data
-        )
+        with timer.stage('cma'):
+            cma_results = self._generate_cma(
+                enhanced_valuation,
+                property_data,
+                market_data,
+                analysis_rng(address, 'cma', self.data_version)
+            )
         
         # Combine all valuation components
-        return {
+        valuation = {
             'valuation': enhanced_valuation,
             'investment_metrics': investment_analysis,
             'renovation_analysis': renovation_analysis,
             'cma_results': cma_results
         }
+        if owns_timer and timer.timings is not None:
+            valuation['stage_timings'] = timer.timings
+        return valuation
     
     def _analyze_market(self, location_data: Dict[str, Any], property_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyzes market conditions for the property location
         
+        Market conditions are shared by every property in a ZIP code, so the
+        ZIP-level context comes from the market cache and is only built on a
+        miss or after its TTL expires.
+        
         Args:
             location_data: Geocoded location data
             property_data: Property details
@@ -741,13 +1007,38 @@ class PropertyAnalyzer:
         Returns:
             Dict containing market analysis
         """
-        # In production, this would retrieve actual market data
-        # For demonstration, we'll simulate the market analysis
-        
         # Extract location components
         zip_code = location_data.get('components', {}).get('zip_code', '00000')
         city = location_data.get('components', {}).get('city', 'Unknown')
-        state = location_data.get('components', {}).get('state_code', 'XX')
+        
+        context = self.market_cache.get_or_build(
+            zip_code,
+            resolve_data_version(self.data_version),
+            lambda: self._build_market_context(
+                zip_code, 
+                city, 
+                analysis_rng(zip_code or '', 'market', self.data_version)
+            )
+        )
+        
+        # The cached context is shared; hand out an independent copy
+        return copy_market_context(context)
+    
+    def _build_market_context(self, zip_code: str, city: str, rng: np.random.Generator) -> Dict[str, Any]:
+        """
+        Builds the market context for a ZIP code
+        
+        Args:
+            zip_code: ZIP code
+            city: City name
+            rng: Random generator for the ZIP code's market stage
+            
+        Returns:
+            Dict containing market metrics, cycle, neighborhood, supply/demand
+            and economic indicators
+        """
+        # In production, this would retrieve actual market data
+        # For demonstration, we'll simulate the market analysis
         
         # Generate market metrics based on location
         zip_num = int(zip_code[:3]) if zip_code and zip_code[:3].isdigit() else 0
@@ -756,12 +1047,12 @@ class PropertyAnalyzer:
         base_price = 200000 + (zip_num * 1000)
         
         # Market metrics
-        median_home_price = base_price + np.random.randint(-20000, 20000)
-        price_growth_rate = round(np.random.uniform(0.02, 0.08), 3)
-        days_on_market = np.random.randint(15, 60)
-        months_of_inventory = round(np.random.uniform(1.0, 6.0), 1)
+        median_home_price = base_price + int(rng.integers(-20000, 20000))
+        price_growth_rate = round(rng.uniform(0.02, 0.08), 3)
+        days_on_market = int(rng.integers(15, 60))
+        months_of_inventory = round(rng.uniform(1.0, 6.0), 1)
         absorption_rate = round(30 / days_on_market, 2)
-        sale_to_list_ratio = round(np.random.uniform(0.95, 1.05), 3)
+        sale_to_list_ratio = round(rng.uniform(0.95, 1.05), 3)
         price_per_sqft = round(median_home_price / 1800, 2)  # Assuming 1800 sq ft average home
         
         # Market cycle determination
@@ -781,30 +1072,30 @@ class PropertyAnalyzer:
         # Supply and demand analysis
         if months_of_inventory < 3:
             market_type = "seller"
-            inventory_trend = np.random.choice(["decreasing", "stable"], p=[0.7, 0.3])
-            demand_level = round(np.random.uniform(7.5, 10), 1)
-            supply_level = round(np.random.uniform(3, 6), 1)
-            competition = np.random.choice(["high", "very high"], p=[0.4, 0.6])
+            inventory_trend = rng.choice(["decreasing", "stable"], p=[0.7, 0.3])
+            demand_level = round(rng.uniform(7.5, 10), 1)
+            supply_level = round(rng.uniform(3, 6), 1)
+            competition = rng.choice(["high", "very high"], p=[0.4, 0.6])
         elif months_of_inventory > 6:
             market_type = "buyer"
-            inventory_trend = np.random.choice(["increasing", "stable"], p=[0.7, 0.3])
-            demand_level = round(np.random.uniform(3, 6), 1)
-            supply_level = round(np.random.uniform(7, 10), 1)
-            competition = np.random.choice(["low", "moderate"], p=[0.6, 0.4])
+            inventory_trend = rng.choice(["increasing", "stable"], p=[0.7, 0.3])
+            demand_level = round(rng.uniform(3, 6), 1)
+            supply_level = round(rng.uniform(7, 10), 1)
+            competition = rng.choice(["low", "moderate"], p=[0.6, 0.4])
         else:
             market_type = "balanced"
             inventory_trend = "stable"
-            demand_level = round(np.random.uniform(5, 7), 1)
-            supply_level = round(np.random.uniform(5, 7), 1)
+            demand_level = round(rng.uniform(5, 7), 1)
+            supply_level = round(rng.uniform(5, 7), 1)
             competition = "moderate"
         
         # Neighborhood analysis
-        neighborhood_name = f"{np.random.choice(['North', 'South', 'East', 'West', 'Central'])} {city}"
-        school_rating = np.random.randint(1, 11)
-        crime_rating = np.random.randint(1, 11)
-        amenity_rating = np.random.randint(1, 11)
-        walkability_score = np.random.randint(1, 101)
-        transit_score = np.random.randint(1, 101)
+        neighborhood_name = f"{rng.choice(['North', 'South', 'East', 'West', 'Central'])} {city}"
+        school_rating = int(rng.integers(1, 11))
+        crime_rating = int(rng.integers(1, 11))
+        amenity_rating = int(rng.integers(1, 11))
+        walkability_score = int(rng.integers(1, 101))
+        transit_score = int(rng.integers(1, 101))
         
         # Combine all market data
         return {
@@ -816,20 +1107,20 @@ class PropertyAnalyzer:
                 'absorption_rate': absorption_rate,
                 'sale_to_list_ratio': sale_to_list_ratio,
                 'price_per_sqft': price_per_sqft,
-                'new_listings_trend': np.random.choice(['increasing', 'stable', 'decreasing']),
-                'pending_sales_trend': np.random.choice(['increasing', 'stable', 'decreasing']),
-                'closed_sales_trend': np.random.choice(['increasing', 'stable', 'decreasing']),
-                'price_reductions_percentage': np.random.randint(5, 40),
-                'median_household_income': np.random.randint(50000, 150000),
-                'unemployment_rate': round(np.random.uniform(2.0, 8.0), 1),
-                'population_growth_rate': round(np.random.uniform(-0.01, 0.05), 3),
-                'job_growth_rate': round(np.random.uniform(-0.01, 0.05), 3)
+                'new_listings_trend': rng.choice(['increasing', 'stable', 'decreasing']),
+                'pending_sales_trend': rng.choice(['increasing', 'stable', 'decreasing']),
+                'closed_sales_trend': rng.choice(['increasing', 'stable', 'decreasing']),
+                'price_reductions_percentage': int(rng.integers(5, 40)),
+                'median_household_income': int(rng.integers(50000, 150000)),
+                'unemployment_rate': round(rng.uniform(2.0, 8.0), 1),
+                'population_growth_rate': round(rng.uniform(-0.01, 0.05), 3),
+                'job_growth_rate': round(rng.uniform(-0.01, 0.05), 3)
             },
             'market_cycle': {
                 'cycle_position': cycle_position,
                 'description': description,
-                'risk_level': np.random.choice(['Low', 'Moderate', 'High']),
-                'opportunity_level': np.random.choice(['Low', 'Moderate', 'High']),
+                'risk_level': rng.choice(['Low', 'Moderate', 'High']),
+                'opportunity_level': rng.choice(['Low', 'Moderate', 'High']),
                 'recommended_strategies': [
                     f"Focus on properties with value-add potential",
                     f"{'Negotiate aggressively' if market_type == 'buyer' else 'Expect competitive bidding'} on price",
@@ -838,31 +1129,31 @@ class PropertyAnalyzer:
             },
             'neighborhood': {
                 'neighborhood_name': neighborhood_name,
-                'neighborhood_class': np.random.choice(['A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-']),
+                'neighborhood_class': rng.choice(['A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-']),
                 'school_rating': school_rating,
                 'crime_rating': crime_rating,
                 'amenity_rating': amenity_rating,
                 'walkability_score': walkability_score,
                 'transit_score': transit_score,
-                'growth_potential': np.random.choice(['Low', 'Moderate', 'High']),
-                'demographic_trend': np.random.choice([
+                'growth_potential': rng.choice(['Low', 'Moderate', 'High']),
+                'demographic_trend': rng.choice([
                     'Young professionals', 
                     'Families', 
                     'Retirees', 
                     'Mixed demographics',
                     'Young professionals, families'
                 ]),
-                'development_activity': np.random.choice(['Low', 'Moderate', 'High']),
-                'gentrification_status': np.random.choice([
+                'development_activity': rng.choice(['Low', 'Moderate', 'High']),
+                'gentrification_status': rng.choice([
                     'Early stage', 
                     'Ongoing', 
                     'Advanced', 
                     'Stable', 
                     'None'
                 ]),
-                'price_trend': np.random.choice(['Appreciating', 'Stable', 'Depreciating']),
-                'rental_demand': np.random.choice(['Weak', 'Moderate', 'Strong']),
-                'neighborhood_features': np.random.choice([
+                'price_trend': rng.choice(['Appreciating', 'Stable', 'Depreciating']),
+                'rental_demand': rng.choice(['Weak', 'Moderate', 'Strong']),
+                'neighborhood_features': _random_list_choice(rng, [
                     ['Parks', 'Shopping centers', 'Good schools'],
                     ['Restaurants', 'Public transportation', 'Parks'],
                     ['Historic district', 'Walkable streets', 'Local businesses'],
@@ -875,35 +1166,35 @@ class PropertyAnalyzer:
                 'demand_level': demand_level,
                 'supply_level': supply_level,
                 'buyer_competition': competition,
-                'new_construction_impact': np.random.choice(['Low', 'Moderate', 'High']),
-                'investor_activity': np.random.choice(['Low', 'Moderate', 'High']),
-                'first_time_buyer_activity': np.random.choice(['Low', 'Moderate', 'High']),
-                'cash_buyer_percentage': np.random.randint(10, 40),
-                'foreign_buyer_activity': np.random.choice(['Low', 'Moderate', 'High'])
+                'new_construction_impact': rng.choice(['Low', 'Moderate', 'High']),
+                'investor_activity': rng.choice(['Low', 'Moderate', 'High']),
+                'first_time_buyer_activity': rng.choice(['Low', 'Moderate', 'High']),
+                'cash_buyer_percentage': int(rng.integers(10, 40)),
+                'foreign_buyer_activity': rng.choice(['Low', 'Moderate', 'High'])
             },
             'economic_indicators': {
-                'interest_rate_trend': np.random.choice(['Decreasing', 'Stable', 'Increasing']),
-                'mortgage_rate_forecast': np.random.choice([
+                'interest_rate_trend': rng.choice(['Decreasing', 'Stable', 'Increasing']),
+                'mortgage_rate_forecast': rng.choice([
                     'Expected to decrease', 
                     'Expected to remain stable', 
                     'Slight increase expected', 
                     'Significant increase expected'
                 ]),
-                'local_economic_health': np.random.choice(['Weak', 'Moderate', 'Strong']),
-                'major_employers': np.random.choice([
+                'local_economic_health': rng.choice(['Weak', 'Moderate', 'Strong']),
+                'major_employers': _random_list_choice(rng, [
                     ['Technology', 'Healthcare', 'Education'],
                     ['Manufacturing', 'Retail', 'Government'],
                     ['Finance', 'Healthcare', 'Technology'],
                     ['Tourism', 'Retail', 'Government']
                 ]),
-                'employment_diversity': np.random.choice(['Low', 'Moderate', 'High']),
-                'economic_risks': np.random.choice([
+                'employment_diversity': rng.choice(['Low', 'Moderate', 'High']),
+                'economic_risks': _random_list_choice(rng, [
                     ['Reliance on single industry', 'Rising unemployment'],
                     ['Aging population', 'Infrastructure needs'],
                     ['High cost of living', 'Income inequality'],
                     ['Environmental concerns', 'Regulatory changes']
                 ]),
-                'economic_opportunities': np.random.choice([
+                'economic_opportunities': _random_list_choice(rng, [
                     ['Growing tech sector', 'Infrastructure investment'],
                     ['Tourism growth', 'New business development'],
                     ['Healthcare expansion', 'Education improvements'],
@@ -914,7 +1205,7 @@ class PropertyAnalyzer:
     
     def _enhance_valuation_with_market_context(self, 
                                               valuation_data: Dict[str, Any],
-                                              property_data: Dict[str, Any],
+                                       property_data: Dict[str, Any],
                                               market_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enhances valuation data with market context
@@ -970,6 +1261,10 @@ class PropertyAnalyzer:
         """
         Generates investment analysis for the property
         
+        This is a single-property view of the vectorized engine in
+        investment_metrics; use compute_investment_metrics directly to screen
+        many properties at once.
+        
         Args:
             valuation: Enhanced valuation data
             property_data: Property details
@@ -978,381 +1273,189 @@ class PropertyAnalyzer:
         Returns:
             Dict containing investment analysis
         """
-        # Extract key data
-        property_value = valuation.get('final_value', 0)
-        
-        # Estimate monthly rent (typically 0.5-1% of property value)
-        monthly_rent = property_value * 0.005  # Starting point
-        
-        # Adjust based on property type and market
-        property_type = property_data.get('property_type', 'Single Family')
-        if property_type == 'Condo':
-            monthly_rent *= 1.1
-        elif property_type == 'Townhouse':
-            monthly_rent *= 1.05
-        
-        # Adjust based on market conditions
-        market_type = market_data.get('supply_demand', {}).get('market_type', 'balanced')
-        if market_type == 'seller':
-            monthly_rent *= 1.1  # Higher demand means higher rents
-        elif market_type == 'buyer':
-            monthly_rent *= 0.9  # Lower demand means lower rents
-        
-        # Calculate annual rent
-        annual_rent = monthly_rent * 12
-        
-        # Calculate operating expenses
-        property_tax = property_data.get('annual_tax_amount', property_value * 0.01)
-        insurance = property_value * 0.005  # Typical annual insurance cost
-        maintenance = property_value * 0.01  # Rule of thumb for maintenance
-        property_management = annual_rent * 0.1  # Typical property management fee
-        vacancy_allowance = annual_rent * 0.05  # Assume 5% vacancy rate
-        
-        total_expenses = property_tax + insurance + maintenance + property_management + vacancy_allowance
-        
-        # Calculate net operating income
-        net_operating_income = annual_rent - total_expenses
-        
-        # Calculate cap rate
-        cap_rate = (net_operating_income / property_value) * 100 if property_value > 0 else 0
-        
-        # Generate financing scenarios
-        financing_scenarios = {}
-        
-        # 20% down payment scenario
-        down_payment_20 = property_value * 0.2
-        loan_amount_20 = property_value * 0.8
-        interest_rate_20 = 6.25  # Current market rate
-        
-        # Calculate monthly mortgage payment
-        monthly_mortgage_20 = loan_amount_20 * (interest_rate_20/1200) * (1 + interest_rate_20/1200)**(30*12) / ((1 + interest_rate_20/1200)**(30*12) - 1)
-        
-        # Calculate cash flow
-        monthly_cash_flow_20 = monthly_rent - (total_expenses / 12) - monthly_mortgage_20
-        annual_cash_flow_20 = monthly_cash_flow_20 * 12
-        
-        # Calculate cash-on-cash return
-        cash_on_cash_return_20 = (annual_cash_flow_20 / down_payment_20) * 100 if down_payment_20 > 0 else 0
-        
-        financing_scenarios['twenty_percent_down'] = {
-            'down_payment': int(down_payment_20),
-            'loan_amount': int(loan_amount_20),
-            'interest_rate': interest_rate_20,
-            'loan_term_years': 30,
-            'monthly_mortgage': int(monthly_mortgage_20),
-            'monthly_cash_flow': int(monthly_cash_flow_20),
-            'annual_cash_flow': int(annual_cash_flow_20),
-            'cash_on_cash_return': round(cash_on_cash_return_20, 2)
-        }
-        
-        # 25% down payment scenario
-        down_payment_25 = property_value * 0.25
-        loan_amount_25 = property_value * 0.75
-        interest_rate_25 = 6.15  # Slightly better rate with higher down payment
-        
-        monthly_mortgage_25 = loan_amount_25 * (interest_rate_25/1200) * (1 + interest_rate_25/1200)**(30*12) / ((1 + interest_rate_25/1200)**(30*12) - 1)
-        monthly_cash_flow_25 = monthly_rent - (total_expenses / 12) - monthly_mortgage_25
-        annual_cash_flow_25 = monthly_cash_flow_25 * 12
-        cash_on_cash_return_25 = (annual_cash_flow_25 / down_payment_25) * 100 if down_payment_25 > 0 else 0
-        
-        financing_scenarios['twenty_five_percent_down'] = {
-            'down_payment': int(down_payment_25),
-            'loan_amount': int(loan_amount_25),
-            'interest_rate': interest_rate_25,
-            'loan_term_years': 30,
-            'monthly_mortgage': int(monthly_mortgage_25),
-            'monthly_cash_flow': int(monthly_cash_flow_25),
-            'annual_cash_flow': int(annual_cash_flow_25),
-            'cash_on_cash_return': round(cash_on_cash_return_25, 2)
-        }
-        
-        # 30% down payment scenario
-        down_payment_30 = property_value * 0.3
-        loan_amount_30 = property_value * 0.7
-        interest_rate_30 = 6.0  # Even better rate with higher down payment
-        
-        monthly_mortgage_30 = loan_amount_30 * (interest_rate_30/1200) * (1 + interest_rate_30/1200)**(30*12) / ((1 + interest_rate_30/1200)**(30*12) - 1)
-        monthly_cash_flow_30 = monthly_rent - (total_expenses / 12) - monthly_mortgage_30
-        annual_cash_flow_30 = monthly_cash_flow_30 * 12
-        cash_on_cash_return_30 = (annual_cash_flow_30 / down_payment_30) * 100 if down_payment_30 > 0 else 0
-        
-        financing_scenarios['thirty_percent_down'] = {
-            'down_payment': int(down_payment_30),
-            'loan_amount': int(loan_amount_30),
-            'interest_rate': interest_rate_30,
-            'loan_term_years': 30,
-            'monthly_mortgage': int(monthly_mortgage_30),
-            'monthly_cash_flow': int(monthly_cash_flow_30),
-            'annual_cash_flow': int(annual_cash_flow_30),
-            'cash_on_cash_return': round(cash_on_cash_return_30, 2)
-        }
-        
-        # All cash scenario
-        monthly_cash_flow_cash = monthly_rent - (total_expenses / 12)
-        annual_cash_flow_cash = monthly_cash_flow_cash * 12
-        cash_on_cash_return_cash = (annual_cash_flow_cash / property_value) * 100 if property_value > 0 else 0
-        
-        financing_scenarios['all_cash'] = {
-            'down_payment': int(property_value),
-            'loan_amount': 0,
-            'interest_rate': 0,
-            'loan_term_years': 0,
-            'monthly_mortgage': 0,
-            'monthly_cash_flow': int(monthly_cash_flow_cash),
-            'annual_cash_flow': int(annual_cash_flow_cash),
-            'cash_on_cash_return': round(cash_on_cash_return_cash, 2)
-        }
-        
-        # Calculate investment rules
-        one_percent_target = property_value * 0.01
-        two_percent_target = property_value * 0.02
+        return self._compute_investment_metrics(valuation, property_data, market_data).to_dict(0)
+    
+    def _compute_investment_metrics(self,
+                                    valuation: Dict[str, Any],
+                                    property_data: Dict[str, Any],
+                                    market_data: Dict[str, Any]) -> InvestmentMetrics:
+        """
+        Runs the investment metrics engine for a single property
         
-        investment_rules = {
-            'one_percent_rule': {
-                'target': int(one_percent_target),
-                'actual': int(monthly_rent),
-                'actual_percentage': round(monthly_rent / property_value * 100, 2) if property_value > 0 else 0,
-                'compliant': monthly_rent >= one_percent_target
-            },
-            'two_percent_rule': {
-                'target': int(two_percent_target),
-                'actual': int(monthly_rent),
-                'actual_percentage': round(monthly_rent / property_value * 100, 2) if property_value > 0 else 0,
-                'compliant': monthly_rent >= two_percent_target
-            },
-            'fifty_percent_rule': {
-                'estimated_operating_expenses': int(annual_rent * 0.5),
-                'actual_operating_expenses': int(total_expenses),
-                'compliant': total_expenses <= annual_rent * 0.5
-            }
-        }
+        Args:
+            valuation: Enhanced valuation data
+            property_data: Property details
+            market_data: Market analysis data
+            
+        Returns:
+            InvestmentMetrics for a batch of one
+        """
+        return compute_investment_metrics(
+            property_values=[valuation.get('final_value', 0)],
+            annual_taxes=[property_data.get('annual_tax_amount', np.nan)],
+            property_types=[property_data.get('property_type', 'Single Family')],
+            market_types=[market_data.get('supply_demand', {}).get('market_type', 'balanced')],
+            price_growth_rates=[market_data.get('market_metrics', {}).get('price_growth_rate', 0.03)],
+            rental_demands=[market_data.get('neighborhood', {}).get('rental_demand', 'moderate')]
+        )
+    
+    def analyze_hold_periods(self,
+                             valuation: Dict[str, Any],
+                             property_data: Dict[str, Any],
+                             market_data: Dict[str, Any],
+                             scenario: str = 'twenty_percent_down',
+                             hold_years: Iterable[int] = range(1, 31),
+                             discount_rate: float = 0.08) -> Dict[str, Any]:
+        """
+        Computes the IRR-by-hold-period curve for one property
         
-        # Calculate break-even ratio
-        total_monthly_debt = monthly_mortgage_20  # Using 20% down scenario as reference
-        break_even_ratio = ((total_expenses / 12) + total_monthly_debt) / monthly_rent * 100 if monthly_rent > 0 else 0
+        Use investment_metrics.compute_hold_period_returns directly to screen
+        many properties at once.
         
-        # Calculate appreciation projections
-        price_growth_rate = market_data.get('market_metrics', {}).get('price_growth_rate', 0.03)
+        Args:
+            valuation: Enhanced valuation data
+            property_data: Property details
+            market_data: Market analysis data
+            scenario: Financing scenario name
+            hold_years: Hold periods to evaluate, in years
+            discount_rate: Annual discount rate for the NPV
+            
+        Returns:
+            Dict containing IRR, NPV and equity multiple per hold period and the
+            hold period with the highest IRR
+        """
+        metrics = self._compute_investment_metrics(valuation, property_data, market_data)
+        returns = compute_hold_period_returns(
+            metrics, scenario=scenario, hold_years=hold_years, discount_rate=discount_rate
+        )
+        return returns.curve(0)
+    
+    def simulate_investment(self,
+                            valuation: Dict[str, Any],
+                            property_data: Dict[str, Any],
+                            market_data: Dict[str, Any],
+                            assumptions: SimulationAssumptions = None,
+                            seed: int = None) -> Dict[str, Any]:
+        """
+        Runs a Monte Carlo simulation of the investment for one property
         
-        # Conservative (2%), moderate (3%), optimistic (4%) scenarios
-        appreciation_projections = {
-            'conservative_2%': {
-                '5_year': int(property_value * (1.02 ** 5)),
-                '10_year': int(property_value * (1.02 ** 10))
-            },
-            'moderate_3%': {
-                '5_year': int(property_value * (1.03 ** 5)),
-                '10_year': int(property_value * (1.03 ** 10))
-            },
-            'optimistic_4%': {
-                '5_year': int(property_value * (1.04 ** 5)),
-                '10_year': int(property_value * (1.04 ** 10))
-            }
-        }
+        Rent and fixed expenses start from the investment analysis estimates
+        and appreciation is centred on the market's price growth rate. Use
+        investment_simulation.simulate_investments to simulate many properties
+        at once.
         
-        # Combine all investment analysis data
-        return {
-            'financing_scenarios': financing_scenarios,
-            'investment_rules': investment_rules,
-            'break_even_ratio': round(break_even_ratio, 2),
-            'appreciation_projections': appreciation_projections,
-            'rental_analysis': {
-                'monthly_rent': int(monthly_rent),
-                'rent_range': {
-                    'low': int(monthly_rent * 0.9),
-                    'high': int(monthly_rent * 1.1)
-                },
-                'annual_rent': int(annual_rent),
-                'gross_rent_multiplier': round(property_value / annual_rent, 1) if annual_rent > 0 else 0,
-                'rent_to_value_ratio': round(annual_rent / property_value * 100, 1) if property_value > 0 else 0,
-                'operating_expenses': {
-                    'property_tax': int(property_tax),
-                    'insurance': int(insurance),
-                    'maintenance': int(maintenance),
-                    'property_management': int(property_management),
-                    'vacancy_allowance': int(vacancy_allowance),
-                    'total_expenses': int(total_expenses)
-                },
-                'net_operating_income': int(net_operating_income),
-                'cap_rate': round(cap_rate, 2),
-                'rental_demand': market_data.get('neighborhood', {}).get('rental_demand', 'moderate').lower(),
-                'rental_growth_potential': 'high' if price_growth_rate > 0.05 else 'moderate' if price_growth_rate > 0.02 else 'low'
-            }
-        }
+        Args:
+            valuation: Enhanced valuation data
+            property_data: Property details
+            market_data: Market analysis data
+            assumptions: Simulation assumptions (paths, hold period, volatilities)
+            seed: Random seed for reproducible results
+            
+        Returns:
+            Dict containing IRR, cash-on-cash and profit distributions and the
+            probability of loss
+        """
+        metrics = self._compute_investment_metrics(valuation, property_data, market_data)
+        result = simulate_investments(
+            property_values=metrics['property_value'],
+            monthly_rents=metrics['monthly_rent'],
+            annual_fixed_expenses=metrics['property_tax'] + metrics['insurance'] + metrics['maintenance'],
+            appreciation_means=metrics.price_growth_rates,
+            assumptions=assumptions,
+            seed=seed
+        )
+        return result.summary(0)
     
     def _generate_renovation_analysis(self,
                                      valuation: Dict[str, Any],
-                                     property_data: Dict[str, Any]) -> Dict[str, Any]:
+                                     property_data: Dict[str, Any],
+                                     rng: np.random.Generator) -> Dict[str, Any]:
         """
         Generates renovation analysis for the property
         
+        This is a single-property view of the vectorized engine in
+        renovation_analysis; use compute_renovation_analysis directly to screen
+        many properties at once.
+        
         Args:
             valuation: Enhanced valuation data
             property_data: Property details
+            rng: Random generator for the renovation stage
             
         Returns:
             Dict containing renovation analysis
         """
-        # Extract key data
-        property_value = valuation.get('final_value', 0)
-        square_feet = property_data.get('square_feet', 0)
-        year_built = property_data.get('year_built', 1970)
-        property_type = property_data.get('property_type', 'Single Family')
+        year_built = property_data.get('year_built')
+        return compute_renovation_analysis(
+            property_values=[valuation.get('final_value', 0)],
+            square_feet=[property_data.get('square_feet') or 0],
+            year_builts=[np.nan if year_built is None else year_built],
+            seed=rng
+        ).to_dict(0)
+    
+    def _adjust_comparable(self, subject: Dict[str, Any], sale: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adjusts a comparable sale's price for its differences from the property
         
-        # Determine property condition based on age and random factor
-        age = 2023 - year_built
-        
-        # Base condition on age with random variation
-        if age < 5:
-            condition = np.random.choice(['Excellent', 'Very Good'], p=[0.7, 0.3])
-        elif age < 15:
-            condition = np.random.choice(['Very Good', 'Good'], p=[0.6, 0.4])
-        elif age < 30:
-            condition = np.random.choice(['Good', 'Fair'], p=[0.6, 0.4])
-        elif age < 50:
-            condition = np.random.choice(['Fair', 'Poor'], p=[0.7, 0.3])
-        else:
-            condition = np.random.choice(['Fair', 'Poor'], p=[0.3, 0.7])
-        
-        # Calculate renovation potential
-        renovation_potential = 'High' if condition in ['Poor', 'Fair'] else 'Moderate' if condition == 'Good' else 'Low'
-        
-        # Calculate potential value increase with renovations
-        if condition == 'Poor':
-            max_value_increase_pct = 0.3  # Up to 30% increase
-        elif condition == 'Fair':
-            max_value_increase_pct = 0.2  # Up to 20% increase
-        elif condition == 'Good':
-            max_value_increase_pct = 0.1  # Up to 10% increase
-        else:
-            max_value_increase_pct = 0.05  # Up to 5% increase
+        Args:
+            subject: The property's bedrooms, bathrooms, square_feet and year_built
+            sale: Comparable sale details
+            
+        Returns:
+            Dict containing the comparable property with its adjustments
+        """
+        def difference(field: str) -> float:
+            # Attributes missing from a recorded sale are not adjusted for
+            value = sale.get(field)
+            return 0 if value is None or value != value else subject[field] - value
         
-        potential_value_increase = property_value * max_value_increase_pct
+        # Calculate adjustments
+        bedroom_adjustment = difference('bedrooms') * 15000
+        bathroom_adjustment = difference('bathrooms') * 10000
+        sqft_adjustment = difference('square_feet') * 100
+        year_adjustment = difference('year_built') * 1000
         
-        # Calculate renovation costs
-        if condition == 'Poor':
-            renovation_cost_per_sqft = np.random.uniform(80, 150)
-        elif condition == 'Fair':
-            renovation_cost_per_sqft = np.random.uniform(50, 100)
-        elif condition == 'Good':
-            renovation_cost_per_sqft = np.random.uniform(30, 60)
-        else:
-            renovation_cost_per_sqft = np.random.uniform(15, 40)
-        
-        total_renovation_cost = square_feet * renovation_cost_per_sqft
-        
-        # Calculate ROI
-        renovation_roi = (potential_value_increase / total_renovation_cost) * 100 if total_renovation_cost > 0 else 0
-        
-        # Generate renovation recommendations
-        recommendations = []
-        
-        if condition in ['Poor', 'Fair']:
-            recommendations.extend([
-                'Complete kitchen remodel',
-                'Bathroom renovations',
-                'Replace flooring throughout',
-                'Update electrical and plumbing systems',
-                'Exterior improvements (siding, roof, windows)'
-            ])
-        elif condition == 'Good':
-            recommendations.extend([
-                'Kitchen updates (countertops, appliances)',
-                'Bathroom updates (fixtures, tile)',
-                'Fresh paint throughout',
-                'Landscaping improvements',
-                'Energy efficiency upgrades'
-            ])
-        else:
-            recommendations.extend([
-                'Minor cosmetic updates',
-                'Smart home technology integration',
-                'Energy efficiency improvements',
-                'Landscaping enhancements'
-            ])
-        
-        # Generate specific renovation projects with costs and ROI
-        renovation_projects = []
-        
-        if condition in ['Poor', 'Fair', 'Good']:
-            # Kitchen renovation
-            kitchen_cost = square_feet * np.random.uniform(100, 200) * 0.1  # Assume kitchen is 10% of home
-            kitchen_value_add = kitchen_cost * np.random.uniform(1.0, 1.8)  # 100-180% ROI
-            
-            renovation_projects.append({
-                'project': 'Kitchen Renovation',
-                'cost': int(kitchen_cost),
-                'value_added': int(kitchen_value_add),
-                'roi': round((kitchen_value_add / kitchen_cost - 1) * 100, 1) if kitchen_cost > 0 else 0
-            })
-            
-            # Bathroom renovation
-            bathroom_cost = square_feet * np.random.uniform(80, 150) * 0.05  # Assume bathroom is 5% of home
-            bathroom_value_add = bathroom_cost * np.random.uniform(1.0, 1.7)  # 100-170% ROI
-            
-            renovation_projects.append({
-                'project': 'Bathroom Renovation',
-                'cost': int(bathroom_cost),
-                'value_added': int(bathroom_value_add),
-                'roi': round((bathroom_value_add / bathroom_cost - 1) * 100, 1) if bathroom_cost > 0 else 0
-            })
-        
-        # Flooring replacement
-        flooring_cost = square_feet * np.random.uniform(7, 12)
-        flooring_value_add = flooring_cost * np.random.uniform(1.0, 1.5)  # 100-150% ROI
-        
-        renovation_projects.append({
-            'project': 'Flooring Replacement',
-            'cost': int(flooring_cost),
-            'value_added': int(flooring_value_add),
-            'roi': round((flooring_value_add / flooring_cost - 1) * 100, 1) if flooring_cost > 0 else 0
-        })
-        
-        # Paint interior
-        paint_cost = square_feet * np.random.uniform(2, 4)
-        paint_value_add = paint_cost * np.random.uniform(1.5, 2.5)  # 150-250% ROI
-        
-        renovation_projects.append({
-            'project': 'Interior Painting',
-            'cost': int(paint_cost),
-            'value_added': int(paint_value_add),
-            'roi': round((paint_value_add / paint_cost - 1) * 100, 1) if paint_cost > 0 else 0
-        })
-        
-        # Landscaping
-        landscaping_cost = square_feet * np.random.uniform(1, 3)
-        landscaping_value_add = landscaping_cost * np.random.uniform(1.5, 2.0)  # 150-200% ROI
-        
-        renovation_projects.append({
-            'project': 'Landscaping Improvements',
-            'cost': int(landscaping_cost),
-            'value_added': int(landscaping_value_add),
-            'roi': round((landscaping_value_add / landscaping_cost - 1) * 100, 1) if landscaping_cost > 0 else 0
-        })
-        
-        # Combine all renovation analysis data
+        total_adjustment = bedroom_adjustment + bathroom_adjustment + sqft_adjustment + year_adjustment
+        adjusted_price = sale['sale_price'] + total_adjustment
+        
+        # Create comparable property
         return {
-            'property_condition': condition,
-            'renovation_potential': renovation_potential,
-            'potential_value_increase': int(potential_value_increase),
-            'after_renovation_value': int(property_value + potential_value_increase),
-            'estimated_renovation_cost': int(total_renovation_cost),
-            'renovation_roi': round(renovation_roi, 1),
-            'renovation_recommendations': recommendations,
-            'renovation_projects': renovation_projects
+            'address': sale.get('address', ''),
+            'sale_price': int(sale['sale_price']),
+            'sale_date': sale.get('sale_date'),
+            'bedrooms': sale.get('bedrooms'),
+            'bathrooms': sale.get('bathrooms'),
+            'square_feet': sale.get('square_feet'),
+            'year_built': sale.get('year_built'),
+            'distance_miles': sale.get('distance_miles'),
+            'adjustments': {
+                'bedroom_adjustment': int(bedroom_adjustment),
+                'bathroom_adjustment': int(bathroom_adjustment),
+                'square_feet_adjustment': int(sqft_adjustment),
+                'year_built_adjustment': int(year_adjustment),
+                'distance_adjustment': 0,  # Assuming distance is close enough to not require adjustment
+                'total_adjustment': int(total_adjustment)
+            },
+            'adjusted_price': int(adjusted_price)
         }
     
     def _generate_cma(self,
                      valuation: Dict[str, Any],
                      property_data: Dict[str, Any],
-                     market_data: Dict[str, Any]) -> Dict[str, Any]:
+                     market_data: Dict[str, Any],
+                     rng: np.random.Generator) -> Dict[str, Any]:
         """
         Generates Comparative Market Analysis (CMA) for the property
         
+        Comparables are the nearest recorded sales from the comparables store
+        that match the property's attribute bands; without a store, coordinates
+        or matching sales, they are simulated.
+        
         Args:
             valuation: Enhanced valuation data
             property_data: Property details
             market_data: Market analysis data
+            rng: Random generator for the CMA stage
             
         Returns:
             Dict containing CMA results
@@ -1364,60 +1467,52 @@ class PropertyAnalyzer:
         square_feet = property_data.get('square_feet', 1500)
         year_built = property_data.get('year_built', 1970)
         property_value = valuation.get('final_value', 0)
+        subject = {
+            'bedrooms': bedrooms,
+            'bathrooms': bathrooms,
+            'square_feet': square_feet,
+            'year_built': year_built
+        }
+        
+        # Prefer recorded nearby sales
+        sales = []
+        if self.comparables_store is not None and property_data.get('coordinates'):
+            sales = self.comparables_store.query({**subject, 'coordinates': property_data['coordinates']}, k=5)
+        comparable_properties = [self._adjust_comparable(subject, sale) for sale in sales]
         
-        # Generate 3-5 comparable properties
-        num_comps = np.random.randint(3, 6)
-        comparable_properties = []
+        # Otherwise generate 3-5 comparable properties
+        num_comps = 0 if comparable_properties else int(rng.integers(3, 6))
         
         for i in range(num_comps):
             # Generate a comparable property with slight variations
-            comp_bedrooms = max(1, bedrooms + np.random.randint(-1, 2))
-            comp_bathrooms = max(1, bathrooms + np.random.choice([-0.5, 0, 0.5, 1]))
-            comp_square_feet = max(500, square_feet + np.random.randint(-300, 301))
-            comp_year_built = max(1900, year_built + np.random.randint(-10, 11))
+            comp_bedrooms = max(1, bedrooms + int(rng.integers(-1, 2)))
+            comp_bathrooms = max(1, bathrooms + rng.choice([-0.5, 0, 0.5, 1]))
+            comp_square_feet = max(500, square_feet + int(rng.integers(-300, 301)))
+            comp_year_built = max(1900, year_built + int(rng.integers(-10, 11)))
             
             # Generate sale price with variation
-            comp_sale_price = property_value * np.random.uniform(0.85, 1.15)
+            comp_sale_price = property_value * rng.uniform(0.85, 1.15)
             
             # Generate sale date within last 6 months
-            months_ago = np.random.randint(0, 6)
+            months_ago = int(rng.integers(0, 6))
             sale_month = ((datetime.now().month - months_ago - 1) % 12) + 1
             sale_year = datetime.now().year if sale_month <= datetime.now().month else datetime.now().year - 1
-            sale_day = np.random.randint(1, 29)
+            sale_day = int(rng.integers(1, 29))
             sale_date = f"{sale_year}-{sale_month:02d}-{sale_day:02d}"
             
             # Generate distance (0.1 to 1.5 miles)
-            distance = round(np.random.uniform(0.1, 1.5), 1)
+            distance = round(rng.uniform(0.1, 1.5), 1)
             
-            # Calculate adjustments
-            bedroom_adjustment = (bedrooms - comp_bedrooms) * 15000
-            bathroom_adjustment = (bathrooms - comp_bathrooms) * 10000
-            sqft_adjustment = (square_feet - comp_square_feet) * 100
-            year_adjustment = (year_built - comp_year_built) * 1000
-            
-            total_adjustment = bedroom_adjustment + bathroom_adjustment + sqft_adjustment + year_adjustment
-            adjusted_price = comp_sale_price + total_adjustment
-            
-            # Create comparable property
-            comparable_properties.append({
-                'address': f"{np.random.randint(100, 999)} {np.random.choice(['Main', 'Oak', 'Maple', 'Cedar', 'Pine'])} {np.random.choice(['St', 'Ave', 'Blvd', 'Dr', 'Ln'])}, {address.split(',')[1] if ',' in address else 'Same City'}",
-                'sale_price': int(comp_sale_price),
+            comparable_properties.append(self._adjust_comparable(subject, {
+                'address': f"{int(rng.integers(100, 999))} {rng.choice(['Main', 'Oak', 'Maple', 'Cedar', 'Pine'])} {rng.choice(['St', 'Ave', 'Blvd', 'Dr', 'Ln'])}, {address.split(',')[1] if ',' in address else 'Same City'}",
+                'sale_price': comp_sale_price,
                 'sale_date': sale_date,
                 'bedrooms': comp_bedrooms,
                 'bathrooms': comp_bathrooms,
                 'square_feet': comp_square_feet,
                 'year_built': comp_year_built,
-                'distance_miles': distance,
-                'adjustments': {
-                    'bedroom_adjustment': int(bedroom_adjustment),
-                    'bathroom_adjustment': int(bathroom_adjustment),
-                    'square_feet_adjustment': int(sqft_adjustment),
-                    'year_built_adjustment': int(year_adjustment),
-                    'distance_adjustment': 0,  # Assuming distance is close enough to not require adjustment
-                    'total_adjustment': int(total_adjustment)
-                },
-                'adjusted_price': int(adjusted_price)
-            })
+                'distance_miles': distance
+            }))
         
         # Calculate average and median adjusted prices
         adjusted_prices = [comp['adjusted_price'] for comp in comparable_properties]
@@ -1425,13 +1520,14 @@ class PropertyAnalyzer:
         median_adjusted_price = sorted(adjusted_prices)[len(adjusted_prices) // 2] if adjusted_prices else 0
         
         # Calculate price per square foot range
-        price_per_sqft_values = [comp['sale_price'] / comp['square_feet'] for comp in comparable_properties if comp['square_feet'] > 0]
+        price_per_sqft_values = [comp['sale_price'] / comp['square_feet'] for comp in comparable_properties if comp['square_feet'] and comp['square_feet'] > 0]
         price_per_sqft_low = min(price_per_sqft_values) if price_per_sqft_values else 0
         price_per_sqft_high = max(price_per_sqft_values) if price_per_sqft_values else 0
         
         # Combine CMA results
         return {
             'comparable_properties': comparable_properties,
+            'data_source': 'recorded_sales' if sales else 'simulated',
             'average_adjusted_price': int(average_adjusted_price),
             'median_adjusted_price': int(median_adjusted_price),
             'price_per_sqft_range': {
@@ -1441,19 +1537,200 @@ class PropertyAnalyzer:
         }
 
 
+# Fields read by the CPU-bound stages. Only these cross the process boundary in
+# process execution mode; the full dicts stay in the parent process.
+STAGE_PROPERTY_FIELDS = (
+    'address', 'bedrooms', 'bathrooms', 'square_feet', 'year_built', 'property_type',
+    'annual_tax_amount', 'estimated_value', 'listing_price', 'original_list_price',
+    'days_on_market', 'listing_status', 'coordinates'
+)
+STAGE_MARKET_FIELDS = {
+    'market_metrics': ('median_home_price', 'price_growth_rate', 'days_on_market'),
+    'supply_demand': ('market_type',),
+    'market_cycle': ('cycle_position',),
+    'neighborhood': ('rental_demand',)
+}
+
+
+class StageInput(NamedTuple):
+    """Compact, picklable input for the CPU-bound analysis stages"""
+    property_data: PropertyRecord
+    market_data: Dict[str, Any]
+    aggregated_valuation: Dict[str, Any]
+
+
+class StageWorkerConfig(NamedTuple):
+    """Analyzer settings a stage worker process needs to match its parent"""
+    data_version: Optional[str]
+    comparables_store: Optional[ComparablesStore]
+    market_cache_ttl: int
+    market_cache_max_entries: int
+    stage_timing: Optional[bool]
+    
+    @classmethod
+    def from_analyzer(cls, analyzer: Optional['PropertyAnalyzer']) -> 'StageWorkerConfig':
+        """Captures the stage settings of an analyzer (None for the defaults)"""
+        market_cache = getattr(analyzer, 'market_cache', None) or get_default_market_cache()
+        return cls(
+            data_version=getattr(analyzer, 'data_version', None),
+            comparables_store=getattr(analyzer, 'comparables_store', None),
+            market_cache_ttl=market_cache.ttl,
+            market_cache_max_entries=market_cache.max_entries,
+            stage_timing=getattr(analyzer, 'stage_timing', None)
+        )
+
+
+class FetchedProperty(NamedTuple):
+    """Provider data for one address, gathered on the I/O side of a batch"""
+    address: str
+    property_data: Dict[str, Any]
+    market_data: Dict[str, Any]
+    valuation_data: Dict[str, Any]
+    
+    def stage_input(self) -> StageInput:
+        """Builds the compact stage input for this property"""
+        market_data = {
+            section: {
+                field: self.market_data[section][field]
+                for field in fields if field in self.market_data.get(section, {})
+            }
+            for section, fields in STAGE_MARKET_FIELDS.items()
+        }
+        return StageInput(
+            property_data=PropertyRecord.from_dicts({
+                field: self.property_data[field] for field in STAGE_PROPERTY_FIELDS if field in self.property_data
+            }),
+            market_data=market_data,
+            aggregated_valuation=self.valuation_data.get('aggregated_valuation', {})
+        )
+
+
+_stage_analyzer = None
+
+
+def init_stage_worker(config: StageWorkerConfig) -> None:
+    """
+    Builds the per-process PropertyAnalyzer used by stage workers
+    
+    This is the process pool initializer. The analyzer is configured like the
+    batch's own analyzer, so process mode gives the same results as thread mode.
+    
+    Args:
+        config: Settings of the parent analyzer
+    """
+    global _stage_analyzer
+    _stage_analyzer = PropertyAnalyzer(
+        data_version=config.data_version,
+        market_cache=MarketContextCache(
+            ttl=config.market_cache_ttl,
+            max_entries=config.market_cache_max_entries
+        ),
+        comparables_store=config.comparables_store,
+        stage_timing=config.stage_timing
+    )
+
+
+def run_stage_chunk(chunk: List[StageInput], include_negotiation: bool = False) -> List[Dict[str, Any]]:
+    """
+    Runs the CPU-bound analysis stages for a chunk of properties
+    
+    This is the process pool entry point, so it must stay a module-level
+    function. Each record is isolated: a failure is returned as an error entry
+    rather than failing the whole chunk.
+    
+    Args:
+        chunk: Compact stage inputs
+        include_negotiation: Whether to also generate negotiation strategies
+        
+    Returns:
+        List with one ``{'valuation': ..., 'negotiation': ...}`` or
+        ``{'error': ...}`` entry per input record
+    """
+    if _stage_analyzer is None:
+        init_stage_worker(StageWorkerConfig.from_analyzer(None))
+    analyzer = _stage_analyzer
+    strategist = None
+    if include_negotiation:
+        from negotiation_strategist import StrategyGenerator
+        strategist = StrategyGenerator(data_version=analyzer.data_version)
+    
+    outputs = []
+    for record in chunk:
+        try:
+            property_data = record.property_data.property_dict()
+            valuation = analyzer._run_valuation_stages(
+                {'aggregated_valuation': record.aggregated_valuation},
+                property_data,
+                record.market_data
+            )
+            output = {'valuation': valuation}
+            if strategist is not None:
+                output['negotiation'] = strategist.generate_strategies(
+                    property_data, record.market_data, valuation
+                )
+            outputs.append(output)
+        except Exception as e:
+            outputs.append({'error': str(e)})
+    return outputs
+
+
 class BatchPropertyAnalyzer:
     """
     Handles batch processing of multiple property addresses
+
+    Addresses are analyzed concurrently on a bounded thread pool. Results are
+    always returned in input order, and a failure (or timeout) for one address
+    never affects the others.
+    
+    In ``'process'`` execution mode the provider I/O still runs on the thread
+    pool, while the CPU-bound stages (investment, renovation, CMA and
+    optionally negotiation strategies) are sent in chunks to a process pool.
+    
+    Before analysis, addresses are geocoded in blocks: rows are de-duplicated
+    by canonical address and by building (units of one building share a
+    location), the cache is checked in bulk, and only the remaining unique
+    buildings are sent to the geocoder. Counts for the most recent batch are
+    kept in ``geocode_report``.
     """
     
-    def __init__(self, property_analyzer: PropertyAnalyzer = None):
+    def __init__(self, 
+                 property_analyzer: PropertyAnalyzer = None,
+                 max_workers: int = None,
+                 address_timeout: Optional[float] = None,
+                 execution_mode: str = 'thread',
+                 cpu_workers: int = None,
+                 chunk_size: int = None,
+                 include_negotiation: bool = False,
+                 geocode_block_size: int = None):
         """
         Initialize the BatchPropertyAnalyzer
         
         Args:
             property_analyzer: PropertyAnalyzer instance
+            max_workers: Number of addresses analyzed concurrently
+            address_timeout: Seconds allowed per address before it is reported as
+                failed (None or 0 disables the timeout)
+            execution_mode: 'thread' to run every stage on the thread pool, or
+                'process' to send CPU-bound stages to a process pool
+            cpu_workers: Number of worker processes in process mode
+            chunk_size: Number of properties sent to a worker process at once
+            include_negotiation: In process mode, also generate negotiation
+                strategies and return them under the 'negotiation' key
+            geocode_block_size: Number of addresses geocoded together in the
+                de-duplicating geocoding stage (0 geocodes each row separately)
         """
+        if execution_mode not in ('thread', 'process'):
+            raise ValueError(f"Invalid execution mode: {execution_mode}")
+        
         self.property_analyzer = property_analyzer or PropertyAnalyzer()
+        self.max_workers = max(1, max_workers or BATCH_MAX_WORKERS)
+        self.address_timeout = BATCH_ADDRESS_TIMEOUT if address_timeout is None else address_timeout
+        self.execution_mode = execution_mode
+        self.cpu_workers = max(1, cpu_workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size or BATCH_CHUNK_SIZE)
+        self.include_negotiation = include_negotiation
+        self.geocode_block_size = BATCH_GEOCODE_BLOCK_SIZE if geocode_block_size is None else geocode_block_size
+        self.geocode_report: Dict[str, int] = {}
         
     def process_batch(self, addresses: List[str]) -> List[Dict[str, Any]]:
         """
@@ -1465,34 +1742,475 @@ class BatchPropertyAnalyzer:
         Returns:
             List of analysis results for each property
         """
-        results = []
+        return list(self.iter_batch(addresses))
+    
+    def write_jsonl(self, 
+                    addresses: Iterable[str], 
+                    sink: Union[str, os.PathLike, IO[str]],
+                    checkpoint_path: Union[str, os.PathLike, None] = None,
+                    resume: bool = False) -> Dict[str, Any]:
+        """
+        Streams batch results to a JSON Lines file as they become ready
+        
+        Each result is written as one JSON line and flushed immediately, so
+        memory stays constant however large the batch is and everything
+        written before a crash remains readable. A trailing summary record
+        (``"record_type": "summary"``) is written once the batch completes.
         
+        With a checkpoint path, progress is recorded durably every
+        BATCH_CHECKPOINT_INTERVAL rows. Calling again with ``resume=True`` and
+        the same input skips the rows that already have results and appends
+        the rest to the existing output.
+        
+        Args:
+            addresses: Iterable of property addresses to analyze
+            sink: Output file path or text file-like object
+            checkpoint_path: Checkpoint file path (requires an output path)
+            resume: Continue an interrupted batch instead of overwriting it
+            
+        Returns:
+            Dict containing the summary record
+            
+        Raises:
+            ValueError: If resuming is requested without an output path, or the
+                input does not match the rows already processed
+        """
+        started = time.time()
+        with JsonlResultWriter(sink, checkpoint_path) as writer:
+            for result in self.iter_batch(writer.open(addresses, resume=resume)):
+                writer.write(result)
+            return writer.finish(
+                elapsed_seconds=round(time.time() - started, 3),
+                geocoding=dict(self.geocode_report)
+            )
+    
+    def iter_batch(self, addresses: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Analyzes addresses concurrently and yields results in input order
+        
+        The input iterable is consumed lazily, one geocoding block at a time,
+        and only a bounded number of addresses are in flight at any time, so
+        memory stays bounded for large uploads.
+        
+        Args:
+            addresses: Iterable of property addresses to analyze
+            
+        Returns:
+            Generator of analysis results, in the same order as the input
+        """
+        rows = self._iter_geocoded(addresses)
+        if self.execution_mode == 'process':
+            return self._iter_with_process_pool(rows)
+        return self._iter_ordered(rows, self._analyze_address)
+    
+    def geocode_batch(self, addresses: List[str]) -> Tuple[List[Optional[Dict[str, Any]]], Dict[str, int]]:
+        """
+        Geocodes a block of addresses with one geocoder call per unique building
+        
+        Rows are de-duplicated by canonical address and by building, cached
+        results are fetched in a single query, and the remaining buildings are
+        geocoded concurrently (at most ``max_workers`` at a time). Successful
+        building results are also cached under each unit's address.
+        
+        Args:
+            addresses: Block of property addresses
+            
+        Returns:
+            Tuple of the geocoding result for each address (None for addresses
+            that fail validation) and a report with the counts for the block
+        """
+        processor = self.property_analyzer.address_processor
+        
+        prepared = []
         for address in addresses:
             try:
-                # Analyze property
-                property_data, market_data = self.property_analyzer.analyze_property(address)
+                prepared.append(self.property_analyzer.prepare_address(address))
+            except ValueError:
+                # Reported by the analysis step like any other invalid address
+                prepared.append(None)
+        
+        keys = [canonical_address(address) if address else None for address in prepared]
+        buildings = [building_key(address) if address else None for address in prepared]
+        cached = processor.cache.get_many(key for key in set(keys) | set(buildings) if key)
+        
+        # One lookup per building with no cached result for the row or the building
+        misses: Dict[str, str] = {}
+        units: Dict[str, set] = {}
+        for address, key, building in zip(prepared, keys, buildings):
+            if address is None or key in cached or building in cached:
+                continue
+            misses.setdefault(building, strip_unit(address))
+            units.setdefault(building, set()).add(key)
+        
+        geocoded = {}
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(misses)),
+                                    thread_name_prefix='batch-geocode') as executor:
+                geocoded = dict(zip(misses, executor.map(self._geocode_building, misses.values())))
+        
+        for building, result in geocoded.items():
+            if result.get('success', False) and not result.get('approximate', False):
+                for key in units[building] - {building}:
+                    processor.cache.set(key, result)
+        
+        locations = []
+        cache_hits = 0
+        for address, key, building in zip(prepared, keys, buildings):
+            if address is None:
+                locations.append(None)
+            elif key in cached or building in cached:
+                cache_hits += 1
+                locations.append(cached.get(key) or cached[building])
+            else:
+                locations.append(geocoded[building])
+        
+        valid_rows = sum(address is not None for address in prepared)
+        report = {
+            'rows': len(addresses),
+            'unique_addresses': len(set(keys) - {None}),
+            'unique_buildings': len(set(buildings) - {None}),
+            'cache_hits': cache_hits,
+            'geocoder_calls': len(misses),
+            'calls_avoided': valid_rows - len(misses)
+        }
+        return locations, report
+    
+    def _geocode_building(self, address: str) -> Dict[str, Any]:
+        """
+        Geocodes one building address, converting any failure into an error result
+        
+        Args:
+            address: Building address (without unit)
+            
+        Returns:
+            Geocoding result
+        """
+        try:
+            return self.property_analyzer.address_processor.geocode_address(address)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Geocoding error: {str(e)}'
+            }
+    
+    def _iter_geocoded(self, addresses: Iterable[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Runs the geocoding stage block by block and pairs each address with its location
+        
+        Analyzers without an address processor (or a block size of 0) skip the
+        stage and geocode during analysis instead.
+        
+        Args:
+            addresses: Iterable of property addresses
+            
+        Yields:
+            (address, location data or None) for each address, in input order
+        """
+        self.geocode_report = {
+            'rows': 0,
+            'unique_addresses': 0,
+            'unique_buildings': 0,
+            'cache_hits': 0,
+            'geocoder_calls': 0,
+            'calls_avoided': 0
+        }
+        
+        if not self.geocode_block_size or not hasattr(self.property_analyzer, 'address_processor'):
+            for address in addresses:
+                yield address, None
+            return
+        
+        address_iter = iter(addresses)
+        while True:
+            block = list(islice(address_iter, self.geocode_block_size))
+            if not block:
+                break
+            
+            locations, report = self.geocode_batch(block)
+            for field, value in report.items():
+                self.geocode_report[field] += value
+            yield from zip(block, locations)
+    
+    def _iter_ordered(self, rows: Iterable[Tuple[str, Optional[Dict[str, Any]]]], worker) -> Iterator[Any]:
+        """
+        Runs ``worker`` over the addresses on the thread pool, in input order
+        
+        At most ``2 * max_workers`` addresses are in flight at any time. With
+        an address timeout, each address must also start within
+        ``address_timeout * (ceil(queue position / max_workers) + 1)`` of being
+        queued, so workers stuck on addresses that already timed out cannot
+        stall the rest of the batch.
+        
+        Args:
+            rows: Iterable of (address, location data or None) pairs
+            worker: Callable taking an address and its location data and
+                returning its result
+            
+        Yields:
+            Worker result (or timeout error result) for each address
+        """
+        window = self.max_workers * 2
+        start_times: Dict[int, float] = {}
+        pending = deque()
+        row_iter = iter(enumerate(rows))
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='batch-analysis')
+        try:
+            while True:
+                # Keep the pipeline full
+                while len(pending) < window:
+                    item = next(row_iter, None)
+                    if item is None:
+                        break
+                    index, (address, location_data) = item
+                    start_deadline = None
+                    if self.address_timeout:
+                        slots = math.ceil((len(pending) + 1) / self.max_workers) + 1
+                        start_deadline = time.monotonic() + self.address_timeout * slots
+                    future = executor.submit(self._timed_call, worker, index, address, location_data, start_times)
+                    pending.append((index, address, future, start_deadline))
                 
-                # Generate valuation
-                valuation_data = self.property_analyzer.generate_valuation(property_data, market_data)
+                if not pending:
+                    break
                 
-                # Add to results
-                results.append({
-                    'success': True,
-                    'address': address,
-                    'property': property_data,
-                    'market': market_data,
-                    'valuation': valuation_data
-                })
+                index, address, future, start_deadline = pending.popleft()
+                yield self._wait_for_result(index, address, future, start_times, start_deadline)
+                start_times.pop(index, None)
+        finally:
+            # Abandon anything still queued (e.g. the caller stopped iterating)
+            for _, _, future, _ in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def _iter_with_process_pool(self, rows: Iterable[Tuple[str, Optional[Dict[str, Any]]]]) -> Iterator[Dict[str, Any]]:
+        """
+        Fetches provider data on threads and runs CPU stages in worker processes
+        
+        Args:
+            rows: Iterable of (address, location data or None) pairs
+            
+        Yields:
+            Analysis result for each property, in input order
+        """
+        window = self.cpu_workers * 2
+        pending = deque()
+        fetched = self._iter_ordered(rows, self._fetch_address)
+        
+        # Workers are spawned rather than forked: forking while the I/O thread
+        # pool is running can deadlock the children on inherited locks
+        executor = ProcessPoolExecutor(
+            max_workers=self.cpu_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_stage_worker,
+            initargs=(StageWorkerConfig.from_analyzer(self.property_analyzer),)
+        )
+        try:
+            while True:
+                chunk = []
+                for item in fetched:
+                    chunk.append(item)
+                    if len(chunk) >= self.chunk_size:
+                        break
+                
+                if chunk:
+                    stage_inputs = [item.stage_input() for item in chunk if isinstance(item, FetchedProperty)]
+                    future = executor.submit(
+                        run_stage_chunk, stage_inputs, self.include_negotiation
+                    ) if stage_inputs else None
+                    pending.append((chunk, future))
                 
-            except Exception as e:
-                # Add error result
-                results.append({
+                # Drain the oldest chunk when the window is full or input is exhausted
+                if pending and (len(pending) >= window or not chunk):
+                    yield from self._collect_chunk(*pending.popleft())
+                elif not chunk:
+                    break
+        finally:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+            fetched.close()
+            executor.shutdown(wait=False)
+    
+    def _collect_chunk(self, chunk: List[Any], future) -> Iterator[Dict[str, Any]]:
+        """
+        Merges stage outputs from a worker process back into full results
+        
+        Args:
+            chunk: Fetched properties and early error results, in input order
+            future: Future for the chunk's stage outputs (None if nothing to run)
+            
+        Yields:
+            Analysis result for each entry in the chunk
+        """
+        try:
+            outputs = iter(future.result()) if future is not None else iter(())
+            chunk_error = None
+        except Exception as e:
+            outputs = iter(())
+            chunk_error = str(e)
+        
+        for item in chunk:
+            if not isinstance(item, FetchedProperty):
+                # Address already failed on the I/O side
+                yield item
+                continue
+            
+            output = next(outputs, None) if chunk_error is None else None
+            if output is None or 'error' in output:
+                yield {
                     'success': False,
-                    'address': address,
-                    'error': str(e)
-                })
+                    'address': item.address,
+                    'error': chunk_error or (output or {}).get('error', 'Unknown error')
+                }
+                continue
+            
+            result = {
+                'success': True,
+                'address': item.address,
+                'property': item.property_data,
+                'market': item.market_data,
+                'valuation': output['valuation']
+            }
+            if 'negotiation' in output:
+                result['negotiation'] = output['negotiation']
+            yield result
+    
+    def _timed_call(self, 
+                    worker, 
+                    index: int, 
+                    address: str, 
+                    location_data: Optional[Dict[str, Any]], 
+                    start_times: Dict[int, float]) -> Any:
+        """
+        Records when a worker picks up an address, then processes it
+        
+        Args:
+            worker: Callable taking an address and its location data
+            index: Position of the address in the batch
+            address: The property address
+            location_data: Geocoding result from the geocoding stage, if any
+            start_times: Shared map of batch position to start time
+            
+        Returns:
+            Worker result for the address
+        """
+        start_times[index] = time.monotonic()
+        return worker(address, location_data)
+    
+    def _wait_for_result(self, 
+                         index: int, 
+                         address: str, 
+                         future, 
+                         start_times: Dict[int, float],
+                         start_deadline: Optional[float] = None) -> Any:
+        """
+        Waits for an address to finish, enforcing the per-address timeout
         
-        return results
+        The timeout is measured from when a worker starts the address, not from
+        when it was queued, so slow neighbours do not eat into its budget. An
+        address still queued at ``start_deadline`` is abandoned: timed-out
+        threads cannot be stopped, and if they occupy every worker it would
+        never start.
+        
+        Args:
+            index: Position of the address in the batch
+            address: The property address
+            future: Future for the running analysis
+            start_times: Shared map of batch position to start time
+            start_deadline: Monotonic time by which the address must have
+                started (None waits indefinitely for a worker)
+            
+        Returns:
+            Worker result, or an error result if the address timed out
+        """
+        if not self.address_timeout:
+            return future.result()
+        
+        while True:
+            started_at = start_times.get(index)
+            if started_at is None:
+                # Still queued behind other work; check again shortly
+                wait = self.address_timeout
+                if start_deadline is not None:
+                    wait = min(wait, start_deadline - time.monotonic())
+            else:
+                wait = started_at + self.address_timeout - time.monotonic()
+            
+            try:
+                return future.result(timeout=max(wait, 0))
+            except FutureTimeoutError:
+                started_at = start_times.get(index)
+                if started_at is None and start_deadline is not None and time.monotonic() >= start_deadline:
+                    future.cancel()
+                    return {
+                        'success': False,
+                        'address': address,
+                        'error': f'Analysis timed out after {self.address_timeout:g} seconds waiting for a free worker'
+                    }
+                if started_at is not None and time.monotonic() >= started_at + self.address_timeout:
+                    future.cancel()
+                    return {
+                        'success': False,
+                        'address': address,
+                        'error': f'Analysis timed out after {self.address_timeout:g} seconds'
+                    }
+    
+    def _analyze_address(self, address: str, location_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Analyzes a single address, converting any failure into an error result
+        
+        Args:
+            address: The property address
+            location_data: Geocoding result from the geocoding stage, if any
+            
+        Returns:
+            Analysis result for the property
+        """
+        try:
+            # Analyze property
+            property_data, market_data = self.property_analyzer.analyze_property(address, location_data)
+            
+            # Generate valuation
+            valuation_data = self.property_analyzer.generate_valuation(property_data, market_data)
+            
+            return {
+                'success': True,
+                'address': address,
+                'property': property_data,
+                'market': market_data,
+                'valuation': valuation_data
+            }
+            
+        except Exception as e:
+            # Add error result
+            return {
+                'success': False,
+                'address': address,
+                'error': str(e)
+            }
+    
+    def _fetch_address(self, address: str, location_data: Dict[str, Any] = None) -> Any:
+        """
+        Performs the I/O-bound part of the analysis for a single address
+        
+        Args:
+            address: The property address
+            location_data: Geocoding result from the geocoding stage, if any
+            
+        Returns:
+            FetchedProperty on success, otherwise an error result
+        """
+        try:
+            property_data, market_data = self.property_analyzer.analyze_property(address, location_data)
+            valuation_data = self.property_analyzer._fetch_valuation_data(property_data)
+            return FetchedProperty(address, property_data, market_data, valuation_data)
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'address': address,
+                'error': str(e)
+            }
 
 
 # Example usage
@@ -1537,20 +2255,13 @@ if __name__ == "__main__":
             "789 Market St, San Francisco, CA 94103"
         ]
         
-        batch_results = batch_analyzer.process_batch(batch_addresses)
+        # Stream batch results to file, one JSON line per property
+        summary = batch_analyzer.write_jsonl(batch_addresses, 'batch_analysis_results.jsonl')
         
-        print(f"\nBatch processing completed for {len(batch_results)} properties")
-        for result in batch_results:
-            if result['success']:
-                print(f"✓ {result['address']}: ${result['property']['estimated_value']:,}")
-            else:
-                print(f"✗ {result['address']}: {result['error']}")
-        
-        # Save batch results to file
-        with open('batch_analysis_results.json', 'w') as f:
-            json.dump(batch_results, f, indent=2)
-            
-        print("Batch results saved to batch_analysis_results.json")
+        print(f"\nBatch processing completed for {summary['rows']} properties")
+        print(f"Succeeded: {summary['succeeded']}, failed: {summary['failed']}")
+        print(f"Geocoder calls avoided: {summary['geocoding']['calls_avoided']}")
+        print("Batch results saved to batch_analysis_results.jsonl")
         
     except Exception as e:
         print(f"Error in batch processing: {str(e)}")
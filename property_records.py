@@ -0,0 +1,378 @@
+"""
+Compact Property Records for Real Estate Valuation and Negotiation Strategist
+
+Properties normally move through the pipeline as nested dicts with string keys,
+repeated for every property. This module provides two compact forms for hot
+paths and large batches:
+
+- ``PropertyRecord``: a ``__slots__`` record of the core property and valuation
+  fields for one property
+- ``PropertyFrame``: a columnar (NumPy) batch of records
+
+Both convert losslessly to and from the dict shape used by the rest of the
+application: core fields that hold a value of their declared type are stored
+in slots or columns, everything else (feature lists, schools, nested
+valuation sections, or values of an unexpected type) is kept as-is, and the
+original key order is preserved.
+"""
+
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Core fields and their kinds: 'int', 'float', 'str' or 'category' (a string
+# with few distinct values, stored as integer codes in a PropertyFrame)
+PROPERTY_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ('property_id', 'str'),
+    ('address', 'str'),
+    ('bedrooms', 'int'),
+    ('bathrooms', 'float'),
+    ('square_feet', 'int'),
+    ('lot_size', 'int'),
+    ('year_built', 'int'),
+    ('property_type', 'category'),
+    ('estimated_value', 'int'),
+    ('last_sold_price', 'int'),
+    ('last_sold_date', 'str'),
+    ('days_on_market', 'int'),
+    ('listing_status', 'category'),
+    ('listing_price', 'int'),
+    ('original_list_price', 'float'),
+    ('price_per_sqft', 'int'),
+    ('tax_assessment', 'int'),
+    ('annual_tax_amount', 'int'),
+    ('hoa_fee', 'int')
+)
+VALUATION_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ('final_value', 'int'),
+    ('valuation_status', 'category'),
+    ('price_to_market_ratio', 'float'),
+    ('market_position', 'category')
+)
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+class _Missing:
+    """Marker for a field that is absent from the dict (as opposed to None)"""
+
+    def __repr__(self) -> str:
+        return 'MISSING'
+
+    def __reduce__(self) -> str:
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    """
+    Converts a value to the built-in type of a core field
+
+    Args:
+        value: Value from the dict
+        kind: Field kind
+
+    Returns:
+        The converted value, or MISSING if the value does not have the field's
+        type (it is then kept unchanged with the extra fields)
+    """
+    if kind == 'int':
+        if isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_)):
+            value = int(value)
+            if _INT64_MIN <= value <= _INT64_MAX:
+                return value
+    elif kind == 'float':
+        if isinstance(value, (float, np.floating)):
+            return float(value)
+    elif isinstance(value, str):
+        return str(value)
+    return MISSING
+
+
+_key_orders: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _intern_keys(keys: Iterable[str]) -> Tuple[str, ...]:
+    """Returns a shared tuple for a key order, so records do not each hold one"""
+    keys = tuple(keys)
+    return _key_orders.setdefault(keys, keys)
+
+
+def _split(data: Dict[str, Any], fields: Tuple[Tuple[str, str], ...]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Splits a dict into coerced core field values and the remaining items"""
+    kinds = dict(fields)
+    core, extra = {}, {}
+    for key, value in data.items():
+        kind = kinds.get(key)
+        coerced = MISSING if kind is None else _coerce(value, kind)
+        if coerced is MISSING:
+            extra[key] = value
+        else:
+            core[key] = coerced
+    return core, extra
+
+
+def _join(keys: Tuple[str, ...], core: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuilds a dict from core and extra values in the original key order"""
+    result = {}
+    for key in keys:
+        value = core.get(key, MISSING)
+        result[key] = extra[key] if value is MISSING else value
+    return result
+
+
+class PropertyRecord:
+    """
+    Compact record of one property's core property and valuation fields
+
+    Core fields are attributes (MISSING when absent from the dict). Other
+    property keys are kept in ``property_extra`` and other valuation keys in
+    ``valuation_extra``; ``valuation_extra`` is None when there is no
+    valuation.
+    """
+
+    __slots__ = (
+        tuple(name for name, _ in PROPERTY_FIELDS)
+        + tuple(name for name, _ in VALUATION_FIELDS)
+        + ('property_extra', 'valuation_extra', 'property_keys', 'valuation_keys')
+    )
+
+    def __init__(self, **values: Any):
+        """
+        Initialize the PropertyRecord
+
+        Args:
+            **values: Core field values, ``property_extra``, ``valuation_extra``
+                and the ``property_keys``/``valuation_keys`` key orders
+        """
+        for name in self.__slots__:
+            setattr(self, name, values.pop(name, MISSING))
+        if values:
+            raise TypeError(f"Unknown PropertyRecord fields: {', '.join(values)}")
+        if self.property_extra is MISSING:
+            self.property_extra = {}
+        if self.valuation_extra is MISSING:
+            self.valuation_extra = None
+        if self.property_keys is MISSING:
+            self.property_keys = _intern_keys(
+                [name for name, _ in PROPERTY_FIELDS if getattr(self, name) is not MISSING]
+                + list(self.property_extra)
+            )
+        if self.valuation_keys is MISSING:
+            self.valuation_keys = () if self.valuation_extra is None else _intern_keys(
+                [name for name, _ in VALUATION_FIELDS if getattr(self, name) is not MISSING]
+                + list(self.valuation_extra)
+            )
+
+    @classmethod
+    def from_dicts(cls,
+                   property_data: Dict[str, Any],
+                   valuation: Optional[Dict[str, Any]] = None) -> 'PropertyRecord':
+        """
+        Builds a record from the property and valuation dicts
+
+        Args:
+            property_data: Property details dict
+            valuation: Enhanced valuation dict (``valuation['valuation']`` of a
+                valuation analysis), if any
+
+        Returns:
+            PropertyRecord
+        """
+        core, extra = _split(property_data, PROPERTY_FIELDS)
+        values = dict(core, property_extra=extra, property_keys=_intern_keys(property_data))
+        if valuation is not None:
+            valuation_core, valuation_extra = _split(valuation, VALUATION_FIELDS)
+            values.update(valuation_core, valuation_extra=valuation_extra, valuation_keys=_intern_keys(valuation))
+        return cls(**values)
+
+    def property_dict(self) -> Dict[str, Any]:
+        """Converts the record back to the property details dict"""
+        core = {name: getattr(self, name) for name, _ in PROPERTY_FIELDS}
+        return _join(self.property_keys, core, self.property_extra)
+
+    def valuation_dict(self) -> Optional[Dict[str, Any]]:
+        """Converts the record back to the valuation dict (None if there is none)"""
+        if self.valuation_extra is None:
+            return None
+        core = {name: getattr(self, name) for name, _ in VALUATION_FIELDS}
+        return _join(self.valuation_keys, core, self.valuation_extra)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Reads a property field, whether core or extra
+
+        Args:
+            name: Property dict key
+            default: Value returned when the field is absent
+
+        Returns:
+            The field value
+        """
+        value = getattr(self, name) if name in _PROPERTY_NAMES else MISSING
+        if value is MISSING:
+            value = self.property_extra.get(name, MISSING)
+        return default if value is MISSING else value
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PropertyRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"PropertyRecord(address={self.address!r}, final_value={self.final_value!r})"
+
+    def __reduce__(self) -> tuple:
+        # Pickle values positionally; field names are not repeated per record
+        return _record_from_values, (tuple(getattr(self, name) for name in self.__slots__),)
+
+
+_PROPERTY_NAMES = frozenset(name for name, _ in PROPERTY_FIELDS)
+
+
+def _record_from_values(values: tuple) -> PropertyRecord:
+    """Rebuilds a pickled PropertyRecord"""
+    record = PropertyRecord.__new__(PropertyRecord)
+    for name, value in zip(PropertyRecord.__slots__, values):
+        setattr(record, name, value)
+    return record
+
+
+class PropertyFrame:
+    """
+    Columnar batch of property records
+
+    Integer and float fields are NumPy arrays with a presence mask, category
+    fields are integer codes into a list of categories, and string fields are
+    object arrays. Extra fields and key orders are kept per row.
+    """
+
+    def __init__(self, records: Sequence[PropertyRecord]):
+        """
+        Initialize the PropertyFrame
+
+        Args:
+            records: Property records, in batch order
+        """
+        self._columns: Dict[str, np.ndarray] = {}
+        self._present: Dict[str, np.ndarray] = {}
+        self._categories: Dict[str, List[str]] = {}
+
+        for name, kind in PROPERTY_FIELDS + VALUATION_FIELDS:
+            values = [getattr(record, name) for record in records]
+            present = np.fromiter((value is not MISSING for value in values), dtype=bool, count=len(values))
+            if kind == 'int':
+                column = np.array([value if value is not MISSING else 0 for value in values], dtype=np.int64)
+            elif kind == 'float':
+                column = np.array([value if value is not MISSING else np.nan for value in values], dtype=float)
+            elif kind == 'category':
+                codes: Dict[str, int] = {}
+                column = np.array(
+                    [codes.setdefault(value, len(codes)) if value is not MISSING else -1 for value in values],
+                    dtype=np.int32
+                )
+                self._categories[name] = list(codes)
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = [value if value is not MISSING else None for value in values]
+            self._columns[name] = column
+            self._present[name] = present
+
+        self._property_extra = [record.property_extra for record in records]
+        self._valuation_extra = [record.valuation_extra for record in records]
+        self._property_keys = [record.property_keys for record in records]
+        self._valuation_keys = [record.valuation_keys for record in records]
+
+    @classmethod
+    def from_dicts(cls,
+                   properties: Iterable[Dict[str, Any]],
+                   valuations: Optional[Iterable[Optional[Dict[str, Any]]]] = None) -> 'PropertyFrame':
+        """
+        Builds a frame from property (and optionally valuation) dicts
+
+        Args:
+            properties: Property details dicts
+            valuations: Enhanced valuation dicts, aligned with ``properties``
+
+        Returns:
+            PropertyFrame
+        """
+        if valuations is None:
+            return cls([PropertyRecord.from_dicts(data) for data in properties])
+        return cls([PropertyRecord.from_dicts(data, valuation) for data, valuation in zip(properties, valuations)])
+
+    def __len__(self) -> int:
+        return len(self._property_keys)
+
+    def __getitem__(self, index: int) -> PropertyRecord:
+        """Returns one row as a PropertyRecord"""
+        values = {}
+        for name, kind in PROPERTY_FIELDS + VALUATION_FIELDS:
+            if not self._present[name][index]:
+                continue
+            value = self._columns[name][index]
+            if kind == 'int':
+                value = int(value)
+            elif kind == 'float':
+                value = float(value)
+            elif kind == 'category':
+                value = self._categories[name][value]
+            values[name] = value
+        return PropertyRecord(
+            **values,
+            property_extra=self._property_extra[index],
+            valuation_extra=self._valuation_extra[index],
+            property_keys=self._property_keys[index],
+            valuation_keys=self._valuation_keys[index]
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Returns the values of one core field for every row
+
+        Args:
+            name: Core field name
+
+        Returns:
+            Integer array (float with NaN where any row lacks the field), float
+            array with NaN for missing values, or object array of strings with
+            None for missing values
+        """
+        column, present = self._columns[name], self._present[name]
+        if name in self._categories:
+            categories = np.array(self._categories[name] + [None], dtype=object)
+            return categories[column]
+        if column.dtype == np.int64 and not present.all():
+            return np.where(present, column, np.nan)
+        return column
+
+    def present(self, name: str) -> np.ndarray:
+        """Returns the mask of rows that have a core field"""
+        return self._present[name]
+
+    def records(self) -> List[PropertyRecord]:
+        """Returns every row as a PropertyRecord"""
+        return [self[index] for index in range(len(self))]
+
+    def property_dicts(self) -> List[Dict[str, Any]]:
+        """Converts every row back to its property details dict"""
+        return [record.property_dict() for record in self.records()]
+
+    def valuation_dicts(self) -> List[Optional[Dict[str, Any]]]:
+        """Converts every row back to its valuation dict"""
+        return [record.valuation_dict() for record in self.records()]
+
+    def to_frame(self) -> 'pd.DataFrame':
+        """
+        Returns the core fields as a DataFrame (one row per property)
+
+        Returns:
+            DataFrame with one column per core field
+        """
+        import pandas as pd
+        return pd.DataFrame({name: self.column(name) for name, _ in PROPERTY_FIELDS + VALUATION_FIELDS})
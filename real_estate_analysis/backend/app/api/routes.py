@@ -6,6 +6,9 @@ from ..models.user import User
 from ..services.auth import get_current_user
 from ..schemas.property import PropertyCreate, PropertyUpdate, PropertyResponse
 from ..schemas.analysis import AnalysisRequest, AnalysisResponse
+from ..schemas.financing import FinancingGridRequest, FinancingGridResponse
+from ..services.financing import evaluate_financing_grid
+from ..services.financing_grid import MAX_SCHEDULE_SCENARIOS
 from ..services.property import (
     create_property,
     get_property,
@@ -115,4 +118,23 @@ def analyze_market_endpoint(
     """
     Analyze market conditions.
     """
-    return analyze_market(db=db, analysis_request=analysis_request, user_id=current_user.id) 
\ No newline at end of file
+    return analyze_market(db=db, analysis_request=analysis_request, user_id=current_user.id)
+
+@router.post("/financing/grid", response_model=FinancingGridResponse, response_model_exclude_none=True)
+def financing_grid_endpoint(
+    grid_request: FinancingGridRequest,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """
+    Evaluate every down payment x rate x term x points financing scenario.
+    """
+    schedule_count = len(grid_request.down_payment_percents) * len(grid_request.interest_rates) * len(grid_request.loan_terms)
+    if grid_request.include_schedules and schedule_count > MAX_SCHEDULE_SCENARIOS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Amortization schedules are limited to {MAX_SCHEDULE_SCENARIOS} down payment x rate x term combinations ({schedule_count} requested)"
+        )
+    try:
+        return evaluate_financing_grid(grid_request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
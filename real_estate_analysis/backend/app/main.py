@@ -9,9 +9,6 @@ from .api.auth import router as auth_router
 from .core.middleware import setup_middleware
 from .core.database import engine, Base
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_DESCRIPTION,
@@ -50,6 +47,12 @@ async def sqlalchemy_exception_handler(request, exc):
         content={"detail": "Database error occurred"},
     )
 
+@app.on_event("startup")
+def create_tables():
+    # Create database tables when the server starts rather than at import,
+    # so importing the app (tests, tooling) does not connect to the database
+    Base.metadata.create_all(bind=engine)
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"} 
\ No newline at end of file
@@ -1,11 +1,11 @@
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 from decimal import Decimal
 
 class AnalysisRequest(BaseModel):
     analysis_type: str = Field(..., description="Type of analysis to perform")
-    parameters: Dict[str, any] = Field(default_factory=dict)
+    parameters: Dict[str, Any] = Field(default_factory=dict)
     timeframe: Optional[str] = None
     location: Optional[str] = None
     property_type: Optional[str] = None
@@ -25,8 +25,8 @@ class MarketMetrics(BaseModel):
 class PropertyMetrics(BaseModel):
     estimated_value: Decimal
     price_per_square_foot: Decimal
-    comparable_properties: List[Dict[str, any]]
-    price_history: List[Dict[str, any]]
+    comparable_properties: List[Dict[str, Any]]
+    price_history: List[Dict[str, Any]]
     market_value_trend: str
     investment_potential: str
     roi_estimate: Decimal
@@ -36,7 +36,7 @@ class AnalysisResponse(BaseModel):
     id: int
     analysis_type: str
     timestamp: datetime
-    metrics: Dict[str, any]
+    metrics: Dict[str, Any]
     insights: List[str]
     recommendations: List[str]
     market_metrics: Optional[MarketMetrics] = None
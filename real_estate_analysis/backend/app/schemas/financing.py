@@ -0,0 +1,40 @@
+from typing import Optional, List, Dict
+from pydantic import BaseModel, Field
+
+class FinancingGridRequest(BaseModel):
+    property_value: float = Field(..., gt=0, description="Purchase price")
+    property_type: str = "Single Family"
+    market_type: str = "balanced"
+    annual_tax_amount: Optional[float] = None
+    monthly_rent: Optional[float] = Field(None, ge=0, description="Expected monthly rent (estimated if omitted)")
+    down_payment_percents: List[float] = Field(default=[20, 25, 30], min_length=1)
+    interest_rates: List[float] = Field(default=[6.0, 6.15, 6.25], min_length=1)
+    loan_terms: List[int] = Field(default=[15, 20, 30], min_length=1)
+    points: List[float] = Field(default=[0], min_length=1)
+    include_schedules: bool = False
+
+class FinancingScenario(BaseModel):
+    down_payment_percent: float
+    interest_rate: float
+    loan_term_years: int
+    points: float
+    down_payment: int
+    loan_amount: int
+    points_cost: int
+    cash_to_close: int
+    monthly_mortgage: int
+    monthly_cash_flow: int
+    annual_cash_flow: int
+    cash_on_cash_return: float
+    total_interest: int
+    debt_service_coverage: Optional[float] = None
+    schedule_index: int
+
+class FinancingGridResponse(BaseModel):
+    property_value: float
+    monthly_rent: float
+    monthly_expenses: float
+    axes: Dict[str, List[float]]
+    scenarios: List[FinancingScenario]
+    schedule_fields: Optional[List[str]] = None
+    schedules: Optional[List[List[List[float]]]] = None
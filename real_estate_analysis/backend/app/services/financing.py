@@ -0,0 +1,17 @@
+from typing import Dict, Any
+from .financing_grid import build_financing_grid
+from ..schemas.financing import FinancingGridRequest
+
+def evaluate_financing_grid(grid_request: FinancingGridRequest) -> Dict[str, Any]:
+    grid = build_financing_grid(
+        property_value=grid_request.property_value,
+        property_type=grid_request.property_type,
+        market_type=grid_request.market_type,
+        annual_tax_amount=grid_request.annual_tax_amount,
+        monthly_rent=grid_request.monthly_rent,
+        down_payment_percents=grid_request.down_payment_percents,
+        interest_rates=grid_request.interest_rates,
+        loan_terms=grid_request.loan_terms,
+        points=grid_request.points,
+    )
+    return grid.to_dict(include_schedules=grid_request.include_schedules)
@@ -0,0 +1,351 @@
+"""
+Financing scenario grid engine for the backend API
+
+Evaluates every combination of down payment, interest rate, loan term and
+discount points for a property in one NumPy broadcast. Month-by-month
+amortization schedules are available for the whole grid as a 3-D array, and are
+only computed when first requested.
+
+The backend image is built from the backend directory alone, so the engine
+lives here; the repository's ``financing_grid`` module re-exports it for the
+Flask app and the analysis graph.
+"""
+
+from functools import cached_property
+from typing import Dict, Any, List, Sequence
+
+import numpy as np
+
+from .investment_assumptions import (
+    BASE_RENT_RATIO,
+    PROPERTY_TYPE_RENT_FACTORS,
+    MARKET_TYPE_RENT_FACTORS,
+    DEFAULT_TAX_RATE,
+    INSURANCE_RATE,
+    MAINTENANCE_RATE,
+    MANAGEMENT_FEE_RATE,
+    VACANCY_RATE
+)
+
+# Default grid axes
+DEFAULT_DOWN_PAYMENT_PERCENTS = (20, 25, 30)
+DEFAULT_INTEREST_RATES = (6.0, 6.15, 6.25)
+DEFAULT_LOAN_TERMS = (15, 20, 30)
+DEFAULT_POINTS = (0,)
+
+# Amortization schedule fields (last axis of the schedule array)
+SCHEDULE_FIELDS = ('interest', 'principal', 'balance')
+
+# Guard against accidentally huge requests
+MAX_GRID_SCENARIOS = 100000
+# Serialized schedules hold months x 3 values per (down, rate, term)
+# combination, so far fewer scenarios may include them
+MAX_SCHEDULE_SCENARIOS = 100
+
+
+class FinancingGrid:
+    """
+    Financing metrics for every down payment x rate x term x points combination
+
+    Grid metrics are arrays of shape (D, R, T, P), indexed in the order of
+    ``down_payment_percents``, ``interest_rates``, ``loan_terms`` and ``points``.
+    Points are a one-off closing cost (1 point = 1% of the loan) and do not
+    change the payment, so amortization schedules only span (D, R, T).
+    """
+
+    def __init__(self,
+                 property_value: float,
+                 monthly_rent: float = 0.0,
+                 monthly_expenses: float = 0.0,
+                 down_payment_percents: Sequence[float] = DEFAULT_DOWN_PAYMENT_PERCENTS,
+                 interest_rates: Sequence[float] = DEFAULT_INTEREST_RATES,
+                 loan_terms: Sequence[int] = DEFAULT_LOAN_TERMS,
+                 points: Sequence[float] = DEFAULT_POINTS):
+        """
+        Initialize the FinancingGrid
+
+        Args:
+            property_value: Purchase price
+            monthly_rent: Expected monthly rent
+            monthly_expenses: Monthly operating expenses (taxes, insurance,
+                maintenance, management and vacancy)
+            down_payment_percents: Down payments as a percent of price
+            interest_rates: Annual interest rates in percent
+            loan_terms: Loan terms in years
+            points: Discount points paid at closing
+
+        Raises:
+            ValueError: If an axis is empty or out of range, or the grid is too large
+        """
+        self.property_value = float(property_value)
+        self.monthly_rent = float(monthly_rent)
+        self.monthly_expenses = float(monthly_expenses)
+        self.down_payment_percents = np.asarray(down_payment_percents, dtype=float)
+        self.interest_rates = np.asarray(interest_rates, dtype=float)
+        self.loan_terms = np.asarray(loan_terms, dtype=int)
+        self.points = np.asarray(points, dtype=float)
+
+        for name in ('down_payment_percents', 'interest_rates', 'loan_terms', 'points'):
+            axis = getattr(self, name)
+            if axis.ndim != 1 or axis.size == 0:
+                raise ValueError(f"{name} must be a non-empty list")
+        if self.property_value <= 0:
+            raise ValueError("property_value must be positive")
+        if np.any((self.down_payment_percents < 0) | (self.down_payment_percents > 100)):
+            raise ValueError("down_payment_percents must be between 0 and 100")
+        if np.any(self.interest_rates < 0) or np.any(self.points < 0):
+            raise ValueError("interest_rates and points must not be negative")
+        if np.any(self.loan_terms <= 0):
+            raise ValueError("loan_terms must be positive")
+        if self.shape[0] * self.shape[1] * self.shape[2] * self.shape[3] > MAX_GRID_SCENARIOS:
+            raise ValueError(f"Financing grid exceeds {MAX_GRID_SCENARIOS} scenarios")
+
+        self._compute()
+
+    @property
+    def shape(self) -> tuple:
+        """Grid shape (D, R, T, P)"""
+        return (
+            len(self.down_payment_percents),
+            len(self.interest_rates),
+            len(self.loan_terms),
+            len(self.points)
+        )
+
+    @property
+    def schedule_count(self) -> int:
+        """Number of amortization schedules (D * R * T)"""
+        down_count, rate_count, term_count, _ = self.shape
+        return down_count * rate_count * term_count
+
+    def _compute(self) -> None:
+        """Evaluates the grid metrics with broadcasting"""
+        down_fraction = self.down_payment_percents[:, None, None, None] / 100
+        monthly_rate = self.interest_rates[None, :, None, None] / 1200
+        payments = self.loan_terms[None, None, :, None] * 12
+        points = self.points[None, None, None, :]
+
+        self.down_payment = self.property_value * down_fraction
+        self.loan_amount = self.property_value - self.down_payment
+
+        # Annuity payment; zero-rate loans are repaid in equal installments
+        growth = (1 + monthly_rate) ** payments
+        with np.errstate(divide='ignore', invalid='ignore'):
+            annuity = np.where(monthly_rate > 0, monthly_rate * growth / (growth - 1), 1 / payments)
+        self._annuity = annuity[..., 0]  # (1, R, T) - points do not affect the payment
+        monthly_mortgage = self.loan_amount * annuity
+
+        self.points_cost = self.loan_amount * points / 100
+        self.cash_to_close = self.down_payment + self.points_cost
+        self.monthly_mortgage = np.broadcast_to(monthly_mortgage, self.shape)
+        self.monthly_cash_flow = np.broadcast_to(
+            self.monthly_rent - self.monthly_expenses - monthly_mortgage, self.shape
+        )
+        self.annual_cash_flow = self.monthly_cash_flow * 12
+        self.total_interest = np.broadcast_to(monthly_mortgage * payments - self.loan_amount, self.shape)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.cash_on_cash_return = np.where(
+                self.cash_to_close > 0, self.annual_cash_flow / self.cash_to_close * 100, 0.0
+            )
+            net_operating_income = (self.monthly_rent - self.monthly_expenses) * 12
+            annual_debt_service = self.monthly_mortgage * 12
+            self.debt_service_coverage = np.where(
+                annual_debt_service > 0, net_operating_income / annual_debt_service, np.inf
+            )
+
+    @cached_property
+    def amortization_schedules(self) -> np.ndarray:
+        """
+        Month-by-month amortization schedules for every (down, rate, term) combination
+
+        Computed on first access. Scenarios are flattened in (D, R, T) order
+        (see ``schedule_index``); months beyond a loan's term are zero.
+
+        Returns:
+            Array of shape (D * R * T, max term in months, 3) holding interest,
+            principal and remaining balance for each month
+        """
+        down_count, rate_count, term_count, _ = self.shape
+        months = int(self.loan_terms.max()) * 12
+
+        loan = np.broadcast_to(self.loan_amount[..., 0], (down_count, rate_count, term_count))[..., None]
+        monthly_rate = np.broadcast_to(
+            (self.interest_rates / 1200)[None, :, None], (down_count, rate_count, term_count)
+        )[..., None]
+        payments = np.broadcast_to(self.loan_terms[None, None, :] * 12, (down_count, rate_count, term_count))[..., None]
+
+        # Closed-form balance after k payments
+        k = np.arange(months + 1)
+        growth_k = (1 + monthly_rate) ** k
+        growth_n = (1 + monthly_rate) ** payments
+        with np.errstate(divide='ignore', invalid='ignore'):
+            balance = np.where(
+                monthly_rate > 0,
+                loan * (growth_n - growth_k) / (growth_n - 1),
+                loan * (1 - k / payments)
+            )
+        balance = np.where(k <= payments, np.maximum(balance, 0.0), 0.0)
+
+        interest = balance[..., :-1] * monthly_rate
+        principal = balance[..., :-1] - balance[..., 1:]
+        active = k[1:] <= payments
+        interest = np.where(active, interest, 0.0)
+        principal = np.where(active, principal, 0.0)
+
+        schedules = np.stack([interest, principal, balance[..., 1:]], axis=-1)
+        return schedules.reshape(down_count * rate_count * term_count, months, len(SCHEDULE_FIELDS))
+
+    def schedule_index(self, down_index: int, rate_index: int, term_index: int) -> int:
+        """
+        Returns the row of ``amortization_schedules`` for a grid combination
+
+        Args:
+            down_index: Index into down_payment_percents
+            rate_index: Index into interest_rates
+            term_index: Index into loan_terms
+
+        Returns:
+            int: Schedule row
+        """
+        _, rate_count, term_count, _ = self.shape
+        return (down_index * rate_count + rate_index) * term_count + term_index
+
+    def schedule(self, down_index: int, rate_index: int, term_index: int) -> List[Dict[str, Any]]:
+        """
+        Returns one amortization schedule as a list of monthly entries
+
+        Args:
+            down_index: Index into down_payment_percents
+            rate_index: Index into interest_rates
+            term_index: Index into loan_terms
+
+        Returns:
+            List of dicts with month, payment, interest, principal and balance
+        """
+        rows = self.amortization_schedules[self.schedule_index(down_index, rate_index, term_index)]
+        months = int(self.loan_terms[term_index]) * 12
+        return [
+            {
+                'month': month + 1,
+                'payment': round(float(interest + principal), 2),
+                'interest': round(float(interest), 2),
+                'principal': round(float(principal), 2),
+                'balance': round(float(balance), 2)
+            }
+            for month, (interest, principal, balance) in enumerate(rows[:months])
+        ]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Lists every scenario in the grid
+
+        Returns:
+            List of scenario dicts in (D, R, T, P) order
+        """
+        records = []
+        for index in np.ndindex(*self.shape):
+            down_index, rate_index, term_index, points_index = index
+            dscr = float(self.debt_service_coverage[index])
+            records.append({
+                'down_payment_percent': float(self.down_payment_percents[down_index]),
+                'interest_rate': float(self.interest_rates[rate_index]),
+                'loan_term_years': int(self.loan_terms[term_index]),
+                'points': float(self.points[points_index]),
+                'down_payment': int(self.down_payment[down_index, 0, 0, 0]),
+                'loan_amount': int(self.loan_amount[down_index, 0, 0, 0]),
+                'points_cost': int(self.points_cost[down_index, 0, 0, points_index]),
+                'cash_to_close': int(self.cash_to_close[down_index, 0, 0, points_index]),
+                'monthly_mortgage': int(self.monthly_mortgage[index]),
+                'monthly_cash_flow': int(self.monthly_cash_flow[index]),
+                'annual_cash_flow': int(self.annual_cash_flow[index]),
+                'cash_on_cash_return': round(float(self.cash_on_cash_return[index]), 2),
+                'total_interest': int(self.total_interest[index]),
+                'debt_service_coverage': round(dscr, 2) if np.isfinite(dscr) else None,
+                'schedule_index': self.schedule_index(down_index, rate_index, term_index)
+            })
+        return records
+
+    def to_dict(self, include_schedules: bool = False) -> Dict[str, Any]:
+        """
+        Serializes the grid for API responses
+
+        Args:
+            include_schedules: Whether to include every amortization schedule
+
+        Returns:
+            Dict containing the grid axes, scenarios and optionally schedules
+
+        Raises:
+            ValueError: If schedules are requested for more than
+                MAX_SCHEDULE_SCENARIOS combinations
+        """
+        if include_schedules and self.schedule_count > MAX_SCHEDULE_SCENARIOS:
+            raise ValueError(
+                f"Amortization schedules are limited to {MAX_SCHEDULE_SCENARIOS} "
+                f"down payment x rate x term combinations ({self.schedule_count} requested)"
+            )
+        result = {
+            'property_value': self.property_value,
+            'monthly_rent': round(self.monthly_rent, 2),
+            'monthly_expenses': round(self.monthly_expenses, 2),
+            'axes': {
+                'down_payment_percents': self.down_payment_percents.tolist(),
+                'interest_rates': self.interest_rates.tolist(),
+                'loan_terms': self.loan_terms.tolist(),
+                'points': self.points.tolist()
+            },
+            'scenarios': self.to_records()
+        }
+        if include_schedules:
+            result['schedule_fields'] = list(SCHEDULE_FIELDS)
+            result['schedules'] = np.round(self.amortization_schedules, 2).tolist()
+        return result
+
+
+def build_financing_grid(property_value: float,
+                         property_type: str = 'Single Family',
+                         market_type: str = 'balanced',
+                         annual_tax_amount: float = None,
+                         monthly_rent: float = None,
+                         **axes) -> FinancingGrid:
+    """
+    Builds a financing grid, estimating rent and expenses when not given
+
+    Rent and operating expenses default to the investment analysis
+    assumptions for the property type and market.
+
+    Args:
+        property_value: Purchase price
+        property_type: Property type used for the rent estimate
+        market_type: Market type used for the rent estimate
+        annual_tax_amount: Annual property tax (defaults to 1% of value)
+        monthly_rent: Expected monthly rent (estimated if None)
+        **axes: Grid axes passed to FinancingGrid (down_payment_percents,
+            interest_rates, loan_terms, points)
+
+    Returns:
+        FinancingGrid
+    """
+    if monthly_rent is None:
+        monthly_rent = (
+            property_value * BASE_RENT_RATIO
+            * PROPERTY_TYPE_RENT_FACTORS.get(property_type, 1.0)
+            * MARKET_TYPE_RENT_FACTORS.get(market_type, 1.0)
+        )
+    if annual_tax_amount is None:
+        annual_tax_amount = property_value * DEFAULT_TAX_RATE
+
+    # Management and vacancy scale with the rent
+    annual_rent = monthly_rent * 12
+    annual_expenses = (
+        annual_tax_amount + property_value * INSURANCE_RATE + property_value * MAINTENANCE_RATE
+        + annual_rent * MANAGEMENT_FEE_RATE + annual_rent * VACANCY_RATE
+    )
+
+    return FinancingGrid(
+        property_value=property_value,
+        monthly_rent=monthly_rent,
+        monthly_expenses=annual_expenses / 12,
+        **axes
+    )
@@ -0,0 +1,27 @@
+"""
+Rent and operating expense assumptions shared by the investment analyses
+
+The repository's investment_metrics module and the backend's financing grid
+both read these, so they live inside the backend package, which its image is
+built from.
+"""
+
+# Rent estimate as a fraction of property value, before adjustments
+BASE_RENT_RATIO = 0.005
+
+# Monthly rent adjustments
+PROPERTY_TYPE_RENT_FACTORS = {
+    'Condo': 1.1,
+    'Townhouse': 1.05
+}
+MARKET_TYPE_RENT_FACTORS = {
+    'seller': 1.1,  # Higher demand means higher rents
+    'buyer': 0.9    # Lower demand means lower rents
+}
+
+# Operating expense assumptions
+DEFAULT_TAX_RATE = 0.01
+INSURANCE_RATE = 0.005  # Typical annual insurance cost
+MAINTENANCE_RATE = 0.01  # Rule of thumb for maintenance
+MANAGEMENT_FEE_RATE = 0.1  # Typical property management fee
+VACANCY_RATE = 0.05  # Assume 5% vacancy rate
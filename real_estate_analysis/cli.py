@@ -10,24 +10,11 @@ from typing import Optional
 import os
 
 import click
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from dotenv import load_dotenv
 
-from api_integrations.census import CensusAPI
-from api_integrations.property import PropertyAPI
-from config import Config
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    datefmt="[%X]",
-    handlers=[RichHandler(rich_tracebacks=True)],
-)
-
-console = Console()
+# rich and the API clients (aiohttp, prometheus_client, ...) are imported when a
+# command runs, not at start-up, so `--help` and argument errors return quickly
+console = None
 
 # Load environment variables
 load_dotenv()
@@ -35,13 +22,29 @@ load_dotenv()
 @click.group()
 def cli():
     """Real Estate Market Analysis System CLI."""
-    pass
+    global console
+    from rich.console import Console
+    from rich.logging import RichHandler
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[RichHandler(rich_tracebacks=True)],
+    )
+
+    console = Console()
 
 @cli.command()
 @click.argument("address")
 @click.option("--output", "-o", help="Output file for the analysis results")
 def analyze_property(address: str, output: Optional[str] = None):
     """Analyze a single property."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from api_integrations.census import CensusAPI
+    from api_integrations.property import PropertyAPI
+
     async def run_analysis():
         try:
             with Progress(
@@ -96,6 +99,9 @@ def analyze_property(address: str, output: Optional[str] = None):
 @click.option("--output", "-o", help="Output file for the market analysis")
 def analyze_market(location: str, output: Optional[str] = None):
     """Analyze market conditions for a location."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from api_integrations.property import PropertyAPI
+
     async def run_market_analysis():
         try:
             with Progress(
@@ -130,6 +136,10 @@ def analyze_market(location: str, output: Optional[str] = None):
 @cli.command()
 def check_health():
     """Check the health of all API integrations."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from api_integrations.census import CensusAPI
+    from api_integrations.property import PropertyAPI
+
     async def run_health_check():
         try:
             with Progress(
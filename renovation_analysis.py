@@ -0,0 +1,274 @@
+"""
+Renovation Analysis Engine for Real Estate Valuation and Negotiation Strategist
+
+This module estimates property condition, renovation costs, value added and
+per-project returns for many properties at once. Age bands, conditions and
+projects are lookup arrays, so a whole portfolio is sampled in one vectorized
+pass from a single seeded ``numpy.random.Generator``. Results are columnar:
+every metric is an array with one entry per property, and project metrics are
+N x P tables with one column per entry in ``RENOVATION_PROJECTS``.
+"""
+
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from investment_metrics import safe_divide
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Year property ages are measured from
+REFERENCE_YEAR = 2023
+DEFAULT_YEAR_BUILT = 1970
+
+# Conditions from best to worst; condition arrays below are indexed by position
+CONDITIONS = ('Excellent', 'Very Good', 'Good', 'Fair', 'Poor')
+
+# Age bands (upper edges in years) and, per band, the two possible conditions
+# and the probability of the better one
+AGE_BAND_EDGES = np.array([5, 15, 30, 50])
+AGE_BAND_CONDITIONS = np.array([
+    [0, 1],  # Under 5 years: Excellent or Very Good
+    [1, 2],  # 5-14 years: Very Good or Good
+    [2, 3],  # 15-29 years: Good or Fair
+    [3, 4],  # 30-49 years: Fair or Poor
+    [3, 4]   # 50+ years: Fair or Poor
+])
+AGE_BAND_BETTER_PROBABILITY = np.array([0.7, 0.6, 0.6, 0.7, 0.3])
+
+# Per-condition renovation potential, maximum value increase and cost per square foot range
+CONDITION_POTENTIAL = np.array(['Low', 'Low', 'Moderate', 'High', 'High'], dtype=object)
+CONDITION_VALUE_INCREASE = np.array([0.05, 0.05, 0.1, 0.2, 0.3])
+CONDITION_COST_PER_SQFT = np.array([
+    [15, 40],
+    [15, 40],
+    [30, 60],
+    [50, 100],
+    [80, 150]
+], dtype=float)
+
+# Recommendation lists and the list used for each condition
+RENOVATION_RECOMMENDATIONS = (
+    (
+        'Minor cosmetic updates',
+        'Smart home technology integration',
+        'Energy efficiency improvements',
+        'Landscaping enhancements'
+    ),
+    (
+        'Kitchen updates (countertops, appliances)',
+        'Bathroom updates (fixtures, tile)',
+        'Fresh paint throughout',
+        'Landscaping improvements',
+        'Energy efficiency upgrades'
+    ),
+    (
+        'Complete kitchen remodel',
+        'Bathroom renovations',
+        'Replace flooring throughout',
+        'Update electrical and plumbing systems',
+        'Exterior improvements (siding, roof, windows)'
+    )
+)
+CONDITION_RECOMMENDATIONS = np.array([0, 0, 1, 2, 2])
+
+# Renovation projects: (name, cost per square foot range, share of the home
+# renovated, value added as a multiple of cost, conditions it is recommended for)
+RENOVATION_PROJECTS: Tuple[Tuple[str, Tuple[float, float], float, Tuple[float, float], Tuple[str, ...]], ...] = (
+    ('Kitchen Renovation', (100, 200), 0.1, (1.0, 1.8), ('Good', 'Fair', 'Poor')),
+    ('Bathroom Renovation', (80, 150), 0.05, (1.0, 1.7), ('Good', 'Fair', 'Poor')),
+    ('Flooring Replacement', (7, 12), 1.0, (1.0, 1.5), CONDITIONS),
+    ('Interior Painting', (2, 4), 1.0, (1.5, 2.5), CONDITIONS),
+    ('Landscaping Improvements', (1, 3), 1.0, (1.5, 2.0), CONDITIONS)
+)
+PROJECT_NAMES = tuple(project[0] for project in RENOVATION_PROJECTS)
+PROJECT_COST_PER_SQFT = np.array([project[1] for project in RENOVATION_PROJECTS], dtype=float)
+PROJECT_AREA_SHARE = np.array([project[2] for project in RENOVATION_PROJECTS])
+PROJECT_VALUE_MULTIPLE = np.array([project[3] for project in RENOVATION_PROJECTS], dtype=float)
+# Condition x project table of which projects are recommended
+PROJECT_APPLIES = np.array([
+    [condition in project[4] for project in RENOVATION_PROJECTS]
+    for condition in CONDITIONS
+])
+
+
+def _scale(draws: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+    """Maps uniform [0, 1) draws onto [low, high) ranges (last axis of ranges)"""
+    return ranges[..., 0] + draws * (ranges[..., 1] - ranges[..., 0])
+
+
+class RenovationAnalysis:
+    """
+    Columnar renovation analysis for a batch of properties
+
+    Per-property metrics are 1-D arrays of length N. Project metrics are N x P
+    arrays, with one column per entry in ``project_names``; ``project_included``
+    marks the projects recommended for each property's condition.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], project_names: Tuple[str, ...] = PROJECT_NAMES):
+        """
+        Initialize the RenovationAnalysis
+
+        Args:
+            columns: Metric name to array
+            project_names: Project name for each project column
+        """
+        self.columns = columns
+        self.project_names = project_names
+
+    def __len__(self) -> int:
+        return len(self.columns['property_value'])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def conditions(self) -> np.ndarray:
+        """Condition label per property"""
+        return np.array(CONDITIONS, dtype=object)[self.columns['condition']]
+
+    def to_frame(self) -> 'pd.DataFrame':
+        """
+        Flattens the analysis into a DataFrame with one row per property
+
+        Project metrics become ``<project>.<metric>`` columns.
+
+        Returns:
+            DataFrame of renovation metrics
+        """
+        data = {}
+        for name, values in self.columns.items():
+            if name == 'condition':
+                data['property_condition'] = self.conditions
+            elif values.ndim == 1:
+                data[name] = values
+            else:
+                for column, project_name in enumerate(self.project_names):
+                    data[f'{project_name}.{name}'] = values[:, column]
+        import pandas as pd
+        return pd.DataFrame(data)
+
+    def project_table(self) -> 'pd.DataFrame':
+        """
+        Lists the recommended projects of every property in long format
+
+        Returns:
+            DataFrame with property_index, project, cost, value_added and roi
+            columns, one row per recommended project
+        """
+        rows, columns = np.nonzero(self.columns['project_included'])
+        import pandas as pd
+        return pd.DataFrame({
+            'property_index': rows,
+            'project': np.array(self.project_names, dtype=object)[columns],
+            'cost': self.columns['project_cost'][rows, columns],
+            'value_added': self.columns['project_value_added'][rows, columns],
+            'roi': self.columns['project_roi'][rows, columns]
+        })
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        """
+        Builds the renovation analysis for one property
+
+        Args:
+            index: Position of the property in the batch
+
+        Returns:
+            Dict in the format returned by PropertyAnalyzer._generate_renovation_analysis
+        """
+        c = {name: values[index] for name, values in self.columns.items()}
+        condition = int(c['condition'])
+
+        renovation_projects: List[Dict[str, Any]] = [
+            {
+                'project': name,
+                'cost': int(c['project_cost'][column]),
+                'value_added': int(c['project_value_added'][column]),
+                'roi': round(float(c['project_roi'][column]), 1)
+            }
+            for column, name in enumerate(self.project_names)
+            if c['project_included'][column]
+        ]
+
+        return {
+            'property_condition': CONDITIONS[condition],
+            'renovation_potential': CONDITION_POTENTIAL[condition],
+            'potential_value_increase': int(c['potential_value_increase']),
+            'after_renovation_value': int(c['after_renovation_value']),
+            'estimated_renovation_cost': int(c['estimated_renovation_cost']),
+            'renovation_roi': round(float(c['renovation_roi']), 1),
+            'renovation_recommendations': list(RENOVATION_RECOMMENDATIONS[CONDITION_RECOMMENDATIONS[condition]]),
+            'renovation_projects': renovation_projects
+        }
+
+
+def compute_renovation_analysis(property_values: Sequence[float],
+                                square_feet: Sequence[float],
+                                year_builts: Optional[Sequence[float]] = None,
+                                seed: Union[int, np.random.Generator, None] = None) -> RenovationAnalysis:
+    """
+    Estimates renovation costs and returns for a batch of properties
+
+    Each property's condition is drawn from its age band, its renovation cost
+    per square foot from its condition's range, and each project's cost and
+    value multiple from the project's ranges. All draws for the batch are
+    taken as one (N, 2 + 2P) uniform matrix.
+
+    Args:
+        property_values: Property value per property
+        square_feet: Living area per property (NaN counts as 0)
+        year_builts: Year built per property (NaN or None falls back to
+            DEFAULT_YEAR_BUILT)
+        seed: Seed or Generator for reproducible results (draws are taken in
+            batch order, so the same seed and batch give the same result)
+
+    Returns:
+        RenovationAnalysis with one entry per property
+    """
+    value = np.asarray(property_values, dtype=float)
+    size = len(value)
+    area = np.nan_to_num(np.asarray(square_feet, dtype=float))
+    if year_builts is None:
+        year_built = np.full(size, DEFAULT_YEAR_BUILT, dtype=float)
+    else:
+        year_built = np.asarray(year_builts, dtype=float)
+        year_built = np.where(np.isnan(year_built), DEFAULT_YEAR_BUILT, year_built)
+    age = REFERENCE_YEAR - year_built
+
+    rng = np.random.default_rng(seed)
+    projects = len(RENOVATION_PROJECTS)
+    draws = rng.random((size, 2 + 2 * projects))
+
+    # Condition from the age band
+    band = np.searchsorted(AGE_BAND_EDGES, age, side='right')
+    worse = draws[:, 0] >= AGE_BAND_BETTER_PROBABILITY[band]
+    condition = AGE_BAND_CONDITIONS[band, worse.astype(int)]
+
+    # Overall renovation
+    potential_value_increase = value * CONDITION_VALUE_INCREASE[condition]
+    cost_per_sqft = _scale(draws[:, 1], CONDITION_COST_PER_SQFT[condition])
+    estimated_renovation_cost = area * cost_per_sqft
+    renovation_roi = safe_divide(potential_value_increase, estimated_renovation_cost) * 100
+
+    # Projects, as N x P tables
+    project_cost = area[:, None] * _scale(draws[:, 2:2 + projects], PROJECT_COST_PER_SQFT) * PROJECT_AREA_SHARE
+    project_value_added = project_cost * _scale(draws[:, 2 + projects:], PROJECT_VALUE_MULTIPLE)
+    project_roi = np.where(project_cost > 0, safe_divide(project_value_added, project_cost) - 1, 0.0) * 100
+
+    return RenovationAnalysis({
+        'property_value': value,
+        'square_feet': area,
+        'age': age,
+        'condition': condition,
+        'potential_value_increase': potential_value_increase,
+        'after_renovation_value': value + potential_value_increase,
+        'cost_per_sqft': cost_per_sqft,
+        'estimated_renovation_cost': estimated_renovation_cost,
+        'renovation_roi': renovation_roi,
+        'project_included': PROJECT_APPLIES[condition],
+        'project_cost': project_cost,
+        'project_value_added': project_value_added,
+        'project_roi': project_roi
+    })
@@ -0,0 +1,755 @@
+"""
+Report Charts for Real Estate Valuation and Negotiation Strategist
+
+This module draws the charts embedded in property reports (valuation,
+comparables, market trends, price trends and strategy comparison). Charts are
+CPU-bound and independent of each other, so render_report_charts draws them
+concurrently in a shared pool of worker processes; each worker loads
+matplotlib with the Agg backend and the report style once and reuses it for
+every chart it draws. With a single worker, charts are drawn in-process.
+
+Drawn charts are kept in a content-addressed cache keyed by a hash of the
+chart's input data and the chart style version, so reports sharing inputs
+(such as the market and price trends of properties in the same ZIP code) draw
+each distinct chart once.
+"""
+
+import os
+import io
+import json
+import base64
+import hashlib
+import random
+import threading
+import multiprocessing
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional
+import numpy as np
+from datetime import datetime
+
+from batch_checkpoint import json_default
+
+# Report charts: template variable, ChartRenderer method, the part of the
+# analysis the chart draws and the field of that part it reads (None for the
+# whole part)
+REPORT_CHARTS = (
+    ('valuation_chart', '_generate_valuation_chart', 'valuation', None),
+    ('comparables_chart', '_generate_comparables_chart', 'valuation', None),
+    ('market_trends_chart', '_generate_market_trends_chart', 'market', 'historical_trends'),
+    ('price_trends_chart', '_generate_price_trends_chart', 'market', 'price_trends'),
+    ('strategy_comparison_chart', '_generate_strategy_comparison_chart', 'negotiation', None),
+)
+
+# Worker processes drawing charts (should be stored in environment variables)
+REPORT_CHART_WORKERS = int(os.getenv("REPORT_CHART_WORKERS", str(min(len(REPORT_CHARTS), os.cpu_count() or 1))))
+
+# Chart cache settings (should be stored in environment variables)
+REPORT_CHART_CACHE_MAX_ENTRIES = int(os.getenv("REPORT_CHART_CACHE_MAX_ENTRIES", "256"))  # About 50 KB per chart
+
+# Part of every chart cache key; bump it whenever a chart or the style set up
+# in _load_pyplot changes, so charts drawn the old way are no longer reused
+CHART_STYLE_VERSION = '1'
+
+# matplotlib and seaborn dominate this module's import time, so they are only
+# loaded once the first chart is drawn (see _load_pyplot)
+_pyplot = None
+
+def _load_pyplot():
+    """
+    Imports matplotlib.pyplot on first use and sets up the report chart style
+    
+    Returns:
+        The matplotlib.pyplot module, using the non-interactive Agg backend
+    """
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # Set Seaborn style
+        sns.set_style("whitegrid")
+        
+        # Set color palette
+        sns.set_palette("colorblind")
+        
+        # Set matplotlib parameters
+        plt.rcParams['figure.figsize'] = (10, 6)
+        plt.rcParams['font.family'] = 'sans-serif'
+        plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans', 'Liberation Sans']
+        plt.rcParams['axes.labelsize'] = 12
+        plt.rcParams['axes.titlesize'] = 14
+        plt.rcParams['xtick.labelsize'] = 10
+        plt.rcParams['ytick.labelsize'] = 10
+        
+        _pyplot = plt
+    return _pyplot
+
+
+class ChartRenderer:
+    """
+    Draws the report charts as base64-encoded PNG images
+    
+    Each chart only depends on the analysis data passed in, so charts can be
+    drawn in worker processes.
+    """
+    
+    def _generate_valuation_chart(self, valuation_data: Dict[str, Any]) -> str:
+        """
+        Generates a valuation comparison chart
+        
+        Args:
+            valuation_data: Property valuation data
+            
+        Returns:
+            Base64-encoded chart image
+        """
+        plt = _load_pyplot()
+        # Extract valuation data
+        valuation_sources = valuation_data.get('valuation', {}).get('sources', [])
+        final_value = valuation_data.get('valuation', {}).get('final_value', 0)
+        listing_price = valuation_data.get('valuation', {}).get('listing_price', 0)
+        
+        # Create figure
+        plt.figure(figsize=(10, 6))
+        
+        # Prepare data
+        sources = []
+        values = []
+        confidence = []
+        
+        for source in valuation_sources:
+            sources.append(source.get('source', 'Unknown'))
+            values.append(source.get('value', 0))
+            confidence.append(source.get('confidence', 50) / 100)
+        
+        # Add final value and listing price
+        sources.extend(['Final Estimate', 'Listing Price'])
+        values.extend([final_value, listing_price])
+        confidence.extend([1.0, 1.0])
+        
+        # Create bar chart
+        bars = plt.bar(sources, values, alpha=0.7)
+        
+        # Color bars based on confidence
+        for i, bar in enumerate(bars):
+            if i < len(sources) - 2:  # Only color the valuation sources
+                bar.set_color(plt.cm.viridis(confidence[i]))
+            elif i == len(sources) - 2:  # Final estimate
+                bar.set_color('green')
+            else:  # Listing price
+                bar.set_color('red')
+        
+        # Add value labels
+        for bar in bars:
+            height = bar.get_height()
+            plt.text(bar.get_x() + bar.get_width()/2., height,
+                    f'${height:,.0f}',
+                    ha='center', va='bottom', rotation=0)
+        
+        # Set labels and title
+        plt.xlabel('Valuation Source')
+        plt.ylabel('Value ($)')
+        plt.title('Property Valuation Comparison')
+        plt.xticks(rotation=45, ha='right')
+        plt.tight_layout()
+        
+        # Add grid
+        plt.grid(axis='y', linestyle='--', alpha=0.7)
+        
+        # Convert to base64
+        return self._fig_to_base64(plt.gcf())
+    
+    def _generate_comparables_chart(self, valuation_data: Dict[str, Any]) -> str:
+        """
+        Generates a comparables chart
+        
+        Args:
+            valuation_data: Property valuation data
+            
+        Returns:
+            Base64-encoded chart image
+        """
+        plt = _load_pyplot()
+        # Extract comparables data
+        comparables = valuation_data.get('valuation', {}).get('comparables', [])
+        subject_value = valuation_data.get('valuation', {}).get('final_value', 0)
+        
+        # Create figure
+        plt.figure(figsize=(10, 6))
+        
+        # Prepare data
+        addresses = ['Subject Property']
+        prices = [subject_value]
+        price_per_sqft = [subject_value / valuation_data.get('property', {}).get('square_feet', 1000)]
+        colors = ['red']
+        
+        for comp in comparables:
+            # Truncate address to keep chart readable
+            address = comp.get('address', 'Unknown')
+            if len(address) > 20:
+                address = address[:20] + '...'
+            
+            addresses.append(address)
+            prices.append(comp.get('sale_price', 0))
+            price_per_sqft.append(comp.get('price_per_sqft', 0))
+            colors.append('blue')
+        
+        # Create bar chart
+        plt.figure(figsize=(12, 10))
+        
+        # Price subplot
+        plt.subplot(2, 1, 1)
+        bars1 = plt.bar(addresses, prices, color=colors, alpha=0.7)
+        
+        # Add value labels
+        for bar in bars1:
+            height = bar.get_height()
+            plt.text(bar.get_x() + bar.get_width()/2., height,
+                    f'${height:,.0f}',
+                    ha='center', va='bottom', rotation=0)
+        
+        plt.title('Comparable Properties - Sale Price')
+        plt.ylabel('Price ($)')
+        plt.xticks(rotation=45, ha='right')
+        plt.grid(axis='y', linestyle='--', alpha=0.7)
+        
+        # Price per sqft subplot
+        plt.subplot(2, 1, 2)
+        bars2 = plt.bar(addresses, price_per_sqft, color=colors, alpha=0.7)
+        
+        # Add value labels
+        for bar in bars2:
+            height = bar.get_height()
+            plt.text(bar.get_x() + bar.get_width()/2., height,
+                    f'${height:.0f}',
+                    ha='center', va='bottom', rotation=0)
+        
+        plt.title('Comparable Properties - Price per Square Foot')
+        plt.ylabel('Price per Sq Ft ($)')
+        plt.xticks(rotation=45, ha='right')
+        plt.grid(axis='y', linestyle='--', alpha=0.7)
+        
+        plt.tight_layout()
+        
+        # Convert to base64
+        return self._fig_to_base64(plt.gcf())
+    
+    def _generate_market_trends_chart(self, market_data: Dict[str, Any]) -> str:
+        """
+        Generates a market trends chart
+        
+        Args:
+            market_data: Market analysis data
+            
+        Returns:
+            Base64-encoded chart image
+        """
+        plt = _load_pyplot()
+        # Extract market trends data
+        trends = market_data.get('historical_trends', {})
+        
+        # If no historical data, generate mock data
+        if not trends:
+            # Generate mock data for demonstration
+            months = 12
+            import pandas as pd
+            dates = pd.period_range(end=datetime.now(), periods=months, freq='M')
+            
+            # Generate random trends with realistic patterns
+            inventory = [random.randint(30, 50) for _ in range(months)]
+            dom = [random.randint(20, 40) for _ in range(months)]
+            
+            # Create trends dictionary
+            trends = {
+                'dates': [d.strftime('%Y-%m') for d in dates],
+                'inventory': inventory,
+                'days_on_market': dom
+            }
+        
+        # Create figure
+        plt.figure(figsize=(10, 6))
+        
+        # Create plot with dual y-axis
+        fig, ax1 = plt.subplots(figsize=(10, 6))
+        
+        # Plot inventory
+        color = 'tab:blue'
+        ax1.set_xlabel('Date')
+        ax1.set_ylabel('Inventory (# of Listings)', color=color)
+        ax1.plot(trends['dates'], trends['inventory'], color=color, marker='o')
+        ax1.tick_params(axis='y', labelcolor=color)
+        
+        # Create second y-axis
+        ax2 = ax1.twinx()
+        color = 'tab:red'
+        ax2.set_ylabel('Days on Market', color=color)
+        ax2.plot(trends['dates'], trends['days_on_market'], color=color, marker='s')
+        ax2.tick_params(axis='y', labelcolor=color)
+        
+        # Set title and adjust layout
+        plt.title('Market Trends - Inventory and Days on Market')
+        plt.xticks(rotation=45)
+        fig.tight_layout()
+        
+        # Add grid
+        ax1.grid(True, linestyle='--', alpha=0.7)
+        
+        # Convert to base64
+        return self._fig_to_base64(fig)
+    
+    def _generate_price_trends_chart(self, market_data: Dict[str, Any]) -> str:
+        """
+        Generates a price trends chart
+        
+        Args:
+            market_data: Market analysis data
+            
+        Returns:
+            Base64-encoded chart image
+        """
+        plt = _load_pyplot()
+        # Extract price trends data
+        trends = market_data.get('price_trends', {})
+        
+        # If no price trends data, generate mock data
+        if not trends:
+            # Generate mock data for demonstration
+            months = 24
+            import pandas as pd
+            dates = pd.period_range(end=datetime.now(), periods=months, freq='M')
+            
+            # Generate random price trends with realistic patterns
+            base_price = 300000
+            monthly_change = [random.uniform(-0.01, 0.02) for _ in range(months)]
+            
+            # Calculate cumulative price changes
+            cumulative_change = np.cumprod([1 + change for change in monthly_change])
+            median_prices = [base_price * change for change in cumulative_change]
+            
+            # Create trends dictionary
+            trends = {
+                'dates': [d.strftime('%Y-%m') for d in dates],
+                'median_price': median_prices
+            }
+        
+        # Create figure
+        plt.figure(figsize=(10, 6))
+        
+        # Plot median prices
+        plt.plot(trends['dates'], trends['median_price'], marker='o', color='green')
+        
+        # Add trend line
+        z = np.polyfit(range(len(trends['dates'])), trends['median_price'], 1)
+        p = np.poly1d(z)
+        plt.plot(trends['dates'], p(range(len(trends['dates']))), "r--", alpha=0.8)
+        
+        # Calculate and display annual appreciation rate
+        if len(trends['median_price']) > 1:
+            start_price = trends['median_price'][0]
+            end_price = trends['median_price'][-1]
+            time_years = len(trends['median_price']) / 12
+            annual_rate = ((end_price / start_price) ** (1/time_years) - 1) * 100
+            
+            plt.annotate(f'Annual Appreciation: {annual_rate:.1f}%', 
+                        xy=(0.05, 0.95), xycoords='axes fraction',
+                        bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="green", alpha=0.8))
+        
+        # Set labels and title
+        plt.xlabel('Date')
+        plt.ylabel('Median Price ($)')
+        plt.title('Market Price Trends')
+        plt.xticks(rotation=45)
+        plt.grid(True, linestyle='--', alpha=0.7)
+        
+        # Format y-axis as currency
+        plt.gca().yaxis.set_major_formatter(plt.FuncFormatter(lambda x, loc: f"${x:,.0f}"))
+        
+        plt.tight_layout()
+        
+        # Convert to base64
+        return self._fig_to_base64(plt.gcf())
+    
+    def _generate_strategy_comparison_chart(self, negotiation_data: Dict[str, Any]) -> str:
+        """
+        Generates a strategy comparison chart
+        
+        Args:
+            negotiation_data: Negotiation strategy data
+            
+        Returns:
+            Base64-encoded chart image
+        """
+        plt = _load_pyplot()
+        # Extract strategy data
+        strategies = negotiation_data.get('recommended_strategies', [])
+        
+        # If no strategies, return empty chart
+        if not strategies or len(strategies) == 0:
+            plt.figure(figsize=(10, 6))
+            plt.text(0.5, 0.5, 'No strategy data available', 
+                    horizontalalignment='center', verticalalignment='center',
+                    transform=plt.gca().transAxes)
+            plt.tight_layout()
+            return self._fig_to_base64(plt.gcf())
+        
+        # Limit to top 5 strategies
+        strategies = strategies[:5]
+        
+        # Create figure
+        plt.figure(figsize=(12, 8))
+        
+        # Prepare data
+        names = [s.get('name', 'Unknown') for s in strategies]
+        scores = [s.get('score', 0) for s in strategies]
+        success_probs = [s.get('expected_success_probability', 0) * 100 for s in strategies]
+        
+        # Get ROI impact data if available
+        roi_impacts = []
+        for s in strategies:
+            if 'roi_impact' in s and 'total_savings' in s['roi_impact']:
+                roi_impacts.append(s['roi_impact']['total_savings'])
+            else:
+                roi_impacts.append(0)
+        
+        # Create color mapping for strategy types
+        colors = []
+        for s in strategies:
+            if s.get('type') == 'price':
+                colors.append('tab:red')
+            elif s.get('type') == 'terms':
+                colors.append('tab:green')
+            elif s.get('type') == 'creative':
+                colors.append('tab:purple')
+            else:
+                colors.append('tab:blue')
+        
+        # Create bar chart with multiple metrics
+        x = np.arange(len(names))
+        width = 0.25
+        
+        fig, ax1 = plt.subplots(figsize=(12, 8))
+        
+        # Plot strategy scores
+        bars1 = ax1.bar(x - width, scores, width, label='Strategy Score', color=colors, alpha=0.7)
+        
+        # Plot success probability
+        ax1.bar(x, success_probs, width, label='Success Probability (%)', color='tab:orange', alpha=0.7)
+        
+        # Create second y-axis for ROI impact
+        ax2 = ax1.twinx()
+        bars3 = ax2.bar(x + width, roi_impacts, width, label='Total Savings ($)', color='tab:blue', alpha=0.7)
+        
+        # Add value labels
+        for bars in [bars1, bars3]:
+            for bar in bars:
+                height = bar.get_height()
+                if height > 0:
+                    if bars == bars3:  # Format as currency for savings
+                        label = f'${height:,.0f}'
+                    else:
+                        label = f'{height:.0f}'
+                    
+                    ax1.text(bar.get_x() + bar.get_width()/2., height,
+                            label, ha='center', va='bottom', rotation=0)
+        
+        # Set labels and title
+        ax1.set_xlabel('Strategy')
+        ax1.set_ylabel('Score / Probability')
+        ax2.set_ylabel('Total Savings ($)')
+        plt.title('Negotiation Strategy Comparison')
+        
+        # Set x-ticks
+        ax1.set_xticks(x)
+        ax1.set_xticklabels(names, rotation=45, ha='right')
+        
+        # Add legends
+        ax1.legend(loc='upper left')
+        ax2.legend(loc='upper right')
+        
+        # Add grid
+        ax1.grid(True, axis='y', linestyle='--', alpha=0.7)
+        
+        plt.tight_layout()
+        
+        # Convert to base64
+        return self._fig_to_base64(fig)
+    
+    def _fig_to_base64(self, fig) -> str:
+        """
+        Converts matplotlib figure to base64 string
+        
+        Args:
+            fig: Matplotlib figure
+            
+        Returns:
+            Base64-encoded image string
+        """
+        plt = _load_pyplot()
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=100)
+        buf.seek(0)
+        img_str = base64.b64encode(buf.read()).decode('utf-8')
+        plt.close(fig)
+        return img_str
+
+
+# Per-process renderer used by chart workers
+_worker_renderer = None
+
+
+def _init_chart_worker():
+    """Sets up matplotlib and the report style once per worker process"""
+    global _worker_renderer
+    _load_pyplot()
+    _worker_renderer = ChartRenderer()
+
+
+def _render_chart(method_name: str, data: Dict[str, Any]) -> str:
+    """Draws one chart in a worker process"""
+    try:
+        return getattr(_worker_renderer, method_name)(data)
+    finally:
+        # Some charts open more than one figure; never let them pile up in a long-lived worker
+        _load_pyplot().close('all')
+
+
+_chart_pools: Dict[int, ProcessPoolExecutor] = {}
+_chart_pools_lock = threading.Lock()
+
+
+def get_chart_pool(workers: int = None) -> Optional[ProcessPoolExecutor]:
+    """
+    Returns the shared chart worker pool of a given size, starting it on first use
+    
+    Workers are started with the spawn method, so the pool is safe to use from
+    the web application's worker threads.
+    
+    Args:
+        workers: Number of worker processes (defaults to REPORT_CHART_WORKERS)
+        
+    Returns:
+        ProcessPoolExecutor, or None if charts should be drawn in-process
+        (one worker or fewer)
+    """
+    workers = REPORT_CHART_WORKERS if workers is None else workers
+    if workers <= 1:
+        return None
+    with _chart_pools_lock:
+        if workers not in _chart_pools:
+            _chart_pools[workers] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_chart_worker
+            )
+        return _chart_pools[workers]
+
+
+def _discard_chart_pool(pool: ProcessPoolExecutor) -> None:
+    """Drops a broken pool so the next call starts a fresh one"""
+    with _chart_pools_lock:
+        for workers, existing in list(_chart_pools.items()):
+            if existing is pool:
+                del _chart_pools[workers]
+    pool.shutdown(wait=False)
+
+
+def _render_in_process(renderer: ChartRenderer, method_name: str, data: Dict[str, Any]) -> Future:
+    """Draws one chart in the calling process, returning it as a completed Future"""
+    future = Future()
+    try:
+        future.set_result(getattr(renderer, method_name)(data))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _hash_default(value: Any) -> Any:
+    """Makes values the json module cannot serialize hashable by content"""
+    try:
+        return json_default(value)
+    except TypeError:
+        return repr(value)
+
+
+def chart_key(method_name: str, data: Dict[str, Any]) -> str:
+    """
+    Computes the content address of a chart
+    
+    Args:
+        method_name: ChartRenderer method drawing the chart
+        data: Input data of the chart (dict key order does not matter)
+        
+    Returns:
+        str: Hex SHA-256 digest of the style version, chart and input data
+    """
+    encoded = json.dumps(
+        [CHART_STYLE_VERSION, method_name, data], sort_keys=True, separators=(',', ':'), default=_hash_default
+    )
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _chart_input(analysis: Dict[str, Any], part: str, field: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Selects the data a chart reads from a report's analysis
+    
+    Returns:
+        Chart input, or None if the chart would draw mock data (and so must
+        not be cached)
+    """
+    data = analysis.get(part) or {}
+    if field is None:
+        return data
+    return {field: data[field]} if data.get(field) else None
+
+
+class ChartCache:
+    """
+    In-memory LRU cache of drawn charts keyed by chart_key
+    
+    Entries are Futures, so a chart that is still being drawn is shared too:
+    concurrent requests for the same key draw it once. Charts that fail to
+    draw are not kept.
+    """
+    
+    def __init__(self, max_entries: int = None):
+        """
+        Initialize the ChartCache
+        
+        Args:
+            max_entries: Maximum number of charts kept (least recently used
+                charts are evicted first)
+        """
+        self.max_entries = REPORT_CHART_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def get_or_render(self, key: str, render: Callable[[], Future]) -> Future:
+        """
+        Returns the cached chart, drawing it on a miss
+        
+        Args:
+            key: Chart key (see chart_key)
+            render: Function that starts drawing the chart and returns a
+                Future of the base64 PNG
+            
+        Returns:
+            Future of the base64-encoded chart image
+        """
+        with self._lock:
+            chart = self._entries.get(key)
+            if chart is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return chart
+            chart = self._entries[key] = Future()
+            self.misses += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        
+        # Draw outside the lock; in-process drawing completes right here
+        try:
+            drawing = render()
+        except Exception as e:
+            drawing = Future()
+            drawing.set_exception(e)
+        drawing.add_done_callback(lambda drawn: self._settle(key, chart, drawn))
+        return chart
+    
+    def clear(self) -> None:
+        """Removes every cached chart"""
+        with self._lock:
+            self._entries.clear()
+    
+    def _settle(self, key: str, chart: Future, drawn: Future) -> None:
+        """Completes a cached chart with the drawing's outcome, dropping failures"""
+        error = drawn.exception()
+        if error is None:
+            chart.set_result(drawn.result())
+            return
+        with self._lock:
+            if self._entries.get(key) is chart:
+                del self._entries[key]
+        chart.set_exception(error)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_chart_cache() -> ChartCache:
+    """Returns the process-wide chart cache"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ChartCache()
+        return _default_cache
+
+
+def render_report_charts(analyses: Iterable[Dict[str, Any]],
+                         renderer: ChartRenderer = None,
+                         workers: int = None,
+                         cache: ChartCache = None) -> Iterator[Dict[str, Future]]:
+    """
+    Draws the report charts for a sequence of reports
+    
+    Charts are submitted to the worker pool ahead of the report being
+    consumed (up to two reports per worker), so a report's charts are drawn
+    concurrently and a batch keeps every worker busy. Charts whose input was
+    drawn before (or is being drawn for an earlier report) come from the
+    cache.
+    
+    Args:
+        analyses: Dicts with the 'valuation', 'market' and 'negotiation' data
+            of each report
+        renderer: Renderer used when drawing in-process (defaults to a
+            ChartRenderer)
+        workers: Number of worker processes (defaults to REPORT_CHART_WORKERS;
+            1 draws in-process)
+        cache: Chart cache (defaults to the process-wide cache)
+        
+    Returns:
+        Iterator yielding, per report and in order, a dict mapping each
+        REPORT_CHARTS template variable to a Future of the base64 PNG
+    """
+    renderer = renderer or ChartRenderer()
+    cache = get_default_chart_cache() if cache is None else cache
+    pool = get_chart_pool(workers)
+    window = 2 * (REPORT_CHART_WORKERS if workers is None else workers)
+    pending = deque()
+    
+    def render(method_name: str, data: Dict[str, Any]) -> Future:
+        nonlocal pool
+        if pool is not None:
+            try:
+                return pool.submit(_render_chart, method_name, data)
+            except BrokenProcessPool:
+                _discard_chart_pool(pool)
+                pool = None
+        return _render_in_process(renderer, method_name, data)
+    
+    for analysis in analyses:
+        charts = {}
+        for name, method_name, part, field in REPORT_CHARTS:
+            data = _chart_input(analysis, part, field)
+            if data is None:
+                charts[name] = render(method_name, {})
+            else:
+                charts[name] = cache.get_or_render(
+                    chart_key(method_name, data), lambda: render(method_name, data)
+                )
+        pending.append(charts)
+        if len(pending) >= window:
+            yield pending.popleft()
+    
+    while pending:
+        yield pending.popleft()
@@ -10,35 +10,37 @@ import json
 import base64
 from typing import Dict, Any, List, Tuple, Optional
 import numpy as np
-import pandas as pd
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-import pdfkit
 import io
 import re
 
-class ReportGenerator:
+from report_charts import ChartCache, ChartRenderer, render_report_charts, _load_pyplot
+
+class ReportGenerator(ChartRenderer):
     """
     Generates comprehensive reports based on property analysis and negotiation strategy data
     """
     
-    def __init__(self, template_dir: str = 'templates'):
+    def __init__(self, template_dir: str = 'templates', chart_workers: int = None, chart_cache: ChartCache = None):
         """
         Initialize the ReportGenerator
         
         Args:
             template_dir: Directory containing report templates
+            chart_workers: Worker processes drawing report charts (defaults
+                to REPORT_CHART_WORKERS; 1 draws them in-process)
+            chart_cache: Cache of drawn charts (defaults to the process-wide
+                chart cache)
         """
         self.template_dir = template_dir
+        self.chart_workers = chart_workers
+        self.chart_cache = chart_cache
         
         # Create template directory if it doesn't exist
         os.makedirs(template_dir, exist_ok=True)
         
         # Initialize Jinja2 environment
+        from jinja2 import Environment, FileSystemLoader, select_autoescape
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
             autoescape=select_autoescape(['html', 'xml'])
@@ -46,9 +48,6 @@ class ReportGenerator:
         
         # Create default templates if they don't exist
         self._create_default_templates()
-        
-        # Initialize visualization settings
-        self._setup_visualization_style()
     
     def _create_default_templates(self):
         """Creates default report templates if they don't exist"""
@@ -580,29 +579,13 @@ class ReportGenerator:
 </body>
 </html>""")
     
-    def _setup_visualization_style(self):
-        """Sets up the style for data visualizations"""
-        # Set Seaborn style
-        sns.set_style("whitegrid")
-        
-        # Set color palette
-        sns.set_palette("colorblind")
-        
-        # Set matplotlib parameters
-        plt.rcParams['figure.figsize'] = (10, 6)
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = ['Arial', 'DejaVu Sans', 'Liberation Sans']
-        plt.rcParams['axes.labelsize'] = 12
-        plt.rcParams['axes.titlesize'] = 14
-        plt.rcParams['xtick.labelsize'] = 10
-        plt.rcParams['ytick.labelsize'] = 10
-    
     def generate_report(self, 
                        property_data: Dict[str, Any], 
                        market_data: Dict[str, Any], 
                        valuation_data: Dict[str, Any], 
                        negotiation_data: Dict[str, Any],
-                       output_dir: str = 'reports') -> Dict[str, Any]:
+                       output_dir: str = 'reports',
+                       charts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generates a comprehensive report based on property analysis and negotiation strategy data
         
@@ -612,6 +595,8 @@ class ReportGenerator:
             valuation_data: Property valuation and investment analysis
             negotiation_data: Negotiation strategies and recommendations
             output_dir: Directory to save generated reports
+            charts: Charts already submitted with render_report_charts (drawn
+                here if None)
             
         Returns:
             Dict containing report file paths and generation status
@@ -631,7 +616,10 @@ class ReportGenerator:
             recommended_action = self._generate_recommended_action(property_data, market_data, valuation_data, negotiation_data)
             
             # Generate data visualizations
-            visualization_data = self._generate_visualizations(property_data, market_data, valuation_data, negotiation_data)
+            if charts is None:
+                visualization_data = self._generate_visualizations(property_data, market_data, valuation_data, negotiation_data)
+            else:
+                visualization_data = {name: chart.result() for name, chart in charts.items()}
             
             # Prepare template data
             template_data = {
@@ -900,415 +888,14 @@ class ReportGenerator:
         Returns:
             Dict containing base64-encoded chart images
         """
-        visualization_data = {}
-        
-        # Generate valuation comparison chart
-        visualization_data['valuation_chart'] = self._generate_valuation_chart(valuation_data)
-        
-        # Generate comparables chart
-        visualization_data['comparables_chart'] = self._generate_comparables_chart(valuation_data)
-        
-        # Generate market trends chart
-        visualization_data['market_trends_chart'] = self._generate_market_trends_chart(market_data)
-        
-        # Generate price trends chart
-        visualization_data['price_trends_chart'] = self._generate_price_trends_chart(market_data)
-        
-        # Generate strategy comparison chart
-        visualization_data['strategy_comparison_chart'] = self._generate_strategy_comparison_chart(negotiation_data)
-        
-        return visualization_data
-    
-    def _generate_valuation_chart(self, valuation_data: Dict[str, Any]) -> str:
-        """
-        Generates a valuation comparison chart
-        
-        Args:
-            valuation_data: Property valuation data
-            
-        Returns:
-            Base64-encoded chart image
-        """
-        # Extract valuation data
-        valuation_sources = valuation_data.get('valuation', {}).get('sources', [])
-        final_value = valuation_data.get('valuation', {}).get('final_value', 0)
-        listing_price = valuation_data.get('valuation', {}).get('listing_price', 0)
-        
-        # Create figure
-        plt.figure(figsize=(10, 6))
-        
-        # Prepare data
-        sources = []
-        values = []
-        confidence = []
-        
-        for source in valuation_sources:
-            sources.append(source.get('source', 'Unknown'))
-            values.append(source.get('value', 0))
-            confidence.append(source.get('confidence', 50) / 100)
-        
-        # Add final value and listing price
-        sources.extend(['Final Estimate', 'Listing Price'])
-        values.extend([final_value, listing_price])
-        confidence.extend([1.0, 1.0])
-        
-        # Create bar chart
-        bars = plt.bar(sources, values, alpha=0.7)
-        
-        # Color bars based on confidence
-        for i, bar in enumerate(bars):
-            if i < len(sources) - 2:  # Only color the valuation sources
-                bar.set_color(plt.cm.viridis(confidence[i]))
-            elif i == len(sources) - 2:  # Final estimate
-                bar.set_color('green')
-            else:  # Listing price
-                bar.set_color('red')
-        
-        # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'${height:,.0f}',
-                    ha='center', va='bottom', rotation=0)
-        
-        # Set labels and title
-        plt.xlabel('Valuation Source')
-        plt.ylabel('Value ($)')
-        plt.title('Property Valuation Comparison')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        # Add grid
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Convert to base64
-        return self._fig_to_base64(plt.gcf())
-    
-    def _generate_comparables_chart(self, valuation_data: Dict[str, Any]) -> str:
-        """
-        Generates a comparables chart
-        
-        Args:
-            valuation_data: Property valuation data
-            
-        Returns:
-            Base64-encoded chart image
-        """
-        # Extract comparables data
-        comparables = valuation_data.get('valuation', {}).get('comparables', [])
-        subject_value = valuation_data.get('valuation', {}).get('final_value', 0)
-        
-        # Create figure
-        plt.figure(figsize=(10, 6))
-        
-        # Prepare data
-        addresses = ['Subject Property']
-        prices = [subject_value]
-        price_per_sqft = [subject_value / valuation_data.get('property', {}).get('square_feet', 1000)]
-        colors = ['red']
-        
-        for comp in comparables:
-            # Truncate address to keep chart readable
-            address = comp.get('address', 'Unknown')
-            if len(address) > 20:
-                address = address[:20] + '...'
-            
-            addresses.append(address)
-            prices.append(comp.get('sale_price', 0))
-            price_per_sqft.append(comp.get('price_per_sqft', 0))
-            colors.append('blue')
-        
-        # Create bar chart
-        plt.figure(figsize=(12, 10))
-        
-        # Price subplot
-        plt.subplot(2, 1, 1)
-        bars1 = plt.bar(addresses, prices, color=colors, alpha=0.7)
-        
-        # Add value labels
-        for bar in bars1:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'${height:,.0f}',
-                    ha='center', va='bottom', rotation=0)
-        
-        plt.title('Comparable Properties - Sale Price')
-        plt.ylabel('Price ($)')
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Price per sqft subplot
-        plt.subplot(2, 1, 2)
-        bars2 = plt.bar(addresses, price_per_sqft, color=colors, alpha=0.7)
-        
-        # Add value labels
-        for bar in bars2:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'${height:.0f}',
-                    ha='center', va='bottom', rotation=0)
-        
-        plt.title('Comparable Properties - Price per Square Foot')
-        plt.ylabel('Price per Sq Ft ($)')
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        
-        plt.tight_layout()
-        
-        # Convert to base64
-        return self._fig_to_base64(plt.gcf())
-    
-    def _generate_market_trends_chart(self, market_data: Dict[str, Any]) -> str:
-        """
-        Generates a market trends chart
-        
-        Args:
-            market_data: Market analysis data
-            
-        Returns:
-            Base64-encoded chart image
-        """
-        # Extract market trends data
-        trends = market_data.get('historical_trends', {})
-        
-        # If no historical data, generate mock data
-        if not trends:
-            # Generate mock data for demonstration
-            months = 12
-            dates = pd.date_range(end=datetime.now(), periods=months, freq='M')
-            
-            # Generate random trends with realistic patterns
-            inventory = [random.randint(30, 50) for _ in range(months)]
-            dom = [random.randint(20, 40) for _ in range(months)]
-            
-            # Create trends dictionary
-            trends = {
-                'dates': [d.strftime('%Y-%m') for d in dates],
-                'inventory': inventory,
-                'days_on_market': dom
-            }
-        
-        # Create figure
-        plt.figure(figsize=(10, 6))
-        
-        # Create plot with dual y-axis
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        # Plot inventory
-        color = 'tab:blue'
-        ax1.set_xlabel('Date')
-        ax1.set_ylabel('Inventory (# of Listings)', color=color)
-        ax1.plot(trends['dates'], trends['inventory'], color=color, marker='o')
-        ax1.tick_params(axis='y', labelcolor=color)
-        
-        # Create second y-axis
-        ax2 = ax1.twinx()
-        color = 'tab:red'
-        ax2.set_ylabel('Days on Market', color=color)
-        ax2.plot(trends['dates'], trends['days_on_market'], color=color, marker='s')
-        ax2.tick_params(axis='y', labelcolor=color)
-        
-        # Set title and adjust layout
-        plt.title('Market Trends - Inventory and Days on Market')
-        plt.xticks(rotation=45)
-        fig.tight_layout()
-        
-        # Add grid
-        ax1.grid(True, linestyle='--', alpha=0.7)
-        
-        # Convert to base64
-        return self._fig_to_base64(fig)
-    
-    def _generate_price_trends_chart(self, market_data: Dict[str, Any]) -> str:
-        """
-        Generates a price trends chart
-        
-        Args:
-            market_data: Market analysis data
-            
-        Returns:
-            Base64-encoded chart image
-        """
-        # Extract price trends data
-        trends = market_data.get('price_trends', {})
-        
-        # If no price trends data, generate mock data
-        if not trends:
-            # Generate mock data for demonstration
-            months = 24
-            dates = pd.date_range(end=datetime.now(), periods=months, freq='M')
-            
-            # Generate random price trends with realistic patterns
-            base_price = 300000
-            monthly_change = [random.uniform(-0.01, 0.02) for _ in range(months)]
-            
-            # Calculate cumulative price changes
-            cumulative_change = np.cumprod([1 + change for change in monthly_change])
-            median_prices = [base_price * change for change in cumulative_change]
-            
-            # Create trends dictionary
-            trends = {
-                'dates': [d.strftime('%Y-%m') for d in dates],
-                'median_price': median_prices
-            }
-        
-        # Create figure
-        plt.figure(figsize=(10, 6))
-        
-        # Plot median prices
-        plt.plot(trends['dates'], trends['median_price'], marker='o', color='green')
-        
-        # Add trend line
-        z = np.polyfit(range(len(trends['dates'])), trends['median_price'], 1)
-        p = np.poly1d(z)
-        plt.plot(trends['dates'], p(range(len(trends['dates']))), "r--", alpha=0.8)
-        
-        # Calculate and display annual appreciation rate
-        if len(trends['median_price']) > 1:
-            start_price = trends['median_price'][0]
-            end_price = trends['median_price'][-1]
-            time_years = len(trends['median_price']) / 12
-            annual_rate = ((end_price / start_price) ** (1/time_years) - 1) * 100
-            
-            plt.annotate(f'Annual Appreciation: {annual_rate:.1f}%', 
-                        xy=(0.05, 0.95), xycoords='axes fraction',
-                        bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="green", alpha=0.8))
-        
-        # Set labels and title
-        plt.xlabel('Date')
-        plt.ylabel('Median Price ($)')
-        plt.title('Market Price Trends')
-        plt.xticks(rotation=45)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        
-        # Format y-axis as currency
-        plt.gca().yaxis.set_major_formatter(plt.FuncFormatter(lambda x, loc: f"${x:,.0f}"))
-        
-        plt.tight_layout()
-        
-        # Convert to base64
-        return self._fig_to_base64(plt.gcf())
-    
-    def _generate_strategy_comparison_chart(self, negotiation_data: Dict[str, Any]) -> str:
-        """
-        Generates a strategy comparison chart
-        
-        Args:
-            negotiation_data: Negotiation strategy data
-            
-        Returns:
-            Base64-encoded chart image
-        """
-        # Extract strategy data
-        strategies = negotiation_data.get('recommended_strategies', [])
-        
-        # If no strategies, return empty chart
-        if not strategies or len(strategies) == 0:
-            plt.figure(figsize=(10, 6))
-            plt.text(0.5, 0.5, 'No strategy data available', 
-                    horizontalalignment='center', verticalalignment='center',
-                    transform=plt.gca().transAxes)
-            plt.tight_layout()
-            return self._fig_to_base64(plt.gcf())
-        
-        # Limit to top 5 strategies
-        strategies = strategies[:5]
-        
-        # Create figure
-        plt.figure(figsize=(12, 8))
-        
-        # Prepare data
-        names = [s.get('name', 'Unknown') for s in strategies]
-        scores = [s.get('score', 0) for s in strategies]
-        success_probs = [s.get('expected_success_probability', 0) * 100 for s in strategies]
-        
-        # Get ROI impact data if available
-        roi_impacts = []
-        for s in strategies:
-            if 'roi_impact' in s and 'total_savings' in s['roi_impact']:
-                roi_impacts.append(s['roi_impact']['total_savings'])
-            else:
-                roi_impacts.append(0)
-        
-        # Create color mapping for strategy types
-        colors = []
-        for s in strategies:
-            if s.get('type') == 'price':
-                colors.append('tab:red')
-            elif s.get('type') == 'terms':
-                colors.append('tab:green')
-            elif s.get('type') == 'creative':
-                colors.append('tab:purple')
-            else:
-                colors.append('tab:blue')
-        
-        # Create bar chart with multiple metrics
-        x = np.arange(len(names))
-        width = 0.25
-        
-        fig, ax1 = plt.subplots(figsize=(12, 8))
-        
-        # Plot strategy scores
-        bars1 = ax1.bar(x - width, scores, width, label='Strategy Score', color=colors, alpha=0.7)
-        
-        # Plot success probability
-        ax1.bar(x, success_probs, width, label='Success Probability (%)', color='tab:orange', alpha=0.7)
-        
-        # Create second y-axis for ROI impact
-        ax2 = ax1.twinx()
-        bars3 = ax2.bar(x + width, roi_impacts, width, label='Total Savings ($)', color='tab:blue', alpha=0.7)
-        
-        # Add value labels
-        for bars in [bars1, bars3]:
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    if bars == bars3:  # Format as currency for savings
-                        label = f'${height:,.0f}'
-                    else:
-                        label = f'{height:.0f}'
-                    
-                    ax1.text(bar.get_x() + bar.get_width()/2., height,
-                            label, ha='center', va='bottom', rotation=0)
-        
-        # Set labels and title
-        ax1.set_xlabel('Strategy')
-        ax1.set_ylabel('Score / Probability')
-        ax2.set_ylabel('Total Savings ($)')
-        plt.title('Negotiation Strategy Comparison')
-        
-        # Set x-ticks
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(names, rotation=45, ha='right')
-        
-        # Add legends
-        ax1.legend(loc='upper left')
-        ax2.legend(loc='upper right')
-        
-        # Add grid
-        ax1.grid(True, axis='y', linestyle='--', alpha=0.7)
-        
-        plt.tight_layout()
-        
-        # Convert to base64
-        return self._fig_to_base64(fig)
-    
-    def _fig_to_base64(self, fig) -> str:
-        """
-        Converts matplotlib figure to base64 string
-        
-        Args:
-            fig: Matplotlib figure
-            
-        Returns:
-            Base64-encoded image string
-        """
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=100)
-        buf.seek(0)
-        img_str = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close(fig)
-        return img_str
+        # The charts are drawn concurrently, so this takes about as long as the slowest one
+        charts = next(render_report_charts(
+            [{'valuation': valuation_data, 'market': market_data, 'negotiation': negotiation_data}],
+            renderer=self,
+            workers=self.chart_workers,
+            cache=self.chart_cache
+        ))
+        return {name: chart.result() for name, chart in charts.items()}
     
     def _generate_pdf_report(self, template_name: str, template_data: Dict[str, Any], output_path: str) -> None:
         """
@@ -1333,6 +920,7 @@ class ReportGenerator:
         # Convert HTML to PDF
         try:
             # Try using wkhtmltopdf if available
+            import pdfkit
             pdfkit.from_file(html_path, output_path)
         except Exception as e:
             print(f"Error generating PDF: {str(e)}")
@@ -1377,14 +965,20 @@ class ReportGenerator:
             'reports': []
         }
         
-        for data in batch_data:
+        # Charts of upcoming reports are drawn across the worker pool while
+        # earlier reports are written
+        charts_per_report = render_report_charts(
+            batch_data, renderer=self, workers=self.chart_workers, cache=self.chart_cache
+        )
+        
+        for data, charts in zip(batch_data, charts_per_report):
             property_data = data.get('property', {})
             market_data = data.get('market', {})
             valuation_data = data.get('valuation', {})
             negotiation_data = data.get('negotiation', {})
             
             report_result = self.generate_report(
-                property_data, market_data, valuation_data, negotiation_data, output_dir
+                property_data, market_data, valuation_data, negotiation_data, output_dir, charts=charts
             )
             
             if report_result.get('success', False):
@@ -1478,6 +1072,7 @@ class BatchReportGenerator:
             # Convert to PDF if possible
             pdf_path = os.path.join(output_dir, "batch_summary.pdf")
             try:
+                import pdfkit
                 pdfkit.from_file(summary_path, pdf_path)
                 summary_path = pdf_path
             except Exception as e:
@@ -1552,6 +1147,7 @@ class BatchReportGenerator:
         Returns:
             Base64-encoded chart image
         """
+        plt = _load_pyplot()
         # Create figure
         plt.figure(figsize=(12, 8))
         
@@ -1617,6 +1213,7 @@ class BatchReportGenerator:
         Returns:
             Base64-encoded chart image
         """
+        plt = _load_pyplot()
         # Create figure
         plt.figure(figsize=(12, 8))
         
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Start-up time benchmark for the application entry points
+
+Each entry point is started in a fresh interpreter with ``python -X importtime``
+several times; the fastest run is compared against the entry point's budget,
+and the slowest imports of that run are listed so a regression can be traced
+to the module that caused it. An entry point that cannot be imported is
+reported on standard error with its traceback. Exits with status 1 if any
+entry point fails to start or exceeds its budget.
+
+Usage:
+    python scripts/startup_benchmark.py
+    python scripts/startup_benchmark.py --only cli --only wsgi --runs 5
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from typing import Dict, Any, List, NamedTuple, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(REPO_ROOT, 'real_estate_analysis', 'backend')
+
+# Placeholder settings so the FastAPI app can be imported without a deployment
+# environment; variables already set in the environment take precedence
+BACKEND_SETTINGS = (
+    ('POSTGRES_SERVER', 'localhost'),
+    ('POSTGRES_USER', 'benchmark'),
+    ('POSTGRES_PASSWORD', 'benchmark'),
+    ('POSTGRES_DB', 'benchmark'),
+    ('SQLALCHEMY_DATABASE_URI', 'sqlite://'),
+    ('REDIS_HOST', 'localhost'),
+    ('REDIS_PORT', '6379'),
+    ('SECRET_KEY', 'benchmark'),
+)
+
+
+class EntryPoint(NamedTuple):
+    """A start-up command and its time budget"""
+    name: str
+    args: Tuple[str, ...]  # Arguments after ``python -X importtime``
+    cwd: str
+    budget_seconds: float
+    env_defaults: Tuple[Tuple[str, str], ...] = ()  # Variables set unless already in the environment
+
+
+ENTRY_POINTS = (
+    EntryPoint('cli', ('real_estate_analysis/cli.py', '--help'), REPO_ROOT, 0.5),
+    EntryPoint('wsgi', ('-c', 'import wsgi'), REPO_ROOT, 1.0),
+    EntryPoint('backend_main', ('-c', 'import app.main'), BACKEND_DIR, 1.5, BACKEND_SETTINGS),
+    EntryPoint('property_analysis', ('-c', 'import property_analysis'), REPO_ROOT, 0.5),
+    EntryPoint('report_generator', ('-c', 'import report_generator'), REPO_ROOT, 0.5),
+    EntryPoint('user_interface', ('-c', 'import user_interface'), REPO_ROOT, 0.75),
+)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, str]]:
+    """
+    Parses ``-X importtime`` output into top-level imports
+
+    Args:
+        stderr: Standard error of the benchmarked process
+
+    Returns:
+        List of (cumulative microseconds, module) for imports made directly by
+        the entry point, slowest first
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # Header line
+        module = parts[2].rstrip()
+        if module.startswith(' '):
+            continue  # Nested import, already counted in its parent
+        imports.append((int(parts[1]), module.strip()))
+    return sorted(imports, reverse=True)
+
+
+def measure(entry_point: EntryPoint, runs: int = 3, top: int = 5) -> Dict[str, Any]:
+    """
+    Measures the start-up time of one entry point
+
+    Args:
+        entry_point: Entry point to start
+        runs: Number of runs (the fastest counts, so disk cache effects of
+            the first run are excluded)
+        top: Number of slowest imports to report
+
+    Returns:
+        Dict containing the best wall time, the budget, whether it was met,
+        and the slowest imports (or the error and traceback if the entry
+        point failed)
+    """
+    env = dict(entry_point.env_defaults)
+    env.update(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [entry_point.cwd, os.environ.get('PYTHONPATH')]))
+    best = None
+    for _ in range(max(1, runs)):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', *entry_point.args],
+            cwd=entry_point.cwd, env=env, capture_output=True, text=True
+        )
+        elapsed = time.perf_counter() - start
+        if completed.returncode != 0:
+            error = [line for line in completed.stderr.splitlines() if not line.startswith('import time:')]
+            return {
+                'name': entry_point.name,
+                'success': False,
+                'budget_seconds': entry_point.budget_seconds,
+                'error': error[-1] if error else f'exit status {completed.returncode}',
+                'traceback': '\n'.join(error)
+            }
+        if best is None or elapsed < best[0]:
+            best = (elapsed, completed.stderr)
+
+    elapsed, stderr = best
+    return {
+        'name': entry_point.name,
+        'success': True,
+        'seconds': round(elapsed, 3),
+        'budget_seconds': entry_point.budget_seconds,
+        'within_budget': elapsed <= entry_point.budget_seconds,
+        'slowest_imports': [
+            {'module': module, 'seconds': round(microseconds / 1e6, 3)}
+            for microseconds, module in parse_importtime(stderr)[:top]
+        ]
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--only', action='append', choices=[entry.name for entry in ENTRY_POINTS],
+                        help='Entry point to benchmark (repeatable; default: all)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per entry point (fastest counts)')
+    parser.add_argument('--top', type=int, default=5, help='Slowest imports to list per entry point')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args(argv)
+
+    results = [
+        measure(entry, runs=args.runs, top=args.top)
+        for entry in ENTRY_POINTS if not args.only or entry.name in args.only
+    ]
+
+    failed = [result for result in results if not result['success']]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            if not result['success']:
+                print(f"{result['name']:<20} FAILED  {result['error']}")
+                continue
+            status = 'ok' if result['within_budget'] else 'OVER BUDGET'
+            print(f"{result['name']:<20} {result['seconds']:>6.3f}s / {result['budget_seconds']:.2f}s  {status}")
+            for item in result['slowest_imports']:
+                print(f"    {item['seconds']:>6.3f}s  {item['module']}")
+
+    # Import failures go to stderr in every output mode so they cannot be
+    # mistaken for a passing run
+    for result in failed:
+        print(f"\nERROR: entry point '{result['name']}' failed to start:\n{result['traceback']}", file=sys.stderr)
+    if failed:
+        print(f"\n{len(failed)} entry point(s) failed to start", file=sys.stderr)
+
+    return 0 if all(result['success'] and result['within_budget'] for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Deterministic Randomness for Real Estate Valuation and Negotiation Strategist
+
+Simulated analysis data is drawn from ``numpy.random.Generator`` instances seeded
+from the canonical address and a data version instead of the global random
+state, so the same address and data version always give the same analysis.
+Each analysis stage draws from its own stream, so stages can run in any order
+or in separate worker processes without changing each other's results.
+"""
+
+import os
+import hashlib
+
+import numpy as np
+
+from geocoding import canonical_address
+
+# Bump to invalidate every cached or memoized analysis result
+ANALYSIS_DATA_VERSION = os.getenv("ANALYSIS_DATA_VERSION", "1")
+
+
+def resolve_data_version(data_version: str = None) -> str:
+    """
+    Resolves an optional data version to the one in effect
+
+    Args:
+        data_version: Data version, or None for ANALYSIS_DATA_VERSION
+
+    Returns:
+        str: Data version
+    """
+    return ANALYSIS_DATA_VERSION if data_version is None else str(data_version)
+
+
+def analysis_seed(address: str, stage: str, data_version: str = None) -> int:
+    """
+    Derives the random seed for one analysis stage of an address
+
+    Args:
+        address: The property address (canonicalized before hashing)
+        stage: Name of the analysis stage (e.g. 'property', 'market')
+        data_version: Data version (defaults to ANALYSIS_DATA_VERSION)
+
+    Returns:
+        int: 128-bit seed
+    """
+    key = '\x1f'.join((canonical_address(address or ''), resolve_data_version(data_version), stage))
+    return int.from_bytes(hashlib.sha256(key.encode('utf-8')).digest()[:16], 'big')
+
+
+def analysis_rng(address: str, stage: str, data_version: str = None) -> np.random.Generator:
+    """
+    Creates the random generator for one analysis stage of an address
+
+    Args:
+        address: The property address (canonicalized before hashing)
+        stage: Name of the analysis stage (e.g. 'property', 'market')
+        data_version: Data version (defaults to ANALYSIS_DATA_VERSION)
+
+    Returns:
+        numpy.random.Generator seeded from the address, data version and stage
+    """
+    return np.random.default_rng(analysis_seed(address, stage, data_version))
@@ -0,0 +1,133 @@
+"""
+Stage Timing for Real Estate Valuation and Negotiation Strategist
+
+This module times the steps of a property analysis (geocoding, provider data,
+market analysis and the valuation, investment, renovation and CMA stages). Each
+stage records wall-clock and CPU time; the CPU time is the calling thread's, so
+timings stay meaningful when many properties are analyzed on a thread pool.
+Timings can also be exported as per-stage latency histograms through the
+Prometheus client used by the API integrations.
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, Optional
+
+# Timing settings (should be stored in environment variables)
+STAGE_TIMING_ENABLED = os.getenv("STAGE_TIMING_ENABLED", "false").lower() == "true"
+STAGE_METRICS_ENABLED = os.getenv("STAGE_METRICS_ENABLED", "false").lower() == "true"
+
+# Histogram buckets in seconds, from cached lookups to slow provider calls
+STAGE_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class StageTimer:
+    """
+    Records wall and CPU time per analysis stage
+
+    Usage:
+        timer = StageTimer()
+        with timer.stage('geocode'):
+            geocode(address)
+        timer.timings  # {'geocode': {'wall_seconds': ..., 'cpu_seconds': ...}}
+    """
+
+    def __init__(self, export: bool = None):
+        """
+        Initialize the StageTimer
+
+        Args:
+            export: Whether to observe timings in the Prometheus stage
+                histograms (defaults to STAGE_METRICS_ENABLED)
+        """
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.export = STAGE_METRICS_ENABLED if export is None else export
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Times the enclosed block as one stage
+
+        Args:
+            name: Stage name
+        """
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            self.timings[name] = {'wall_seconds': round(wall, 6), 'cpu_seconds': round(cpu, 6)}
+            if self.export:
+                observe_stage(name, wall, cpu)
+
+
+class _DisabledTimer:
+    """Timer that records nothing, used when stage timing is turned off"""
+
+    timings: Optional[Dict[str, Dict[str, float]]] = None
+    _context = nullcontext()
+
+    def stage(self, name: str) -> nullcontext:
+        return self._context
+
+
+DISABLED_TIMER = _DisabledTimer()
+
+
+def create_stage_timer(enabled: bool = None):
+    """
+    Creates a timer for one analysis
+
+    Args:
+        enabled: Whether to record timings (defaults to STAGE_TIMING_ENABLED)
+
+    Returns:
+        StageTimer, or a shared timer that records nothing when disabled
+    """
+    enabled = STAGE_TIMING_ENABLED if enabled is None else enabled
+    return StageTimer() if enabled else DISABLED_TIMER
+
+
+_stage_histogram = None
+_histogram_lock = threading.Lock()
+
+
+def get_stage_histogram():
+    """
+    Returns the Prometheus histogram of analysis stage latencies
+
+    The histogram is registered in the default Prometheus registry, next to the
+    API request metrics, on first use.
+
+    Returns:
+        prometheus_client.Histogram labelled by stage and clock ('wall' or 'cpu')
+    """
+    global _stage_histogram
+    with _histogram_lock:
+        if _stage_histogram is None:
+            # prometheus_client is only needed when metrics export is enabled
+            from prometheus_client import Histogram
+            _stage_histogram = Histogram(
+                'analysis_stage_seconds',
+                'Property analysis stage latency in seconds',
+                ['stage', 'clock'],
+                buckets=STAGE_LATENCY_BUCKETS
+            )
+        return _stage_histogram
+
+
+def observe_stage(name: str, wall_seconds: float, cpu_seconds: float) -> None:
+    """
+    Records one stage timing in the Prometheus stage histograms
+
+    Args:
+        name: Stage name
+        wall_seconds: Wall-clock duration
+        cpu_seconds: CPU time of the calling thread
+    """
+    histogram = get_stage_histogram()
+    histogram.labels(stage=name, clock='wall').observe(wall_seconds)
+    histogram.labels(stage=name, clock='cpu').observe(cpu_seconds)
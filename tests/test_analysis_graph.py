@@ -0,0 +1,121 @@
+"""
+Tests for the incremental analysis graph.
+"""
+
+import pytest
+
+import property_analysis
+from analysis_graph import AnalysisGraph, StageCache, content_hash
+from geocoding import GeocodeCache
+from property_analysis import PropertyAnalyzer
+
+ADDRESS = "123 Main St, Springfield, IL 62701"
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """Create a PropertyAnalyzer that geocodes without network access."""
+    calls = []
+
+    def fake_geocode(self, address):
+        calls.append(address)
+        return {
+            'success': True,
+            'coordinates': {'latitude': 39.78, 'longitude': -89.65},
+            'formatted_address': address,
+            'components': {'zip_code': address[-5:], 'city': 'Springfield', 'state_code': 'IL'}
+        }
+
+    monkeypatch.setattr(property_analysis.AddressProcessor, 'geocode_address', fake_geocode)
+    analyzer = PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'))
+    analyzer.geocode_calls = calls
+    return analyzer
+
+
+def test_graph_matches_full_analysis(analyzer):
+    """Test that the graph produces the same analysis as the full pipeline."""
+    result = AnalysisGraph(analyzer).run(ADDRESS)
+
+    property_data, market_data = analyzer.analyze_property(ADDRESS)
+    assert result['success']
+    assert result['property'] == property_data
+    assert result['market'] == market_data
+    assert result['valuation'] == analyzer.generate_valuation(property_data, market_data)
+    assert result['financing_grid'] is None
+
+
+def test_rerun_uses_cache(analyzer):
+    """Test that an unchanged rerun recomputes nothing."""
+    graph = AnalysisGraph(analyzer)
+    first = graph.run(ADDRESS)
+    second = graph.run(ADDRESS)
+
+    assert second['stages']['recomputed'] == []
+    assert second['valuation'] == first['valuation']
+    assert len(analyzer.geocode_calls) == 1
+    # Results are copies, so callers cannot corrupt the cache
+    second['property']['bedrooms'] = -1
+    assert graph.run(ADDRESS)['property'] == first['property']
+
+
+def test_listing_price_change_recomputes_only_dependents(analyzer):
+    """Test that a price tweak skips provider, investment, renovation and CMA stages."""
+    graph = AnalysisGraph(analyzer)
+    graph.run(ADDRESS)
+
+    result = graph.run(ADDRESS, overrides={'listing_price': 123456})
+
+    assert set(result['stages']['recomputed']) == {
+        'property', 'valuation_basis', 'investment_basis', 'renovation_basis', 'cma_basis',
+        'valuation_data', 'enhanced_valuation', 'value'
+    }
+    assert result['property']['listing_price'] == 123456
+    property_data = {**analyzer.analyze_property(ADDRESS)[0], 'listing_price': 123456}
+    expected = analyzer.generate_valuation(property_data, analyzer.analyze_property(ADDRESS)[1])
+    assert result['valuation'] == expected
+
+
+def test_financing_change_recomputes_only_grid(analyzer):
+    """Test that new financing assumptions only rebuild the financing grid."""
+    graph = AnalysisGraph(analyzer)
+    graph.run(ADDRESS, financing={'interest_rates': [0.06]})
+
+    result = graph.run(ADDRESS, financing={'interest_rates': [0.06, 0.07]})
+
+    assert result['stages']['recomputed'] == ['financing_grid']
+    assert result['financing_grid'] is not None
+
+
+
+def test_financing_grid_route_reuses_cached_analysis(analyzer, monkeypatch):
+    """Test that the financing grid endpoint only rebuilds the grid for an analyzed address."""
+    import user_interface
+
+    monkeypatch.setattr(user_interface, 'analysis_graph', AnalysisGraph(analyzer))
+    user_interface.get_analysis_graph().run(ADDRESS)
+    client = user_interface.app.test_client()
+
+    response = client.post('/financing-grid', json={'address': ADDRESS, 'interest_rates': [6.5]})
+
+    data = response.get_json()
+    assert data['success']
+    assert data['stages']['recomputed'] == ['financing_grid']
+    assert len(analyzer.geocode_calls) == 1
+
+
+def test_failed_stage_returns_error(monkeypatch):
+    """Test that a failing stage produces an error result."""
+    monkeypatch.setattr(property_analysis.AddressProcessor, 'geocode_address',
+                        lambda self, address: {'success': False, 'error': 'no match'})
+    graph = AnalysisGraph(PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:')), cache=StageCache())
+
+    result = graph.run(ADDRESS)
+
+    assert not result['success']
+    assert 'no match' in result['error']
+
+
+def test_content_hash_ignores_key_order():
+    """Test that content hashes depend on content, not dict order."""
+    assert content_hash({'a': 1, 'b': [1, 2]}) == content_hash({'b': [1, 2], 'a': 1})
+    assert content_hash({'a': 1}) != content_hash({'a': 2})
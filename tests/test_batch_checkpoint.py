@@ -0,0 +1,156 @@
+"""
+Tests for checkpointed, resumable batch output.
+"""
+
+import json
+
+import pytest
+
+from batch_checkpoint import BatchCheckpoint, JsonlResultWriter
+from property_analysis import BatchPropertyAnalyzer
+
+
+class CountingAnalyzer:
+    """Stand-in for PropertyAnalyzer that records which addresses it analyzed."""
+
+    def __init__(self):
+        self.analyzed = []
+
+    def analyze_property(self, address, location_data=None):
+        self.analyzed.append(address)
+        return {'address': address}, {}
+
+    def generate_valuation(self, property_data, market_data):
+        return {'valuation': {'final_value': 100000}}
+
+
+@pytest.fixture
+def addresses():
+    """Create a batch of test addresses."""
+    return [f"{100 + i} Main St, Springfield, IL 62701" for i in range(25)]
+
+
+def failing_after(addresses, count):
+    """Yield the first rows of a batch, then fail like a provider outage."""
+    for i, address in enumerate(addresses):
+        if i == count:
+            raise ConnectionError("provider outage")
+        yield address
+
+
+def read_records(path):
+    """Read every JSON line of an output file."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_resume_skips_finished_rows(addresses, tmp_path):
+    """Test that a resumed batch only analyzes rows without results."""
+    output, checkpoint = tmp_path / 'out.jsonl', tmp_path / 'out.checkpoint'
+    analyzer = CountingAnalyzer()
+    batch = BatchPropertyAnalyzer(analyzer, max_workers=2)
+
+    with pytest.raises(ConnectionError):
+        batch.write_jsonl(failing_after(addresses, 12), output, checkpoint_path=checkpoint)
+
+    written = len(read_records(output))
+    assert 0 < written <= 12
+    assert BatchCheckpoint(checkpoint).load()['rows_completed'] == written
+
+    analyzer.analyzed.clear()
+    summary = batch.write_jsonl(addresses, output, checkpoint_path=checkpoint, resume=True)
+
+    assert analyzer.analyzed == addresses[written:]
+    records = read_records(output)
+    assert [r['address'] for r in records[:-1]] == addresses
+    assert records[-1] == summary
+    assert (summary['rows'], summary['succeeded'], summary['resumed_rows']) == (25, 25, written)
+
+
+def test_resume_recovers_lines_after_checkpoint(addresses, tmp_path):
+    """Test that complete lines past the checkpoint are kept and a torn line is dropped."""
+    output, checkpoint = tmp_path / 'out.jsonl', tmp_path / 'out.checkpoint'
+    crashed = JsonlResultWriter(output, checkpoint, checkpoint_interval=2)
+    crashed.open(addresses)
+    for address in addresses[:5]:
+        crashed.write({'address': address, 'success': True})
+    with open(output, 'ab') as f:
+        f.write(b'{"address": "torn')
+
+    assert BatchCheckpoint(checkpoint).load()['rows_completed'] == 4
+
+    with pytest.raises(ValueError):
+        JsonlResultWriter(output, checkpoint).open(addresses[1:], resume=True)
+
+    with JsonlResultWriter(output, checkpoint) as writer:
+        remaining = list(writer.open(addresses, resume=True))
+
+    assert remaining == addresses[5:]
+    assert writer.resumed_rows == 5
+    assert len(read_records(output)) == 5
+
+
+def test_resume_completed_batch_does_no_work(addresses, tmp_path):
+    """Test that resuming a finished batch returns its summary."""
+    output, checkpoint = tmp_path / 'out.jsonl', tmp_path / 'out.checkpoint'
+    analyzer = CountingAnalyzer()
+    batch = BatchPropertyAnalyzer(analyzer)
+    first = batch.write_jsonl(addresses[:3], output, checkpoint_path=checkpoint)
+
+    analyzer.analyzed.clear()
+    again = batch.write_jsonl(addresses[:3], output, checkpoint_path=checkpoint, resume=True)
+
+    assert again == first
+    assert analyzer.analyzed == []
+    assert len(read_records(output)) == 4
+
+
+def test_resume_requires_path(addresses):
+    """Test that file-like sinks cannot be resumed."""
+    with pytest.raises(ValueError):
+        JsonlResultWriter(open('/dev/null', 'w'), 'checkpoint')
+
+
+def test_batch_job_streams_records_with_input_rows(monkeypatch, tmp_path):
+    """Test that a batch job keeps uploaded columns and builds summary rows as it streams."""
+    import user_interface
+
+    class StubStrategist:
+        def __init__(self, top_k=None):
+            pass
+
+        def generate_strategies_batch(self, results):
+            return [{
+                'seller_motivation': {'level': 'high'},
+                'recommended_strategies': [{'name': 'Anchor low', 'expected_success_probability': 0.7},
+                                           {'name': 'Wait', 'expected_success_probability': 0.4}]
+            } for _ in results]
+
+    monkeypatch.setattr(user_interface, 'BATCH_JOB_FOLDER', str(tmp_path))
+    monkeypatch.setattr(user_interface, 'BatchPropertyAnalyzer', lambda: BatchPropertyAnalyzer(CountingAnalyzer()))
+    monkeypatch.setattr(user_interface, 'NegotiationStrategist', StubStrategist)
+    upload = tmp_path / 'upload.csv'
+    upload.write_text(
+        "address,listing_price,owner\n"
+        '"1 Main St, Springfield, IL 62701",300000,Smith\n'
+        '"2 Main St, Springfield, IL 62701",,\n'
+    )
+
+    user_interface.background_jobs['job'] = {'status': 'processing', 'progress': 0}
+    user_interface.process_batch_job('job', str(upload), 'full', False, False)
+    job = user_interface.background_jobs.pop('job')
+
+    assert job['status'] == 'completed'
+    with open(tmp_path / 'job.jsonl') as f:
+        records = [json.loads(line) for line in f][:-1]
+    assert records[0]['input'] == {'address': '1 Main St, Springfield, IL 62701', 'listing_price': 300000.0, 'owner': 'Smith'}
+    assert records[1]['input'] == {'address': '2 Main St, Springfield, IL 62701', 'listing_price': None, 'owner': None}
+    rows = job['results']['properties']
+    assert [row['input']['address'] for row in rows] == [record['address'] for record in records]
+    assert rows[0]['negotiation']['recommended_strategies'] == [
+        {'name': 'Anchor low', 'expected_success_probability': 0.7}
+    ]
+
+    # Resuming a finished job rebuilds the summary rows from the file
+    user_interface.background_jobs['job'] = {'status': 'processing', 'progress': 0}
+    user_interface.process_batch_job('job', str(upload), 'full', False, False, resume=True)
+    assert user_interface.background_jobs.pop('job')['results']['properties'] == rows
@@ -0,0 +1,126 @@
+"""
+Tests for the comparable sales index.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from comparables import ComparableCriteria, ComparablesStore, project
+from geocoding import GeocodeCache
+from property_analysis import PropertyAnalyzer
+
+NO_FILTERS = ComparableCriteria(bedroom_band=None, bathroom_band=None, square_feet_band=None,
+                                year_built_band=None, recency_days=None, max_distance_miles=None)
+
+
+@pytest.fixture(scope='module')
+def sales():
+    """Create random recorded sales around Springfield, IL."""
+    rng = np.random.default_rng(7)
+    n = 20000
+    return pd.DataFrame({
+        'address': [f"{i} Main St" for i in range(n)],
+        'latitude': rng.uniform(39.5, 40.1, n),
+        'longitude': rng.uniform(-90.0, -89.3, n),
+        'sale_price': rng.uniform(150000, 450000, n).round(),
+        'sale_date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, n), unit='D'),
+        'bedrooms': rng.integers(1, 6, n),
+        'bathrooms': rng.integers(1, 4, n),
+        'square_feet': rng.integers(800, 4000, n),
+        'year_built': rng.integers(1940, 2020, n)
+    })
+
+
+@pytest.fixture(scope='module')
+def store(sales):
+    """Index the recorded sales."""
+    return ComparablesStore(sales, leaf_size=16)
+
+
+def brute_force(sales, latitude, longitude, k, mask=None):
+    """Return the addresses of the k nearest sales by exhaustive search."""
+    points = project(sales['latitude'].to_numpy(), sales['longitude'].to_numpy())
+    distances = np.linalg.norm(points - project(latitude, longitude), axis=1)
+    if mask is not None:
+        distances[~mask] = np.inf
+    return sales['address'].to_numpy()[np.argsort(distances, kind='stable')[:k]].tolist()
+
+
+def test_nearest_matches_brute_force(store, sales):
+    """Test that unfiltered queries return the exact k nearest sales."""
+    for latitude, longitude in [(39.8, -89.65), (39.5, -90.0), (40.3, -89.0)]:
+        subject = {'coordinates': {'latitude': latitude, 'longitude': longitude}}
+        results = store.query(subject, k=8, criteria=NO_FILTERS, as_of='2025-01-01')
+
+        assert [sale['address'] for sale in results] == brute_force(sales, latitude, longitude, 8)
+        assert [sale['distance_miles'] for sale in results] == sorted(sale['distance_miles'] for sale in results)
+
+
+def test_filters_and_recency_window(store, sales):
+    """Test that attribute bands and the recency window are applied."""
+    subject = {
+        'coordinates': {'latitude': 39.8, 'longitude': -89.65},
+        'bedrooms': 3, 'bathrooms': 2, 'square_feet': 2000, 'year_built': 1990
+    }
+    criteria = ComparableCriteria(recency_days=90, max_distance_miles=None)
+    results = store.query(subject, k=5, criteria=criteria, as_of='2024-10-01')
+
+    dates = sales['sale_date']
+    mask = ((sales['bedrooms'] - 3).abs() <= 1) & ((sales['bathrooms'] - 2).abs() <= 1) \
+        & ((sales['square_feet'] - 2000).abs() <= 400) & ((sales['year_built'] - 1990).abs() <= 15) \
+        & (dates >= pd.Timestamp('2024-07-03')) & (dates <= pd.Timestamp('2024-10-01'))
+    assert [sale['address'] for sale in results] == brute_force(sales, 39.8, -89.65, 5, mask.to_numpy())
+    assert all('2024-07-03' <= sale['sale_date'] <= '2024-10-01' for sale in results)
+
+    nearby = store.query(subject, k=50, criteria=ComparableCriteria(max_distance_miles=0.5), as_of='2024-10-01')
+    assert all(sale['distance_miles'] <= 0.5 for sale in nearby)
+
+
+def test_query_many_matches_single_queries(store):
+    """Test that a bulk query returns each property's comparables in order."""
+    subjects = [{'coordinates': {'latitude': 39.6 + i * 0.05, 'longitude': -89.8 + i * 0.05}, 'bedrooms': 3}
+                for i in range(6)]
+    subjects.append({'address': 'no coordinates'})
+
+    results = store.query_many(subjects, k=4, as_of='2024-12-31')
+
+    assert len(results) == len(subjects)
+    assert results[-1] == []
+    for subject, comps in zip(subjects[:-1], results[:-1]):
+        assert comps == store.query(subject, k=4, as_of='2024-12-31')
+
+
+@pytest.mark.slow
+def test_query_is_sub_millisecond(store):
+    """Test that k-nearest queries take well under a millisecond."""
+    rng = np.random.default_rng(1)
+    subjects = [{'coordinates': {'latitude': lat, 'longitude': lon}, 'bedrooms': 3, 'bathrooms': 2,
+                 'square_feet': 1800, 'year_built': 1985}
+                for lat, lon in zip(rng.uniform(39.5, 40.1, 500).tolist(), rng.uniform(-90.0, -89.3, 500).tolist())]
+
+    start = time.perf_counter()
+    store.query_many(subjects, k=5, as_of='2024-12-31')
+    assert (time.perf_counter() - start) / len(subjects) < 0.001
+
+
+def test_cma_uses_recorded_sales(sales):
+    """Test that the CMA uses recorded sales when the property has coordinates."""
+    recent = sales.assign(sale_date=pd.Timestamp.today().normalize() - pd.Timedelta(days=30))
+    store = ComparablesStore(recent)
+    analyzer = PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'), comparables_store=store)
+    property_data = {
+        'address': '1 Main St, Springfield, IL 62701', 'bedrooms': 3, 'bathrooms': 2,
+        'square_feet': 2000, 'year_built': 1990, 'coordinates': {'latitude': 39.8, 'longitude': -89.65}
+    }
+    rng = np.random.default_rng(0)
+
+    cma = analyzer._generate_cma({'final_value': 300000}, property_data, {}, rng)
+    simulated = analyzer._generate_cma({'final_value': 300000}, {**property_data, 'coordinates': {}}, {}, rng)
+
+    assert cma['data_source'] == 'recorded_sales'
+    assert simulated['data_source'] == 'simulated'
+    expected = store.query(property_data, k=5)
+    assert [comp['address'] for comp in cma['comparable_properties']] == [sale['address'] for sale in expected]
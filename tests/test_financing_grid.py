@@ -0,0 +1,128 @@
+"""
+Tests for the financing scenario grid.
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from financing_grid import FinancingGrid, build_financing_grid, MAX_SCHEDULE_SCENARIOS
+from investment_metrics import compute_investment_metrics
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(REPO_ROOT, 'real_estate_analysis', 'backend')
+BACKEND_SETTINGS = {
+    'POSTGRES_SERVER': 'localhost',
+    'POSTGRES_USER': 'test',
+    'POSTGRES_PASSWORD': 'test',
+    'POSTGRES_DB': 'test',
+    'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+    'REDIS_HOST': 'localhost',
+    'REDIS_PORT': '6379',
+    'SECRET_KEY': 'test'
+}
+
+
+@pytest.fixture
+def grid():
+    """Create a 10 x 10 x 3 x 2 financing grid."""
+    return FinancingGrid(
+        property_value=400000,
+        monthly_rent=2600,
+        monthly_expenses=900,
+        down_payment_percents=np.linspace(5, 50, 10),
+        interest_rates=np.linspace(0, 9, 10),
+        loan_terms=[15, 20, 30],
+        points=[0, 1]
+    )
+
+
+def test_grid_matches_investment_analysis():
+    """Test that the grid reproduces the investment analysis mortgage payments."""
+    metrics = compute_investment_metrics([450000])
+    grid = build_financing_grid(450000, down_payment_percents=[20], interest_rates=[6.25], loan_terms=[30])
+
+    assert grid.monthly_mortgage[0, 0, 0, 0] == pytest.approx(
+        metrics.scenario('twenty_percent_down', 'monthly_mortgage')[0]
+    )
+    assert grid.monthly_cash_flow[0, 0, 0, 0] == pytest.approx(
+        metrics.scenario('twenty_percent_down', 'monthly_cash_flow')[0]
+    )
+
+
+def test_grid_shape_and_points(grid):
+    """Test that every combination is evaluated and points only add closing cost."""
+    assert grid.cash_on_cash_return.shape == (10, 10, 3, 2)
+    assert len(grid.to_records()) == 600
+    np.testing.assert_allclose(grid.monthly_mortgage[..., 0], grid.monthly_mortgage[..., 1])
+    np.testing.assert_allclose(
+        grid.cash_to_close[..., 1] - grid.cash_to_close[..., 0],
+        grid.loan_amount[..., 0] / 100
+    )
+
+
+def test_amortization_schedules_are_lazy(grid):
+    """Test that schedules are only computed when requested."""
+    assert 'amortization_schedules' not in grid.__dict__
+
+    schedules = grid.amortization_schedules
+
+    assert schedules.shape == (300, 360, 3)
+    assert 'amortization_schedules' in grid.__dict__
+
+
+@pytest.mark.parametrize('down_index, rate_index, term_index', [(0, 0, 0), (3, 5, 1), (9, 9, 2)])
+def test_amortization_schedule_pays_off_loan(grid, down_index, rate_index, term_index):
+    """Test that principal repaid equals the loan and each payment is constant."""
+    rows = grid.amortization_schedules[grid.schedule_index(down_index, rate_index, term_index)]
+    months = grid.loan_terms[term_index] * 12
+    interest, principal, balance = rows[:months].T
+
+    assert principal.sum() == pytest.approx(grid.loan_amount[down_index, 0, 0, 0])
+    np.testing.assert_allclose(interest + principal, grid.monthly_mortgage[down_index, rate_index, term_index, 0])
+    assert balance[-1] == pytest.approx(0, abs=1e-6)
+    assert not rows[months:].any()
+
+
+def test_invalid_grid():
+    """Test that out-of-range axes are rejected."""
+    with pytest.raises(ValueError):
+        FinancingGrid(property_value=400000, down_payment_percents=[120])
+    with pytest.raises(ValueError):
+        FinancingGrid(property_value=400000, loan_terms=[])
+
+
+def test_schedules_are_capped(grid):
+    """Test that serializing schedules for too many combinations is rejected."""
+    assert grid.schedule_count > MAX_SCHEDULE_SCENARIOS
+    assert 'schedules' not in grid.to_dict()
+    with pytest.raises(ValueError):
+        grid.to_dict(include_schedules=True)
+
+    small = FinancingGrid(property_value=400000, down_payment_percents=[20], interest_rates=[6], loan_terms=[15, 30])
+    result = small.to_dict(include_schedules=True)
+    assert np.array(result['schedules']).shape == (2, 360, 3)
+
+
+def test_root_module_reexports_backend_engine():
+    """Test that the Flask app and the backend share one financing grid engine."""
+    from real_estate_analysis.backend.app.services import financing_grid as backend
+
+    assert FinancingGrid is backend.FinancingGrid
+    assert build_financing_grid is backend.build_financing_grid
+
+
+def test_backend_routes_import_from_backend_directory():
+    """Test that the API router imports with only the backend directory on the path."""
+    for module in ('fastapi', 'sqlalchemy', 'pydantic_settings'):
+        pytest.importorskip(module)
+
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR, **BACKEND_SETTINGS)
+    completed = subprocess.run(
+        [sys.executable, '-c', 'import app.api.routes'],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,140 @@
+"""
+Tests for geocoding cache and offline fallback.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from geopy.exc import GeocoderQuotaExceeded
+
+from geocoding import GeocodeCache, ZipCentroidTable, building_key, canonical_address, extract_zip_code, strip_unit
+from property_analysis import AddressProcessor
+
+
+@pytest.fixture
+def cache():
+    """Create an in-memory geocode cache."""
+    return GeocodeCache(path=':memory:')
+
+
+@pytest.fixture
+def centroid_table(tmp_path):
+    """Create a centroid table in Census Gazetteer format."""
+    path = tmp_path / 'zcta.txt'
+    path.write_text(
+        "GEOID\tALAND\tAWATER\tINTPTLAT\tINTPTLONG\n"
+        "62701\t7047396\t0\t39.800000\t-89.650000\n"
+    )
+    return ZipCentroidTable(path=str(path))
+
+
+@pytest.fixture
+def processor(cache, centroid_table):
+    """Create an AddressProcessor with a mocked geocoder."""
+    processor = AddressProcessor(api_key='test_key', cache=cache, centroid_table=centroid_table)
+    location = Mock(
+        latitude=39.7990,
+        longitude=-89.6440,
+        address='123 Main St, Springfield, IL 62701, USA',
+        raw={'address_components': [
+            {'types': ['postal_code'], 'long_name': '62701'},
+            {'types': ['locality'], 'long_name': 'Springfield'},
+            {'types': ['administrative_area_level_1'], 'long_name': 'Illinois', 'short_name': 'IL'}
+        ]}
+    )
+    processor.geocoder = Mock()
+    processor.geocoder.geocode.return_value = location
+    return processor
+
+
+def test_canonical_address():
+    """Test that equivalent spellings share a canonical key."""
+    assert canonical_address("123 Main Street, Springfield, IL 62701-1234") == \
+        canonical_address("123  main st.,  springfield, il 62701")
+    assert canonical_address("9 Elm Ave #4, Springfield, IL 62701") == \
+        "9 ELM AVE UNIT 4, SPRINGFIELD, IL 62701"
+    assert extract_zip_code("123 Main St, Springfield, IL 62701-1234") == "62701"
+
+
+def test_building_key_ignores_unit():
+    """Test that units of one building share a building key."""
+    assert building_key("20 Oak Ave Apt 1, Springfield, IL 62702") == \
+        building_key("20 Oak Avenue, Suite 200, Springfield, IL 62702") == \
+        building_key("20 Oak Ave #3, Springfield, IL 62702") == \
+        "20 OAK AVE, SPRINGFIELD, IL 62702"
+
+
+@pytest.mark.parametrize('address', [
+    '5 Unit Rd, Springfield, IL 62701',
+    '44 Suite Ave, Akron, OH 44301',
+    '100 Main St, Ste. Genevieve, MO 63670'
+])
+def test_strip_unit_keeps_street_and_city_names(address):
+    """Test that unit words in street or city names are not taken for units."""
+    assert strip_unit(address) == address
+
+
+def test_get_many(cache):
+    """Test that bulk lookups return only cached keys."""
+    cache.set('A', {'success': True})
+    cache.set('B', {'success': False, 'error': 'Address could not be geocoded'})
+
+    assert cache.get_many(['A', 'B', 'C']) == {
+        'A': {'success': True},
+        'B': {'success': False, 'error': 'Address could not be geocoded'}
+    }
+
+
+def test_repeat_geocode_skips_network(processor):
+    """Test that a cached address is not geocoded again."""
+    first = processor.geocode_address("123 Main Street, Springfield, IL 62701")
+    second = processor.geocode_address("123 Main St, Springfield, IL 62701")
+
+    assert first == second
+    assert first['components']['zip_code'] == '62701'
+    assert processor.geocoder.geocode.call_count == 1
+
+
+def test_cache_expiry(cache):
+    """Test that expired entries are ignored and purged."""
+    expired = GeocodeCache(path=':memory:', ttl=-1)
+    expired.set('KEY', {'success': True, 'coordinates': {'latitude': 1.0, 'longitude': 2.0}})
+
+    assert expired.get('KEY') is None
+    assert expired.purge_expired() == 1
+
+
+def test_fallback_to_centroid_table(processor):
+    """Test that geocoder outages fall back to the offline ZIP centroid."""
+    processor.geocoder.geocode.side_effect = GeocoderQuotaExceeded('quota exceeded')
+
+    result = processor.geocode_address("500 Oak Ave, Springfield, IL 62701")
+
+    assert result['success']
+    assert result['approximate']
+    assert result['coordinates'] == {'latitude': 39.8, 'longitude': -89.65}
+    assert result['components'] == {'zip_code': '62701', 'city': 'Springfield', 'state_code': 'IL'}
+
+
+def test_fallback_to_cached_zip_centroid(cache, processor):
+    """Test that cached addresses in the same ZIP provide a centroid when the table has none."""
+    processor.centroid_table = ZipCentroidTable(path='/nonexistent/zcta.txt')
+    processor.geocode_address("123 Main St, Springfield, IL 62701")
+    processor.geocoder.geocode.side_effect = GeocoderQuotaExceeded('quota exceeded')
+
+    result = processor.geocode_address("500 Oak Ave, Springfield, IL 62701")
+
+    assert result['success']
+    assert result['coordinates'] == {'latitude': 39.799, 'longitude': -89.644}
+    # Approximate results are not cached
+    assert cache.get(canonical_address("500 Oak Ave, Springfield, IL 62701")) is None
+
+
+def test_fallback_without_centroid_reports_error(processor):
+    """Test that an unknown ZIP during an outage reports the geocoder error."""
+    processor.geocoder.geocode.side_effect = GeocoderQuotaExceeded('quota exceeded')
+
+    result = processor.geocode_address("1 Pine Rd, Nowhere, ZZ 99999")
+
+    assert not result['success']
+    assert 'quota exceeded' in result['error']
@@ -0,0 +1,123 @@
+"""
+Tests for the vectorized investment metrics engine.
+"""
+
+import numpy as np
+import pytest
+
+from geocoding import GeocodeCache
+from investment_metrics import FINANCING_SCENARIOS, compute_hold_period_returns, compute_investment_metrics, npv
+from property_analysis import PropertyAnalyzer
+
+
+@pytest.fixture
+def analyzer():
+    """Create a PropertyAnalyzer that does not touch the shared geocode cache."""
+    return PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'))
+
+
+@pytest.fixture
+def batch():
+    """Create a small batch of property inputs."""
+    return {
+        'property_values': [450000, 250000, 1200000, 0],
+        'annual_taxes': [5400, np.nan, 15000, np.nan],
+        'property_types': ['Single Family', 'Condo', 'Townhouse', 'Single Family'],
+        'market_types': ['balanced', 'seller', 'buyer', 'balanced'],
+        'price_growth_rates': [0.03, 0.06, 0.01, 0.03],
+        'rental_demands': ['High', 'Moderate', 'Low', 'Moderate']
+    }
+
+
+def test_batch_matches_single_property(analyzer, batch):
+    """Test that each batch row equals the single-property analysis."""
+    metrics = compute_investment_metrics(**batch)
+
+    for i, value in enumerate(batch['property_values']):
+        property_data = {'property_type': batch['property_types'][i]}
+        if not np.isnan(batch['annual_taxes'][i]):
+            property_data['annual_tax_amount'] = batch['annual_taxes'][i]
+        market_data = {
+            'supply_demand': {'market_type': batch['market_types'][i]},
+            'market_metrics': {'price_growth_rate': batch['price_growth_rates'][i]},
+            'neighborhood': {'rental_demand': batch['rental_demands'][i]}
+        }
+
+        single = analyzer._generate_investment_analysis({'final_value': value}, property_data, market_data)
+
+        assert metrics.to_dict(i) == single
+
+
+def test_financing_scenarios_are_columnar(batch):
+    """Test that financing metrics have one column per scenario."""
+    metrics = compute_investment_metrics(**batch)
+
+    assert len(metrics) == 4
+    assert metrics['monthly_mortgage'].shape == (4, len(FINANCING_SCENARIOS))
+    assert np.all(metrics.scenario('all_cash', 'monthly_mortgage') == 0)
+    # A larger down payment means a smaller loan payment
+    assert np.all(
+        metrics.scenario('thirty_percent_down', 'monthly_mortgage')[:3]
+        < metrics.scenario('twenty_percent_down', 'monthly_mortgage')[:3]
+    )
+
+
+def test_missing_taxes_default_to_one_percent(batch):
+    """Test that missing tax amounts fall back to 1% of value."""
+    metrics = compute_investment_metrics(**batch)
+
+    assert metrics['property_tax'][1] == pytest.approx(2500)
+    assert metrics['property_tax'][0] == 5400
+
+
+def test_zero_value_property(batch):
+    """Test that a zero-value property yields zero ratios instead of NaN."""
+    result = compute_investment_metrics(**batch).to_dict(3)
+
+    assert result['rental_analysis']['cap_rate'] == 0
+    assert result['break_even_ratio'] == 0
+    assert result['financing_scenarios']['all_cash']['cash_on_cash_return'] == 0
+
+
+def test_to_frame_flattens_scenarios(batch):
+    """Test that the DataFrame view has one row per property."""
+    frame = compute_investment_metrics(**batch).to_frame()
+
+    assert len(frame) == 4
+    assert 'twenty_percent_down.cash_on_cash_return' in frame.columns
+
+
+def test_hold_period_irr_solves_npv(batch):
+    """Test that every hold-period IRR zeroes the NPV of its cash flows."""
+    returns = compute_hold_period_returns(compute_investment_metrics(**batch))
+
+    assert returns.irr.shape == (4, 30)
+    finite = np.isfinite(returns.irr[:3])
+    assert finite.all()
+    for i in range(3):
+        for column in (0, 9, 29):
+            flows = returns.cash_flows[i, column]
+            assert npv(returns.irr[i, column], flows) == pytest.approx(0, abs=1e-4)
+
+
+def test_hold_period_cash_flows(batch):
+    """Test that cash flows stop after the sale year."""
+    returns = compute_hold_period_returns(compute_investment_metrics(**batch), hold_years=[3, 5])
+
+    flows = returns.cash_flows[0, 0]
+    assert flows[0] == pytest.approx(-90000)
+    assert not flows[4:].any()
+    assert npv(0.0, returns.cash_flows[0]) == pytest.approx(returns.cash_flows[0].sum(axis=-1))
+
+
+def test_hold_period_curve(analyzer):
+    """Test the single-property hold-period curve."""
+    curve = analyzer.analyze_hold_periods(
+        {'final_value': 450000},
+        {'annual_tax_amount': 5400},
+        {'market_metrics': {'price_growth_rate': 0.04}},
+        scenario='all_cash'
+    )
+
+    assert [point['hold_years'] for point in curve['curve']] == list(range(1, 31))
+    assert 1 <= curve['best_hold_years'] <= 30
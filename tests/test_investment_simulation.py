@@ -0,0 +1,102 @@
+"""
+Tests for the Monte Carlo investment simulator.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from geocoding import GeocodeCache
+from investment_simulation import SimulationAssumptions, irr, simulate_investments
+from property_analysis import PropertyAnalyzer
+
+
+@pytest.fixture
+def values():
+    """Create a batch of purchase prices."""
+    return np.array([250000, 450000, 900000])
+
+
+def test_irr_known_values():
+    """Test the vectorized IRR against hand-checked cash flows."""
+    cash_flows = np.array([
+        [-100, 10, 10, 110],
+        [-100, 0, 0, 50],
+        [-100, 200, -150, 0],   # NPV never crosses zero
+        [100, 10, 10, 10]       # No sign change
+    ], dtype=float)
+
+    rates = irr(cash_flows)
+
+    assert rates[0] == pytest.approx(0.1)
+    assert rates[1] == pytest.approx(0.5 ** (1 / 3) - 1)
+    assert np.isnan(rates[2]) and np.isnan(rates[3])
+
+
+def test_simulation_is_reproducible(values):
+    """Test that the same seed gives the same distributions."""
+    assumptions = SimulationAssumptions(n_paths=2000)
+
+    first = simulate_investments(values, assumptions=assumptions, seed=7)
+    second = simulate_investments(values, assumptions=assumptions, seed=7)
+    other = simulate_investments(values, assumptions=assumptions, seed=8)
+
+    np.testing.assert_array_equal(first.irr, second.irr)
+    assert not np.array_equal(first.irr, other.irr)
+
+
+def test_simulation_batches_properties(values):
+    """Test that every property gets its own row of paths and a summary."""
+    result = simulate_investments(values, assumptions=SimulationAssumptions(n_paths=1000), seed=1)
+
+    assert result.irr.shape == (3, 1000)
+    assert np.all((result.probability_of_loss >= 0) & (result.probability_of_loss <= 1))
+    summary = result.summaries()[1]
+    assert summary['paths'] == 1000
+    assert summary['irr']['p5'] <= summary['irr']['p50'] <= summary['irr']['p95']
+
+
+def test_zero_volatility_paths_agree(values):
+    """Test that removing randomness collapses the distribution."""
+    assumptions = SimulationAssumptions(
+        n_paths=100,
+        appreciation_volatility=0,
+        rent_growth_volatility=0,
+        vacancy_concentration=1e9,
+        adjustable_rate=False
+    )
+
+    result = simulate_investments(values, assumptions=assumptions, seed=3)
+
+    assert np.allclose(result.irr, result.irr[:, :1], atol=1e-4)
+    assert set(np.unique(result.probability_of_loss)) <= {0.0, 1.0}
+
+
+def test_property_analyzer_simulation():
+    """Test the single-property wrapper."""
+    analyzer = PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'))
+
+    summary = analyzer.simulate_investment(
+        {'final_value': 450000},
+        {'property_type': 'Condo', 'annual_tax_amount': 5400},
+        {'market_metrics': {'price_growth_rate': 0.04}, 'supply_demand': {'market_type': 'seller'}},
+        assumptions=SimulationAssumptions(n_paths=1000),
+        seed=11
+    )
+
+    assert summary['equity_invested'] == 90000
+    assert 0 <= summary['probability_of_loss'] <= 1
+
+
+@pytest.mark.slow
+def test_simulation_runtime(values):
+    """Test that 10k paths stay well under 50ms per property."""
+    simulate_investments(values[:1], seed=0)  # Warm up
+    batch = np.tile(values, 8)
+
+    start = time.perf_counter()
+    simulate_investments(batch, seed=0)
+    per_property = (time.perf_counter() - start) / len(batch)
+
+    assert per_property < 0.05
@@ -0,0 +1,137 @@
+"""
+Tests for the listing event store and its use in seller motivation.
+"""
+
+import sqlite3
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from listing_events import ListingEventStore
+from negotiation_strategist import SellerMotivationAnalyzer
+
+ADDRESS = '12 Oak Street, Springfield, IL 62701'
+
+
+@pytest.fixture
+def store():
+    """Create an in-memory store with one relisted property."""
+    store = ListingEventStore(path=':memory:')
+    store.append_many([
+        {'address': ADDRESS, 'event_type': 'list', 'event_date': '2023-01-10', 'price': 400000},
+        {'address': ADDRESS, 'event_type': 'price_change', 'event_date': '2023-02-15', 'price': 390000},
+        {'address': ADDRESS, 'event_type': 'price_change', 'event_date': '2023-03-20', 'price': 380000},
+        {'address': ADDRESS, 'event_type': 'withdrawn', 'event_date': '2023-04-01'},
+        {'address': ADDRESS, 'event_type': 'list', 'event_date': '2023-05-01', 'price': 375000},
+    ])
+    return store
+
+
+def test_history_summary(store):
+    """Test that cuts, reduction and relists are summarized across a withdrawal."""
+    history = store.histories(['12 oak st, springfield, il 62701-1234'])['12 OAK ST, SPRINGFIELD, IL 62701']
+
+    assert history.status == 'list'
+    assert history.listed_date == '2023-01-10'
+    assert history.price_cuts == 3
+    assert history.reduction_pct == pytest.approx(6.25)
+    assert history.relist_count == 1
+    # 81 days before the withdrawal and 39 since relisting
+    assert history.days_on_market('2023-06-09') == 120
+
+
+def test_sale_starts_a_new_run(store):
+    """Test that listing after a sale starts a new marketing run."""
+    store.append(ADDRESS, 'sold', '2023-06-15', 370000)
+    assert store.histories([ADDRESS])['12 OAK ST, SPRINGFIELD, IL 62701'].current_price == 370000
+
+    store.append(ADDRESS, 'list', '2024-03-01', 420000)
+    history = store.histories([ADDRESS])['12 OAK ST, SPRINGFIELD, IL 62701']
+    assert (history.listed_date, history.price_cuts, history.relist_count) == ('2024-03-01', 0, 0)
+    assert len(store.events(ADDRESS)) == 7
+
+
+def test_withdrawn_property_stops_accruing_days(store):
+    """Test that days on market stop counting while a property is withdrawn."""
+    store.append(ADDRESS, 'withdrawn', '2023-06-01')
+    history = store.histories([ADDRESS])['12 OAK ST, SPRINGFIELD, IL 62701']
+
+    assert history.days_on_market('2023-06-01') == 112
+    assert history.days_on_market('2024-06-01') == 112
+
+
+def test_sold_property_stops_accruing_days(store):
+    """Test that days on market stop counting at the sale."""
+    store.append(ADDRESS, 'pending', '2023-05-21')
+    store.append(ADDRESS, 'sold', '2023-06-15', 370000)
+    history = store.histories([ADDRESS])['12 OAK ST, SPRINGFIELD, IL 62701']
+
+    assert history.status == 'sold'
+    assert history.days_on_market('2023-06-15') == 101
+    assert history.days_on_market() == 101
+
+
+def test_store_is_append_only(store):
+    """Test that recorded events cannot be changed and bad events are rejected."""
+    with pytest.raises(sqlite3.DatabaseError):
+        store._conn.execute('DELETE FROM listing_events')
+    with pytest.raises(ValueError):
+        store.append_many([
+            {'address': '1 Elm St, Springfield, IL 62701', 'event_type': 'list', 'event_date': '2023-01-01'},
+            {'address': '1 Elm St, Springfield, IL 62701', 'event_type': 'relisted', 'event_date': '2023-02-01'}
+        ])
+
+    assert store.events('1 Elm St, Springfield, IL 62701') == []
+    assert len(store.events(ADDRESS)) == 5
+
+
+def test_bulk_histories():
+    """Test that thousands of histories are read in one pass and by ZIP."""
+    store = ListingEventStore(path=':memory:')
+    addresses = [f'{i} Main St, Springfield, IL {62701 + i % 3}' for i in range(3000)]
+    store.append_many(
+        {'address': address, 'event_type': event_type, 'event_date': f'2023-0{month}-01', 'price': price}
+        for address in addresses
+        for month, event_type, price in [(1, 'list', 300000), (2, 'price_change', 290000), (3, 'pending', None)]
+    )
+
+    start = time.perf_counter()
+    histories = store.histories(addresses + ['1 Unknown Rd, Springfield, IL 62701'])
+    elapsed = time.perf_counter() - start
+
+    assert len(histories) == 3000
+    assert all(history.price_cuts == 1 and history.status == 'pending' for history in histories.values())
+    assert len(store.histories_in_zip('62702')) == 1000
+    assert elapsed < 1.0
+
+
+def test_motivation_uses_recorded_history(store):
+    """Test that recorded events replace estimated price cuts."""
+    property_data = {'address': ADDRESS, 'listing_price': 375000, 'days_on_market': 40}
+    market_data = {'supply_demand': {'market_type': 'balanced'}, 'market_metrics': {'days_on_market': 30}}
+
+    recorded = SellerMotivationAnalyzer(listing_events=store).analyze_motivation(property_data, market_data)
+    other = SellerMotivationAnalyzer(listing_events=store).analyze_motivation(
+        dict(property_data, address='99 Pine St, Springfield, IL 62701'), market_data
+    )
+
+    assert recorded['price_history_source'] == 'listing_events'
+    assert (recorded['price_cuts'], recorded['price_reduction_pct'], recorded['relist_count']) == (3, 6.2, 1)
+    assert "Property has been relisted 1 time(s)" in recorded['factors']
+    assert other['price_history_source'] == 'estimated'
+    assert other['relist_count'] == 0
+
+
+def test_recorded_days_on_market_override_reported():
+    """Test that recorded days on market replace the property's simulated value."""
+    listed = (date.today() - timedelta(days=200)).isoformat()
+    store = ListingEventStore(path=':memory:')
+    store.append(ADDRESS, 'list', listed, 400000)
+    property_data = {'address': ADDRESS, 'listing_price': 400000, 'days_on_market': 4}
+    market_data = {'supply_demand': {'market_type': 'balanced'}, 'market_metrics': {'days_on_market': 30}}
+
+    result = SellerMotivationAnalyzer(listing_events=store).analyze_motivation(property_data, market_data)
+
+    assert result['price_history_source'] == 'listing_events'
+    assert result['days_on_market'] == 200
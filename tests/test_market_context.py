@@ -0,0 +1,99 @@
+"""
+Tests for the ZIP-level market context cache.
+"""
+
+import threading
+import time
+
+import pytest
+
+from geocoding import GeocodeCache
+from market_context import MarketContextCache, copy_market_context
+from property_analysis import PropertyAnalyzer
+
+
+@pytest.fixture
+def cache():
+    """Create an empty market context cache."""
+    return MarketContextCache(ttl=60, max_entries=2)
+
+
+def test_get_or_build_reuses_context(cache):
+    """Test that a context is built once per ZIP and data version."""
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'market_metrics': {'median_home_price': 300000}}
+
+    first = cache.get_or_build('62701', '1', build)
+    second = cache.get_or_build('62701', '1', build)
+    cache.get_or_build('62701', '2', build)
+
+    assert first is second
+    assert len(builds) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_concurrent_misses_build_once(cache):
+    """Test that threads missing on the same key wait for a single build."""
+    builds = []
+
+    def build():
+        builds.append(1)
+        time.sleep(0.05)
+        return {'market_metrics': {}}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_build('62701', '1', build)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_ttl_and_eviction():
+    """Test that expired and least recently used contexts are rebuilt."""
+    expired = MarketContextCache(ttl=0)
+    expired.set('62701', '1', {})
+    assert expired.get('62701', '1') is None
+
+    cache = MarketContextCache(ttl=60, max_entries=2)
+    for zip_code in ('62701', '62702', '62703'):
+        cache.set(zip_code, '1', {'zip': zip_code})
+
+    assert len(cache) == 2
+    assert cache.get('62701', '1') is None
+    assert cache.get('62703', '1') == {'zip': '62703'}
+
+
+def test_copy_is_independent():
+    """Test that copies do not share mutable values with the cached context."""
+    context = {'neighborhood': {'neighborhood_features': ['Parks'], 'school_rating': 7}}
+
+    copy = copy_market_context(context)
+    copy['neighborhood']['neighborhood_features'].append('Shops')
+    copy['neighborhood']['school_rating'] = 1
+
+    assert context == {'neighborhood': {'neighborhood_features': ['Parks'], 'school_rating': 7}}
+
+
+def test_properties_in_a_zip_share_market_context():
+    """Test that the analyzer builds each ZIP's market context once."""
+    cache = MarketContextCache()
+    analyzer = PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'), market_cache=cache)
+    location = {'components': {'zip_code': '62701', 'city': 'Springfield'}}
+
+    first = analyzer._analyze_market(location, {'address': '1 Main St, Springfield, IL 62701'})
+    second = analyzer._analyze_market(location, {'address': '2 Oak Ave, Springfield, IL 62701'})
+    other = analyzer._analyze_market({'components': {'zip_code': '10001', 'city': 'New York'}}, {})
+
+    assert first == second and first is not second
+    assert other != first
+    assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,95 @@
+"""
+Tests for batch negotiation strategy generation.
+"""
+
+import copy
+
+import pytest
+
+from negotiation_strategist import NegotiationStrategist
+
+
+def make_analysis(index, market_type='buyer', cycle='Contraction', valuation=True):
+    """Create one analyzed property."""
+    price = 250000 + 10000 * index
+    property_data = {
+        'address': f'{index} Main St, Springfield, IL 62701',
+        'listing_price': price,
+        'days_on_market': 15 * index,
+        'original_list_price': price * 1.05
+    }
+    market_data = {
+        'supply_demand': {'market_type': market_type},
+        'market_cycle': {'cycle_position': cycle},
+        'market_metrics': {'days_on_market': 30}
+    }
+    valuation_data = {
+        'valuation': {'final_value': price * 0.97},
+        'renovation_analysis': {'property_condition': 'Fair', 'estimated_renovation_cost': 40000},
+        'investment_metrics': {
+            'financing_scenarios': {'twenty_percent_down': {'monthly_cash_flow': -150, 'cash_on_cash_return': 3.0}},
+            'rental_analysis': {'cap_rate': 5.0}
+        }
+    } if valuation else {}
+    return {'property': property_data, 'market': market_data, 'valuation': valuation_data}
+
+
+@pytest.fixture
+def analyses():
+    """Create a portfolio across market types, with one property lacking a valuation."""
+    markets = [('buyer', 'Contraction'), ('balanced', 'Expansion'), ('seller', 'Recovery')]
+    portfolio = [make_analysis(i, *markets[i % 3]) for i in range(12)]
+    portfolio[5] = make_analysis(5, valuation=False)
+    return portfolio
+
+
+def test_batch_matches_single_property(analyses):
+    """Test that each batch result equals the single-property result."""
+    strategist = NegotiationStrategist()
+
+    batch = strategist.generate_strategies_batch(copy.deepcopy(analyses))
+    single = [
+        strategist.generate_strategies(a['property'], a['market'], a['valuation'])
+        for a in copy.deepcopy(analyses)
+    ]
+
+    assert batch == single
+    assert all(result['success'] for i, result in enumerate(batch) if i != 5)
+    for result in batch:
+        if result['success']:
+            ranks = [strategy['rank'] for strategy in result['recommended_strategies']]
+            assert ranks == list(range(1, len(ranks) + 1))
+
+
+def test_failing_property_is_isolated(analyses):
+    """Test that a property that cannot be scored does not fail the rest of the batch."""
+    results = NegotiationStrategist().generate_strategies_batch(analyses)
+
+    assert len(results) == len(analyses)
+    assert not results[5]['success']
+    assert results[5]['error_message']
+    assert sum(result['success'] for result in results) == len(analyses) - 1
+
+
+def test_empty_batch():
+    """Test that an empty portfolio gives no results."""
+    assert NegotiationStrategist().generate_strategies_batch([]) == []
+
+
+@pytest.mark.parametrize('top_k', [1, 3])
+def test_top_k_matches_full_ranking(analyses, top_k):
+    """Test that top-k ranking returns the head of the full ranking and the same fallbacks."""
+    strategist = NegotiationStrategist()
+
+    full = strategist.generate_strategies_batch(copy.deepcopy(analyses))
+    top = strategist.generate_strategies_batch(copy.deepcopy(analyses), top_k=top_k)
+
+    for expected, result in zip(full, top):
+        if not expected['success']:
+            continue
+        ranked = result['recommended_strategies']
+        assert list(ranked) == expected['recommended_strategies'][:top_k]
+        assert result['fallback_options'] == expected['fallback_options']
+        assert result['negotiation_script'] == expected['negotiation_script']
+        # The rest is ordered on request
+        assert ranked.all() == expected['recommended_strategies']
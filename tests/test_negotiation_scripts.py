@@ -0,0 +1,81 @@
+"""
+Tests for the negotiation script templates.
+"""
+
+import pytest
+
+from negotiation_scripts import SCRIPT_TEMPLATES, SCRIPT_VARIANTS, _render, clear_script_cache, render_script
+from negotiation_strategist import NegotiationStrategist
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start each test with no memoized scripts."""
+    clear_script_cache()
+
+
+def test_price_scripts():
+    """Test that price scripts fill in formatted amounts and optional points."""
+    below_market = render_script({
+        'type': 'price', 'name': 'Below-Market Offer', 'offer_price': 285000,
+        'justification': ['Extended days on market', 'Price reductions'], 'roi_impact': {}
+    })
+    assert below_market['opening_statement'].endswith('an offer of $285,000.')
+    assert below_market['key_points'][1] == 'My offer reflects Extended days on market, Price reductions'
+    assert len(below_market['key_points']) == 3
+
+    incremental = render_script({'type': 'price', 'name': 'Incremental Negotiation', 'offer_price': 300000})
+    assert incremental['closing_statement'].endswith('would be around $315,000.0.')
+
+    tiers = render_script({
+        'type': 'price', 'name': 'Conditional Price Tiers',
+        'condition_tiers': [{'condition': 'As-is', 'price': 270000}, {'condition': 'Quick close', 'price': 280000}]
+    })
+    assert tiers['key_points'] == ['Option 1: As-is - $270,000', 'Option 2: Quick close - $280,000']
+
+
+def test_every_variant_has_a_template():
+    """Test that each strategy variant and each type's fallback have templates."""
+    for strategy_type, variants in SCRIPT_VARIANTS.items():
+        assert (strategy_type, 'generic') in SCRIPT_TEMPLATES
+        for _, variant, _ in variants:
+            assert (strategy_type, variant) in SCRIPT_TEMPLATES
+
+    default = render_script(None)
+    assert render_script({'type': 'unknown'}) == default
+    assert default['key_points'][0] == 'Discuss property features'
+
+
+def test_renderings_are_memoized():
+    """Test that identical parameters render once and callers get independent copies."""
+    strategy = {
+        'type': 'terms', 'name': 'Closing Timeline Flexibility',
+        'options': [{'name': 'Quick Close', 'description': '21-day closing'}],
+        'justification': ['Seller may need to move quickly']
+    }
+
+    first = render_script(strategy)
+    first['key_points'].append('changed')
+    second = render_script(dict(strategy))
+
+    assert second['key_points'] == [
+        'Option: Quick Close - 21-day closing',
+        "I'm offering this flexibility because seller may need to move quickly"
+    ]
+    assert _render.cache_info().hits == 1
+    assert _render.cache_info().misses == 1
+
+
+def test_lazy_scripts_render_on_request():
+    """Test that scripts left out of results render the same script on request."""
+    property_data = {'address': '1 Main St, Springfield, IL 62701', 'listing_price': 300000, 'days_on_market': 75}
+    market_data = {'supply_demand': {'market_type': 'buyer'}, 'market_metrics': {'days_on_market': 30}}
+    valuation_data = {'valuation': {'final_value': 290000}}
+
+    eager = NegotiationStrategist().generate_strategies(property_data, market_data, valuation_data)
+    lazy_strategist = NegotiationStrategist(render_scripts=False)
+    lazy = lazy_strategist.generate_strategies(property_data, market_data, valuation_data)
+
+    assert lazy['negotiation_script'] is None
+    assert lazy_strategist.negotiation_script(lazy) == eager['negotiation_script']
+    assert lazy_strategist.negotiation_script(eager) == eager['negotiation_script']
@@ -0,0 +1,83 @@
+"""
+Tests for the offer price optimization engine.
+"""
+
+import numpy as np
+
+from negotiation_strategist import NegotiationStrategist
+from offer_optimization import (
+    OFFER_DISCOUNT_GRID,
+    compute_offer_curves,
+    success_probability,
+    success_probability_table
+)
+
+MOTIVATIONS = ['high', 'moderate', 'low', 'unknown']
+MARKETS = ['buyer', 'balanced', 'seller', 'unknown']
+
+
+def reference_probability(discount_pct, motivation_level, market_type):
+    """Score one offer with the original binned rules."""
+    if discount_pct <= 0.03:
+        base = 0.9
+    elif discount_pct <= 0.05:
+        base = 0.8
+    elif discount_pct <= 0.08:
+        base = 0.7
+    elif discount_pct <= 0.1:
+        base = 0.6
+    elif discount_pct <= 0.15:
+        base = 0.4
+    else:
+        base = 0.3
+    motivation = {'high': 1.3, 'moderate': 1.0}.get(motivation_level, 0.7)
+    market = {'buyer': 1.2, 'balanced': 1.0}.get(market_type, 0.8)
+    return max(0.1, min(0.95, base * motivation * market))
+
+
+def test_probabilities_match_binned_rules():
+    """Test that the vectorized probabilities equal the scalar rules at every grid point."""
+    discounts = np.concatenate([OFFER_DISCOUNT_GRID, [0.03, 0.05, 0.08, 0.1, 0.15, 0.5]])
+    for motivation in MOTIVATIONS:
+        for market in MARKETS:
+            expected = [reference_probability(d, motivation, market) for d in discounts]
+            assert success_probability(discounts, motivation, market).tolist() == expected
+            assert success_probability(0.07, motivation, market) == reference_probability(0.07, motivation, market)
+
+    assert success_probability_table().shape == (3, 3, len(OFFER_DISCOUNT_GRID))
+
+
+def test_optimal_offer_maximizes_expected_savings():
+    """Test that the optimal offer is the brute-force maximum of the curve."""
+    prices = [400000, 250000, 0]
+    curves = compute_offer_curves(prices, ['high', 'low', 'moderate'], ['buyer', 'seller', 'balanced'])
+
+    for index, (price, motivation, market) in enumerate(zip(prices, ['high', 'low', 'moderate'],
+                                                             ['buyer', 'seller', 'balanced'])):
+        expected_savings = [price * d * reference_probability(d, motivation, market) for d in OFFER_DISCOUNT_GRID]
+        curve = curves.to_dict(index)
+        best = int(np.argmax(expected_savings))
+        assert len(curve['offer_prices']) == len(OFFER_DISCOUNT_GRID)
+        assert curve['optimal_offer']['discount_percentage'] == round(OFFER_DISCOUNT_GRID[best] * 100, 1)
+        assert curve['optimal_offer']['expected_savings'] == max(curve['expected_savings'])
+
+    # Nothing to save on a zero price, so the optimum is the listing price
+    assert curves.optimal('offer_prices')[2] == 0
+    assert curves.to_dict(2)['optimal_offer']['discount_percentage'] == 0
+
+
+def test_strategies_include_offer_curve():
+    """Test that negotiation strategies include the offer curve for the listing price."""
+    property_data = {'address': '1 Main St, Springfield, IL 62701', 'listing_price': 300000, 'days_on_market': 45}
+    market_data = {'supply_demand': {'market_type': 'buyer'}, 'market_metrics': {'days_on_market': 30}}
+    valuation_data = {'valuation': {'final_value': 290000}}
+
+    result = NegotiationStrategist().generate_strategies(property_data, market_data, valuation_data)
+
+    assert result['success'], result.get('error_message')
+    curve = result['offer_curve']
+    assert curve['offer_prices'][0] == 300000
+    assert curve['optimal_offer']['offer_price'] < 300000
+    first = result['recommended_strategies'][0]
+    assert 0.1 <= first['expected_success_probability'] <= 0.95
+    assert isinstance(first['expected_success_probability'], float)
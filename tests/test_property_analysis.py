@@ -0,0 +1,381 @@
+"""
+Tests for the property analysis module.
+"""
+
+import io
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+import property_analysis
+from geocoding import GeocodeCache
+from market_context import MarketContextCache
+from negotiation_strategist import SellerMotivationAnalyzer
+from property_analysis import BatchPropertyAnalyzer, PropertyAnalyzer
+from seeding import analysis_seed
+
+
+class StubAnalyzer:
+    """Minimal stand-in for PropertyAnalyzer with controllable latency."""
+
+    def __init__(self, delays=None, failures=()):
+        self.delays = delays or {}
+        self.failures = set(failures)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def analyze_property(self, address, location_data=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(address, 0.01))
+            if address in self.failures:
+                raise ValueError(f"Invalid address format: {address}")
+            return {'address': address}, {'zip': address[-5:]}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def generate_valuation(self, property_data, market_data):
+        return {'valuation': {'final_value': 100000}}
+
+
+@pytest.fixture
+def offline_analyzer(monkeypatch):
+    """Create a PropertyAnalyzer that geocodes without network access."""
+    def fake_geocode(self, address):
+        return {
+            'success': True,
+            'coordinates': {'latitude': 39.78, 'longitude': -89.65},
+            'formatted_address': address,
+            'components': {'zip_code': address[-5:], 'city': 'Springfield', 'state_code': 'IL'}
+        }
+
+    monkeypatch.setattr(property_analysis.AddressProcessor, 'geocode_address', fake_geocode)
+    return PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'))
+
+
+@pytest.fixture
+def mock_geocoder_analyzer():
+    """Create a PropertyAnalyzer with an in-memory cache and a mocked geocoder."""
+    analyzer = PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'))
+    analyzer.address_processor.geocoder = Mock()
+    analyzer.address_processor.geocoder.geocode.side_effect = lambda address, exactly_one: Mock(
+        latitude=39.78,
+        longitude=-89.65,
+        address=address,
+        raw={'address_components': [{'types': ['postal_code'], 'long_name': address[-5:]}]}
+    )
+    return analyzer
+
+
+@pytest.fixture
+def addresses():
+    """Create a batch of test addresses."""
+    return [f"{100 + i} Main St, Springfield, IL 6270{i % 10}" for i in range(20)]
+
+
+def test_process_batch_preserves_input_order(addresses):
+    """Test that results come back in input order regardless of completion order."""
+    delays = {address: 0.05 if i % 3 == 0 else 0.001 for i, address in enumerate(addresses)}
+    batch = BatchPropertyAnalyzer(StubAnalyzer(delays=delays), max_workers=4)
+
+    results = batch.process_batch(addresses)
+
+    assert [r['address'] for r in results] == addresses
+    assert all(r['success'] for r in results)
+
+
+def test_batch_concurrency_is_bounded(addresses):
+    """Test that no more than max_workers addresses run at once."""
+    stub = StubAnalyzer()
+    batch = BatchPropertyAnalyzer(stub, max_workers=3)
+
+    batch.process_batch(addresses)
+
+    assert 1 < stub.max_active <= 3
+
+
+def test_batch_failure_isolation(addresses):
+    """Test that a failing address yields an error result without affecting others."""
+    batch = BatchPropertyAnalyzer(StubAnalyzer(failures=[addresses[2]]), max_workers=4)
+
+    results = batch.process_batch(addresses)
+
+    assert results[2] == {
+        'success': False,
+        'address': addresses[2],
+        'error': f"Invalid address format: {addresses[2]}"
+    }
+    assert sum(r['success'] for r in results) == len(addresses) - 1
+
+
+def test_batch_address_timeout(addresses):
+    """Test that a slow address is reported as timed out."""
+    batch = BatchPropertyAnalyzer(
+        StubAnalyzer(delays={addresses[0]: 1.0}),
+        max_workers=2,
+        address_timeout=0.2
+    )
+
+    results = list(batch.iter_batch(addresses[:4]))
+
+    assert not results[0]['success']
+    assert 'timed out' in results[0]['error']
+    assert all(r['success'] for r in results[1:])
+
+
+def test_batch_timeout_with_all_workers_blocked(addresses):
+    """Test that queued addresses time out when every worker is stuck."""
+    release = threading.Event()
+    blocked = set(addresses[:2])
+
+    class BlockingAnalyzer(StubAnalyzer):
+        def analyze_property(self, address, location_data=None):
+            if address in blocked:
+                release.wait(10)
+            return super().analyze_property(address, location_data)
+
+    batch = BatchPropertyAnalyzer(BlockingAnalyzer(), max_workers=2, address_timeout=0.2)
+    started = time.monotonic()
+    try:
+        results = list(batch.iter_batch(addresses[:4]))
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 2
+    assert [r['address'] for r in results] == addresses[:4]
+    assert not any(r['success'] for r in results)
+    assert all('waiting for a free worker' in r['error'] for r in results[2:])
+
+
+def test_iter_batch_streams_lazily():
+    """Test that the generator does not consume the whole input up front."""
+    consumed = []
+
+    def address_source():
+        for i in range(1000):
+            consumed.append(i)
+            yield f"{i} Oak Ave, Springfield, IL 62701"
+
+    batch = BatchPropertyAnalyzer(StubAnalyzer(), max_workers=2)
+    stream = batch.iter_batch(address_source())
+    first = next(stream)
+    stream.close()
+
+    assert first['success']
+    assert len(consumed) <= 2 * 2 + 1
+
+
+@pytest.mark.slow
+def test_process_execution_mode(offline_analyzer, addresses):
+    """Test that process mode runs CPU stages in workers and keeps order and isolation."""
+    batch_addresses = addresses[:6] + ['not an address'] + addresses[6:9]
+    batch = BatchPropertyAnalyzer(
+        offline_analyzer,
+        execution_mode='process',
+        cpu_workers=2,
+        chunk_size=3,
+        include_negotiation=True
+    )
+
+    results = batch.process_batch(batch_addresses)
+
+    assert [r['address'] for r in results] == batch_addresses
+    assert not results[6]['success']
+    successes = [r for r in results if r['success']]
+    assert len(successes) == len(batch_addresses) - 1
+    for result in successes:
+        assert set(result['valuation']) == {'valuation', 'investment_metrics', 'renovation_analysis', 'cma_results'}
+        assert result['negotiation']['success']
+
+    # Stages are seeded per address, so workers reproduce the in-process results
+    thread_results = BatchPropertyAnalyzer(offline_analyzer).process_batch(batch_addresses)
+    for result, expected in zip(results, thread_results):
+        assert result.get('valuation') == expected.get('valuation')
+
+
+@pytest.mark.slow
+def test_process_mode_uses_parent_configuration(monkeypatch, addresses):
+    """Test that process workers use the batch analyzer's comparables store."""
+    import pandas as pd
+    from comparables import ComparablesStore
+
+    rng = np.random.default_rng(3)
+    n = 5000
+    store = ComparablesStore(pd.DataFrame({
+        'address': [f"{i} Elm St" for i in range(n)],
+        'latitude': rng.uniform(39.77, 39.79, n),
+        'longitude': rng.uniform(-89.66, -89.64, n),
+        'sale_price': rng.uniform(150000, 450000, n).round(),
+        'sale_date': pd.Timestamp.today().normalize() - pd.to_timedelta(rng.integers(0, 90, n), unit='D'),
+        'bedrooms': rng.integers(1, 6, n),
+        'bathrooms': rng.integers(1, 4, n),
+        'square_feet': rng.integers(800, 4000, n),
+        'year_built': rng.integers(1940, 2020, n)
+    }))
+    monkeypatch.setattr(property_analysis.AddressProcessor, 'geocode_address', lambda self, address: {
+        'success': True,
+        'coordinates': {'latitude': 39.78, 'longitude': -89.65},
+        'formatted_address': address,
+        'components': {'zip_code': address[-5:], 'city': 'Springfield', 'state_code': 'IL'}
+    })
+    analyzer = PropertyAnalyzer(
+        geocode_cache=GeocodeCache(path=':memory:'),
+        comparables_store=store,
+        market_cache=MarketContextCache(ttl=60, max_entries=5)
+    )
+
+    thread_results = BatchPropertyAnalyzer(analyzer).process_batch(addresses[:4])
+    process_results = BatchPropertyAnalyzer(
+        analyzer, execution_mode='process', cpu_workers=2, chunk_size=2
+    ).process_batch(addresses[:4])
+
+    for result, expected in zip(process_results, thread_results):
+        assert result['valuation']['cma_results']['data_source'] == 'recorded_sales'
+        assert result['valuation'] == expected['valuation']
+
+
+def test_invalid_execution_mode():
+    """Test that an unknown execution mode is rejected."""
+    with pytest.raises(ValueError):
+        BatchPropertyAnalyzer(StubAnalyzer(), execution_mode='gpu')
+
+
+def test_batch_geocoding_deduplicates(mock_geocoder_analyzer):
+    """Test that repeated addresses and units of one building share a geocoder call."""
+    processor = mock_geocoder_analyzer.address_processor
+    processor.geocode_address("5 Cached Rd, Springfield, IL 62703")
+    processor.geocoder.geocode.reset_mock()
+    batch_addresses = [
+        "10 Main St, Springfield, IL 62701",
+        "10 Main Street, Springfield, IL 62701",
+        "20 Oak Ave Apt 1, Springfield, IL 62702",
+        "20 Oak Ave Apt 2, Springfield, IL 62702",
+        "20 Oak Ave #3, Springfield, IL 62702",
+        "5 Cached Rd, Springfield, IL 62703",
+        "not an address"
+    ]
+    batch = BatchPropertyAnalyzer(mock_geocoder_analyzer, max_workers=4)
+
+    locations, report = batch.geocode_batch(batch_addresses)
+
+    assert processor.geocoder.geocode.call_count == 2
+    assert report == {
+        'rows': 7,
+        'unique_addresses': 5,
+        'unique_buildings': 3,
+        'cache_hits': 1,
+        'geocoder_calls': 2,
+        'calls_avoided': 4
+    }
+    assert locations[0] is locations[1]
+    assert locations[2] is locations[3] is locations[4]
+    assert locations[6] is None
+    # Units are cached individually, so a later single lookup is free
+    processor.geocode_address("20 Oak Ave Apt 2, Springfield, IL 62702")
+    assert processor.geocoder.geocode.call_count == 2
+
+
+def test_batch_uses_geocoding_stage(mock_geocoder_analyzer):
+    """Test that batch analysis fans stage locations out to rows instead of re-geocoding."""
+    batch_addresses = ["10 Main St, Springfield, IL 62701"] * 3 + ["not an address"]
+    batch = BatchPropertyAnalyzer(mock_geocoder_analyzer, max_workers=2)
+
+    results = batch.process_batch(batch_addresses)
+
+    assert [r['success'] for r in results] == [True, True, True, False]
+    assert mock_geocoder_analyzer.address_processor.geocoder.geocode.call_count == 1
+    assert batch.geocode_report['calls_avoided'] == 2
+
+
+def test_analysis_is_deterministic(offline_analyzer):
+    """Test that an address always gets the same analysis for a data version."""
+    address = "123 Main St, Springfield, IL 62701"
+
+    def analyze(analyzer):
+        property_data, market_data = analyzer.analyze_property(address)
+        return property_data, market_data, analyzer.generate_valuation(property_data, market_data)
+
+    first = analyze(offline_analyzer)
+
+    assert analyze(offline_analyzer) == first
+    assert analyze(PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'))) == first
+    assert analyze(PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'), data_version='2')) != first
+
+
+def test_analysis_seed_uses_canonical_address():
+    """Test that address spellings share a seed while stages and versions do not."""
+    seed = analysis_seed("123 Main Street, Springfield, IL 62701-1234", 'market')
+
+    assert seed == analysis_seed("123 main st,  springfield, il 62701", 'market')
+    assert seed != analysis_seed("123 Main St, Springfield, IL 62701", 'property')
+    assert seed != analysis_seed("123 Main St, Springfield, IL 62701", 'market', data_version='2')
+
+
+def test_seller_motivation_is_deterministic():
+    """Test that estimated price history is seeded from the address."""
+    property_data = {'address': "123 Main St, Springfield, IL 62701", 'listing_price': 300000, 'days_on_market': 90}
+    market_data = {'market_metrics': {'days_on_market': 30}, 'supply_demand': {'market_type': 'buyer'}}
+
+    results = [SellerMotivationAnalyzer().analyze_motivation(property_data, market_data) for _ in range(3)]
+
+    assert results[0] == results[1] == results[2]
+
+
+def test_write_jsonl_streams_results(addresses):
+    """Test that each result is one flushed JSON line followed by a summary record."""
+    class RecordingSink(io.StringIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+            super().flush()
+
+    sink = RecordingSink()
+    batch = BatchPropertyAnalyzer(StubAnalyzer(failures={addresses[2]}), max_workers=4)
+
+    summary = batch.write_jsonl(addresses[:5], sink)
+
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [r['address'] for r in records[:-1]] == addresses[:5]
+    assert records[-1] == summary
+    assert (summary['record_type'], summary['rows'], summary['failed']) == ('summary', 5, 1)
+    assert sink.flushes >= 6
+
+
+def test_write_jsonl_to_path(offline_analyzer, addresses, tmp_path):
+    """Test that full analyses, including NumPy values, serialize to a file."""
+    path = tmp_path / 'results.jsonl'
+
+    BatchPropertyAnalyzer(offline_analyzer).write_jsonl(iter(addresses[:3]), path)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(records) == 4
+    assert all(r['success'] for r in records[:3])
+    assert isinstance(records[0]['property']['hoa_fee'], int)
+
+
+def test_stage_timings_are_optional(offline_analyzer):
+    """Test that stage timings are attached only when stage timing is enabled."""
+    address = "123 Main St, Springfield, IL 62701"
+    property_data, market_data = offline_analyzer.analyze_property(address)
+    assert 'stage_timings' not in property_data
+    assert 'stage_timings' not in offline_analyzer.generate_valuation(property_data, market_data)
+
+    offline_analyzer.stage_timing = True
+    property_data, market_data = offline_analyzer.analyze_property(address)
+    valuation = offline_analyzer.generate_valuation(property_data, market_data)
+
+    assert set(valuation['stage_timings']) == {
+        'address', 'geocode', 'property_data', 'market',
+        'valuation_data', 'market_context', 'investment', 'renovation', 'cma'
+    }
+    assert all(timing['wall_seconds'] >= 0 and timing['cpu_seconds'] >= 0
+               for timing in valuation['stage_timings'].values())
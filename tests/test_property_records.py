@@ -0,0 +1,92 @@
+"""
+Tests for the compact property record and columnar property frame.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from geocoding import GeocodeCache
+from property_analysis import PropertyAnalyzer
+from property_records import MISSING, PropertyFrame, PropertyRecord
+
+
+@pytest.fixture(scope='module')
+def analyses():
+    """Analyze a few properties offline."""
+    analyzer = PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'))
+    results = []
+    for i in range(4):
+        location = {
+            'success': True,
+            'coordinates': {'latitude': 39.78, 'longitude': -89.65},
+            'components': {'zip_code': f'6270{i}', 'city': 'Springfield', 'state_code': 'IL'}
+        }
+        property_data, market_data = analyzer.analyze_property(f"{100 + i} Main St, Springfield, IL 6270{i}", location)
+        results.append((property_data, analyzer.generate_valuation(property_data, market_data)['valuation']))
+    return results
+
+
+def test_record_round_trip(analyses):
+    """Test that property and valuation dicts survive conversion, key order included."""
+    for property_data, valuation in analyses:
+        record = PropertyRecord.from_dicts(property_data, valuation)
+
+        assert record.property_dict() == property_data
+        assert list(record.property_dict()) == list(property_data)
+        assert record.valuation_dict() == valuation
+        assert record.final_value == valuation['final_value']
+        assert isinstance(record.hoa_fee, int)
+
+
+def test_record_keeps_unexpected_values():
+    """Test that absent fields, None and values of another type are preserved."""
+    data = {'address': '1 Main St', 'bedrooms': None, 'bathrooms': 2, 'square_feet': 1500.5, 'custom': [1]}
+
+    record = PropertyRecord.from_dicts(data)
+
+    assert record.property_dict() == data
+    assert record.year_built is MISSING
+    assert record.get('year_built', 1970) == 1970
+    assert record.get('square_feet') == 1500.5
+    assert record.valuation_dict() is None
+
+
+def test_record_pickles_compactly(analyses):
+    """Test that records pickle smaller than the dicts they replace."""
+    subset = {key: analyses[0][0][key] for key in ('address', 'bedrooms', 'bathrooms', 'square_feet', 'year_built')}
+    record = PropertyRecord.from_dicts(subset)
+
+    restored = pickle.loads(pickle.dumps(record))
+
+    assert restored == record
+    assert restored.property_dict() == subset
+    assert len(pickle.dumps([record] * 100)) < len(pickle.dumps([dict(subset) for _ in range(100)]))
+
+
+def test_frame_round_trip(analyses):
+    """Test that a frame converts back to the original dicts."""
+    properties = [property_data for property_data, _ in analyses] + [{'address': '9 Elm St'}]
+    valuations = [valuation for _, valuation in analyses] + [None]
+
+    frame = PropertyFrame.from_dicts(properties, valuations)
+
+    assert len(frame) == 5
+    assert frame.property_dicts() == properties
+    assert frame.valuation_dicts() == valuations
+    assert frame[0] == PropertyRecord.from_dicts(properties[0], valuations[0])
+
+
+def test_frame_columns(analyses):
+    """Test the columnar views of core fields."""
+    properties = [property_data for property_data, _ in analyses]
+    frame = PropertyFrame.from_dicts(properties + [{'address': '9 Elm St'}])
+
+    values = frame.column('estimated_value')
+    assert np.isnan(values[-1])
+    np.testing.assert_array_equal(values[:-1], [p['estimated_value'] for p in properties])
+    assert list(frame.column('property_type')[:-1]) == [p['property_type'] for p in properties]
+    assert frame.column('property_type')[-1] is None
+    assert frame.present('address').all()
+    assert len(frame.to_frame()) == 5
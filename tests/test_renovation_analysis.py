@@ -0,0 +1,86 @@
+"""
+Tests for the vectorized renovation analysis engine.
+"""
+
+import numpy as np
+import pytest
+
+from geocoding import GeocodeCache
+from property_analysis import PropertyAnalyzer
+from renovation_analysis import CONDITIONS, PROJECT_NAMES, compute_renovation_analysis
+
+
+@pytest.fixture
+def batch():
+    """Create a portfolio spanning every age band."""
+    rng = np.random.default_rng(3)
+    n = 5000
+    year_builts = rng.integers(1900, 2023, n).astype(float)
+    year_builts[:10] = np.nan
+    return {
+        'property_values': rng.uniform(100000, 900000, n),
+        'square_feet': rng.uniform(600, 4000, n),
+        'year_builts': year_builts
+    }
+
+
+def test_single_property_view_matches_batch():
+    """Test that the analyzer's renovation analysis is row 0 of the engine."""
+    analyzer = PropertyAnalyzer(geocode_cache=GeocodeCache(path=':memory:'))
+    property_data = {'square_feet': 1800, 'year_built': 1985, 'property_type': 'Single Family'}
+
+    result = analyzer._generate_renovation_analysis({'final_value': 300000}, property_data, np.random.default_rng(5))
+    expected = compute_renovation_analysis([300000], [1800], [1985], seed=5).to_dict(0)
+
+    assert result == expected
+    assert set(result) == {
+        'property_condition', 'renovation_potential', 'potential_value_increase', 'after_renovation_value',
+        'estimated_renovation_cost', 'renovation_roi', 'renovation_recommendations', 'renovation_projects'
+    }
+
+
+def test_conditions_follow_age_bands(batch):
+    """Test that conditions, costs and projects respect the lookup tables."""
+    analysis = compute_renovation_analysis(**batch, seed=11)
+    conditions = analysis.conditions
+    age = analysis['age']
+
+    assert set(conditions[age < 5]) <= {'Excellent', 'Very Good'}
+    assert set(conditions[(age >= 15) & (age < 30)]) <= {'Good', 'Fair'}
+    assert set(conditions[age >= 30]) <= {'Fair', 'Poor'}
+    # Older homes are mostly Poor
+    assert np.mean(conditions[age >= 50] == 'Poor') == pytest.approx(0.7, abs=0.05)
+
+    poor = conditions == 'Poor'
+    assert np.all((analysis['cost_per_sqft'][poor] >= 80) & (analysis['cost_per_sqft'][poor] < 150))
+    kitchen = analysis['project_included'][:, PROJECT_NAMES.index('Kitchen Renovation')]
+    assert np.array_equal(kitchen, np.isin(conditions, ['Good', 'Fair', 'Poor']))
+
+
+def test_rows_and_project_table(batch):
+    """Test that rows, the flat frame and the project table agree."""
+    analysis = compute_renovation_analysis(**batch, seed=11)
+    again = compute_renovation_analysis(**batch, seed=11)
+    frame = analysis.to_frame()
+    table = analysis.project_table()
+
+    assert len(frame) == len(analysis) == len(batch['property_values'])
+    assert set(frame['property_condition']) <= set(CONDITIONS)
+    assert len(table) == analysis['project_included'].sum()
+
+    for index in (0, 1, 2500):
+        row = analysis.to_dict(index)
+        assert row == again.to_dict(index)
+        assert [project['project'] for project in row['renovation_projects']] == \
+            table.loc[table['property_index'] == index, 'project'].tolist()
+        assert row['after_renovation_value'] == int(batch['property_values'][index]
+                                                    + analysis['potential_value_increase'][index])
+
+
+def test_zero_square_feet():
+    """Test that properties without a living area have no costs or returns."""
+    row = compute_renovation_analysis([250000], [np.nan], [1950], seed=0).to_dict(0)
+
+    assert row['estimated_renovation_cost'] == 0
+    assert row['renovation_roi'] == 0
+    assert all(project['cost'] == 0 and project['roi'] == 0 for project in row['renovation_projects'])
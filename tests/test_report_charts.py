@@ -0,0 +1,121 @@
+"""
+Tests for parallel report chart rendering.
+"""
+
+import base64
+import os
+
+import pytest
+
+from report_charts import REPORT_CHARTS, ChartCache, ChartRenderer, render_report_charts
+from report_generator import ReportGenerator
+
+
+def make_report_data(index):
+    """Create deterministic chart inputs for one report."""
+    dates = [f'2023-{month:02d}' for month in range(1, 13)]
+    return {
+        'property': {
+            'address': f'{index} Main St, Springfield, IL 62701',
+            'listing_price': 310000,
+            'square_feet': 1800,
+            'lot_size': 6000
+        },
+        'valuation': {
+            'valuation': {
+                'final_value': 300000 + 1000 * index,
+                'listing_price': 310000,
+                'sources': [{'source': 'Comparables', 'value': 298000, 'confidence': 80}],
+                'comparables': [{'address': '1 Elm St', 'sale_price': 295000, 'price_per_sqft': 180}]
+            },
+            'investment_metrics': {
+                'rental_analysis': {'cap_rate': 5.5},
+                'financing_scenarios': {'twenty_percent_down': {'cash_on_cash_return': 4.0, 'monthly_cash_flow': 120}}
+            }
+        },
+        'market': {
+            'supply_demand': {'market_type': 'balanced', 'inventory_level': 'normal'},
+            'market_metrics': {'days_on_market': 30},
+            'historical_trends': {'dates': dates, 'inventory': list(range(30, 42)), 'days_on_market': list(range(20, 32))},
+            'price_trends': {'dates': dates, 'median_price': [300000 + 1000 * month for month in range(12)]}
+        },
+        'negotiation': {
+            'seller_motivation': {'level': 'Moderate', 'score': 55, 'days_on_market': 40, 'factors': []},
+            'buyer_leverage': {'level': 'Moderate', 'score': 50, 'points': []},
+            'recommended_strategies': [
+                {'name': 'Below-Market Offer', 'type': 'price', 'score': 80, 'expected_success_probability': 0.6,
+                 'description': 'Offer below the listing price', 'justification': [],
+                 'roi_impact': {'purchase_price_impact': -5.0, 'cash_on_cash_impact': 1.2, 'total_savings': 15000}}
+            ],
+            'negotiation_script': {'opening_statement': 'Hello', 'key_points': [], 'closing_statement': 'Thanks'},
+            'fallback_options': []
+        }
+    }
+
+
+@pytest.fixture
+def batch():
+    """Create chart inputs for three reports."""
+    return [make_report_data(i) for i in range(3)]
+
+
+def test_worker_pool_matches_in_process(batch):
+    """Test that charts drawn by worker processes equal charts drawn in-process."""
+    serial = [{name: chart.result() for name, chart in charts.items()}
+              for charts in render_report_charts(batch, workers=1, cache=ChartCache(max_entries=0))]
+    pooled = [{name: chart.result() for name, chart in charts.items()}
+              for charts in render_report_charts(batch, workers=2, cache=ChartCache(max_entries=0))]
+
+    assert pooled == serial
+    assert [set(charts) for charts in serial] == [{name for name, _, _, _ in REPORT_CHARTS}] * 3
+    assert base64.b64decode(serial[0]['valuation_chart'])[:4] == b'\x89PNG'
+
+
+def test_mock_market_data_charts():
+    """Test that market charts fall back to mock data when trends are missing."""
+    renderer = ChartRenderer()
+
+    assert renderer._generate_market_trends_chart({})
+    assert renderer._generate_price_trends_chart({})
+
+
+def test_failing_chart_fails_only_its_report(batch, tmp_path):
+    """Test that a chart error fails its own report and not the rest of the batch."""
+    batch[1]['valuation']['valuation']['sources'] = ['not a source']
+    generator = ReportGenerator(template_dir=str(tmp_path / 'templates'), chart_workers=1, chart_cache=ChartCache())
+
+    results = generator.generate_batch_reports(batch, output_dir=str(tmp_path / 'reports'))
+
+    assert (results['successful'], results['failed']) == (2, 1)
+    assert not results['reports'][1]['success']
+    assert os.path.exists(results['reports'][0]['main_report_path'].replace('.pdf', '.html'))
+
+
+def test_shared_charts_are_drawn_once(batch):
+    """Test that charts with the same inputs are drawn once and reused."""
+    cache = ChartCache()
+
+    first = [{name: chart.result() for name, chart in charts.items()}
+             for charts in render_report_charts(batch, workers=1, cache=cache)]
+    # Each property has its own valuation; market and negotiation inputs are shared
+    assert (cache.misses, cache.hits, len(cache)) == (9, 6, 9)
+
+    second = [{name: chart.result() for name, chart in charts.items()}
+              for charts in render_report_charts(batch, workers=1, cache=cache)]
+    assert second == first
+    assert (cache.misses, cache.hits) == (9, 21)
+
+
+def test_cache_skips_mock_and_failed_charts(batch):
+    """Test that mock-data charts and charts that failed to draw are not cached."""
+    cache = ChartCache(max_entries=4)
+    batch[0]['market'] = {}
+    batch[0]['valuation']['valuation']['sources'] = ['not a source']
+
+    charts = next(render_report_charts(batch[:1], workers=1, cache=cache))
+
+    with pytest.raises(AttributeError):
+        charts['valuation_chart'].result()
+    assert charts['market_trends_chart'].result()
+    # Only the comparables and strategy charts are kept
+    assert len(cache) == 2
@@ -0,0 +1,57 @@
+"""
+Tests for analysis stage timing.
+"""
+
+import time
+
+import pytest
+
+from stage_timing import DISABLED_TIMER, StageTimer, create_stage_timer
+
+
+def test_timer_records_wall_and_cpu_time():
+    """Test that a stage records wall time even when it does not use the CPU."""
+    timer = StageTimer(export=False)
+    with timer.stage('sleep'):
+        time.sleep(0.02)
+    with timer.stage('spin'):
+        sum(range(200000))
+
+    assert timer.timings['sleep']['wall_seconds'] >= 0.02
+    assert timer.timings['sleep']['cpu_seconds'] < timer.timings['sleep']['wall_seconds']
+    assert timer.timings['spin']['cpu_seconds'] > 0
+
+
+def test_timer_records_failed_stage():
+    """Test that a stage raising an exception is still timed."""
+    timer = StageTimer(export=False)
+    with pytest.raises(ValueError):
+        with timer.stage('geocode'):
+            raise ValueError('no match')
+
+    assert 'geocode' in timer.timings
+
+
+def test_disabled_timer_records_nothing():
+    """Test that the disabled timer is shared and keeps no timings."""
+    timer = create_stage_timer(False)
+    with timer.stage('geocode'):
+        pass
+
+    assert timer is DISABLED_TIMER
+    assert timer.timings is None
+    assert isinstance(create_stage_timer(True), StageTimer)
+
+
+def test_timings_are_exported_to_prometheus():
+    """Test that exported timings are observed in the stage histogram."""
+    prometheus_client = pytest.importorskip('prometheus_client')
+
+    timer = StageTimer(export=True)
+    with timer.stage('cma'):
+        pass
+
+    count = prometheus_client.REGISTRY.get_sample_value(
+        'analysis_stage_seconds_count', {'stage': 'cma', 'clock': 'wall'}
+    )
+    assert count >= 1
@@ -0,0 +1,91 @@
+"""
+Tests for the start-up cost of the analysis entry points.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('pandas', 'matplotlib', 'seaborn', 'pdfkit', 'geopy')
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the heavy modules it loaded."""
+    check = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, '-c', check], cwd=REPO_ROOT, capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+    return [module for module in completed.stdout.strip().split(',') if module]
+
+
+def load_benchmark():
+    """Import scripts/startup_benchmark.py."""
+    sys.path.insert(0, os.path.join(REPO_ROOT, 'scripts'))
+    try:
+        import startup_benchmark
+    finally:
+        sys.path.pop(0)
+    return startup_benchmark
+
+
+@pytest.mark.parametrize('module', ['property_analysis', 'report_generator', 'user_interface'])
+def test_import_defers_heavy_dependencies(module):
+    """Test that importing an analysis module loads no heavy dependency."""
+    assert loaded_modules(f"import {module}") == []
+
+
+def test_charts_load_matplotlib_on_first_use():
+    """Test that drawing a chart loads matplotlib with the Agg backend."""
+    code = (
+        "import report_generator\n"
+        "plt = report_generator._load_pyplot()\n"
+        "assert plt.get_backend().lower() == 'agg'"
+    )
+    assert 'matplotlib' in loaded_modules(code)
+
+
+@pytest.mark.slow
+def test_cli_help_is_within_budget():
+    """Test that `cli.py --help` starts within its start-up budget."""
+    startup_benchmark = load_benchmark()
+
+    result = startup_benchmark.measure(
+        next(entry for entry in startup_benchmark.ENTRY_POINTS if entry.name == 'cli')
+    )
+    assert result['success'], result.get('error')
+    assert result['within_budget'], result
+
+
+@pytest.mark.parametrize('name', [
+    'cli',
+    pytest.param('wsgi', marks=pytest.mark.xfail(
+        reason="wsgi imports app from app.py, which the app/ package shadows", strict=True
+    )),
+    'backend_main',
+    'property_analysis',
+    'report_generator',
+    'user_interface'
+])
+def test_entry_point_imports(name):
+    """Test that every benchmarked entry point starts, whatever its time."""
+    if name == 'backend_main':
+        for module in ('fastapi', 'sqlalchemy', 'pydantic_settings'):
+            pytest.importorskip(module)
+    startup_benchmark = load_benchmark()
+
+    result = startup_benchmark.measure(
+        next(entry for entry in startup_benchmark.ENTRY_POINTS if entry.name == name), runs=1
+    )
+    assert result['success'], result.get('traceback')
+
+
+def test_benchmark_reports_import_failure(capsys, monkeypatch):
+    """Test that an entry point that cannot import fails the benchmark on stderr."""
+    startup_benchmark = load_benchmark()
+    broken = startup_benchmark.EntryPoint('broken', ('-c', 'import no_such_module'), REPO_ROOT, 10.0)
+    monkeypatch.setattr(startup_benchmark, 'ENTRY_POINTS', (broken,))
+
+    assert startup_benchmark.main(['--json', '--runs', '1']) == 1
+    assert "entry point 'broken' failed to start" in capsys.readouterr().err
@@ -10,23 +10,50 @@ import json
 import time
 from typing import Dict, Any, List, Optional
 from flask import Flask, request, render_template, jsonify, send_file, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
-import pandas as pd
 import threading
+from itertools import islice
 
 # Import application modules
-from property_analysis import PropertyAnalyzer, BatchPropertyAnalyzer
+from property_analysis import BatchPropertyAnalyzer, BATCH_CHUNK_SIZE
+from analysis_graph import AnalysisGraph
+from batch_checkpoint import JsonlResultWriter, json_default
+from financing_grid import (
+    build_financing_grid,
+    DEFAULT_DOWN_PAYMENT_PERCENTS,
+    DEFAULT_INTEREST_RATES,
+    DEFAULT_LOAN_TERMS,
+    MAX_SCHEDULE_SCENARIOS
+)
 from negotiation_strategist import NegotiationStrategist
+from negotiation_scripts import render_script
 from report_generator import ReportGenerator, BatchReportGenerator
 
 # Initialize Flask application
 app = Flask(__name__, static_folder='static', template_folder='templates')
 
+class AnalysisJSONProvider(DefaultJSONProvider):
+    """JSON provider that also serializes the NumPy values in analysis results"""
+    
+    @staticmethod
+    def default(o):
+        try:
+            return json_default(o)
+        except TypeError:
+            return DefaultJSONProvider.default(o)
+
+app.json = AnalysisJSONProvider(app)
+
 # Configure upload folder
 UPLOAD_FOLDER = 'uploads'
 REPORT_FOLDER = 'reports'
+BATCH_JOB_FOLDER = 'batch_jobs'
 ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
 
+# Strategies ranked and stored per property in batch jobs (reports chart the top 5)
+BATCH_STRATEGY_TOP_K = int(os.getenv("BATCH_STRATEGY_TOP_K", "5"))
+
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['REPORT_FOLDER'] = REPORT_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
@@ -34,6 +61,7 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
 # Create necessary directories
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(REPORT_FOLDER, exist_ok=True)
+os.makedirs(BATCH_JOB_FOLDER, exist_ok=True)
 os.makedirs('templates', exist_ok=True)
 os.makedirs('static', exist_ok=True)
 os.makedirs('static/css', exist_ok=True)
@@ -43,6 +71,18 @@ os.makedirs('static/img', exist_ok=True)
 # Create background job tracking
 background_jobs = {}
 
+# Shared analysis graph, so repeat analyses of a property only rerun changed stages
+analysis_graph = None
+analysis_graph_lock = threading.Lock()
+
+def get_analysis_graph():
+    """Returns the shared analysis graph, creating it on first use"""
+    global analysis_graph
+    with analysis_graph_lock:
+        if analysis_graph is None:
+            analysis_graph = AnalysisGraph()
+        return analysis_graph
+
 # Create HTML templates
 def create_templates():
     """Create HTML templates for the application"""
@@ -443,6 +483,13 @@ def create_templates():
                                 </div>
                             </div>
                         </div>
+                        <div class="card mb-3">
+                            <div class="card-body">
+                                <h5 class="card-title">Offer Price Curve</h5>
+                                <p><strong>Expected-Value Optimal Offer:</strong> <span id="optimalOffer"></span></p>
+                                <canvas id="offerCurveChart"></canvas>
+                            </div>
+                        </div>
                         <div class="card mb-3">
                             <div class="card-body">
                                 <h5 class="card-title">Recommended Strategies</h5>
@@ -840,6 +887,68 @@ document.addEventListener('DOMContentLoaded', function() {
             li.innerHTML = `<strong>${option.name}:</strong> ${option.description}`;
             fallbackOptions.appendChild(li);
         });
+        
+        // Offer price curve
+        const offerCurve = data.negotiation.offer_curve;
+        if (offerCurve) {
+            const optimal = offerCurve.optimal_offer;
+            document.getElementById('optimalOffer').textContent =
+                `$${formatNumber(optimal.offer_price)} (${optimal.discount_percentage}% below listing, ` +
+                `${Math.round(optimal.success_probability * 100)}% success probability, ` +
+                `$${formatNumber(optimal.expected_savings)} expected savings)`;
+            
+            const offerCurveCtx = document.getElementById('offerCurveChart').getContext('2d');
+            new Chart(offerCurveCtx, {
+                type: 'line',
+                data: {
+                    labels: offerCurve.discount_percentages.map(discount => discount + '%'),
+                    datasets: [
+                        {
+                            label: 'Expected Savings',
+                            data: offerCurve.expected_savings,
+                            borderColor: 'rgba(54, 162, 235, 1)',
+                            backgroundColor: 'rgba(54, 162, 235, 0.2)',
+                            pointRadius: 0,
+                            yAxisID: 'y'
+                        },
+                        {
+                            label: 'Success Probability',
+                            data: offerCurve.success_probabilities.map(probability => probability * 100),
+                            borderColor: 'rgba(255, 99, 132, 1)',
+                            backgroundColor: 'rgba(255, 99, 132, 0.2)',
+                            pointRadius: 0,
+                            stepped: true,
+                            yAxisID: 'y1'
+                        }
+                    ]
+                },
+                options: {
+                    scales: {
+                        y: {
+                            position: 'left',
+                            ticks: {
+                                callback: function(value) {
+                                    return '$' + formatNumber(value);
+                                }
+                            }
+                        },
+                        y1: {
+                            position: 'right',
+                            min: 0,
+                            max: 100,
+                            ticks: {
+                                callback: function(value) {
+                                    return value + '%';
+                                }
+                            },
+                            grid: {
+                                drawOnChartArea: false
+                            }
+                        }
+                    }
+                }
+            });
+        }
     }
     
     function addTableRow(table, label, value) {
@@ -1719,7 +1828,7 @@ def analyze_property():
     try:
         # Get form data
         address = request.form.get('address')
-        property_type = request.form.get('propertyType', 'Single Family')
+        property_type = request.form.get('propertyType')
         listing_price = request.form.get('listingPrice')
         bedrooms = request.form.get('bedrooms')
         bathrooms = request.form.get('bathrooms')
@@ -1740,19 +1849,18 @@ def analyze_property():
         if year_built:
             year_built = int(year_built)
         
-        # Create property analyzer
-        property_analyzer = PropertyAnalyzer()
-        
-        # Analyze property
-        property_data = property_analyzer.analyze_property(
-            address=address,
-            property_type=property_type,
-            listing_price=listing_price,
-            bedrooms=bedrooms,
-            bathrooms=bathrooms,
-            square_feet=square_feet,
-            year_built=year_built,
-            analysis_type=analysis_type
+        # Analyze property; user-supplied details override provider data, and
+        # only the stages affected by changed details are recomputed
+        property_data = get_analysis_graph().run(
+            address,
+            overrides={
+                'property_type': property_type or None,
+                'listing_price': listing_price or None,
+                'bedrooms': bedrooms or None,
+                'bathrooms': bathrooms or None,
+                'square_feet': square_feet or None,
+                'year_built': year_built or None
+            }
         )
         
         # Check if analysis was successful
@@ -1819,6 +1927,109 @@ def analyze_property():
             'error': f'Error analyzing property: {str(e)}'
         })
 
+@app.route('/financing-grid', methods=['POST'])
+def financing_grid():
+    """Evaluate every down payment x rate x term x points financing scenario"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        address = data.get('address')
+        property_value = data.get('property_value')
+        if not address and not property_value:
+            return jsonify({
+                'success': False,
+                'error': 'address or property_value is required'
+            })
+        
+        # Only pass the axes the caller supplied; the rest use grid defaults
+        axes = {
+            name: data[name]
+            for name in ('down_payment_percents', 'interest_rates', 'loan_terms', 'points')
+            if data.get(name)
+        }
+        
+        include_schedules = bool(data.get('include_schedules', False))
+        schedule_count = (len(axes.get('down_payment_percents', DEFAULT_DOWN_PAYMENT_PERCENTS)) *
+                          len(axes.get('interest_rates', DEFAULT_INTEREST_RATES)) *
+                          len(axes.get('loan_terms', DEFAULT_LOAN_TERMS)))
+        if include_schedules and schedule_count > MAX_SCHEDULE_SCENARIOS:
+            return jsonify({
+                'success': False,
+                'error': (f'Amortization schedules are limited to {MAX_SCHEDULE_SCENARIOS} '
+                          f'down payment x rate x term combinations ({schedule_count} requested)')
+            }), 400
+        
+        if address:
+            # Route through the analysis graph, so a financing-only change
+            # reuses the cached property, market and valuation stages
+            financing = dict(axes)
+            financing.update({
+                'purchase_price': float(property_value) if property_value else None,
+                'monthly_rent': data.get('monthly_rent'),
+                'include_schedules': include_schedules
+            })
+            analysis = get_analysis_graph().run(address, financing=financing)
+            if not analysis.get('success'):
+                return jsonify({
+                    'success': False,
+                    'error': f"Error evaluating financing grid: {analysis.get('error')}"
+                })
+            result = analysis['financing_grid']
+            result['stages'] = analysis['stages']
+        else:
+            grid = build_financing_grid(
+                property_value=float(property_value),
+                property_type=data.get('property_type', 'Single Family'),
+                market_type=data.get('market_type', 'balanced'),
+                annual_tax_amount=data.get('annual_tax_amount'),
+                monthly_rent=data.get('monthly_rent'),
+                **axes
+            )
+            result = grid.to_dict(include_schedules=include_schedules)
+        
+        result['success'] = True
+        return jsonify(result)
+        
+    except (TypeError, ValueError) as e:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid financing grid request: {str(e)}'
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error evaluating financing grid: {str(e)}'
+        })
+
+@app.route('/negotiation-script', methods=['POST'])
+def negotiation_script():
+    """Render the negotiation script for one strategy on request"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        strategy = data.get('strategy')
+        if strategy is not None and not isinstance(strategy, dict):
+            return jsonify({
+                'success': False,
+                'error': 'strategy must be an object'
+            })
+        
+        return jsonify({
+            'success': True,
+            'negotiation_script': render_script(strategy)
+        })
+        
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid strategy: {str(e)}'
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error rendering negotiation script: {str(e)}'
+        })
+
 @app.route('/analyze-batch', methods=['POST'])
 def analyze_batch():
     """Analyze a batch of properties"""
@@ -1859,6 +2070,14 @@ def analyze_batch():
         # Create job ID
         job_id = f'batch_{int(time.time())}'
         
+        # Store job in background jobs before the worker starts updating it
+        background_jobs[job_id] = {
+            'status': 'processing',
+            'progress': 0,
+            'file_path': file_path,
+            'start_time': time.time()
+        }
+        
         # Start background job
         thread = threading.Thread(
             target=process_batch_job,
@@ -1867,24 +2086,65 @@ def analyze_batch():
         thread.daemon = True
         thread.start()
         
-        # Store job in background jobs
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'message': 'Batch analysis started'
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error starting batch analysis: {str(e)}'
+        })
+
+@app.route('/resume-batch/<job_id>', methods=['POST'])
+def resume_batch(job_id):
+    """Resume an interrupted batch job from its last checkpoint"""
+    try:
+        if background_jobs.get(job_id, {}).get('status') == 'processing':
+            return jsonify({
+                'success': False,
+                'error': 'Job is still processing'
+            })
+        
+        metadata_path, _, _ = batch_job_paths(job_id)
+        if not os.path.exists(metadata_path):
+            return jsonify({
+                'success': False,
+                'error': 'Job not found'
+            })
+        
+        with open(metadata_path, 'r') as f:
+            job = json.load(f)
+        
+        # Start background job
         background_jobs[job_id] = {
             'status': 'processing',
             'progress': 0,
-            'file_path': file_path,
+            'file_path': job['file_path'],
             'start_time': time.time()
         }
         
+        thread = threading.Thread(
+            target=process_batch_job,
+            args=(job_id, job['file_path'], job['analysis_type'],
+                  job['generate_reports'], job['generate_summary']),
+            kwargs={'resume': True}
+        )
+        thread.daemon = True
+        thread.start()
+        
         return jsonify({
             'success': True,
             'job_id': job_id,
-            'message': 'Batch analysis started'
+            'message': 'Batch analysis resumed'
         })
         
     except Exception as e:
         return jsonify({
             'success': False,
-            'error': f'Error starting batch analysis: {str(e)}'
+            'error': f'Error resuming batch analysis: {str(e)}'
         })
 
 @app.route('/job-status/<job_id>')
@@ -1902,7 +2162,8 @@ def job_status(job_id):
         'status': job.get('status', 'unknown'),
         'progress': job.get('progress', 0),
         'results': job.get('results', None),
-        'error': job.get('error', None)
+        'error': job.get('error', None),
+        'resumable': job.get('resumable', False)
     })
 
 @app.route('/get-reports')
@@ -2012,8 +2273,21 @@ def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def process_batch_job(job_id, file_path, analysis_type, generate_reports, generate_summary):
-    """Process a batch job in the background"""
+def batch_job_paths(job_id):
+    """Return the metadata, results and checkpoint paths of a batch job"""
+    base = os.path.join(BATCH_JOB_FOLDER, secure_filename(job_id))
+    return f'{base}.json', f'{base}.jsonl', f'{base}.checkpoint'
+
+def process_batch_job(job_id, file_path, analysis_type, generate_reports, generate_summary, resume=False):
+    """
+    Process a batch job in the background
+    
+    Results are appended to the job's JSON Lines file with periodic
+    checkpoints, so a job that dies part way can be resumed (resume=True)
+    without analyzing its finished rows again. Each record keeps its uploaded
+    row under 'input'; only compact summary rows are held in memory for the
+    job status and the summary report.
+    """
     try:
         # Load properties from file
         properties = load_properties_from_file(file_path)
@@ -2025,83 +2299,65 @@ def process_batch_job(job_id, file_path, analysis_type, generate_reports, genera
             }
             return
         
-        # Create batch analyzer
+        # Record the job so it can be resumed after a restart
+        metadata_path, results_path, checkpoint_path = batch_job_paths(job_id)
+        with open(metadata_path, 'w') as f:
+            json.dump({
+                'job_id': job_id,
+                'file_path': file_path,
+                'analysis_type': analysis_type,
+                'generate_reports': generate_reports,
+                'generate_summary': generate_summary
+            }, f)
+        
+        # Create batch analyzer and one strategist/report generator for the job
         batch_analyzer = BatchPropertyAnalyzer()
+        negotiation_strategist = NegotiationStrategist(top_k=BATCH_STRATEGY_TOP_K)
+        report_generator = ReportGenerator() if generate_reports else None
+        total = len(properties)
         
-        # Create batch results
-        batch_results = {
-            'total': len(properties),
-            'successful': 0,
-            'failed': 0,
-            'properties': []
-        }
+        # Only compact summary rows are kept in memory; full records stream
+        # straight to the results file
+        summary_rows = []
         
-        # Process each property
-        for i, prop in enumerate(properties):
-            try:
-                # Update progress
-                progress = int((i / len(properties)) * 100)
-                background_jobs[job_id]['progress'] = progress
-                
-                # Analyze property
-                property_data = batch_analyzer.analyze_property(
-                    address=prop.get('address'),
-                    property_type=prop.get('property_type', 'Single Family'),
-                    listing_price=prop.get('listing_price'),
-                    bedrooms=prop.get('bedrooms'),
-                    bathrooms=prop.get('bathrooms'),
-                    square_feet=prop.get('square_feet'),
-                    year_built=prop.get('year_built'),
-                    analysis_type=analysis_type
-                )
-                
-                # Check if analysis was successful
-                if not property_data.get('success', False):
-                    batch_results['failed'] += 1
-                    continue
-                
-                # Extract data
-                property_info = property_data.get('property', {})
-                market_data = property_data.get('market', {})
-                valuation_data = property_data.get('valuation', {})
-                
-                # Generate negotiation strategies
-                negotiation_strategist = NegotiationStrategist()
-                negotiation_data = negotiation_strategist.generate_strategies(
-                    property_info, market_data, valuation_data
+        with JsonlResultWriter(results_path, checkpoint_path) as writer:
+            remaining = writer.open((prop.get('address') for prop in properties), resume=resume)
+            
+            # Rows finished by an earlier run are read back one line at a time
+            finished_rows = writer.summary['rows'] if writer.summary is not None else writer.rows
+            for record in iter_jsonl_records(results_path, finished_rows):
+                if record.get('success'):
+                    summary_rows.append(build_batch_summary_row(record))
+            
+            # Negotiation strategies are generated a chunk of results at a time
+            results = zip(batch_analyzer.iter_batch(remaining), islice(properties, writer.rows, None))
+            while True:
+                chunk = list(islice(results, BATCH_CHUNK_SIZE))
+                if not chunk:
+                    break
+                records = build_batch_job_records(
+                    [result for result, _ in chunk], negotiation_strategist, report_generator,
+                    input_rows=[row for _, row in chunk]
                 )
+                for record in records:
+                    writer.write(record)
+                    if record.get('success'):
+                        summary_rows.append(build_batch_summary_row(record))
                 
-                # Generate report if requested
-                report_url = None
-                report_download_url = None
-                
-                if generate_reports:
-                    report_generator = ReportGenerator()
-                    report_result = report_generator.generate_report(
-                        property_info, market_data, valuation_data, negotiation_data
-                    )
-                    
-                    if report_result.get('success', False):
-                        report_path = report_result.get('main_report_path', '')
-                        
-                        # Create URLs for the report
-                        report_filename = os.path.basename(report_path)
-                        report_url = f'/reports/{report_filename}'
-                        report_download_url = f'/download/{report_filename}'
-                
-                # Add to batch results
-                batch_results['successful'] += 1
-                batch_results['properties'].append({
-                    'property': property_info,
-                    'valuation': valuation_data,
-                    'negotiation': negotiation_data,
-                    'report_url': report_url,
-                    'report_download_url': report_download_url
-                })
-                
-            except Exception as e:
-                batch_results['failed'] += 1
-                print(f"Error processing property: {str(e)}")
+                # Update progress
+                background_jobs[job_id]['progress'] = int((writer.rows / total) * 100)
+            
+            summary = writer.finish()
+        
+        # Create batch results
+        batch_results = {
+            'total': total,
+            'successful': summary['succeeded'],
+            'failed': summary['failed'],
+            'resumed_rows': summary['resumed_rows'],
+            'results_file': results_path,
+            'properties': summary_rows
+        }
         
         # Generate batch summary report if requested
         summary_url = None
@@ -2110,17 +2366,8 @@ def process_batch_job(job_id, file_path, analysis_type, generate_reports, genera
         if generate_summary and batch_results['successful'] > 0:
             batch_report_generator = BatchReportGenerator()
             
-            # Prepare data for batch summary
-            batch_data = []
-            for prop_result in batch_results['properties']:
-                batch_data.append({
-                    'property': prop_result['property'],
-                    'valuation': prop_result['valuation'],
-                    'negotiation': prop_result['negotiation']
-                })
-            
-            # Generate batch summary
-            summary_result = batch_report_generator.generate_summary_report(batch_data)
+            # Summary rows carry every field the batch summary reads
+            summary_result = batch_report_generator.generate_summary_report(summary_rows)
             
             if summary_result.get('success', False):
                 summary_path = summary_result.get('summary_path', '')
@@ -2144,12 +2391,128 @@ def process_batch_job(job_id, file_path, analysis_type, generate_reports, genera
     except Exception as e:
         background_jobs[job_id] = {
             'status': 'failed',
+            'resumable': True,
             'error': f'Error processing batch: {str(e)}'
         }
 
+def build_batch_job_records(results, negotiation_strategist, report_generator=None, input_rows=None):
+    """Build the stored records for a chunk of analyzed properties of a batch job"""
+    successful = [result for result in results if result.get('success', False)]
+    negotiations = iter(negotiation_strategist.generate_strategies_batch(successful))
+    input_rows = input_rows or [None] * len(results)
+    return [
+        build_batch_job_record(
+            result, next(negotiations) if result.get('success', False) else None, report_generator, input_row
+        )
+        for result, input_row in zip(results, input_rows)
+    ]
+
+def build_batch_job_record(result, negotiation_data, report_generator=None, input_row=None):
+    """Build the stored record for one analyzed property of a batch job"""
+    record = build_batch_job_result(result, negotiation_data, report_generator)
+    if input_row is not None:
+        # Keep the uploaded row's columns (missing cells become null)
+        record['input'] = {
+            key: None if isinstance(value, float) and value != value else value
+            for key, value in input_row.items()
+        }
+    return record
+
+def build_batch_summary_row(record):
+    """Reduce a successful batch job record to the fields the results table and summary report use"""
+    property_info = record.get('property') or {}
+    negotiation_data = record.get('negotiation') or {}
+    top_strategies = negotiation_data.get('recommended_strategies') or []
+    return {
+        'input': record.get('input'),
+        'property': {
+            'address': property_info.get('address', record.get('address')),
+            'listing_price': property_info.get('listing_price', 0)
+        },
+        'valuation': {
+            'valuation': {
+                'final_value': (record.get('valuation') or {}).get('valuation', {}).get('final_value', 0)
+            }
+        },
+        'negotiation': {
+            'seller_motivation': {
+                'level': negotiation_data.get('seller_motivation', {}).get('level', 'moderate')
+            },
+            'recommended_strategies': [
+                {
+                    'name': strategy.get('name', 'Unknown'),
+                    'expected_success_probability': strategy.get('expected_success_probability', 0)
+                }
+                for strategy in top_strategies[:1]
+            ]
+        },
+        'report_url': record.get('report_url'),
+        'report_download_url': record.get('report_download_url')
+    }
+
+def iter_jsonl_records(path, limit):
+    """Yield the first ``limit`` records of a JSON Lines results file, one line at a time"""
+    if not limit:
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in islice(f, limit):
+            yield json.loads(line)
+
+def build_batch_job_result(result, negotiation_data, report_generator=None):
+    """Build the analysis part of a batch job record"""
+    if not result.get('success', False):
+        return {
+            'success': False,
+            'address': result.get('address'),
+            'error': result.get('error', 'Unknown error')
+        }
+    
+    try:
+        # Extract data
+        property_info = result.get('property', {})
+        market_data = result.get('market', {})
+        valuation_data = result.get('valuation', {})
+        
+        # Generate report if requested
+        report_url = None
+        report_download_url = None
+        
+        if report_generator is not None:
+            report_result = report_generator.generate_report(
+                property_info, market_data, valuation_data, negotiation_data
+            )
+            
+            if report_result.get('success', False):
+                report_path = report_result.get('main_report_path', '')
+                
+                # Create URLs for the report
+                report_filename = os.path.basename(report_path)
+                report_url = f'/reports/{report_filename}'
+                report_download_url = f'/download/{report_filename}'
+        
+        return {
+            'success': True,
+            'address': result.get('address'),
+            'property': property_info,
+            'valuation': valuation_data,
+            'negotiation': negotiation_data,
+            'report_url': report_url,
+            'report_download_url': report_download_url
+        }
+        
+    except Exception as e:
+        print(f"Error processing property: {str(e)}")
+        return {
+            'success': False,
+            'address': result.get('address'),
+            'error': str(e)
+        }
+
 def load_properties_from_file(file_path):
     """Load properties from a CSV or Excel file"""
     try:
+        import pandas as pd
+        
         # Determine file type
         file_ext = file_path.rsplit('.', 1)[1].lower()
         